@@ -131,7 +131,14 @@ class A2AServerConfig(BaseModel):
     )
     task_history_limit: int = Field(
         default=1000,
-        description="Maximum tasks to keep in history",
+        description=(
+            "Maximum tasks to keep in history (only terminal tasks are "
+            "evicted; live tasks are kept beyond this limit)"
+        ),
+    )
+    task_store_path: str | None = Field(
+        default=None,
+        description="SQLite file for persistent task history (memory only if None)",
     )
 
     # Paracle integration
@@ -7,6 +7,7 @@ from paracle_a2a.server.agent_card_generator import AgentCardGenerator
 from paracle_a2a.server.agent_executor import ParacleA2AExecutor
 from paracle_a2a.server.event_queue import EventQueue, TaskEventQueue
 from paracle_a2a.server.task_manager import TaskManager
+from paracle_a2a.server.task_store import SQLiteTaskStore, StoredTask, TaskStore
 
 __all__ = [
     "AgentCardGenerator",
@@ -14,4 +15,7 @@ __all__ = [
     "ParacleA2AExecutor",
     "TaskEventQueue",
     "TaskManager",
+    "TaskStore",
+    "SQLiteTaskStore",
+    "StoredTask",
 ]
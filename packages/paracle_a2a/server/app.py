@@ -325,11 +325,16 @@ def create_a2a_app(
             states=query_params.states,
             limit=query_params.limit,
             offset=query_params.offset,
+            cursor=params.get("cursor"),
         )
 
         return {
             "tasks": [task_to_response(t) for t in tasks],
             "total": len(tasks),
+            # Pass back as "cursor" to fetch the next page
+            "next_cursor": (
+                tasks[-1].id if tasks and len(tasks) >= query_params.limit else None
+            ),
         }
 
     async def handle_tasks_cancel(params: dict[str, Any]) -> dict[str, Any]:
@@ -1,10 +1,18 @@
 """Task Manager.
 
 Manages A2A task lifecycle and persistence.
+
+Tasks are kept in memory with secondary indexes (context, session, state)
+holding id-sorted task ids. ULIDs sort by creation time, so listing walks an
+index backwards from a keyset cursor instead of copying and sorting every
+task on each call.
 """
 
 import asyncio
+import heapq
+from bisect import bisect_left
 from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -24,13 +32,47 @@ from paracle_a2a.models import (
     create_task,
     is_task_terminal,
 )
+from paracle_a2a.server.task_store import SQLiteTaskStore, TaskStore
+
+
+def _insert_sorted(ids: list[str], task_id: str) -> None:
+    # New ULIDs are almost always the largest id, so appending is the fast path
+    if not ids or ids[-1] < task_id:
+        ids.append(task_id)
+        return
+    i = bisect_left(ids, task_id)
+    if i == len(ids) or ids[i] != task_id:
+        ids.insert(i, task_id)
+
+
+def _discard_sorted(ids: list[str], task_id: str) -> None:
+    i = bisect_left(ids, task_id)
+    if i < len(ids) and ids[i] == task_id:
+        del ids[i]
+
+
+def _iter_before(ids: list[str], cursor: str | None) -> Iterator[str]:
+    """Iterate ids strictly below cursor, newest first."""
+    end = bisect_left(ids, cursor) if cursor else len(ids)
+    for i in range(end - 1, -1, -1):
+        yield ids[i]
 
 
 class TaskManager:
     """Manages A2A task lifecycle.
 
     Handles task creation, updates, queries, and cleanup.
-    Stores tasks in memory with optional persistence.
+    Stores tasks in memory with optional persistence (``store`` or
+    ``config.task_store_path``).
+
+    Only terminal tasks are evicted once ``config.task_history_limit`` is
+    exceeded; live tasks (submitted, working, input-required) are always
+    kept, so memory is bounded by the limit plus the number of live tasks.
+
+    Concurrency: in-memory state is only mutated between awaits, so it needs
+    no global lock. A per-task lock serializes updates of a single task
+    (status changes, persistence and event emission stay in order) without
+    blocking other tasks.
     """
 
     def __init__(
@@ -38,6 +80,7 @@ class TaskManager:
         config: A2AServerConfig | None = None,
         on_status_update: Any | None = None,
         on_artifact_update: Any | None = None,
+        store: TaskStore | None = None,
     ):
         """Initialize task manager.
 
@@ -45,18 +88,35 @@ class TaskManager:
             config: Server configuration
             on_status_update: Callback for status updates
             on_artifact_update: Callback for artifact updates
+            store: Optional persistence backend (defaults to a SQLite store
+                when ``config.task_store_path`` is set)
         """
         self.config = config or A2AServerConfig()
         self._on_status_update = on_status_update
         self._on_artifact_update = on_artifact_update
 
-        # Task storage (LRU-like with max size)
+        # Task storage in LRU order
         self._tasks: OrderedDict[str, Task] = OrderedDict()
         self._task_messages: dict[str, list[Message]] = {}
         self._task_artifacts: dict[str, list[Artifact]] = {}
 
-        # Locks for concurrent access
-        self._lock = asyncio.Lock()
+        # Secondary indexes of id-sorted task ids
+        self._ids: list[str] = []
+        self._by_context: dict[str, list[str]] = {}
+        self._by_session: dict[str, list[str]] = {}
+        self._by_state: dict[TaskState, list[str]] = {}
+
+        # Terminal tasks in LRU order; live tasks are never evicted
+        self._evictable: OrderedDict[str, None] = OrderedDict()
+
+        # Per-task locks for read-modify-write sequences
+        self._task_locks: dict[str, asyncio.Lock] = {}
+
+        if store is None and self.config.task_store_path:
+            store = SQLiteTaskStore(self.config.task_store_path)
+        self._store = store
+        if self._store is not None:
+            self._load_from_store()
 
     async def create_task(
         self,
@@ -78,51 +138,56 @@ class TaskManager:
         Returns:
             Created Task
         """
-        async with self._lock:
-            # Check if continuing existing task
-            if task_id and task_id in self._tasks:
-                task = self._tasks[task_id]
-                self._task_messages.setdefault(task_id, []).append(message)
-                # Move to end (LRU)
-                self._tasks.move_to_end(task_id)
-                return task
-
-            # Create new task
-            new_id = task_id or str(ULID())
-            history = [] if self.config.enable_state_transition_history else None
-
-            # SDK Task requires context_id, generate one if not provided
-            ctx_id = context_id or str(ULID())
-
-            task = create_task(
-                task_id=new_id,
-                context_id=ctx_id,
-                status=TaskStatus(state=TaskState.submitted),
-                metadata=metadata or {},
-                history=history,
+        # Check if continuing existing task
+        if task_id and task_id in self._tasks:
+            async with self._task_lock(task_id):
+                # Evicted (and deleted from the store) while waiting for the
+                # lock: the message starts a new task with the same ID
+                task = self._tasks.get(task_id)
+                if task is not None:
+                    self._task_messages.setdefault(task_id, []).append(message)
+                    self._touch(task_id)
+                    await self._persist("append_message", task_id, message)
+                    return task
+
+        # Create new task
+        new_id = task_id or str(ULID())
+        history = [] if self.config.enable_state_transition_history else None
+
+        # SDK Task requires context_id, generate one if not provided
+        ctx_id = context_id or str(ULID())
+
+        task = create_task(
+            task_id=new_id,
+            context_id=ctx_id,
+            status=TaskStatus(state=TaskState.submitted),
+            metadata=metadata or {},
+            history=history,
+        )
+        # Store session_id in metadata for Paracle-specific tracking
+        if session_id:
+            task_meta = dict(task.metadata or {})
+            task_meta["session_id"] = session_id
+            task = Task(
+                id=task.id,
+                context_id=task.context_id,
+                status=task.status,
+                metadata=task_meta,
+                history=task.history,
+                artifacts=task.artifacts,
             )
-            # Store session_id in metadata for Paracle-specific tracking
-            if session_id:
-                task_meta = dict(task.metadata or {})
-                task_meta["session_id"] = session_id
-                task = Task(
-                    id=task.id,
-                    context_id=task.context_id,
-                    status=task.status,
-                    metadata=task_meta,
-                    history=task.history,
-                    artifacts=task.artifacts,
-                )
 
-            # Store task and initial message
-            self._tasks[new_id] = task
-            self._task_messages[new_id] = [message]
-            self._task_artifacts[new_id] = []
+        # Store task and initial message
+        self._add(task, [message], [])
 
-            # Enforce max tasks limit
-            await self._cleanup_old_tasks()
+        async with self._task_lock(new_id):
+            await self._persist("save_task", task)
+            await self._persist("append_message", new_id, message)
 
-            return task
+        # Enforce max tasks limit
+        await self._cleanup_old_tasks()
+
+        return task
 
     async def get_task(self, task_id: str) -> Task:
         """Get task by ID.
@@ -136,12 +201,10 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task not found
         """
-        async with self._lock:
-            if task_id not in self._tasks:
-                raise TaskNotFoundError(task_id)
-            # Move to end (LRU)
-            self._tasks.move_to_end(task_id)
-            return self._tasks[task_id]
+        if task_id not in self._tasks:
+            raise TaskNotFoundError(task_id)
+        self._touch(task_id)
+        return self._tasks[task_id]
 
     async def get_task_messages(self, task_id: str) -> list[Message]:
         """Get messages for a task.
@@ -155,10 +218,9 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task not found
         """
-        async with self._lock:
-            if task_id not in self._tasks:
-                raise TaskNotFoundError(task_id)
-            return self._task_messages.get(task_id, [])
+        if task_id not in self._tasks:
+            raise TaskNotFoundError(task_id)
+        return self._task_messages.get(task_id, [])
 
     async def get_task_artifacts(self, task_id: str) -> list[Artifact]:
         """Get artifacts for a task.
@@ -172,10 +234,9 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task not found
         """
-        async with self._lock:
-            if task_id not in self._tasks:
-                raise TaskNotFoundError(task_id)
-            return self._task_artifacts.get(task_id, [])
+        if task_id not in self._tasks:
+            raise TaskNotFoundError(task_id)
+        return self._task_artifacts.get(task_id, [])
 
     async def update_status(
         self,
@@ -200,10 +261,13 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task not found
         """
-        async with self._lock:
+        if task_id not in self._tasks:
+            raise TaskNotFoundError(task_id)
+
+        async with self._task_lock(task_id):
+            # Re-check: the task may have been evicted while waiting
             if task_id not in self._tasks:
                 raise TaskNotFoundError(task_id)
-
             task = self._tasks[task_id]
 
             # Create new status with optional message
@@ -234,7 +298,8 @@ class TaskManager:
                 history=new_history,
                 artifacts=task.artifacts,
             )
-            self._tasks[task_id] = updated_task
+            self._replace(task, updated_task)
+            await self._persist("save_task", updated_task)
 
             # Emit event
             if self._on_status_update:
@@ -246,7 +311,11 @@ class TaskManager:
                 )
                 await self._on_status_update(event)
 
-            return updated_task
+        # A task turning terminal may unblock eviction
+        if is_task_terminal(updated_task):
+            await self._cleanup_old_tasks()
+
+        return updated_task
 
     async def add_message(
         self,
@@ -265,12 +334,13 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task not found
         """
-        async with self._lock:
-            if task_id not in self._tasks:
-                raise TaskNotFoundError(task_id)
+        if task_id not in self._tasks:
+            raise TaskNotFoundError(task_id)
 
+        async with self._task_lock(task_id):
             self._task_messages.setdefault(task_id, []).append(message)
             task = self._tasks[task_id]
+            await self._persist("append_message", task_id, message)
             # SDK Task is immutable, no updated_at field
             return task
 
@@ -291,12 +361,13 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If task not found
         """
-        async with self._lock:
-            if task_id not in self._tasks:
-                raise TaskNotFoundError(task_id)
+        if task_id not in self._tasks:
+            raise TaskNotFoundError(task_id)
 
+        async with self._task_lock(task_id):
             self._task_artifacts.setdefault(task_id, []).append(artifact)
             task = self._tasks[task_id]
+            await self._persist("append_artifact", task_id, artifact)
             # SDK Task is immutable, no updated_at field
 
             # Emit event
@@ -340,54 +411,177 @@ class TaskManager:
         states: list[TaskState] | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[Task]:
-        """List tasks with filtering.
+        """List tasks with filtering, newest first.
+
+        The smallest matching secondary index drives the scan; remaining
+        filters are checked per task. Pass the id of the last task of a page
+        as ``cursor`` to get the next page (stable under concurrent inserts,
+        unlike ``offset``).
 
         Args:
             context_id: Filter by context ID
             session_id: Filter by session ID (stored in metadata)
             states: Filter by states
             limit: Maximum results
-            offset: Results offset
+            offset: Results offset (kept for compatibility, prefer cursor)
+            cursor: Only return tasks with an id lower than this one
 
         Returns:
             List of matching tasks
         """
-        async with self._lock:
-            tasks = list(self._tasks.values())
-
-            # Apply filters
-            if context_id:
-                tasks = [t for t in tasks if t.context_id == context_id]
-            if session_id:
-                # session_id is stored in metadata for SDK compatibility
-                tasks = [
-                    t
-                    for t in tasks
-                    if (t.metadata or {}).get("session_id") == session_id
-                ]
-            if states:
-                tasks = [t for t in tasks if t.status.state in states]
-
-            # SDK Task has no created_at, sort by id (ULID is time-ordered)
-            tasks.sort(key=lambda t: t.id, reverse=True)
-
-            # Apply pagination
-            return tasks[offset : offset + limit]
+        candidates: list[list[list[str]]] = []
+        if context_id:
+            candidates.append([self._by_context.get(context_id, [])])
+        if session_id:
+            candidates.append([self._by_session.get(session_id, [])])
+        if states:
+            candidates.append([self._by_state.get(state, []) for state in set(states)])
+        driver = min(
+            candidates or [[self._ids]],
+            key=lambda lists: sum(len(ids) for ids in lists),
+        )
+
+        if len(driver) == 1:
+            ids = _iter_before(driver[0], cursor)
+        else:
+            ids = heapq.merge(
+                *(_iter_before(lst, cursor) for lst in driver), reverse=True
+            )
+
+        state_set = set(states) if states else None
+        results: list[Task] = []
+        skipped = 0
+        # Nothing below awaits, so indexes cannot change during the scan
+        for task_id in ids:
+            task = self._tasks[task_id]
+            if context_id and task.context_id != context_id:
+                continue
+            if session_id and (task.metadata or {}).get("session_id") != session_id:
+                continue
+            if state_set and task.status.state not in state_set:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            results.append(task)
+            if len(results) >= limit:
+                break
+        return results
 
     async def _cleanup_old_tasks(self) -> None:
-        """Remove old tasks when limit exceeded."""
-        while len(self._tasks) > self.config.task_history_limit:
-            # Remove oldest (first item in OrderedDict)
-            task_id = next(iter(self._tasks))
-            task = self._tasks.pop(task_id)
+        """Evict least recently used terminal tasks when limit exceeded.
 
-            # Only remove completed tasks
+        Live tasks are skipped rather than stalling eviction.
+        """
+        evicted = []
+        while len(self._tasks) > self.config.task_history_limit and self._evictable:
+            task_id, _ = self._evictable.popitem(last=False)
+            self._remove(task_id)
+            evicted.append(task_id)
+        if evicted:
+            await self._persist("delete_tasks", evicted)
+
+    # ------------------------------------------------------------------
+    # Index maintenance (synchronous: never awaits mid-update)
+    # ------------------------------------------------------------------
+
+    def _add(
+        self, task: Task, messages: list[Message], artifacts: list[Artifact]
+    ) -> None:
+        self._tasks[task.id] = task
+        self._task_messages[task.id] = messages
+        self._task_artifacts[task.id] = artifacts
+        _insert_sorted(self._ids, task.id)
+        _insert_sorted(self._by_context.setdefault(task.context_id, []), task.id)
+        session_id = (task.metadata or {}).get("session_id")
+        if session_id:
+            _insert_sorted(self._by_session.setdefault(session_id, []), task.id)
+        _insert_sorted(self._by_state.setdefault(task.status.state, []), task.id)
+        if is_task_terminal(task):
+            self._evictable[task.id] = None
+
+    def _replace(self, old: Task, new: Task) -> None:
+        self._tasks[new.id] = new
+        if old.status.state != new.status.state:
+            self._unindex(self._by_state, old.status.state, old.id)
+            _insert_sorted(self._by_state.setdefault(new.status.state, []), new.id)
+        if is_task_terminal(new):
+            self._evictable[new.id] = None
+            self._evictable.move_to_end(new.id)
+        else:
+            self._evictable.pop(new.id, None)
+
+    def _remove(self, task_id: str) -> None:
+        task = self._tasks.pop(task_id)
+        self._task_messages.pop(task_id, None)
+        self._task_artifacts.pop(task_id, None)
+        self._task_locks.pop(task_id, None)
+        self._evictable.pop(task_id, None)
+        _discard_sorted(self._ids, task_id)
+        self._unindex(self._by_context, task.context_id, task_id)
+        session_id = (task.metadata or {}).get("session_id")
+        if session_id:
+            self._unindex(self._by_session, session_id, task_id)
+        self._unindex(self._by_state, task.status.state, task_id)
+
+    @staticmethod
+    def _unindex(index: dict[Any, list[str]], key: Any, task_id: str) -> None:
+        ids = index.get(key)
+        if ids is None:
+            return
+        _discard_sorted(ids, task_id)
+        if not ids:
+            del index[key]
+
+    def _touch(self, task_id: str) -> None:
+        self._tasks.move_to_end(task_id)
+        if task_id in self._evictable:
+            self._evictable.move_to_end(task_id)
+
+    def _task_lock(self, task_id: str) -> asyncio.Lock:
+        lock = self._task_locks.get(task_id)
+        if lock is None:
+            lock = self._task_locks[task_id] = asyncio.Lock()
+        return lock
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    async def _persist(self, method: str, *args: Any) -> None:
+        if self._store is not None:
+            await asyncio.to_thread(getattr(self._store, method), *args)
+
+    def _load_from_store(self) -> None:
+        """Restore task history from the store.
+
+        Tasks that were still live when the server stopped lost their
+        executor, so they are restored as failed (and evictable).
+        """
+        assert self._store is not None
+        for stored in self._store.load(self.config.task_history_limit):
+            task = stored.task
             if not is_task_terminal(task):
-                # Put it back at the end
-                self._tasks[task_id] = task
-                break
+                task = Task(
+                    id=task.id,
+                    context_id=task.context_id,
+                    status=TaskStatus(
+                        state=TaskState.failed,
+                        message=create_message(
+                            "Task interrupted by server restart", role="agent"
+                        ),
+                        timestamp=datetime.utcnow().isoformat(),
+                    ),
+                    metadata=task.metadata,
+                    history=task.history,
+                    artifacts=task.artifacts,
+                )
+                self._store.save_task(task)
+            self._add(task, stored.messages, stored.artifacts)
 
-            # Clean up associated data
-            self._task_messages.pop(task_id, None)
-            self._task_artifacts.pop(task_id, None)
+    def close(self) -> None:
+        """Close the persistence backend."""
+        if self._store is not None:
+            self._store.close()
@@ -0,0 +1,175 @@
+"""Task Store.
+
+Persistence backends for A2A task history.
+"""
+
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from paracle_a2a.models import Artifact, Message, Task
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    context_id TEXT NOT NULL,
+    session_id TEXT,
+    state TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_context ON tasks(context_id, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_session ON tasks(session_id, id)
+    WHERE session_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_tasks_state ON tasks(state, id);
+CREATE TABLE IF NOT EXISTS task_items (
+    task_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_task_items_task ON task_items(task_id, kind, seq);
+"""
+
+
+@dataclass
+class StoredTask:
+    """A task with its messages and artifacts, as loaded from a store."""
+
+    task: Task
+    messages: list[Message] = field(default_factory=list)
+    artifacts: list[Artifact] = field(default_factory=list)
+
+
+class TaskStore(ABC):
+    """Persistence backend for TaskManager.
+
+    Methods are synchronous and called from a worker thread, so
+    implementations must be thread-safe.
+    """
+
+    @abstractmethod
+    def save_task(self, task: Task) -> None:
+        """Insert or replace a task."""
+
+    @abstractmethod
+    def append_message(self, task_id: str, message: Message) -> None:
+        """Append a message to a task."""
+
+    @abstractmethod
+    def append_artifact(self, task_id: str, artifact: Artifact) -> None:
+        """Append an artifact to a task."""
+
+    @abstractmethod
+    def delete_tasks(self, task_ids: list[str]) -> None:
+        """Delete tasks and their messages and artifacts."""
+
+    @abstractmethod
+    def load(self, limit: int) -> list[StoredTask]:
+        """Load the most recent tasks, oldest first.
+
+        Args:
+            limit: Maximum number of tasks to load
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release resources."""
+
+
+class SQLiteTaskStore(TaskStore):
+    """SQLite task store so task history survives restarts."""
+
+    def __init__(self, db_path: str | Path):
+        """Open (and create if needed) the task database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def save_task(self, task: Task) -> None:
+        session_id = (task.metadata or {}).get("session_id")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tasks (id, context_id, session_id, state, body) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    task.id,
+                    task.context_id,
+                    session_id,
+                    _state_value(task),
+                    task.model_dump_json(by_alias=True, exclude_none=True),
+                ),
+            )
+
+    def append_message(self, task_id: str, message: Message) -> None:
+        self._append(task_id, "message", message)
+
+    def append_artifact(self, task_id: str, artifact: Artifact) -> None:
+        self._append(task_id, "artifact", artifact)
+
+    def delete_tasks(self, task_ids: list[str]) -> None:
+        if not task_ids:
+            return
+        rows = [(task_id,) for task_id in task_ids]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("DELETE FROM tasks WHERE id = ?", rows)
+                self._conn.executemany("DELETE FROM task_items WHERE task_id = ?", rows)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def load(self, limit: int) -> list[StoredTask]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, body FROM tasks ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+            stored: dict[str, StoredTask] = {
+                task_id: StoredTask(task=Task.model_validate_json(body))
+                for task_id, body in reversed(rows)
+            }
+            if stored:
+                items = self._conn.execute(
+                    "SELECT task_id, kind, body FROM task_items WHERE task_id IN "
+                    "(SELECT id FROM tasks ORDER BY id DESC LIMIT ?) ORDER BY seq",
+                    (limit,),
+                ).fetchall()
+                for task_id, kind, body in items:
+                    if kind == "message":
+                        stored[task_id].messages.append(
+                            Message.model_validate_json(body)
+                        )
+                    else:
+                        stored[task_id].artifacts.append(
+                            Artifact.model_validate_json(body)
+                        )
+        return list(stored.values())
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _append(self, task_id: str, kind: str, item: Message | Artifact) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO task_items (task_id, kind, body) VALUES (?, ?, ?)",
+                (task_id, kind, item.model_dump_json(by_alias=True, exclude_none=True)),
+            )
+
+
+def _state_value(task: Task) -> str:
+    state = task.status.state
+    return state.value if hasattr(state, "value") else str(state)
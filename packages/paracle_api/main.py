@@ -18,6 +18,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from paracle_core.logging import create_request_logging_middleware, get_logger
+from paracle_core.parac.registry import get_registry, resolve_parac_root
 from paracle_domain.inheritance import InheritanceError
 from paracle_orchestration.exceptions import OrchestrationError
 from paracle_profiling import ProfilerMiddleware
@@ -46,6 +47,7 @@ from paracle_api.routers import (
     workflow_crud_router,
     workflow_execution_router,
 )
+from paracle_api.routers.workflow_execution import resume_pending_executions
 from paracle_api.security.config import SecurityConfig, get_security_config
 from paracle_api.security.headers import SecurityHeadersMiddleware
 
@@ -79,11 +81,29 @@ async def lifespan(app: FastAPI):
         init_default_users()
         logger.info("Development mode: initialized default users")
 
+    # Keep the .parac/ artifact registry fresh from file system events
+    artifacts = None
+    parac_root = resolve_parac_root()
+    if parac_root is not None:
+        artifacts = get_registry(parac_root)
+        if not artifacts.start_watching():
+            artifacts = None
+
+    # Resume workflows paused at an approval gate before the last shutdown
+    try:
+        resumed = await resume_pending_executions()
+        if resumed:
+            logger.info(f"Resumed {resumed} execution(s) awaiting approval")
+    except Exception as e:
+        logger.warning(f"Failed to resume pending executions: {e}")
+
     logger.info("Paracle API started with security enabled")
 
     yield
 
     # Shutdown
+    if artifacts is not None:
+        artifacts.stop_watching()
     logger.info("Paracle API shutting down")
 
 
@@ -16,6 +16,7 @@ Endpoints:
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from paracle_core.parac.registry import resolve_parac_root
 from paracle_domain.models import ApprovalPriority, ApprovalStatus
 from paracle_orchestration.approval import (
     ApprovalAlreadyDecidedError,
@@ -24,19 +25,29 @@ from paracle_orchestration.approval import (
     ApprovalNotFoundError,
     UnauthorizedApproverError,
 )
+from paracle_orchestration.approval_store import SQLiteApprovalStore
 from pydantic import BaseModel, Field
 
 router = APIRouter(prefix="/approvals", tags=["approvals"])
 
+# Approval requests database, relative to .parac/
+APPROVALS_DB = "memory/data/approvals.db"
+
 # Global approval manager (in production, use dependency injection)
 _approval_manager: ApprovalManager | None = None
 
 
 def get_approval_manager() -> ApprovalManager:
-    """Get the global approval manager."""
+    """Get the global approval manager.
+
+    Requests are persisted in ``.parac/memory/data/approvals.db`` when a
+    ``.parac/`` workspace is found, so pending approvals survive restarts.
+    """
     global _approval_manager
     if _approval_manager is None:
-        _approval_manager = ApprovalManager()
+        parac_root = resolve_parac_root()
+        store = SQLiteApprovalStore(parac_root / APPROVALS_DB) if parac_root else None
+        _approval_manager = ApprovalManager(store=store)
     return _approval_manager
 
 
@@ -138,6 +149,7 @@ def _to_response(request: Any) -> ApprovalRequestResponse:
 async def list_pending_approvals(
     workflow_id: str | None = None,
     priority: str | None = None,
+    limit: int | None = None,
     manager: ApprovalManager = Depends(get_approval_manager),
 ) -> ApprovalListResponse:
     """List pending approval requests.
@@ -145,6 +157,7 @@ async def list_pending_approvals(
     Args:
         workflow_id: Filter by workflow ID.
         priority: Filter by priority (low, medium, high, critical).
+        limit: Maximum number of results.
 
     Returns:
         List of pending approval requests, sorted by priority.
@@ -160,7 +173,9 @@ async def list_pending_approvals(
                 detail=f"Invalid priority: {priority}. Must be one of: low, medium, high, critical",
             )
 
-    approvals = manager.list_pending(workflow_id=workflow_id, priority=priority_enum)
+    approvals = manager.list_pending(
+        workflow_id=workflow_id, priority=priority_enum, limit=limit
+    )
     return ApprovalListResponse(
         approvals=[_to_response(a) for a in approvals],
         total=len(approvals),
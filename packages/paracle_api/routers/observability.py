@@ -12,6 +12,11 @@ Provides REST endpoints for metrics, tracing, and alerts:
 - GET /api/alerts/rules - List alert rules
 - POST /api/alerts/evaluate - Evaluate alert rules
 - POST /api/alerts/{fingerprint}/silence - Silence an alert
+- GET /api/profiling/stats - Aggregated profiler statistics
+- POST /api/profiling/sampler/start - Start the stack sampler
+- POST /api/profiling/sampler/stop - Stop the stack sampler
+- GET /api/profiling/sampler/status - Stack sampler state
+- GET /api/profiling/sampler/export - Export samples (collapsed/speedscope)
 """
 
 from datetime import datetime
@@ -24,6 +29,12 @@ from paracle_observability import (
     get_metrics_registry,
     get_tracer,
 )
+from paracle_profiling import (
+    get_profile_stats,
+    get_sampler,
+    start_sampling,
+    stop_sampling,
+)
 
 from paracle_api.schemas.observability import (
     AlertEvaluateResponse,
@@ -36,6 +47,10 @@ from paracle_api.schemas.observability import (
     MetricsExportResponse,
     MetricsListResponse,
     MetricValue,
+    ProfileStatsResponse,
+    SamplerExportResponse,
+    SamplerStartRequest,
+    SamplerStatusResponse,
     SpanEvent,
     SpanResponse,
     TraceExportResponse,
@@ -360,6 +375,113 @@ async def silence_alert(
     )
 
 
+# =============================================================================
+# Profiling Endpoints
+# =============================================================================
+
+
+@router.get(
+    "/profiling/stats",
+    response_model=ProfileStatsResponse,
+    operation_id="getProfileStats",
+    summary="Get aggregated profiler statistics",
+)
+async def profiling_stats() -> ProfileStatsResponse:
+    """Get call counts and latency percentiles per profiled function.
+
+    Returns:
+        Summary per profiled name
+    """
+    stats = get_profile_stats()
+    return ProfileStatsResponse(stats=stats, total=len(stats))
+
+
+@router.post(
+    "/profiling/sampler/start",
+    response_model=SamplerStatusResponse,
+    operation_id="startStackSampler",
+    summary="Start the stack sampler",
+)
+async def start_stack_sampler(
+    request: SamplerStartRequest | None = None,
+) -> SamplerStatusResponse:
+    """Start sampling the stacks of this API process.
+
+    Args:
+        request: Optional sampling interval and reset flag
+
+    Returns:
+        Sampler state
+    """
+    request = request or SamplerStartRequest()
+    sampler = start_sampling(interval=request.interval, reset=request.reset)
+    return SamplerStatusResponse(**sampler.status())
+
+
+@router.post(
+    "/profiling/sampler/stop",
+    response_model=SamplerStatusResponse,
+    operation_id="stopStackSampler",
+    summary="Stop the stack sampler",
+)
+async def stop_stack_sampler() -> SamplerStatusResponse:
+    """Stop sampling. Samples are kept until the next start.
+
+    Returns:
+        Sampler state
+    """
+    sampler = stop_sampling()
+    return SamplerStatusResponse(**sampler.status())
+
+
+@router.get(
+    "/profiling/sampler/status",
+    response_model=SamplerStatusResponse,
+    operation_id="getStackSamplerStatus",
+    summary="Get stack sampler state",
+)
+async def stack_sampler_status() -> SamplerStatusResponse:
+    """Get stack sampler state.
+
+    Returns:
+        Sampler state and counters
+    """
+    return SamplerStatusResponse(**get_sampler().status())
+
+
+@router.get(
+    "/profiling/sampler/export",
+    response_model=SamplerExportResponse,
+    operation_id="exportStackSamples",
+    summary="Export stack samples",
+)
+async def export_stack_samples(
+    format: str = Query(
+        default="collapsed", description="Export format (collapsed, speedscope)"
+    ),
+) -> SamplerExportResponse:
+    """Export stack samples for flamegraph tools.
+
+    Args:
+        format: collapsed (flamegraph.pl/inferno) or speedscope (JSON)
+
+    Returns:
+        Exported profile
+    """
+    sampler = get_sampler()
+    if format == "collapsed":
+        content = sampler.to_collapsed()
+    elif format == "speedscope":
+        content = sampler.to_speedscope()
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid format: {format}. Use collapsed or speedscope.",
+        )
+
+    return SamplerExportResponse(format=format, content=content)
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -22,9 +22,11 @@ from paracle_orchestration.workflow_loader import WorkflowLoader, WorkflowLoadEr
 from paracle_store.workflow_repository import WorkflowRepository
 from pydantic import BaseModel, Field
 
-# Global instances
+from paracle_api.routers.approvals import get_approval_manager
+
+# Global instances (the engine shares the approvals API manager)
 _repository = WorkflowRepository()
-_engine = WorkflowEngine()
+_engine = WorkflowEngine(approval_manager=get_approval_manager())
 _loader: WorkflowLoader | None = None
 
 
@@ -39,6 +41,38 @@ def _get_loader() -> WorkflowLoader | None:
     return _loader
 
 
+async def resume_pending_executions() -> int:
+    """Resume executions paused at an approval gate before a restart.
+
+    Workflows are resolved like in ``execute_workflow``: the YAML
+    definition first (keeping the paused execution's workflow ID), then
+    the repository.
+
+    Returns:
+        Number of resumed executions
+    """
+    loader = _get_loader()
+    workflows: dict[str, Workflow] = {}
+    for request in _engine.orchestrator.approval_manager.store.list_pending():
+        if request.workflow_id in workflows:
+            continue
+        state = request.metadata.get("execution_state") or {}
+        name = state.get("metadata", {}).get("workflow_name")
+        workflow = None
+        if loader is not None and name:
+            try:
+                spec = loader.load_workflow_spec(name)
+                workflow = Workflow(id=request.workflow_id, spec=spec)
+            except WorkflowLoadError:
+                pass
+        if workflow is None:
+            workflow = _repository.get(request.workflow_id)
+        if workflow is not None:
+            workflows[request.workflow_id] = workflow
+
+    return len(await _engine.resume_pending(workflows))
+
+
 router = APIRouter(prefix="/api/workflows", tags=["workflow_execution"])
 
 
@@ -46,6 +46,10 @@ from paracle_api.schemas.observability import (
     MetricsExportResponse,
     MetricsListResponse,
     MetricValue,
+    ProfileStatsResponse,
+    SamplerExportResponse,
+    SamplerStartRequest,
+    SamplerStatusResponse,
     SpanEvent,
     SpanResponse,
     TraceExportResponse,
@@ -152,4 +156,8 @@ __all__ = [
     "AlertSilenceRequest",
     "AlertSilenceResponse",
     "AlertEvaluateResponse",
+    "ProfileStatsResponse",
+    "SamplerStartRequest",
+    "SamplerStatusResponse",
+    "SamplerExportResponse",
 ]
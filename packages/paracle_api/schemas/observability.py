@@ -1,6 +1,7 @@
 """Observability API schemas.
 
-Provides request/response models for metrics, tracing, and alerts endpoints.
+Provides request/response models for metrics, tracing, alerts and profiling
+endpoints.
 """
 
 from datetime import datetime
@@ -144,3 +145,44 @@ class AlertEvaluateResponse(BaseModel):
         default_factory=list, description="New alerts fired"
     )
     total_rules_evaluated: int = Field(..., description="Total rules evaluated")
+
+
+# =============================================================================
+# Profiling Schemas
+# =============================================================================
+
+
+class ProfileStatsResponse(BaseModel):
+    """Aggregated profiler statistics."""
+
+    stats: dict[str, dict] = Field(
+        default_factory=dict, description="Summary per profiled name"
+    )
+    total: int = Field(..., description="Number of profiled names")
+
+
+class SamplerStartRequest(BaseModel):
+    """Request to start the stack sampler."""
+
+    interval: float | None = Field(
+        default=None, gt=0, le=1.0, description="Seconds between samples"
+    )
+    reset: bool = Field(default=True, description="Discard previous samples")
+
+
+class SamplerStatusResponse(BaseModel):
+    """Stack sampler state."""
+
+    running: bool = Field(..., description="Whether the sampler is active")
+    interval: float = Field(..., description="Seconds between samples")
+    samples: int = Field(..., description="Snapshots taken")
+    distinct_stacks: int = Field(..., description="Distinct stacks recorded")
+    dropped: int = Field(..., description="Samples dropped (stack limit)")
+    elapsed_seconds: float = Field(..., description="Time spent sampling")
+
+
+class SamplerExportResponse(BaseModel):
+    """Stack sampler export."""
+
+    format: str = Field(..., description="Export format (collapsed, speedscope)")
+    content: str | dict = Field(..., description="Exported profile")
@@ -21,7 +21,13 @@ from paracle_api.security.auth import (
 )
 from paracle_api.security.config import SecurityConfig, get_security_config
 from paracle_api.security.headers import SecurityHeadersMiddleware
-from paracle_api.security.rate_limit import RateLimiter, rate_limit
+from paracle_api.security.rate_limit import RateLimiter, RouteCost, rate_limit
+from paracle_api.security.rate_limit_backends import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+    SQLiteRateLimitBackend,
+)
 
 __all__ = [
     # Auth
@@ -41,5 +47,10 @@ __all__ = [
     "SecurityHeadersMiddleware",
     # Rate Limiting
     "RateLimiter",
+    "RouteCost",
     "rate_limit",
+    "RateLimitBackend",
+    "InMemoryRateLimitBackend",
+    "SQLiteRateLimitBackend",
+    "RedisRateLimitBackend",
 ]
@@ -105,6 +105,34 @@ class SecurityConfig(BaseSettings):
         description="Burst limit for rate limiting",
     )
 
+    rate_limit_backend: str = Field(
+        default="memory",
+        description="Rate limit state backend: memory, sqlite (single node) or redis",
+    )
+
+    rate_limit_sqlite_path: str = Field(
+        default=".paracle/rate_limits.db",
+        description="SQLite database shared by workers when backend is sqlite",
+    )
+
+    rate_limit_redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        description="Redis URL when backend is redis",
+    )
+
+    rate_limit_route_costs: dict[str, float] = Field(
+        default_factory=lambda: {
+            "POST /api/workflows/execute": 10.0,
+            "POST /api/workflows/*/execute": 10.0,
+        },
+        description="Token cost per route, keyed by 'METHOD /path/glob' (default cost 1)",
+    )
+
+    rate_limit_key_costs: dict[str, float] = Field(
+        default_factory=dict,
+        description="Cost multipliers for specific client keys",
+    )
+
     # ==========================================================================
     # Security Headers Settings
     # ==========================================================================
@@ -1,43 +1,72 @@
 """Rate Limiting for Paracle API.
 
 Provides rate limiting to prevent abuse and DoS attacks.
-Uses in-memory storage by default, can be extended to Redis for distributed deployments.
+
+Limits are enforced with GCRA (Generic Cell Rate Algorithm), a token bucket
+that stores a single timestamp per client. Unlike fixed windows it does not
+let a double burst through at window boundaries. State lives in a pluggable
+backend (in-process, SQLite or Redis) so that several uvicorn workers or API
+nodes can share one limit instead of each enforcing their own.
 """
 
 from __future__ import annotations
 
-import asyncio
+import fnmatch
 import time
-from collections import defaultdict
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from functools import wraps
 
 from fastapi import HTTPException, Request, status
 
 from paracle_api.security.config import SecurityConfig, get_security_config
+from paracle_api.security.rate_limit_backends import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+    SQLiteRateLimitBackend,
+    ceil_seconds,
+)
+
+
+@dataclass(frozen=True)
+class RouteCost:
+    """Cost weight for requests matching a route.
+
+    Attributes:
+        pattern: Path glob (e.g. ``/api/workflows/*/execute``)
+        cost: Number of tokens consumed per request
+        method: HTTP method, or ``*`` for any method
+    """
 
+    pattern: str
+    cost: float
+    method: str = "*"
 
-@dataclass
-class RateLimitInfo:
-    """Information about rate limit status for a client."""
+    @classmethod
+    def parse(cls, rule: str, cost: float) -> RouteCost:
+        """Build a RouteCost from a ``"METHOD /path"`` or ``"/path"`` rule."""
+        method, _, pattern = rule.strip().rpartition(" ")
+        return cls(pattern=pattern, cost=cost, method=(method or "*").upper())
 
-    requests: int = 0
-    window_start: float = field(default_factory=time.time)
-    blocked_until: float = 0
+    def matches(self, method: str, path: str) -> bool:
+        """Check whether a request matches this rule."""
+        if self.method != "*" and self.method != method.upper():
+            return False
+        return fnmatch.fnmatchcase(path, self.pattern)
 
 
 class RateLimiter:
-    """In-memory rate limiter with sliding window.
+    """GCRA token-bucket rate limiter with a pluggable backend.
 
-    Tracks request counts per client IP and enforces rate limits.
-    Thread-safe for async operations.
+    Each client gets a bucket of ``requests_per_window`` tokens that refills
+    continuously over ``window_seconds``. Requests may consume more than one
+    token through per-route and per-key cost weights.
 
     Example:
         >>> limiter = RateLimiter(requests_per_window=100, window_seconds=60)
-        >>> if limiter.is_allowed("192.168.1.1"):
-        ...     # Process request
-        ... else:
+        >>> allowed, headers = await limiter.is_allowed("192.168.1.1")
+        >>> if not allowed:
         ...     # Return 429 Too Many Requests
     """
 
@@ -47,6 +76,9 @@ class RateLimiter:
         window_seconds: int = 60,
         burst_limit: int = 20,
         block_duration_seconds: int = 300,
+        backend: RateLimitBackend | None = None,
+        route_costs: list[RouteCost] | None = None,
+        key_costs: dict[str, float] | None = None,
     ):
         """Initialize the rate limiter.
 
@@ -55,74 +87,91 @@ class RateLimiter:
             window_seconds: Time window in seconds
             burst_limit: Maximum burst requests allowed
             block_duration_seconds: How long to block after exceeding limits
+            backend: State backend (in-process by default)
+            route_costs: Cost weights for matching routes (first match wins)
+            key_costs: Cost multipliers for specific client keys
         """
         self.requests_per_window = requests_per_window
         self.window_seconds = window_seconds
         self.burst_limit = burst_limit
         self.block_duration_seconds = block_duration_seconds
 
-        self._clients: dict[str, RateLimitInfo] = defaultdict(RateLimitInfo)
-        self._lock = asyncio.Lock()
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.route_costs = list(route_costs or [])
+        self.key_costs = dict(key_costs or {})
+
+        # Seconds of bucket capacity consumed by one token
+        self._emission_interval = window_seconds / requests_per_window
+        self._route_cost_cache: dict[tuple[str, str], float] = {}
+
+    def cost_for(self, method: str, path: str) -> float:
+        """Resolve the token cost of a route.
 
-    async def is_allowed(self, client_id: str) -> tuple[bool, dict[str, int]]:
+        Args:
+            method: HTTP method
+            path: Request path
+
+        Returns:
+            Cost of the first matching route rule, or 1.0
+        """
+        cache_key = (method, path)
+        cost = self._route_cost_cache.get(cache_key)
+        if cost is None:
+            cost = next(
+                (rc.cost for rc in self.route_costs if rc.matches(method, path)),
+                1.0,
+            )
+            if len(self._route_cost_cache) < 4096:
+                self._route_cost_cache[cache_key] = cost
+        return cost
+
+    async def is_allowed(
+        self, client_id: str, cost: float = 1.0, scope: str = ""
+    ) -> tuple[bool, dict[str, int]]:
         """Check if a request from client is allowed.
 
         Args:
             client_id: Unique client identifier (usually IP address)
+            cost: Number of tokens the request consumes
+            scope: Optional namespace for the bucket (e.g. an endpoint name)
 
         Returns:
             Tuple of (allowed: bool, headers: dict with rate limit info)
         """
-        async with self._lock:
-            now = time.time()
-            info = self._clients[client_id]
-
-            # Check if client is blocked
-            if info.blocked_until > now:
-                remaining_block = int(info.blocked_until - now)
-                return False, {
-                    "X-RateLimit-Limit": self.requests_per_window,
-                    "X-RateLimit-Remaining": 0,
-                    "X-RateLimit-Reset": int(info.blocked_until),
-                    "Retry-After": remaining_block,
-                }
-
-            # Check if we need to reset the window
-            if now - info.window_start >= self.window_seconds:
-                info.requests = 0
-                info.window_start = now
-
-            # Check rate limit
-            if info.requests >= self.requests_per_window:
-                # Block the client
-                info.blocked_until = now + self.block_duration_seconds
-                return False, {
-                    "X-RateLimit-Limit": self.requests_per_window,
-                    "X-RateLimit-Remaining": 0,
-                    "X-RateLimit-Reset": int(info.blocked_until),
-                    "Retry-After": self.block_duration_seconds,
-                }
-
-            # Increment request count
-            info.requests += 1
-            remaining = max(0, self.requests_per_window - info.requests)
-            reset_time = int(info.window_start + self.window_seconds)
-
-            return True, {
+        cost *= self.key_costs.get(client_id, 1.0)
+        increment = self._emission_interval * cost
+        result = await self.backend.acquire(
+            f"{scope}:{client_id}" if scope else client_id,
+            increment=increment,
+            window=self.window_seconds,
+            penalty=self.block_duration_seconds,
+        )
+
+        if not result.allowed:
+            retry_after = ceil_seconds(
+                result.tat + increment - self.window_seconds - result.now
+            )
+            return False, {
                 "X-RateLimit-Limit": self.requests_per_window,
-                "X-RateLimit-Remaining": remaining,
-                "X-RateLimit-Reset": reset_time,
+                "X-RateLimit-Remaining": 0,
+                "X-RateLimit-Reset": int(result.now) + retry_after,
+                "Retry-After": retry_after,
             }
 
+        return True, {
+            "X-RateLimit-Limit": self.requests_per_window,
+            "X-RateLimit-Remaining": self._remaining(result.tat, result.now),
+            "X-RateLimit-Reset": int(result.now)
+            + ceil_seconds(result.tat - result.now),
+        }
+
     async def reset(self, client_id: str) -> None:
         """Reset rate limit for a client.
 
         Args:
             client_id: Client identifier to reset
         """
-        async with self._lock:
-            if client_id in self._clients:
-                del self._clients[client_id]
+        await self.backend.reset(client_id)
 
     async def cleanup_expired(self) -> int:
         """Remove expired client entries to free memory.
@@ -130,19 +179,9 @@ class RateLimiter:
         Returns:
             Number of entries removed
         """
-        async with self._lock:
-            now = time.time()
-            expired = [
-                cid
-                for cid, info in self._clients.items()
-                if now - info.window_start > self.window_seconds * 2
-                and info.blocked_until < now
-            ]
-            for cid in expired:
-                del self._clients[cid]
-            return len(expired)
-
-    def get_client_status(self, client_id: str) -> dict:
+        return await self.backend.cleanup_expired()
+
+    async def get_client_status(self, client_id: str) -> dict:
         """Get current rate limit status for a client.
 
         Args:
@@ -151,23 +190,49 @@ class RateLimiter:
         Returns:
             Dictionary with rate limit status
         """
-        info = self._clients.get(client_id)
-        if not info:
-            return {
-                "requests": 0,
-                "limit": self.requests_per_window,
-                "window_seconds": self.window_seconds,
-                "blocked": False,
-            }
-
+        tat = await self.backend.peek(client_id)
         now = time.time()
-        return {
-            "requests": info.requests,
+        status_info = {
             "limit": self.requests_per_window,
             "window_seconds": self.window_seconds,
-            "blocked": info.blocked_until > now,
-            "blocked_until": info.blocked_until if info.blocked_until > now else None,
+            "remaining": self.requests_per_window,
+            "blocked": False,
         }
+        if tat is None or tat <= now:
+            return status_info
+
+        blocked = tat - now > self.window_seconds
+        status_info["remaining"] = self._remaining(tat, now)
+        status_info["blocked"] = blocked
+        if blocked:
+            status_info["blocked_until"] = tat - self.window_seconds
+        return status_info
+
+    def _remaining(self, tat: float, now: float) -> int:
+        free = self.window_seconds - max(0.0, tat - now)
+        return max(0, int(free / self._emission_interval + 1e-9))
+
+
+def create_rate_limit_backend(config: SecurityConfig) -> RateLimitBackend:
+    """Create the rate limit backend selected in configuration.
+
+    Args:
+        config: Security configuration
+
+    Returns:
+        RateLimitBackend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = config.rate_limit_backend.lower()
+    if backend == "memory":
+        return InMemoryRateLimitBackend()
+    if backend == "sqlite":
+        return SQLiteRateLimitBackend(config.rate_limit_sqlite_path)
+    if backend == "redis":
+        return RedisRateLimitBackend(url=config.rate_limit_redis_url)
+    raise ValueError(f"Unknown rate limit backend: {config.rate_limit_backend}")
 
 
 # Global rate limiter instance
@@ -191,6 +256,12 @@ def get_rate_limiter(config: SecurityConfig | None = None) -> RateLimiter:
             requests_per_window=config.rate_limit_requests,
             window_seconds=config.rate_limit_window_seconds,
             burst_limit=config.rate_limit_burst,
+            backend=create_rate_limit_backend(config),
+            route_costs=[
+                RouteCost.parse(rule, cost)
+                for rule, cost in config.rate_limit_route_costs.items()
+            ],
+            key_costs=config.rate_limit_key_costs,
         )
     return _rate_limiter
 
@@ -246,7 +317,8 @@ async def check_rate_limit(request: Request) -> None:
     limiter = get_rate_limiter(config)
     client_ip = get_client_ip(request)
 
-    allowed, headers = await limiter.is_allowed(client_ip)
+    cost = limiter.cost_for(request.method, request.url.path)
+    allowed, headers = await limiter.is_allowed(client_ip, cost=cost)
 
     # Always add rate limit headers to response
     # (This requires response middleware, simplified here)
@@ -262,12 +334,17 @@ async def check_rate_limit(request: Request) -> None:
 def rate_limit(
     requests: int | None = None,
     window: int | None = None,
+    cost: float = 1.0,
 ):
     """Decorator for custom rate limiting on specific endpoints.
 
+    Endpoint limiters use the configured backend, so they are shared across
+    workers just like the global limiter.
+
     Args:
         requests: Max requests per window (uses config default if None)
         window: Window in seconds (uses config default if None)
+        cost: Tokens consumed per call
 
     Returns:
         Decorator function
@@ -309,10 +386,16 @@ def rate_limit(
                 _endpoint_limiter = RateLimiter(
                     requests_per_window=requests or config.rate_limit_requests,
                     window_seconds=window or config.rate_limit_window_seconds,
+                    backend=create_rate_limit_backend(config),
+                    key_costs=config.rate_limit_key_costs,
                 )
 
             client_ip = get_client_ip(request)
-            allowed, headers = await _endpoint_limiter.is_allowed(client_ip)
+            allowed, headers = await _endpoint_limiter.is_allowed(
+                client_ip,
+                cost=cost,
+                scope=f"{func.__module__}.{func.__qualname__}",
+            )
 
             if not allowed:
                 raise HTTPException(
@@ -0,0 +1,390 @@
+"""Storage backends for the GCRA rate limiter.
+
+Each backend stores a single float per client key: the *theoretical arrival
+time* (TAT) used by the Generic Cell Rate Algorithm. A backend performs the
+whole check-and-update step atomically, so the limit is shared across every
+worker that talks to the same backend:
+
+- ``InMemoryRateLimitBackend``: process-local, no I/O (single worker)
+- ``SQLiteRateLimitBackend``: file-backed, shared by workers on one node
+- ``RedisRateLimitBackend``: shared by every node, atomic via a Lua script
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import redis.asyncio as aioredis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    aioredis = None  # type: ignore
+
+
+@dataclass(frozen=True)
+class GCRAResult:
+    """Outcome of a single GCRA check.
+
+    Attributes:
+        allowed: Whether the request may proceed
+        tat: Theoretical arrival time stored for the key after the check
+        now: Clock value the decision was made with
+    """
+
+    allowed: bool
+    tat: float
+    now: float
+
+
+def gcra_step(
+    stored_tat: float | None,
+    now: float,
+    increment: float,
+    window: float,
+    penalty: float,
+) -> tuple[bool, float]:
+    """Pure GCRA decision shared by the in-process and SQLite backends.
+
+    Args:
+        stored_tat: Previously stored TAT (None if the key is unknown)
+        now: Current time in seconds
+        increment: Emission interval multiplied by the request cost
+        window: Delay variation tolerance (the bucket capacity in seconds)
+        penalty: Extra seconds to push the TAT out when a request is denied
+
+    Returns:
+        Tuple of (allowed, new TAT to store)
+    """
+    tat = now if stored_tat is None or stored_tat < now else stored_tat
+    new_tat = tat + increment
+    if new_tat - now <= window:
+        return True, new_tat
+    if penalty > 0:
+        return False, max(tat, now + window + penalty - increment)
+    return False, tat
+
+
+class RateLimitBackend(ABC):
+    """Atomic GCRA state store."""
+
+    @abstractmethod
+    async def acquire(
+        self,
+        key: str,
+        increment: float,
+        window: float,
+        penalty: float = 0.0,
+    ) -> GCRAResult:
+        """Check and, if allowed, consume capacity for a key.
+
+        Args:
+            key: Client key
+            increment: Emission interval multiplied by the request cost
+            window: Bucket capacity expressed in seconds
+            penalty: Extra block time applied when the request is denied
+
+        Returns:
+            GCRAResult describing the decision
+        """
+
+    @abstractmethod
+    async def peek(self, key: str) -> float | None:
+        """Return the stored TAT for a key without modifying it."""
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        """Forget all state for a key."""
+
+    @abstractmethod
+    async def cleanup_expired(self) -> int:
+        """Drop keys whose bucket has fully refilled.
+
+        Returns:
+            Number of entries removed
+        """
+
+    async def close(self) -> None:  # noqa: B027
+        """Release backend resources."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Process-local backend.
+
+    The check-and-update step contains no ``await``, so it is atomic with
+    respect to other coroutines on the same event loop without a lock.
+    Expired entries are swept opportunistically every ``gc_interval`` calls.
+    """
+
+    def __init__(self, gc_interval: int = 10_000):
+        """Initialize the backend.
+
+        Args:
+            gc_interval: Number of acquisitions between opportunistic sweeps
+        """
+        self._tats: dict[str, float] = {}
+        self._gc_interval = gc_interval
+        self._calls = 0
+
+    async def acquire(
+        self,
+        key: str,
+        increment: float,
+        window: float,
+        penalty: float = 0.0,
+    ) -> GCRAResult:
+        now = time.time()
+        allowed, tat = gcra_step(self._tats.get(key), now, increment, window, penalty)
+        self._tats[key] = tat
+
+        self._calls += 1
+        if self._calls >= self._gc_interval:
+            self._calls = 0
+            self._sweep(now)
+
+        return GCRAResult(allowed=allowed, tat=tat, now=now)
+
+    async def peek(self, key: str) -> float | None:
+        return self._tats.get(key)
+
+    async def reset(self, key: str) -> None:
+        self._tats.pop(key, None)
+
+    async def cleanup_expired(self) -> int:
+        return self._sweep(time.time())
+
+    def _sweep(self, now: float) -> int:
+        expired = [key for key, tat in self._tats.items() if tat <= now]
+        for key in expired:
+            del self._tats[key]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """SQLite backend shared by all workers on a single node.
+
+    Each acquisition runs in a ``BEGIN IMMEDIATE`` transaction, which takes
+    the database write lock up front so concurrent workers serialize on it.
+    WAL mode keeps readers from blocking the writer.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        busy_timeout_ms: int = 5000,
+        gc_interval: int = 10_000,
+    ):
+        """Initialize the backend.
+
+        Args:
+            db_path: Path to the SQLite database file
+            busy_timeout_ms: How long to wait for the write lock
+            gc_interval: Number of acquisitions between opportunistic sweeps
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._gc_interval = gc_interval
+        self._calls = 0
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=busy_timeout_ms / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits "
+            "(key TEXT PRIMARY KEY, tat REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rate_limits_tat ON rate_limits(tat)"
+        )
+
+    async def acquire(
+        self,
+        key: str,
+        increment: float,
+        window: float,
+        penalty: float = 0.0,
+    ) -> GCRAResult:
+        return await asyncio.to_thread(self._acquire, key, increment, window, penalty)
+
+    async def peek(self, key: str) -> float | None:
+        return await asyncio.to_thread(self._peek, key)
+
+    async def reset(self, key: str) -> None:
+        await asyncio.to_thread(self._reset, key)
+
+    async def cleanup_expired(self) -> int:
+        return await asyncio.to_thread(self._cleanup_expired)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    # Blocking SQLite calls, run in a worker thread so waiting on the write
+    # lock (up to busy_timeout_ms) does not stall the event loop
+
+    def _acquire(
+        self, key: str, increment: float, window: float, penalty: float
+    ) -> GCRAResult:
+        with self._lock:
+            now = time.time()
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT tat FROM rate_limits WHERE key = ?", (key,)
+                ).fetchone()
+                allowed, tat = gcra_step(
+                    row[0] if row else None, now, increment, window, penalty
+                )
+                conn.execute(
+                    "INSERT INTO rate_limits (key, tat) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                    (key, tat),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+            self._calls += 1
+            if self._calls >= self._gc_interval:
+                self._calls = 0
+                conn.execute("DELETE FROM rate_limits WHERE tat <= ?", (now,))
+
+        return GCRAResult(allowed=allowed, tat=tat, now=now)
+
+    def _peek(self, key: str) -> float | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tat FROM rate_limits WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _reset(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    def _cleanup_expired(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM rate_limits WHERE tat <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def _close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# KEYS[1] = bucket key
+# ARGV = increment, window, penalty
+# The server clock is used so that all API nodes agree on "now".
+_GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local increment = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local penalty = tonumber(ARGV[3])
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if tat == nil or tat < now then
+    tat = now
+end
+
+local new_tat = tat + increment
+local allowed = 0
+if new_tat - now <= window then
+    allowed = 1
+    tat = new_tat
+elseif penalty > 0 then
+    tat = math.max(tat, now + window + penalty - increment)
+end
+
+local ttl_ms = math.ceil((tat - now) * 1000)
+if ttl_ms > 0 then
+    redis.call('SET', KEYS[1], tostring(tat), 'PX', ttl_ms)
+end
+return {allowed, tostring(tat), tostring(now)}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Redis backend shared by every API node.
+
+    The GCRA step runs as a single Lua script, so it is atomic on the Redis
+    server. Keys carry a TTL equal to the time until the bucket refills,
+    which makes garbage collection automatic.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "paracle:ratelimit:",
+        client: Any | None = None,
+    ):
+        """Initialize the backend.
+
+        Args:
+            url: Redis connection URL (ignored when ``client`` is given)
+            prefix: Key prefix for rate limit entries
+            client: Pre-configured ``redis.asyncio`` client
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+        """
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise RuntimeError("redis required: pip install redis")
+            client = aioredis.from_url(url)
+        self._redis = client
+        self._prefix = prefix
+        self._script = self._redis.register_script(_GCRA_LUA)
+
+    async def acquire(
+        self,
+        key: str,
+        increment: float,
+        window: float,
+        penalty: float = 0.0,
+    ) -> GCRAResult:
+        allowed, tat, now = await self._script(
+            keys=[self._prefix + key],
+            args=[repr(increment), repr(window), repr(penalty)],
+        )
+        return GCRAResult(allowed=bool(int(allowed)), tat=float(tat), now=float(now))
+
+    async def peek(self, key: str) -> float | None:
+        value = await self._redis.get(self._prefix + key)
+        return float(value) if value is not None else None
+
+    async def reset(self, key: str) -> None:
+        await self._redis.delete(self._prefix + key)
+
+    async def cleanup_expired(self) -> int:
+        # Redis expires keys on its own via PX TTLs.
+        return 0
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def ceil_seconds(value: float) -> int:
+    """Round a duration up to whole seconds for HTTP headers."""
+    return max(0, math.ceil(value))
@@ -7,6 +7,12 @@ and improve response times. Supports TTL, cache invalidation, and hit/miss track
 from paracle_cache.cache_manager import CacheConfig, CacheManager
 from paracle_cache.decorators import cached_llm_call
 from paracle_cache.llm_cache import CacheKey, LLMCache
+from paracle_cache.semantic_cache import (
+    SemanticCache,
+    SemanticCacheConfig,
+    hash_embedding,
+    normalize_prompt,
+)
 from paracle_cache.stats import CacheStats, CacheStatsTracker
 
 __all__ = [
@@ -14,6 +20,10 @@ __all__ = [
     "CacheConfig",
     "LLMCache",
     "CacheKey",
+    "SemanticCache",
+    "SemanticCacheConfig",
+    "hash_embedding",
+    "normalize_prompt",
     "cached_llm_call",
     "CacheStats",
     "CacheStatsTracker",
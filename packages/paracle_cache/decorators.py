@@ -7,13 +7,14 @@ from typing import Any
 from paracle_cache.llm_cache import CacheKey, get_llm_cache
 
 
-def cached_llm_call(ttl: int = 3600):
+def cached_llm_call(ttl: int = 3600, agent: str | None = None):
     """Decorator to cache LLM calls.
 
     Caches based on provider, model, messages, and parameters.
 
     Args:
         ttl: Time to live in seconds (default: 1 hour)
+        agent: Agent name, used to enable the semantic tier per agent
 
     Example:
         ```python
@@ -51,7 +52,7 @@ def cached_llm_call(ttl: int = 3600):
             )
 
             # Try cache first
-            cached_response = cache.get(key)
+            cached_response = cache.get(key, agent=agent)
             if cached_response is not None:
                 return cached_response
 
@@ -66,7 +67,7 @@ def cached_llm_call(ttl: int = 3600):
             )
 
             # Cache response
-            cache.set(key, response, ttl=ttl)
+            cache.set(key, response, ttl=ttl, agent=agent)
 
             return response
 
@@ -91,7 +92,7 @@ def cached_llm_call(ttl: int = 3600):
             )
 
             # Try cache first
-            cached_response = cache.get(key)
+            cached_response = cache.get(key, agent=agent)
             if cached_response is not None:
                 return cached_response
 
@@ -106,7 +107,7 @@ def cached_llm_call(ttl: int = 3600):
             )
 
             # Cache response
-            cache.set(key, response, ttl=ttl)
+            cache.set(key, response, ttl=ttl, agent=agent)
 
             return response
 
@@ -3,10 +3,13 @@
 import hashlib
 import json
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from paracle_cache.cache_manager import get_cache_manager
 
+if TYPE_CHECKING:
+    from paracle_cache.semantic_cache import SemanticCache
+
 
 @dataclass
 class CacheKey:
@@ -40,22 +43,26 @@ class CacheKey:
 class LLMCache:
     """LLM response cache with hit/miss tracking."""
 
-    def __init__(self, ttl: int = 3600):
+    def __init__(self, ttl: int = 3600, semantic: "SemanticCache | None" = None):
         """Initialize LLM cache.
 
         Args:
             ttl: Time to live in seconds (default: 1 hour)
+            semantic: Optional near-duplicate tier consulted on exact misses
         """
         self.ttl = ttl
+        self.semantic = semantic
         self._cache = get_cache_manager()
         self._hits = 0
         self._misses = 0
+        self._semantic_hits = 0
 
-    def get(self, key: CacheKey) -> dict[str, Any] | None:
+    def get(self, key: CacheKey, agent: str | None = None) -> dict[str, Any] | None:
         """Get cached LLM response.
 
         Args:
             key: Cache key
+            agent: Agent making the request (selects the semantic tier)
 
         Returns:
             Cached response or None if not found
@@ -67,6 +74,13 @@ class LLMCache:
             self._hits += 1
             return response
 
+        if self.semantic is not None:
+            hit = self.semantic.lookup(key, agent=agent)
+            if hit is not None:
+                self._hits += 1
+                self._semantic_hits += 1
+                return hit.response
+
         self._misses += 1
         return None
 
@@ -75,6 +89,7 @@ class LLMCache:
         key: CacheKey,
         response: dict[str, Any],
         ttl: int | None = None,
+        agent: str | None = None,
     ) -> bool:
         """Cache LLM response.
 
@@ -82,11 +97,14 @@ class LLMCache:
             key: Cache key
             response: LLM response to cache
             ttl: Time to live (None = use default)
+            agent: Agent that made the request (selects the semantic tier)
 
         Returns:
             True if cached successfully
         """
         key_str = key.to_string()
+        if self.semantic is not None:
+            self.semantic.store(key, response, agent=agent, ttl=ttl or self.ttl)
         return self._cache.set(key_str, response, ttl or self.ttl)
 
     def invalidate(self, key: CacheKey) -> bool:
@@ -99,6 +117,8 @@ class LLMCache:
             True if invalidated
         """
         key_str = key.to_string()
+        if self.semantic is not None:
+            self.semantic.invalidate(key)
         return self._cache.delete(key_str)
 
     def clear(self) -> int:
@@ -107,6 +127,8 @@ class LLMCache:
         Returns:
             Number of entries cleared
         """
+        if self.semantic is not None:
+            self.semantic.clear()
         return self._cache.clear()
 
     def hit_rate(self) -> float | None:
@@ -128,13 +150,17 @@ class LLMCache:
         """
         cache_stats = self._cache.stats()
 
-        return {
+        stats = {
             **cache_stats,
             "hits": self._hits,
             "misses": self._misses,
             "total_requests": self._hits + self._misses,
             "hit_rate": self.hit_rate(),
         }
+        if self.semantic is not None:
+            stats["semantic_hits"] = self._semantic_hits
+            stats["semantic"] = self.semantic.stats()
+        return stats
 
 
 # Global LLM cache instance
@@ -144,6 +170,9 @@ _llm_cache: LLMCache | None = None
 def get_llm_cache(ttl: int = 3600) -> LLMCache:
     """Get global LLM cache instance.
 
+    The semantic tier is attached when ``PARACLE_SEMANTIC_CACHE_ENABLED``
+    is set (see ``SemanticCacheConfig.from_env``).
+
     Args:
         ttl: Time to live in seconds (only used on first call)
 
@@ -152,5 +181,9 @@ def get_llm_cache(ttl: int = 3600) -> LLMCache:
     """
     global _llm_cache
     if _llm_cache is None:
-        _llm_cache = LLMCache(ttl=ttl)
+        from paracle_cache.semantic_cache import SemanticCache, SemanticCacheConfig
+
+        config = SemanticCacheConfig.from_env()
+        semantic = SemanticCache(config) if config.enabled else None
+        _llm_cache = LLMCache(ttl=ttl, semantic=semantic)
     return _llm_cache
@@ -0,0 +1,450 @@
+"""Semantic (near-duplicate) tier for the LLM response cache.
+
+The exact cache only hits when the whole request hashes identically, so
+prompts that differ in whitespace or wording always miss. This tier
+embeds the last user turn and looks up its nearest cached neighbour
+within a scope of requests that must match exactly: provider, model,
+system prompt, earlier turns, max_tokens and a temperature bucket. A
+cached response is returned when the cosine similarity reaches the
+configured threshold.
+
+The index is a small in-memory LRU per scope; lookups first try the
+normalized prompt text (O(1)) and then scan the scope's vectors.
+"""
+
+import hashlib
+import itertools
+import json
+import math
+import operator
+import random
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from paracle_cache.llm_cache import CacheKey
+
+Embedder = Callable[[str], list[float]]
+
+_WHITESPACE = re.compile(r"\s+")
+_WORD = re.compile(r"\w+")
+_TRAILING_PUNCTUATION = " .?!;:"
+
+
+def normalize_prompt(text: str) -> str:
+    """Normalize a prompt for comparison.
+
+    Lowercases, collapses whitespace and strips trailing punctuation, so
+    ``"What is  Paracle?"`` and ``"what is paracle"`` are the same prompt.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Normalized prompt
+    """
+    return _WHITESPACE.sub(" ", text).strip().lower().rstrip(_TRAILING_PUNCTUATION)
+
+
+def hash_embedding(text: str, dimensions: int = 256) -> list[float]:
+    """Embed text by hashing its words and word pairs.
+
+    A dependency-free fallback embedder: it catches reordered and lightly
+    edited prompts but not paraphrases. Pass a real embedding model to
+    ``SemanticCache`` for those.
+
+    Args:
+        text: Text to embed
+        dimensions: Vector size
+
+    Returns:
+        L2-normalized vector
+    """
+    words = _WORD.findall(text.lower())
+    features = words + [f"{a} {b}" for a, b in itertools.pairwise(words)]
+    vector = [0.0] * dimensions
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        vector[value % dimensions] += 1.0 if value >> 63 else -1.0
+    return _normalize(vector)
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return vector
+    return [x / norm for x in vector]
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()[:16]
+
+
+@dataclass
+class SemanticCacheConfig:
+    """Semantic cache configuration.
+
+    The tier is opt-in: it does nothing unless ``enabled`` is set, and
+    ``agents`` / ``excluded_agents`` restrict it further to the agents
+    whose answers are safe to reuse (e.g. FAQ-style agents).
+    """
+
+    enabled: bool = False
+    similarity_threshold: float = 0.92
+    max_entries_per_scope: int = 1000
+    ttl: int = 3600  # seconds
+    temperature_bucket: float = 0.25  # temperatures rounded to this step
+    max_temperature: float = 1.0  # hotter requests are never served semantically
+    agents: set[str] | None = None  # None = all agents
+    excluded_agents: set[str] = field(default_factory=set)
+    sample_rate: float = 0.0  # fraction of semantic hits kept for review
+    max_samples: int = 100
+
+    @classmethod
+    def from_env(cls) -> "SemanticCacheConfig":
+        """Create config from environment variables."""
+        import os
+
+        def agent_set(name: str) -> set[str]:
+            return {a.strip() for a in os.getenv(name, "").split(",") if a.strip()}
+
+        return cls(
+            enabled=os.getenv("PARACLE_SEMANTIC_CACHE_ENABLED", "false").lower()
+            == "true",
+            similarity_threshold=float(
+                os.getenv("PARACLE_SEMANTIC_CACHE_THRESHOLD", "0.92")
+            ),
+            max_entries_per_scope=int(
+                os.getenv("PARACLE_SEMANTIC_CACHE_MAX_ENTRIES", "1000")
+            ),
+            ttl=int(os.getenv("PARACLE_SEMANTIC_CACHE_TTL", "3600")),
+            agents=agent_set("PARACLE_SEMANTIC_CACHE_AGENTS") or None,
+            excluded_agents=agent_set("PARACLE_SEMANTIC_CACHE_EXCLUDED_AGENTS"),
+            sample_rate=float(os.getenv("PARACLE_SEMANTIC_CACHE_SAMPLE_RATE", "0")),
+        )
+
+
+@dataclass
+class SemanticHit:
+    """Response served by the semantic tier."""
+
+    response: dict[str, Any]
+    similarity: float
+    prompt: str
+    matched_prompt: str
+
+
+@dataclass
+class HitSample:
+    """A sampled semantic hit, kept for quality review."""
+
+    sample_id: str
+    agent: str | None
+    prompt: str
+    matched_prompt: str
+    similarity: float
+    response: dict[str, Any]
+    created_at: datetime = field(default_factory=datetime.now)
+    accepted: bool | None = None  # set by record_feedback
+
+
+@dataclass
+class _Entry:
+    prompt: str
+    vector: list[float]
+    response: dict[str, Any]
+    expires_at: float
+
+
+class SemanticCache:
+    """Near-duplicate LLM response cache.
+
+    Usage:
+        model = SentenceTransformer("all-MiniLM-L6-v2")
+        semantic = SemanticCache(
+            SemanticCacheConfig(enabled=True, agents={"faq"}),
+            embedder=lambda text: model.encode(text).tolist(),
+        )
+        cache = LLMCache(semantic=semantic)
+        response = cache.get(key, agent="faq")
+    """
+
+    def __init__(
+        self,
+        config: SemanticCacheConfig | None = None,
+        embedder: Embedder | None = None,
+    ):
+        """Initialize semantic cache.
+
+        Args:
+            config: Configuration. If None, loads from environment.
+            embedder: Synchronous function mapping one text to a vector;
+                vectors are normalized here. Defaults to ``hash_embedding``.
+                Async services such as ``EmbeddingService.embed`` cannot be
+                passed directly since lookups run inside ``LLMCache.get``.
+        """
+        self.config = config or SemanticCacheConfig.from_env()
+        self._embed = embedder or hash_embedding
+        self._lock = threading.Lock()
+        # scope -> normalized prompt -> entry, least recently used first
+        self._scopes: dict[tuple, OrderedDict[str, _Entry]] = {}
+        self._samples: deque[HitSample] = deque(maxlen=self.config.max_samples)
+        self._random = random.Random()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._accepted = 0
+        self._rejected = 0
+
+    def is_enabled_for(self, agent: str | None) -> bool:
+        """Check whether the semantic tier serves an agent.
+
+        Args:
+            agent: Agent name (None for calls made outside an agent)
+
+        Returns:
+            True if lookups and stores are active for the agent
+        """
+        if not self.config.enabled:
+            return False
+        if agent is None:
+            return self.config.agents is None
+        if agent in self.config.excluded_agents:
+            return False
+        return self.config.agents is None or agent in self.config.agents
+
+    def _split(self, key: CacheKey) -> tuple[tuple, str] | None:
+        """Split a request into its exact-match scope and last user prompt."""
+        if key.temperature > self.config.max_temperature:
+            return None
+        messages = key.messages
+        if not messages or messages[-1].get("role") != "user":
+            return None
+        last = len(messages) - 1
+
+        system = [m for m in messages[:last] if m.get("role") == "system"]
+        history = [m for m in messages[:last] if m.get("role") != "system"]
+        bucket = self.config.temperature_bucket
+        temperature = round(key.temperature / bucket) if bucket > 0 else key.temperature
+        scope = (
+            key.provider,
+            key.model,
+            _digest(system),
+            _digest(history),
+            key.max_tokens,
+            temperature,
+        )
+        return scope, str(messages[last].get("content", ""))
+
+    def lookup(self, key: CacheKey, agent: str | None = None) -> SemanticHit | None:
+        """Find a cached response for a near-duplicate request.
+
+        Args:
+            key: Request key
+            agent: Agent making the request
+
+        Returns:
+            Hit with the cached response, or None
+        """
+        if not self.is_enabled_for(agent):
+            return None
+        split = self._split(key)
+        if split is None:
+            return None
+        scope, prompt = split
+        normalized = normalize_prompt(prompt)
+
+        with self._lock:
+            entries = self._scopes.get(scope)
+            entry = entries.get(normalized) if entries else None
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del entries[normalized]
+                entry = None
+            if entry is not None:
+                entries.move_to_end(normalized)
+                hit = SemanticHit(entry.response, 1.0, prompt, entry.prompt)
+            elif not entries:
+                hit = None
+            else:
+                hit = self._nearest(entries, normalized, prompt)
+
+            if hit is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            if self.config.sample_rate and (
+                self._random.random() < self.config.sample_rate
+            ):
+                self._samples.append(
+                    HitSample(
+                        sample_id=uuid.uuid4().hex,
+                        agent=agent,
+                        prompt=hit.prompt,
+                        matched_prompt=hit.matched_prompt,
+                        similarity=hit.similarity,
+                        response=hit.response,
+                    )
+                )
+            return hit
+
+    def _nearest(
+        self, entries: OrderedDict[str, _Entry], normalized: str, prompt: str
+    ) -> SemanticHit | None:
+        """Scan a scope for the most similar live entry (lock held)."""
+        query = _normalize(list(self._embed(normalized)))
+        now = time.monotonic()
+        best_key, best_score = None, self.config.similarity_threshold
+        expired = []
+        for entry_key, entry in entries.items():
+            if entry.expires_at <= now:
+                expired.append(entry_key)
+                continue
+            score = sum(map(operator.mul, query, entry.vector))
+            if score >= best_score:
+                best_key, best_score = entry_key, score
+        for entry_key in expired:
+            del entries[entry_key]
+        if best_key is None:
+            return None
+        entries.move_to_end(best_key)
+        entry = entries[best_key]
+        return SemanticHit(entry.response, best_score, prompt, entry.prompt)
+
+    def store(
+        self,
+        key: CacheKey,
+        response: dict[str, Any],
+        agent: str | None = None,
+        ttl: int | None = None,
+    ) -> bool:
+        """Add a response to the semantic index.
+
+        Args:
+            key: Request key
+            response: LLM response
+            agent: Agent that made the request
+            ttl: Time to live in seconds (None = use config)
+
+        Returns:
+            True if the response was indexed
+        """
+        if not self.is_enabled_for(agent):
+            return False
+        split = self._split(key)
+        if split is None:
+            return False
+        scope, prompt = split
+        normalized = normalize_prompt(prompt)
+        vector = _normalize(list(self._embed(normalized)))
+        expires_at = time.monotonic() + (ttl or self.config.ttl)
+
+        with self._lock:
+            entries = self._scopes.setdefault(scope, OrderedDict())
+            entries.pop(normalized, None)
+            entries[normalized] = _Entry(prompt, vector, response, expires_at)
+            while len(entries) > self.config.max_entries_per_scope:
+                entries.popitem(last=False)
+                self._evictions += 1
+        return True
+
+    def invalidate(self, key: CacheKey) -> bool:
+        """Remove the entry stored for a request's prompt.
+
+        Args:
+            key: Request key
+
+        Returns:
+            True if an entry was removed
+        """
+        split = self._split(key)
+        if split is None:
+            return False
+        scope, prompt = split
+        with self._lock:
+            entries = self._scopes.get(scope)
+            if not entries:
+                return False
+            return entries.pop(normalize_prompt(prompt), None) is not None
+
+    def clear(self) -> int:
+        """Clear the index.
+
+        Returns:
+            Number of entries cleared
+        """
+        with self._lock:
+            count = sum(len(entries) for entries in self._scopes.values())
+            self._scopes.clear()
+            return count
+
+    def samples(self) -> list[HitSample]:
+        """Return sampled hits, oldest first."""
+        with self._lock:
+            return list(self._samples)
+
+    def record_feedback(self, sample_id: str, accepted: bool) -> bool:
+        """Record whether a sampled hit answered its prompt correctly.
+
+        Args:
+            sample_id: ID of the sample
+            accepted: True if the cached response was a good answer
+
+        Returns:
+            True if the sample was found
+        """
+        with self._lock:
+            for sample in self._samples:
+                if sample.sample_id == sample_id:
+                    if sample.accepted is not None:
+                        if sample.accepted:
+                            self._accepted -= 1
+                        else:
+                            self._rejected -= 1
+                    sample.accepted = accepted
+                    if accepted:
+                        self._accepted += 1
+                    else:
+                        self._rejected += 1
+                    return True
+        return False
+
+    def precision(self) -> float | None:
+        """Share of reviewed samples judged correct.
+
+        Returns:
+            Precision (0.0-1.0) or None if nothing was reviewed
+        """
+        reviewed = self._accepted + self._rejected
+        if reviewed == 0:
+            return None
+        return self._accepted / reviewed
+
+    def stats(self) -> dict[str, Any]:
+        """Get semantic cache statistics.
+
+        Returns:
+            Dictionary with entries, hits, misses, evictions and precision
+        """
+        with self._lock:
+            entries = sum(len(scope) for scope in self._scopes.values())
+            scopes = len(self._scopes)
+            samples = len(self._samples)
+        total = self._hits + self._misses
+        return {
+            "enabled": self.config.enabled,
+            "entries": entries,
+            "scopes": scopes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else None,
+            "evictions": self._evictions,
+            "samples": samples,
+            "precision": self.precision(),
+        }
@@ -1392,6 +1392,86 @@ class APIClient:
             )
             return self._handle_response(response)
 
+    # =========================================================================
+    # Observability - Profiling Endpoints
+    # =========================================================================
+
+    def profiling_stats(self) -> dict[str, Any]:
+        """Get aggregated profiler statistics.
+
+        Returns:
+            ProfileStatsResponse as dict
+        """
+        with httpx.Client(timeout=self.timeout) as client:
+            response = client.get(
+                f"{self.base_url}/api/profiling/stats",
+                headers=self._get_headers(),
+            )
+            return self._handle_response(response)
+
+    def sampler_start(
+        self, interval: float | None = None, reset: bool = True
+    ) -> dict[str, Any]:
+        """Start the stack sampler in the API process.
+
+        Args:
+            interval: Seconds between samples
+            reset: Discard previous samples
+
+        Returns:
+            SamplerStatusResponse as dict
+        """
+        with httpx.Client(timeout=self.timeout) as client:
+            response = client.post(
+                f"{self.base_url}/api/profiling/sampler/start",
+                headers=self._get_headers(),
+                json={"interval": interval, "reset": reset},
+            )
+            return self._handle_response(response)
+
+    def sampler_stop(self) -> dict[str, Any]:
+        """Stop the stack sampler.
+
+        Returns:
+            SamplerStatusResponse as dict
+        """
+        with httpx.Client(timeout=self.timeout) as client:
+            response = client.post(
+                f"{self.base_url}/api/profiling/sampler/stop",
+                headers=self._get_headers(),
+            )
+            return self._handle_response(response)
+
+    def sampler_status(self) -> dict[str, Any]:
+        """Get stack sampler state.
+
+        Returns:
+            SamplerStatusResponse as dict
+        """
+        with httpx.Client(timeout=self.timeout) as client:
+            response = client.get(
+                f"{self.base_url}/api/profiling/sampler/status",
+                headers=self._get_headers(),
+            )
+            return self._handle_response(response)
+
+    def sampler_export(self, format: str = "collapsed") -> dict[str, Any]:
+        """Export stack samples.
+
+        Args:
+            format: Export format (collapsed, speedscope)
+
+        Returns:
+            SamplerExportResponse as dict
+        """
+        with httpx.Client(timeout=self.timeout) as client:
+            response = client.get(
+                f"{self.base_url}/api/profiling/sampler/export",
+                headers=self._get_headers(),
+                params={"format": format},
+            )
+            return self._handle_response(response)
+
 
 class APIError(Exception):
     """API request error."""
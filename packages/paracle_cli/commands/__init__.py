@@ -14,47 +14,37 @@ This module contains all CLI command groups:
 - audit: Audit trail management and integrity verification
 - compliance: ISO 42001 compliance reporting
 - serve: API server command
+
+Each command lives in the submodule of the same name (for example
+``paracle_cli.commands.agents.agents``). Submodules are not imported here:
+the CLI loads them on demand (see ``paracle_cli.lazy_group``), so importing
+one command does not drag in the dependencies of every other one.
 """
 
-from paracle_cli.commands.agents import agents
-from paracle_cli.commands.audit import audit
-from paracle_cli.commands.cache import cache
-from paracle_cli.commands.compliance import compliance
-from paracle_cli.commands.governance import governance
-from paracle_cli.commands.groups import groups
-from paracle_cli.commands.ide import ide
-from paracle_cli.commands.logs import logs
-from paracle_cli.commands.meta import meta
-from paracle_cli.commands.parac import init, parac, session, status, sync, validate
-from paracle_cli.commands.pool import pool
-from paracle_cli.commands.providers import providers
-from paracle_cli.commands.runs import runs_group
-from paracle_cli.commands.serve import serve
-from paracle_cli.commands.tools import tools
-from paracle_cli.commands.workflow import workflow
+import importlib
+from typing import Any
+
+# Top-level commands whose name differs from their submodule
+_LAZY_ATTRS = {
+    "init": "parac",
+    "session": "parac",
+    "status": "parac",
+    "sync": "parac",
+    "runs_group": "runs",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_ATTRS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+
 
 __all__ = [
-    # Command groups
-    "agents",
-    "audit",
-    "cache",
-    "compliance",
-    "governance",
-    "groups",
-    "ide",
-    "logs",
-    "meta",
-    "parac",
-    "pool",
-    "providers",
-    "runs_group",
-    "serve",
-    "tools",
-    "workflow",
-    # Top-level governance commands
     "init",
+    "runs_group",
     "session",
     "status",
     "sync",
-    "validate",
 ]
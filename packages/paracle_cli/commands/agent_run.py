@@ -7,6 +7,7 @@ from typing import Any
 import click
 from paracle_domain.models import WorkflowStep
 from paracle_orchestration.agent_executor import AgentExecutor
+from paracle_runs import record_agent_run
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -559,8 +560,9 @@ async def _execute_agent_task(
         task_id = progress.add_task(f"[cyan]Executing {agent_name}...", total=None)
 
         try:
+            # Recorded so the run can be replayed with `paracle runs replay`
             result = await asyncio.wait_for(
-                executor.execute_step(step, inputs), timeout=timeout
+                record_agent_run(executor, step, inputs), timeout=timeout
             )
 
             progress.update(task_id, completed=True)
@@ -7,6 +7,7 @@ Commands:
     paracle benchmark list    - List available benchmarks
     paracle benchmark compare - Compare results with baseline
     paracle benchmark save    - Save results as baseline
+    paracle benchmark imports - Check CLI import-time budget
 """
 
 import json
@@ -374,3 +375,67 @@ def save_baseline(input: str, output: str):
     shutil.copy(input_path, output_path)
 
     click.echo(f"[OK] Saved baseline to {output_path}")
+
+
+@benchmark.command("imports")
+@click.option(
+    "--module",
+    "-m",
+    default="paracle_cli.main",
+    help="Module to measure",
+)
+@click.option(
+    "--budget",
+    type=float,
+    default=None,
+    help="Import budget in milliseconds (default: CLI budget)",
+)
+@click.option(
+    "--runs",
+    type=int,
+    default=3,
+    help="Interpreter launches (fastest is kept)",
+)
+@click.option(
+    "--json",
+    "json_output",
+    is_flag=True,
+    help="Output as JSON",
+)
+def imports(module: str, budget: float | None, runs: int, json_output: bool):
+    """Check import-time budget (python -X importtime).
+
+    Exits with code 1 when the module is over budget or imports a
+    forbidden heavy dependency.
+
+    Example:
+        paracle benchmark imports
+        paracle benchmark imports -m paracle_api.main --budget 800
+    """
+    from paracle_profiling.import_time import (
+        CLI_FORBIDDEN_IMPORTS,
+        CLI_IMPORT_BUDGET_MS,
+        check_import_budget,
+    )
+
+    is_cli = module == "paracle_cli.main"
+    result = check_import_budget(
+        module,
+        budget_ms=budget if budget is not None else CLI_IMPORT_BUDGET_MS,
+        forbidden=CLI_FORBIDDEN_IMPORTS if is_cli else (),
+        runs=runs,
+    )
+
+    if json_output:
+        data = result.report.to_dict()
+        data.update(
+            budget_ms=result.budget_ms,
+            forbidden=result.forbidden,
+            passed=result.passed,
+        )
+        click.echo(json.dumps(data, indent=2))
+    else:
+        click.echo(result.format())
+
+    if not result.passed:
+        sys.exit(1)
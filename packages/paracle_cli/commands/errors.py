@@ -163,11 +163,7 @@ def clear_errors() -> None:
         from paracle_observability import get_error_registry
 
         registry = get_error_registry()
-        count = len(registry.errors)
-        registry.errors.clear()
-        registry.error_counts.clear()
-        registry.component_errors.clear()
-        registry._error_index.clear()
+        count = registry.clear()
 
         console.print(f"[green]✓[/green] Cleared {count} errors from registry")
 
@@ -720,7 +720,19 @@ def ide_sync(
     type=click.Path(),
     help="Custom output directory",
 )
-def ide_build(target: str, copy: bool, output: str | None) -> None:
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Re-render every output instead of only the changed ones",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep rebuilding when .parac/ files change (Ctrl+C to stop)",
+)
+def ide_build(
+    target: str, copy: bool, output: str | None, full: bool, watch: bool
+) -> None:
     """Build native agent files for IDEs.
 
     Compiles .parac/agents/ to IDE-native formats:
@@ -741,10 +753,14 @@ def ide_build(target: str, copy: bool, output: str | None) -> None:
     Generated files reference Paracle MCP tools via:
         paracle mcp serve --stdio
 
+    Builds are incremental: only outputs whose inputs changed are
+    re-rendered, and files whose content is unchanged are not rewritten.
+
     Examples:
         paracle ide build --target vscode
         paracle ide build --target all --copy
         paracle ide build --target claude --no-copy --output ./custom/
+        paracle ide build --target all --watch
     """
     parac_root = get_parac_root_or_exit()
 
@@ -763,18 +779,47 @@ def ide_build(target: str, copy: bool, output: str | None) -> None:
     console.print(f"\n[bold]Building agents for {target}...[/bold]\n")
 
     try:
-        result = compiler.build(target, output_dir=output_dir)
+        result = compiler.build(target, output_dir=output_dir, incremental=not full)
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         raise SystemExit(1)
 
-    # Display generated files
-    for file_path in result["files"]:
+    _report_build(compiler, target, result, copy)
+
+    if watch:
+        import threading
+
+        console.print(
+            "\n[bold]Watching .parac/ for changes...[/bold] [dim](Ctrl+C to stop)[/dim]"
+        )
+        stop = threading.Event()
+        try:
+            compiler.watch(
+                target,
+                output_dir=output_dir,
+                on_build=lambda r: _report_build(compiler, target, r, copy),
+                stop_event=stop,
+            )
+        except KeyboardInterrupt:
+            stop.set()
+            console.print("\n[dim]Stopped watching.[/dim]")
+        return
+
+    # Hint about MCP
+    console.print(
+        "\n[dim]Tip: Start MCP server for tool access: paracle mcp serve --stdio[/dim]"
+    )
+
+
+def _report_build(compiler, target: str, result: dict, copy: bool) -> None:
+    """Print the outcome of an IDE build and copy outputs if requested."""
+    for file_path in result["written"]:
         console.print(f"  [green]OK[/green] Generated: {Path(file_path).name}")
+    for file_path in result["removed"]:
+        console.print(f"  [yellow]-[/yellow] Removed: {Path(file_path).name}")
 
     # Copy to destinations if requested
     if copy:
-        console.print()
         try:
             copied = compiler.copy_to_destinations(target)
             for dest in copied:
@@ -784,12 +829,8 @@ def ide_build(target: str, copy: bool, output: str | None) -> None:
 
     # Summary
     console.print(
-        f"\n[green]OK[/green] Built {len(result['files'])} file(s) for {target}"
-    )
-
-    # Hint about MCP
-    console.print(
-        "\n[dim]Tip: Start MCP server for tool access: paracle mcp serve --stdio[/dim]"
+        f"\n[green]OK[/green] Built {len(result['files'])} file(s) for {target} "
+        f"({len(result['written'])} written, {len(result['unchanged'])} unchanged)"
     )
 
 
@@ -8,6 +8,7 @@ Provides commands for:
 - Viewing traces
 - Managing alerts
 - Exporting observability data
+- Profiling a running API process (stack sampler)
 """
 
 import json
@@ -330,7 +331,7 @@ def _fallback_alerts_silence(fingerprint: str, duration: int) -> dict:
 
 @click.group()
 def observability():
-    """Observability commands (metrics, tracing, alerts)."""
+    """Observability commands (metrics, tracing, alerts, profiling)."""
     pass
 
 
@@ -776,6 +777,188 @@ def alerts_evaluate(as_json: bool):
         raise SystemExit(1)
 
 
+# =============================================================================
+# Profiling Commands
+# =============================================================================
+
+
+def _api_profile_stats(client: APIClient) -> dict:
+    """Get profiler statistics via API."""
+    return client.profiling_stats()
+
+
+def _fallback_profile_stats() -> dict:
+    """Get profiler statistics of this process."""
+    from paracle_profiling import get_profile_stats
+
+    stats = get_profile_stats()
+    return {"stats": stats, "total": len(stats)}
+
+
+def _fallback_sampler_unavailable(*args, **kwargs) -> dict:
+    """The sampler profiles the API process, so it needs the API."""
+    raise RuntimeError(
+        "The stack sampler profiles the API server process; "
+        "start it with 'paracle serve' first"
+    )
+
+
+@observability.group()
+def profile():
+    """Profile the running API server (stats and stack sampling)."""
+    pass
+
+
+@profile.command("stats")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def profile_stats(as_json: bool):
+    """Show aggregated timings of profiled functions."""
+    try:
+        result = use_api_or_fallback(_api_profile_stats, _fallback_profile_stats)
+
+        if as_json:
+            click.echo(json.dumps(result, indent=2, default=str))
+            return
+
+        stats = result.get("stats", {})
+        if not stats:
+            console.print("[yellow]No profiling data[/yellow]")
+            return
+
+        table = Table(title="Profiled Functions")
+        table.add_column("Name", style="cyan")
+        table.add_column("Calls", justify="right")
+        table.add_column("Avg", justify="right", style="green")
+        table.add_column("P95", justify="right", style="yellow")
+        table.add_column("P99", justify="right", style="red")
+        table.add_column("Total", justify="right")
+
+        rows = sorted(stats.values(), key=lambda s: s["total_time"], reverse=True)
+        for s in rows:
+            table.add_row(
+                s["name"],
+                str(s["calls"]),
+                f"{s['avg_time'] * 1000:.2f}ms",
+                f"{s['p95_time'] * 1000:.2f}ms",
+                f"{s['p99_time'] * 1000:.2f}ms",
+                f"{s['total_time']:.3f}s",
+            )
+
+        console.print(table)
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+
+@profile.command("start")
+@click.option(
+    "--interval",
+    type=float,
+    default=None,
+    help="Seconds between samples (default: 0.01)",
+)
+@click.option("--keep", is_flag=True, help="Keep samples from the previous run")
+def profile_start(interval: float | None, keep: bool):
+    """Start the stack sampler in the API server.
+
+    Examples:
+        paracle observability profile start
+        paracle observability profile start --interval 0.005
+    """
+    try:
+        result = use_api_or_fallback(
+            lambda client: client.sampler_start(interval=interval, reset=not keep),
+            _fallback_sampler_unavailable,
+        )
+        console.print(
+            f"[green]Stack sampler running[/green] "
+            f"(interval {result['interval'] * 1000:.1f}ms)"
+        )
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+
+@profile.command("stop")
+def profile_stop():
+    """Stop the stack sampler (samples are kept for export)."""
+    try:
+        result = use_api_or_fallback(
+            lambda client: client.sampler_stop(),
+            _fallback_sampler_unavailable,
+        )
+        console.print(
+            f"[green]Stack sampler stopped[/green] "
+            f"({result['samples']} samples, "
+            f"{result['distinct_stacks']} distinct stacks)"
+        )
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+
+@profile.command("status")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def profile_status(as_json: bool):
+    """Show stack sampler state."""
+    try:
+        result = use_api_or_fallback(
+            lambda client: client.sampler_status(),
+            _fallback_sampler_unavailable,
+        )
+
+        if as_json:
+            click.echo(json.dumps(result, indent=2))
+            return
+
+        state = "[green]running[/green]" if result["running"] else "[dim]stopped[/dim]"
+        console.print(f"Sampler:   {state}")
+        console.print(f"Interval:  {result['interval'] * 1000:.1f}ms")
+        console.print(f"Samples:   {result['samples']}")
+        console.print(f"Stacks:    {result['distinct_stacks']}")
+        console.print(f"Dropped:   {result['dropped']}")
+        console.print(f"Elapsed:   {result['elapsed_seconds']:.1f}s")
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+
+@profile.command("export")
+@click.option(
+    "--format",
+    type=click.Choice(["collapsed", "speedscope"]),
+    default="collapsed",
+    help="Export format",
+)
+@click.option("--output", "-o", required=True, help="Output file")
+def profile_export(format: str, output: str):
+    """Export stack samples for flamegraph tools.
+
+    Examples:
+        paracle observability profile export -o api.folded
+        paracle observability profile export --format speedscope -o api.speedscope.json
+    """
+    try:
+        result = use_api_or_fallback(
+            lambda client: client.sampler_export(format=format),
+            _fallback_sampler_unavailable,
+        )
+
+        content = result.get("content", "")
+        if not isinstance(content, str):
+            content = json.dumps(content)
+        Path(output).write_text(content)
+        console.print(f"[green]Profile exported to {output}[/green]")
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -437,6 +437,79 @@ def validate(fix: bool) -> None:
     use_api_or_fallback(_validate_via_api, _validate_direct, fix)
 
 
+# =============================================================================
+# COMPILE Command
+# =============================================================================
+
+
+@click.command("compile")
+@click.option("--force", is_flag=True, help="Recompile even if the cache is fresh")
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Only report whether the cache is fresh (exit 1 if stale)",
+)
+def compile_workspace(force: bool, check: bool) -> None:
+    """Compile .parac/ into a binary cache for fast startup.
+
+    The cache is rebuilt automatically when files change; run this after
+    pulling changes to pay the parsing cost up front.
+    """
+    import time
+
+    from paracle_core.parac.compiled import (
+        cache_path,
+        load_workspace,
+        read_workspace,
+        workspace_tree_hash,
+    )
+
+    parac_root = get_parac_root_or_exit()
+    path = cache_path(parac_root)
+
+    tree_hash = workspace_tree_hash(parac_root)
+    fresh = read_workspace(path, tree_hash) is not None
+
+    if check:
+        if fresh:
+            console.print(f"[green]OK[/green] Workspace cache is fresh: {path}")
+            return
+        console.print(f"[yellow]Stale[/yellow] Workspace cache needs compiling: {path}")
+        raise SystemExit(1)
+
+    if fresh and not force:
+        console.print(f"[green]OK[/green] Workspace cache is up to date: {path}")
+        return
+
+    start = time.perf_counter()
+    workspace = load_workspace(parac_root, rebuild=True)
+    elapsed = time.perf_counter() - start
+
+    if not path.exists():
+        console.print(f"[red]Error:[/red] Could not write {path}")
+        raise SystemExit(1)
+
+    table = Table(title="Compiled Workspace")
+    table.add_column("Artifact", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_row("Agents", str(len(workspace.agents)))
+    table.add_row("Skills", str(len(workspace.skills)))
+    table.add_row("Workflows", str(len(workspace.workflows)))
+    table.add_row("Policies", str(len(workspace.policies)))
+    table.add_row("Documents", str(len(workspace.documents)))
+    table.add_row("Texts", str(len(workspace.texts)))
+    console.print(table)
+
+    for rel_path, error in sorted(workspace.errors.items()):
+        console.print(f"[yellow]Warning:[/yellow] {rel_path}: {error}")
+
+    size_kb = path.stat().st_size / 1024
+    console.print(
+        f"\n[green]OK[/green] Compiled in {elapsed * 1000:.0f} ms "
+        f"-> {path} ({size_kb:.0f} KB, tree {workspace.tree_hash[:12]})"
+    )
+
+
 # =============================================================================
 # SESSION Commands
 # =============================================================================
@@ -2426,4 +2499,5 @@ def parac() -> None:
 parac.add_command(status, "status")
 parac.add_command(sync, "sync")
 parac.add_command(validate, "validate")
+parac.add_command(compile_workspace, "compile")
 parac.add_command(session, "session")
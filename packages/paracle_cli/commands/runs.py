@@ -13,6 +13,16 @@ from rich.table import Table
 
 console = Console()
 
+_RELATIVE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def _parse_since(value: str) -> datetime:
+    """Parse an absolute (YYYY-MM-DD) or relative (30m, 12h, 7d, 2w) date."""
+    unit = _RELATIVE_UNITS.get(value[-1:].lower())
+    if unit and value[:-1].isdigit():
+        return datetime.now() - timedelta(**{unit: int(value[:-1])})
+    return datetime.strptime(value, "%Y-%m-%d")
+
 
 @click.group(name="runs")
 def runs_group():
@@ -35,9 +45,14 @@ def runs_group():
     type=click.Choice([s.value for s in RunStatus]),
     help="Filter by status",
 )
-@click.option("--since", help="Filter runs since date (YYYY-MM-DD)")
+@click.option(
+    "--since", help="Filter runs since date (YYYY-MM-DD) or age (30m, 12h, 7d)"
+)
+@click.option(
+    "--min-duration", type=float, help="Only runs that took at least N seconds"
+)
 @click.option("--limit", default=20, help="Maximum number of runs to list")
-def list_runs(run_type, agent_id, workflow_id, status, since, limit):
+def list_runs(run_type, agent_id, workflow_id, status, since, min_duration, limit):
     """List execution runs."""
     storage = get_run_storage()
 
@@ -45,9 +60,9 @@ def list_runs(run_type, agent_id, workflow_id, status, since, limit):
     since_dt = None
     if since:
         try:
-            since_dt = datetime.strptime(since, "%Y-%m-%d")
+            since_dt = _parse_since(since)
         except ValueError:
-            rprint("[red]Invalid date format. Use YYYY-MM-DD[/red]")
+            rprint("[red]Invalid date format. Use YYYY-MM-DD or 7d/12h/30m[/red]")
             return
 
     # Create query
@@ -56,6 +71,7 @@ def list_runs(run_type, agent_id, workflow_id, status, since, limit):
         workflow_id=workflow_id,
         status=RunStatus(status) if status else None,
         since=since_dt,
+        min_duration_seconds=min_duration,
         limit=limit,
     )
 
@@ -240,21 +256,60 @@ def get_artifacts(run_id, run_type, output):
     required=True,
     help="Type of run",
 )
-def replay_run(run_id, run_type):
+@click.option(
+    "--mode",
+    type=click.Choice(["recorded", "hybrid", "live"]),
+    default="recorded",
+    show_default=True,
+    help=(
+        "recorded: serve LLM calls from the run trace; hybrid: call live "
+        "models only for changed prompts; live: call live models"
+    ),
+)
+@click.option(
+    "--show", is_flag=True, help="Only show the stored run data, do not re-execute"
+)
+def replay_run(run_id, run_type, mode, show):
     """Replay a run with the same inputs."""
-    from paracle_runs import replay_agent_run, replay_workflow_run
+    import asyncio
+
+    from paracle_runs import (
+        ReplayError,
+        load_agent_run,
+        load_workflow_run,
+        replay_agent_run,
+        replay_workflow_run,
+    )
 
     try:
-        if run_type == "agent":
-            result = replay_agent_run(run_id)
-        else:
-            result = replay_workflow_run(run_id)
+        if show:
+            if run_type == "agent":
+                result = load_agent_run(run_id)
+            else:
+                result = load_workflow_run(run_id)
+            rprint(json.dumps(result, indent=2, default=str))
+            return
 
-        rprint(f"\n[bold green]Replay started for run: {run_id}[/bold green]")
-        rprint(json.dumps(result, indent=2, default=str))
+        replay = replay_agent_run if run_type == "agent" else replay_workflow_run
+        replay = asyncio.run(replay(run_id, mode=mode))
+
+        color = "green" if replay.status == "completed" else "red"
+        rprint(
+            f"\n[bold {color}]Replay of {run_id} ({replay.mode.value}): "
+            f"{replay.status}[/bold {color}]"
+        )
+        rprint(
+            f"  Recorded calls: {replay.recorded_calls}  "
+            f"Live calls: {replay.live_calls}  "
+            f"Misses: {len(replay.misses)}  "
+            f"Duration: {replay.duration_seconds:.2f}s"
+        )
+        rprint(json.dumps(replay.to_dict(), indent=2, default=str))
 
     except FileNotFoundError:
         rprint(f"[red]Run not found: {run_id}[/red]")
+    except ReplayError as e:
+        rprint(f"[red]{e}[/red]")
     except Exception as e:
         rprint(f"[red]Error replaying run: {e}[/red]")
 
@@ -307,8 +362,8 @@ def cleanup_runs(older_than, max_runs, dry_run):
     type=click.Choice([s.value for s in RunStatus]),
     help="Filter by status",
 )
-@click.option("--since", help="Since date (YYYY-MM-DD)")
-@click.option("--until", help="Until date (YYYY-MM-DD)")
+@click.option("--since", help="Since date (YYYY-MM-DD) or age (30m, 12h, 7d)")
+@click.option("--until", help="Until date (YYYY-MM-DD) or age (30m, 12h, 7d)")
 @click.option("--limit", default=50, help="Maximum number of results")
 def search_runs(agent_id, workflow_id, status, since, until, limit):
     """Search runs with advanced filtering."""
@@ -318,16 +373,16 @@ def search_runs(agent_id, workflow_id, status, since, until, limit):
 
     if since:
         try:
-            since_dt = datetime.strptime(since, "%Y-%m-%d")
+            since_dt = _parse_since(since)
         except ValueError:
-            rprint("[red]Invalid since date format. Use YYYY-MM-DD[/red]")
+            rprint("[red]Invalid since date format. Use YYYY-MM-DD or 7d[/red]")
             return
 
     if until:
         try:
-            until_dt = datetime.strptime(until, "%Y-%m-%d")
+            until_dt = _parse_since(until)
         except ValueError:
-            rprint("[red]Invalid until date format. Use YYYY-MM-DD[/red]")
+            rprint("[red]Invalid until date format. Use YYYY-MM-DD or 7d[/red]")
             return
 
     # Create query
@@ -357,3 +412,24 @@ def search_runs(agent_id, workflow_id, status, since, until, limit):
         rprint(f"\nWorkflow runs: {len(workflow_runs)}")
         for run in workflow_runs[:10]:  # Show first 10
             rprint(f"  • {run.run_id} - {run.workflow_name} - {run.status.value}")
+
+
+@runs_group.command(name="migrate")
+@click.option(
+    "--keep-legacy",
+    is_flag=True,
+    help="Keep the old run directories after conversion",
+)
+def migrate_runs(keep_legacy):
+    """Convert legacy run directories to compact storage and index them."""
+    storage = get_run_storage()
+    migrated = storage.migrate_legacy_runs(remove_legacy=not keep_legacy)
+    rprint(f"[green]Migrated {migrated} runs to compact storage[/green]")
+
+
+@runs_group.command(name="reindex")
+def reindex_runs():
+    """Rebuild the run index from stored runs."""
+    storage = get_run_storage()
+    indexed = storage.reindex()
+    rprint(f"[green]Indexed {indexed} runs[/green]")
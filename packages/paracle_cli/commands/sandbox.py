@@ -30,6 +30,12 @@ def sandbox_group():
     default="none",
     help="Network mode",
 )
+@click.option(
+    "--backend",
+    type=click.Choice(["docker", "process"]),
+    default="docker",
+    help="Isolation backend (process: Linux namespaces, no Docker, no network)",
+)
 @click.option("--inputs", type=click.Path(exists=True), help="JSON file with inputs")
 @click.option("--monitor/--no-monitor", default=True, help="Enable resource monitoring")
 @click.option("--output", type=click.Path(), help="Save results to JSON file")
@@ -40,6 +46,7 @@ def execute(
     memory: int,
     timeout: int,
     network: str,
+    backend: str,
     inputs: str | None,
     monitor: bool,
     output: str | None,
@@ -68,6 +75,7 @@ def execute(
         memory_mb=memory,
         timeout_seconds=timeout,
         network_mode=network,
+        backend=backend,
     )
 
     # Display configuration
@@ -79,6 +87,7 @@ def execute(
         config_table.add_row("Memory", f"{config.memory_mb} MB")
         config_table.add_row("Timeout", f"{config.timeout_seconds}s")
         config_table.add_row("Network", config.network_mode)
+        config_table.add_row("Backend", config.backend)
         config_table.add_row(
             "Monitoring", "Enabled" if monitor else "Disabled")
         console.print(config_table)
@@ -179,7 +188,13 @@ def health(verbose: bool):
 @sandbox_group.command("test")
 @click.option("--cpu", type=float, default=0.5, help="CPU cores limit")
 @click.option("--memory", type=int, default=256, help="Memory limit in MB")
-def test(cpu: float, memory: int):
+@click.option(
+    "--backend",
+    type=click.Choice(["docker", "process"]),
+    default="docker",
+    help="Isolation backend",
+)
+def test(cpu: float, memory: int, backend: str):
     """Test sandbox with simple execution.
 
     Example:
@@ -204,6 +219,7 @@ print(f"Available memory: {os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGE
             cpu_cores=cpu,
             memory_mb=memory,
             timeout_seconds=30,
+            backend=backend,
         )
 
         console.print(
@@ -0,0 +1,88 @@
+"""Lazy-loading Click group for the Paracle CLI.
+
+Command modules pull in heavy dependencies (providers, MCP, Docker, the API
+stack, ...). ``LazyGroup`` registers command names and short help text from a
+static table and imports a command's module only when that command is
+actually resolved, so ``paracle --help`` and quick commands stay fast.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+
+import click
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """Static description of a lazily imported command.
+
+    Attributes:
+        import_path: ``"module.path:attribute"`` of the Click command object
+        help: Short help shown in ``--help`` listings without importing
+        hidden: Hide the command from listings
+    """
+
+    import_path: str
+    help: str
+    hidden: bool = False
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommands on first use.
+
+    Example:
+        >>> @click.group(
+        ...     cls=LazyGroup,
+        ...     lazy_commands={"serve": LazyCommand("pkg.serve:serve", "Start.")},
+        ... )
+        ... def cli() -> None: ...
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_commands: dict[str, LazyCommand] | None = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, LazyCommand] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+        return self._load(cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """List commands from the static table without importing them."""
+        rows = []
+        for name in self.list_commands(ctx):
+            spec = self.lazy_commands.get(name)
+            if spec is not None and name not in self.commands:
+                if not spec.hidden:
+                    rows.append((name, spec.help))
+                continue
+            command = self.commands[name]
+            if not command.hidden:
+                rows.append((name, command.get_short_help_str(formatter.width)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        spec = self.lazy_commands[cmd_name]
+        module_name, _, attr = spec.import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{spec.import_path} is not a click command")
+        # Cache under the public name so later lookups skip the import
+        self.add_command(command, name=cmd_name)
+        return command
@@ -3,49 +3,139 @@
 import click
 from rich.console import Console
 
-from paracle_cli.commands.a2a import a2a
-from paracle_cli.commands.adr import adr
-from paracle_cli.commands.agents import agents
-from paracle_cli.commands.approvals import approvals
-from paracle_cli.commands.audit import audit
-from paracle_cli.commands.benchmark import benchmark
-from paracle_cli.commands.board import board
-from paracle_cli.commands.cache import cache
-from paracle_cli.commands.compliance import compliance
-from paracle_cli.commands.config import config
-from paracle_cli.commands.conflicts import conflicts
-from paracle_cli.commands.cost import cost
-from paracle_cli.commands.errors import errors
-from paracle_cli.commands.git import git
-from paracle_cli.commands.governance import governance
-from paracle_cli.commands.groups import groups
-from paracle_cli.commands.ide import ide
-from paracle_cli.commands.inventory import inventory
-from paracle_cli.commands.logs import logs
-from paracle_cli.commands.mcp import mcp
-from paracle_cli.commands.meta import meta
-from paracle_cli.commands.parac import init, parac, session, status, sync
-from paracle_cli.commands.parac import validate as parac_validate
-from paracle_cli.commands.pool import pool
-from paracle_cli.commands.providers import providers
-from paracle_cli.commands.release import release
-from paracle_cli.commands.remote import remote
-from paracle_cli.commands.retry import retry
-from paracle_cli.commands.reviews import reviews
-from paracle_cli.commands.roadmap import roadmap
-from paracle_cli.commands.runs import runs_group
-from paracle_cli.commands.sandbox import sandbox_group
-from paracle_cli.commands.serve import serve
-from paracle_cli.commands.task import task
-from paracle_cli.commands.tools import tools
-from paracle_cli.commands.tutorial import tutorial
-from paracle_cli.commands.validate import validate as governance_validate
-from paracle_cli.commands.workflow import workflow
+from paracle_cli.lazy_group import LazyCommand, LazyGroup
 
 console = Console()
 
-
-@click.group()
+_C = "paracle_cli.commands"
+
+# Command table: modules are imported only when their command is invoked.
+# Keep help strings in sync with the command docstrings.
+LAZY_COMMANDS: dict[str, LazyCommand] = {
+    # Project governance commands
+    "init": LazyCommand(f"{_C}.parac:init", "Initialize a new .parac/ workspace."),
+    "status": LazyCommand(
+        f"{_C}.parac:status", "Show current project state from .parac/."
+    ),
+    "sync": LazyCommand(
+        f"{_C}.parac:sync",
+        "Synchronize .parac/ state with project reality and roadmap.",
+    ),
+    "parac-validate": LazyCommand(
+        f"{_C}.parac:validate", "Validate .parac/ workspace consistency."
+    ),
+    "compile": LazyCommand(
+        f"{_C}.parac:compile_workspace",
+        "Compile .parac/ into a binary cache for fast startup.",
+    ),
+    "validate": LazyCommand(
+        f"{_C}.validate:validate", "Validate governance compliance and structure."
+    ),
+    "session": LazyCommand(f"{_C}.parac:session", "Session management commands."),
+    # Interactive tutorial
+    "tutorial": LazyCommand(
+        f"{_C}.tutorial:tutorial", "Interactive tutorial for learning Paracle."
+    ),
+    # API server
+    "serve": LazyCommand(f"{_C}.serve:serve", "Start the Paracle API server."),
+    # Agent management (includes run command)
+    "agents": LazyCommand(f"{_C}.agents:agents", "Manage, discover, and run agents."),
+    # Agent groups for multi-agent collaboration
+    "groups": LazyCommand(
+        f"{_C}.groups:groups", "Manage agent groups for multi-agent collaboration."
+    ),
+    # IDE, MCP, and A2A integration
+    "ide": LazyCommand(f"{_C}.ide:ide", "IDE and AI assistant integration commands."),
+    "mcp": LazyCommand(f"{_C}.mcp:mcp", "MCP server commands."),
+    "a2a": LazyCommand(f"{_C}.a2a:a2a", "A2A (Agent-to-Agent) protocol commands."),
+    # Paracle Meta AI Engine (system-level)
+    "meta": LazyCommand(f"{_C}.meta:meta", "Paracle Meta AI Engine."),
+    # Workflow and tool management
+    "workflow": LazyCommand(
+        f"{_C}.workflow:workflow", "Manage workflows and workflow executions."
+    ),
+    "runs": LazyCommand(
+        f"{_C}.runs:runs_group", "Manage execution runs (agents and workflows)."
+    ),
+    "tools": LazyCommand(f"{_C}.tools:tools", "Manage tools (built-in and MCP)."),
+    "providers": LazyCommand(f"{_C}.providers:providers", "Manage LLM providers."),
+    # Cost tracking
+    "cost": LazyCommand(
+        f"{_C}.cost:cost", "Cost tracking and budget management commands."
+    ),
+    # Error management and monitoring
+    "errors": LazyCommand(f"{_C}.errors:errors", "View and manage error registry."),
+    # Cache management
+    "cache": LazyCommand(f"{_C}.cache:cache", "Manage LLM response cache."),
+    # Performance benchmarking
+    "benchmark": LazyCommand(
+        f"{_C}.benchmark:benchmark", "Run performance benchmarks."
+    ),
+    # Connection pool management
+    "pool": LazyCommand(f"{_C}.pool:pool", "Manage connection pools."),
+    # Configuration management
+    "config": LazyCommand(f"{_C}.config:config", "Manage project configuration."),
+    # Remote development
+    "remote": LazyCommand(f"{_C}.remote:remote", "Manage remote Paracle instances."),
+    # Release management
+    "release": LazyCommand(
+        f"{_C}.release:release",
+        "ReleaseManager agent operations (git, versioning, releases).",
+    ),
+    # Human-in-the-loop approvals and reviews
+    "approvals": LazyCommand(
+        f"{_C}.approvals:approvals", "Manage approval requests (Human-in-the-Loop)."
+    ),
+    "reviews": LazyCommand(
+        f"{_C}.reviews:reviews", "Manage artifact reviews (sandbox execution)."
+    ),
+    # Retry management
+    "retry": LazyCommand(
+        f"{_C}.retry:retry", "Manage workflow retry policies and statistics."
+    ),
+    # Kanban task management
+    "task": LazyCommand(f"{_C}.task:task", "Manage Kanban tasks."),
+    "board": LazyCommand(f"{_C}.board:board", "Manage Kanban boards."),
+    # Git integration and automatic commits
+    "git": LazyCommand(f"{_C}.git:git", "Git integration and automatic commits."),
+    # Conflict resolution and file locking
+    "conflicts": LazyCommand(
+        f"{_C}.conflicts:conflicts", "Manage conflicts and file locks."
+    ),
+    # Governance, Audit, and Compliance (ISO 42001)
+    "governance": LazyCommand(
+        f"{_C}.governance:governance", "Manage governance policies and risk scoring."
+    ),
+    "audit": LazyCommand(
+        f"{_C}.audit:audit", "Manage audit trails and compliance logging."
+    ),
+    "compliance": LazyCommand(
+        f"{_C}.compliance:compliance",
+        "Compliance reporting and ISO 42001 monitoring.",
+    ),
+    # Project documentation
+    "adr": LazyCommand(f"{_C}.adr:adr", "Manage Architecture Decision Records (ADRs)."),
+    "roadmap": LazyCommand(f"{_C}.roadmap:roadmap", "Manage project roadmaps."),
+    "logs": LazyCommand(f"{_C}.logs:logs", "View and manage Paracle logs."),
+    # Services inventory management
+    "inventory": LazyCommand(
+        f"{_C}.inventory:inventory", "Manage services inventory documentation."
+    ),
+    # Sandbox management
+    "sandbox": LazyCommand(
+        f"{_C}.sandbox:sandbox_group",
+        "Sandbox management commands for isolated execution.",
+    ),
+    # Legacy commands (hidden)
+    "parac": LazyCommand(
+        f"{_C}.parac:parac",
+        "[DEPRECATED] Use top-level commands instead.",
+        hidden=True,
+    ),
+}
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version="1.0.0")
 def cli() -> None:
     """Paracle - User-driven multi-agent framework.
@@ -62,101 +152,6 @@ def cli() -> None:
     pass
 
 
-# Project governance commands
-cli.add_command(init)
-cli.add_command(status)
-cli.add_command(sync)
-cli.add_command(parac_validate, name="parac-validate")
-cli.add_command(governance_validate, name="validate")
-cli.add_command(session)
-
-# Interactive tutorial
-cli.add_command(tutorial)
-
-# API server
-cli.add_command(serve)
-
-# Agent management (includes run command)
-cli.add_command(agents)
-
-# Agent groups for multi-agent collaboration
-cli.add_command(groups)
-
-# IDE, MCP, and A2A integration
-cli.add_command(ide)
-cli.add_command(mcp)
-cli.add_command(a2a)
-
-# Paracle Meta AI Engine (system-level)
-cli.add_command(meta)
-
-# Workflow and tool management
-cli.add_command(workflow)
-cli.add_command(runs_group, name="runs")
-cli.add_command(tools)
-cli.add_command(providers)
-
-# Cost tracking
-cli.add_command(cost)
-
-# Error management and monitoring
-cli.add_command(errors)
-
-# Cache management
-cli.add_command(cache)
-
-# Performance benchmarking
-cli.add_command(benchmark)
-
-# Connection pool management
-cli.add_command(pool)
-
-# Configuration management
-cli.add_command(config)
-
-# Remote development
-cli.add_command(remote)
-
-# Release management
-cli.add_command(release)
-
-# Human-in-the-loop approvals and reviews
-cli.add_command(approvals)
-cli.add_command(reviews)
-
-# Retry management
-cli.add_command(retry)
-
-# Kanban task management
-cli.add_command(task)
-cli.add_command(board)
-
-# Git integration and automatic commits
-cli.add_command(git)
-
-# Conflict resolution and file locking
-cli.add_command(conflicts)
-
-# Governance, Audit, and Compliance (ISO 42001)
-cli.add_command(governance)
-cli.add_command(audit)
-cli.add_command(compliance)
-
-# Project documentation
-cli.add_command(adr)
-cli.add_command(roadmap)
-cli.add_command(logs)
-
-# Services inventory management
-cli.add_command(inventory)
-
-# Sandbox management
-cli.add_command(sandbox_group, name="sandbox")
-
-# Legacy commands (hidden)
-cli.add_command(parac)
-
-
 @cli.command()
 def hello() -> None:
     """Verify Paracle installation."""
@@ -126,6 +126,24 @@ class CostConfig(BaseModel):
         }
     )
 
+    # Share of the input price charged for prompt tokens read from a
+    # provider-side prompt cache. Providers not listed get no discount.
+    cached_input_multipliers: dict[str, float] = Field(
+        default_factory=lambda: {
+            "anthropic": 0.1,
+            "openai": 0.5,
+            "deepseek": 0.1,
+        }
+    )
+
+    # Share of the input price charged for prompt tokens written to a
+    # provider-side prompt cache. Providers not listed charge no premium.
+    cache_write_multipliers: dict[str, float] = Field(
+        default_factory=lambda: {
+            "anthropic": 1.25,
+        }
+    )
+
     # Cost display settings
     currency: str = Field(default="USD", description="Currency for display")
     decimal_places: int = Field(default=4, ge=0, le=8, description="Decimal places")
@@ -314,3 +332,25 @@ class CostConfig(BaseModel):
                 return (pricing["input"], pricing["output"])
 
         return None
+
+    def get_cached_input_multiplier(self, provider: str) -> float:
+        """Get the price multiplier for cached prompt tokens.
+
+        Args:
+            provider: Provider name (e.g., "anthropic")
+
+        Returns:
+            Fraction of the input price charged for cached tokens
+        """
+        return self.cached_input_multipliers.get(provider, 1.0)
+
+    def get_cache_write_multiplier(self, provider: str) -> float:
+        """Get the price multiplier for prompt tokens written to the cache.
+
+        Args:
+            provider: Provider name (e.g., "anthropic")
+
+        Returns:
+            Fraction of the input price charged for cache writes
+        """
+        return self.cache_write_multipliers.get(provider, 1.0)
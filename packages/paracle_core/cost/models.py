@@ -44,6 +44,8 @@ class CostRecord:
     step_id: str | None = None
     agent_id: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    cached_tokens: int = 0  # prompt tokens served from the provider's cache
+    cache_savings: float = 0.0  # net cost avoided by prompt caching
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -54,9 +56,11 @@ class CostRecord:
             "prompt_tokens": self.prompt_tokens,
             "completion_tokens": self.completion_tokens,
             "total_tokens": self.total_tokens,
+            "cached_tokens": self.cached_tokens,
             "prompt_cost": self.prompt_cost,
             "completion_cost": self.completion_cost,
             "total_cost": self.total_cost,
+            "cache_savings": self.cache_savings,
             "execution_id": self.execution_id,
             "workflow_id": self.workflow_id,
             "step_id": self.step_id,
@@ -74,6 +78,9 @@ class CostUsage(BaseModel):
         default=0, ge=0, description="Total completion tokens"
     )
     total_tokens: int = Field(default=0, ge=0, description="Total tokens")
+    cached_tokens: int = Field(
+        default=0, ge=0, description="Prompt tokens served from prompt caches"
+    )
 
     # Costs in USD
     prompt_cost: float = Field(default=0.0, ge=0.0, description="Total prompt cost")
@@ -81,6 +88,11 @@ class CostUsage(BaseModel):
         default=0.0, ge=0.0, description="Total completion cost"
     )
     total_cost: float = Field(default=0.0, ge=0.0, description="Total cost")
+    cache_savings: float = Field(
+        default=0.0,
+        description="Net cost avoided by prompt caching (negative when cache "
+        "writes cost more than cache reads saved)",
+    )
 
     # Counts
     request_count: int = Field(default=0, ge=0, description="Number of requests")
@@ -94,9 +106,11 @@ class CostUsage(BaseModel):
         self.prompt_tokens += record.prompt_tokens
         self.completion_tokens += record.completion_tokens
         self.total_tokens += record.total_tokens
+        self.cached_tokens += record.cached_tokens
         self.prompt_cost += record.prompt_cost
         self.completion_cost += record.completion_cost
         self.total_cost += record.total_cost
+        self.cache_savings += record.cache_savings
         self.request_count += 1
 
         # Update period bounds
@@ -111,9 +125,11 @@ class CostUsage(BaseModel):
             prompt_tokens=self.prompt_tokens + other.prompt_tokens,
             completion_tokens=self.completion_tokens + other.completion_tokens,
             total_tokens=self.total_tokens + other.total_tokens,
+            cached_tokens=self.cached_tokens + other.cached_tokens,
             prompt_cost=self.prompt_cost + other.prompt_cost,
             completion_cost=self.completion_cost + other.completion_cost,
             total_cost=self.total_cost + other.total_cost,
+            cache_savings=self.cache_savings + other.cache_savings,
             request_count=self.request_count + other.request_count,
         )
 
@@ -198,6 +214,8 @@ class CostReport(BaseModel):
                 "request_count": self.total_usage.request_count,
                 "prompt_cost": self.total_usage.prompt_cost,
                 "completion_cost": self.total_usage.completion_cost,
+                "cached_tokens": self.total_usage.cached_tokens,
+                "cache_savings": self.total_usage.cache_savings,
             },
             "by_provider": {k: v.model_dump() for k, v in self.by_provider.items()},
             "by_model": {k: v.model_dump() for k, v in self.by_model.items()},
@@ -142,11 +142,26 @@ class CostTracker:
                 workflow_id TEXT,
                 step_id TEXT,
                 agent_id TEXT,
-                metadata_json TEXT
+                metadata_json TEXT,
+                cached_tokens INTEGER NOT NULL DEFAULT 0,
+                cache_savings REAL NOT NULL DEFAULT 0
             )
         """
         )
 
+        # Add prompt-cache columns to databases created before they existed
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(cost_records)")}
+        if "cached_tokens" not in columns:
+            cursor.execute(
+                "ALTER TABLE cost_records "
+                "ADD COLUMN cached_tokens INTEGER NOT NULL DEFAULT 0"
+            )
+        if "cache_savings" not in columns:
+            cursor.execute(
+                "ALTER TABLE cost_records "
+                "ADD COLUMN cache_savings REAL NOT NULL DEFAULT 0"
+            )
+
         # Create indexes
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_cost_timestamp ON cost_records(timestamp)"
@@ -189,6 +204,8 @@ class CostTracker:
         model: str,
         prompt_tokens: int,
         completion_tokens: int,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> tuple[float, float, float]:
         """Calculate cost for token usage.
 
@@ -197,28 +214,73 @@ class CostTracker:
             model: Model name (e.g., "gpt-4")
             prompt_tokens: Number of prompt/input tokens
             completion_tokens: Number of completion/output tokens
+            cached_tokens: Prompt tokens (included in ``prompt_tokens``)
+                served from the provider's prompt cache
+            cache_write_tokens: Prompt tokens (included in ``prompt_tokens``)
+                written to the provider's prompt cache
 
         Returns:
             Tuple of (prompt_cost, completion_cost, total_cost) in USD
         """
-        # Try to get pricing from config
-        pricing = self.config.get_model_pricing(provider, model)
-
-        if pricing:
-            input_rate, output_rate = pricing
-        else:
-            # Default fallback pricing
-            logger.warning(f"No pricing found for {provider}/{model}, using defaults")
-            input_rate = 1.0  # $1 per million tokens
-            output_rate = 2.0  # $2 per million tokens
+        input_rate, output_rate = self._get_rates(provider, model)
+        cached_rate = input_rate * self.config.get_cached_input_multiplier(provider)
+        write_rate = input_rate * self.config.get_cache_write_multiplier(provider)
 
         # Calculate costs (rates are per million tokens)
-        prompt_cost = (prompt_tokens / 1_000_000) * input_rate
+        cached_tokens = min(cached_tokens, prompt_tokens)
+        cache_write_tokens = min(cache_write_tokens, prompt_tokens - cached_tokens)
+        uncached_tokens = prompt_tokens - cached_tokens - cache_write_tokens
+        prompt_cost = (
+            uncached_tokens * input_rate
+            + cached_tokens * cached_rate
+            + cache_write_tokens * write_rate
+        ) / 1_000_000
         completion_cost = (completion_tokens / 1_000_000) * output_rate
         total_cost = prompt_cost + completion_cost
 
         return (prompt_cost, completion_cost, total_cost)
 
+    def _get_rates(self, provider: str, model: str) -> tuple[float, float]:
+        """Get (input, output) prices per million tokens."""
+        # Try to get pricing from config
+        pricing = self.config.get_model_pricing(provider, model)
+
+        if pricing:
+            return pricing
+
+        # Default fallback pricing
+        logger.warning(f"No pricing found for {provider}/{model}, using defaults")
+        return (1.0, 2.0)  # $1 / $2 per million tokens
+
+    def calculate_cache_savings(
+        self,
+        provider: str,
+        model: str,
+        cached_tokens: int,
+        cache_write_tokens: int = 0,
+    ) -> float:
+        """Calculate the net cost avoided by provider prompt caching.
+
+        Cache reads save their discount; cache writes cost their premium.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            cached_tokens: Prompt tokens served from the provider's cache
+            cache_write_tokens: Prompt tokens written to the provider's cache
+
+        Returns:
+            Savings in USD compared to uncached input pricing (negative when
+            the write premium outweighs the read discount)
+        """
+        if cached_tokens <= 0 and cache_write_tokens <= 0:
+            return 0.0
+        input_rate, _ = self._get_rates(provider, model)
+        discount = 1.0 - self.config.get_cached_input_multiplier(provider)
+        premium = self.config.get_cache_write_multiplier(provider) - 1.0
+        saved = max(cached_tokens, 0) * discount - max(cache_write_tokens, 0) * premium
+        return saved * input_rate / 1_000_000
+
     def track_usage(
         self,
         provider: str,
@@ -230,6 +292,8 @@ class CostTracker:
         step_id: str | None = None,
         agent_id: str | None = None,
         metadata: dict[str, Any] | None = None,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> CostRecord:
         """Track token usage and calculate cost.
 
@@ -243,6 +307,10 @@ class CostTracker:
             step_id: Optional step ID
             agent_id: Optional agent ID
             metadata: Optional additional metadata
+            cached_tokens: Prompt tokens served from the provider's prompt
+                cache (billed at the cached input price)
+            cache_write_tokens: Prompt tokens written to the provider's
+                prompt cache (billed at the cache write price)
 
         Returns:
             CostRecord with calculated costs
@@ -262,11 +330,17 @@ class CostTracker:
                 prompt_cost=0.0,
                 completion_cost=0.0,
                 total_cost=0.0,
+                cached_tokens=cached_tokens,
             )
 
         # Calculate costs
         prompt_cost, completion_cost, total_cost = self.calculate_cost(
-            provider, model, prompt_tokens, completion_tokens
+            provider,
+            model,
+            prompt_tokens,
+            completion_tokens,
+            cached_tokens,
+            cache_write_tokens,
         )
 
         # Create record
@@ -285,6 +359,10 @@ class CostTracker:
             step_id=step_id,
             agent_id=agent_id,
             metadata=metadata or {},
+            cached_tokens=cached_tokens,
+            cache_savings=self.calculate_cache_savings(
+                provider, model, cached_tokens, cache_write_tokens
+            ),
         )
 
         with self._lock:
@@ -481,8 +559,8 @@ class CostTracker:
                 prompt_tokens, completion_tokens, total_tokens,
                 prompt_cost, completion_cost, total_cost,
                 execution_id, workflow_id, step_id, agent_id,
-                metadata_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                metadata_json, cached_tokens, cache_savings
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
             (
                 record.timestamp.isoformat(),
@@ -499,6 +577,8 @@ class CostTracker:
                 record.step_id,
                 record.agent_id,
                 json.dumps(record.metadata) if record.metadata else None,
+                record.cached_tokens,
+                record.cache_savings,
             ),
         )
 
@@ -673,7 +753,9 @@ class CostTracker:
                 SUM(total_cost),
                 COUNT(*),
                 MIN(timestamp),
-                MAX(timestamp)
+                MAX(timestamp),
+                SUM(cached_tokens),
+                SUM(cache_savings)
             FROM cost_records
             WHERE {where_clause}
         """,
@@ -695,6 +777,8 @@ class CostTracker:
                 usage.period_start = datetime.fromisoformat(row[7])
             if row[8]:
                 usage.period_end = datetime.fromisoformat(row[8])
+            usage.cached_tokens = row[9] or 0
+            usage.cache_savings = row[10] or 0.0
 
         return usage
 
@@ -788,7 +872,9 @@ class CostTracker:
                 SUM(prompt_cost),
                 SUM(completion_cost),
                 SUM(total_cost),
-                COUNT(*)
+                COUNT(*),
+                SUM(cached_tokens),
+                SUM(cache_savings)
             FROM cost_records
             WHERE {where_clause}
             GROUP BY {field}
@@ -806,6 +892,8 @@ class CostTracker:
                 completion_cost=row[5] or 0.0,
                 total_cost=row[6] or 0.0,
                 request_count=row[7] or 0,
+                cached_tokens=row[8] or 0,
+                cache_savings=row[9] or 0.0,
             )
             result[key] = usage
 
@@ -0,0 +1,373 @@
+"""Indexed reading of governance action logs.
+
+``agent_actions.log`` is append-only and only grows, so queries should not
+read all of it. This module provides:
+
+- ``tail_lines``: the last N lines, read by seeking backwards from the end
+- ``ActionLogIndex``: a SQLite sidecar index (``agent_actions.log.idx``)
+  mapping each day to a byte range and each agent to line offsets. A
+  refresh indexes only the lines appended since the last one (by any
+  process), and the index is rebuilt when the log is rotated/truncated
+- ``rotated_logs``: rotated predecessors (``.1``, ``.1.gz``, ...) so
+  time-based queries can continue across a rotation
+
+Example:
+    >>> index = ActionLogIndex(Path(".parac/memory/logs/agent_actions.log"))
+    >>> index.refresh()
+    >>> index.read_lines(index.agent_offsets("CoderAgent", limit=20))
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# "[2026-01-05 10:00:00] [CoderAgent] [IMPLEMENTATION] ..."
+LOG_LINE_PATTERN = re.compile(rb"^\[(\d{4}-\d{2}-\d{2})[^\]]*\] \[([^\]]+)\]")
+
+
+def tail_lines(path: Path, count: int, block_size: int = 8192) -> list[str]:
+    """Read the last lines of a file without reading the whole file.
+
+    Args:
+        path: File to read
+        count: Number of lines
+        block_size: Bytes read per backward seek
+
+    Returns:
+        Up to ``count`` lines (with line endings), oldest first
+    """
+    if count <= 0 or not path.exists():
+        return []
+
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        data = b""
+        # One extra newline is needed to know the oldest line is complete
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    lines = data.splitlines(keepends=True)
+    if position > 0:
+        lines = lines[1:]  # Partial first line
+    return [line.decode("utf-8", errors="replace") for line in lines[-count:]]
+
+
+def rotated_logs(path: Path) -> list[Path]:
+    """Find rotated predecessors of a log file, newest first.
+
+    Args:
+        path: Live log file
+
+    Returns:
+        Existing ``<name>.1``, ``<name>.2``, ... files (plain or ``.gz``)
+    """
+    rotated = []
+    number = 1
+    while True:
+        candidates = [
+            path.with_name(f"{path.name}.{number}"),
+            path.with_name(f"{path.name}.{number}.gz"),
+        ]
+        found = next((c for c in candidates if c.exists()), None)
+        if found is None:
+            return rotated
+        rotated.append(found)
+        number += 1
+
+
+def read_log_lines(path: Path) -> list[str]:
+    """Read every line of a (possibly gzip-compressed) log file.
+
+    Args:
+        path: Log file
+
+    Returns:
+        Lines with line endings
+    """
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as f:
+        return [line.decode("utf-8", errors="replace") for line in f]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS days (
+    day TEXT PRIMARY KEY,
+    start_offset INTEGER NOT NULL,
+    end_offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lines (
+    agent TEXT NOT NULL,
+    line_offset INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lines_agent ON lines(agent, line_offset);
+"""
+
+
+class ActionLogIndex:
+    """SQLite sidecar index of an append-only action log.
+
+    ``days`` maps ``YYYY-MM-DD`` to the byte range ``[start, end)`` of
+    that day's lines and ``lines`` maps an agent name to the offsets of
+    its lines. The index covers the first ``size`` bytes of the log; a
+    signature of the first bytes detects rotation or truncation, in
+    which case the index is rebuilt.
+
+    Appends are indexed by ``refresh`` in a single transaction, so the
+    cost of keeping the index current follows the bytes appended and
+    queries only read the rows they return.
+    """
+
+    VERSION = 2
+    SIGNATURE_BYTES = 256
+
+    def __init__(self, log_path: Path, index_path: Path | None = None):
+        """Initialize the index (opened lazily).
+
+        Args:
+            log_path: Action log file
+            index_path: Sidecar database (default: ``<log>.idx``)
+        """
+        self.log_path = log_path
+        self.index_path = index_path or log_path.with_name(log_path.name + ".idx")
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the sidecar database once, rebuilding it if unreadable."""
+        if self._conn is None:
+            try:
+                self._conn = self._open()
+            except sqlite3.DatabaseError as e:
+                logger.debug(f"Rebuilding unreadable log index: {e}")
+                self.index_path.unlink(missing_ok=True)
+                self._conn = self._open()
+        return self._conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.index_path), check_same_thread=False, isolation_level=None
+        )
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            version = self._meta(conn).get("version")
+            if version != str(self.VERSION):
+                self._clear(conn)
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection) -> dict[str, str]:
+        return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+
+    def _clear(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM days")
+        conn.execute("DELETE FROM lines")
+        conn.execute("DELETE FROM meta")
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('version', ?)", (str(self.VERSION),)
+        )
+
+    def _signature_of(self, f, length: int) -> str:
+        f.seek(0)
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+    @property
+    def size(self) -> int:
+        """Number of log bytes covered by the index."""
+        with self._lock:
+            return int(self._meta(self._connect()).get("size", 0))
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the log file.
+
+        Only bytes appended since the last refresh (by any process) are
+        read; the transaction keeps concurrent refreshes from indexing
+        the same bytes twice.
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._refresh(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _refresh(self, conn: sqlite3.Connection) -> None:
+        meta = self._meta(conn)
+        size = int(meta.get("size", 0))
+        signature = meta.get("signature", "")
+        signature_length = int(meta.get("signature_length", 0))
+
+        if not self.log_path.exists():
+            if size:
+                self._clear(conn)
+            return
+
+        with open(self.log_path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            rotated = end < size or (
+                signature_length
+                and self._signature_of(f, signature_length) != signature
+            )
+            if rotated:
+                logger.debug(f"{self.log_path} was rotated, rebuilding index")
+                self._clear(conn)
+                size, signature, signature_length = 0, "", 0
+            # Widen the signature while the log is still short
+            length = min(end, self.SIGNATURE_BYTES)
+            if length > signature_length:
+                signature_length = length
+                signature = self._signature_of(f, signature_length)
+            new_size = size
+            if end > size:
+                f.seek(size)
+                new_size = self._index_lines(conn, f.read(end - size), size)
+
+        if rotated or new_size != size or signature != meta.get("signature"):
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("size", str(new_size)),
+                    ("signature", signature),
+                    ("signature_length", str(signature_length)),
+                ],
+            )
+
+    def _index_lines(self, conn: sqlite3.Connection, data: bytes, offset: int) -> int:
+        """Index complete lines in ``data`` starting at ``offset``.
+
+        Returns:
+            Offset after the last complete line
+        """
+        days: dict[str, list[int]] = {}
+        rows: list[tuple[str, int]] = []
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break  # Incomplete line, indexed once finished
+            match = LOG_LINE_PATTERN.match(line)
+            if match:
+                day = match.group(1).decode()
+                agent = match.group(2).decode("utf-8", errors="replace")
+                day_range = days.setdefault(day, [offset, offset])
+                day_range[1] = offset + len(line)
+                rows.append((agent, offset))
+            offset += len(line)
+
+        conn.executemany("INSERT INTO lines (agent, line_offset) VALUES (?, ?)", rows)
+        conn.executemany(
+            "INSERT INTO days (day, start_offset, end_offset) VALUES (?, ?, ?) "
+            "ON CONFLICT(day) DO UPDATE SET end_offset = excluded.end_offset",
+            [(day, start, end) for day, (start, end) in days.items()],
+        )
+        return offset
+
+    def day_range(self, day: str) -> tuple[int, int] | None:
+        """Get the byte range of a day's lines.
+
+        Args:
+            day: Date as ``YYYY-MM-DD``
+
+        Returns:
+            ``(start, end)`` offsets, or None if the day has no lines
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT start_offset, end_offset FROM days WHERE day = ?", (day,)
+                )
+                .fetchone()
+            )
+        return tuple(row) if row else None
+
+    def first_day(self) -> str | None:
+        """Get the earliest day in the live log."""
+        with self._lock:
+            return self._connect().execute("SELECT MIN(day) FROM days").fetchone()[0]
+
+    def agent_offsets(self, agent: str, limit: int | None = None) -> list[int]:
+        """Get the offsets of an agent's lines, oldest first.
+
+        Args:
+            agent: Agent name as written in the log (e.g. ``CoderAgent``)
+            limit: Only return the offsets of the N most recent lines
+
+        Returns:
+            Line offsets
+        """
+        if limit is not None and limit <= 0:
+            return []
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT line_offset FROM lines WHERE agent = ? "
+                    "ORDER BY line_offset DESC LIMIT ?",
+                    (agent, -1 if limit is None else limit),
+                )
+                .fetchall()
+            )
+        return [row[0] for row in reversed(rows)]
+
+    def close(self) -> None:
+        """Close the sidecar database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def read_range(self, start: int, end: int) -> list[str]:
+        """Read the lines in a byte range of the log.
+
+        Args:
+            start: Start offset (beginning of a line)
+            end: End offset
+
+        Returns:
+            Lines with line endings
+        """
+        with open(self.log_path, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+        return [
+            line.decode("utf-8", errors="replace")
+            for line in data.splitlines(keepends=True)
+        ]
+
+    def read_lines(self, offsets: list[int]) -> list[str]:
+        """Read the lines starting at the given offsets.
+
+        Args:
+            offsets: Line offsets
+
+        Returns:
+            Lines with line endings
+        """
+        lines = []
+        with open(self.log_path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                lines.append(f.readline().decode("utf-8", errors="replace"))
+        return lines
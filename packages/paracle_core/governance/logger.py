@@ -23,6 +23,12 @@ from paracle_core.governance.context import (
     get_current_agent,
     get_current_session,
 )
+from paracle_core.governance.log_index import (
+    ActionLogIndex,
+    read_log_lines,
+    rotated_logs,
+    tail_lines,
+)
 from paracle_core.governance.types import GovernanceActionType, GovernanceAgentType
 
 
@@ -56,8 +62,12 @@ class GovernanceLogger:
 
     Log locations:
         - .parac/memory/logs/agent_actions.log - All actions
+        - .parac/memory/logs/agent_actions.log.idx - Query index (day, agent)
         - .parac/memory/logs/decisions.log - Important decisions
 
+    Queries read only the lines they return: recent actions are tailed
+    from the end of the file and agent/day queries use the index.
+
     Example:
         logger = get_governance_logger()
 
@@ -90,6 +100,7 @@ class GovernanceLogger:
         self.logs_dir = parac_root / "memory" / "logs"
         self.actions_log = self.logs_dir / "agent_actions.log"
         self.decisions_log = self.logs_dir / "decisions.log"
+        self._index = ActionLogIndex(self.actions_log)
 
         # Ensure logs directory exists
         self.logs_dir.mkdir(parents=True, exist_ok=True)
@@ -152,7 +163,7 @@ class GovernanceLogger:
             f"[{entry.action.value}] {description}\n"
         )
 
-        # Write to file
+        # Write to file (indexed on the next query)
         with open(self.actions_log, "a", encoding="utf-8") as f:
             f.write(log_line)
 
@@ -253,6 +264,9 @@ class GovernanceLogger:
     def get_recent_actions(self, count: int = 10) -> list[str]:
         """Get the N most recent actions.
 
+        Reads backwards from the end of the log, continuing into rotated
+        logs if the live log has fewer lines.
+
         Args:
             count: Number of actions to retrieve
 
@@ -262,16 +276,27 @@ class GovernanceLogger:
         if not self.actions_log.exists():
             return []
 
-        with open(self.actions_log, encoding="utf-8") as f:
-            lines = f.readlines()
-
-        return lines[-count:]
-
-    def get_agent_actions(self, agent: GovernanceAgentType | str) -> list[str]:
+        lines = tail_lines(self.actions_log, count)
+        for rotated in rotated_logs(self.actions_log):
+            if len(lines) >= count:
+                break
+            missing = count - len(lines)
+            if rotated.suffix == ".gz":
+                older = read_log_lines(rotated)[-missing:]
+            else:
+                older = tail_lines(rotated, missing)
+            lines = older + lines
+
+        return lines
+
+    def get_agent_actions(
+        self, agent: GovernanceAgentType | str, limit: int | None = None
+    ) -> list[str]:
         """Get all actions by a specific agent.
 
         Args:
             agent: Agent to filter by
+            limit: Only return the N most recent actions
 
         Returns:
             List of log lines for that agent
@@ -282,10 +307,10 @@ class GovernanceLogger:
         if isinstance(agent, str):
             agent = GovernanceAgentType.from_string(agent)
 
-        with open(self.actions_log, encoding="utf-8") as f:
-            lines = f.readlines()
+        self._index.refresh()
+        offsets = self._index.agent_offsets(agent.value, limit=limit)
 
-        return [line for line in lines if f"[{agent.value}]" in line]
+        return self._index.read_lines(offsets)
 
     def get_today_actions(self) -> list[str]:
         """Get all actions from today.
@@ -297,11 +322,23 @@ class GovernanceLogger:
             return []
 
         today = datetime.now().strftime("%Y-%m-%d")
+        prefix = f"[{today}"
+
+        self._index.refresh()
+        lines = []
+        day_range = self._index.day_range(today)
+        if day_range is not None:
+            lines = self._index.read_range(*day_range)
 
-        with open(self.actions_log, encoding="utf-8") as f:
-            lines = f.readlines()
+        # Today may have started before the last rotation
+        if self._index.first_day() in (today, None):
+            for rotated in rotated_logs(self.actions_log):
+                older = read_log_lines(rotated)
+                lines = [line for line in older if line.startswith(prefix)] + lines
+                if older and not older[0].startswith(prefix):
+                    break
 
-        return [line for line in lines if line.startswith(f"[{today}")]
+        return [line for line in lines if line.startswith(prefix)]
 
 
 # Singleton instance
@@ -335,6 +372,7 @@ def _create_noop_logger() -> GovernanceLogger:
     logger.logs_dir = None
     logger.actions_log = None
     logger.decisions_log = None
+    logger._index = None
     return logger
 
 
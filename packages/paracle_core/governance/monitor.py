@@ -2,6 +2,8 @@
 
 This module provides continuous monitoring of .parac/ structure with:
 - Background file system watcher
+- Debounced, coalesced event handling validated on a worker pool
+- Persistent validation cache and incremental health
 - Automatic violation repair
 - Governance health dashboard
 - Self-healing capabilities
@@ -25,12 +27,18 @@ CLI:
     paracle governance repair        # Manual repair
 """
 
+import hashlib
+import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
@@ -94,8 +102,158 @@ class GovernanceHealth:
         return (self.valid_files / self.total_files) * 100.0
 
 
+def rules_fingerprint(rules: dict[str, dict[str, Any]]) -> str:
+    """Fingerprint compliance rules so cached results expire when they change.
+
+    Args:
+        rules: Compliance engine rules (pattern -> rule info)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    encoded = json.dumps(rules, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ValidationCache:
+    """Validation results keyed by relative path, persisted as JSON.
+
+    The compliance engine validates file paths, not contents, so a result
+    stays valid until the file disappears or the rules change. All entries
+    are discarded when the rules fingerprint differs from the saved one.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path | None, fingerprint: str):
+        """Initialize the cache, loading saved results if any.
+
+        Args:
+            path: JSON file to persist to (None keeps results in memory)
+            fingerprint: Rules fingerprint the results were computed with
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, list[Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load saved results if they match the current rules."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable validation cache: {e}")
+            return
+        if (
+            data.get("version") == self.VERSION
+            and data.get("rules") == self.fingerprint
+        ):
+            self._entries = data.get("entries", {})
+
+    def get(self, path: str) -> ValidationResult | None:
+        """Get the cached result for a relative path.
+
+        Args:
+            path: Path relative to the workspace (e.g. ".parac/costs.db")
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        is_valid, category, error, suggested_path = entry
+        return ValidationResult(
+            is_valid=is_valid,
+            path=Path(path),
+            category=FileCategory(category) if category else None,
+            error=error,
+            suggested_path=Path(suggested_path) if suggested_path else None,
+            auto_fix_available=not is_valid,
+        )
+
+    def put(self, path: str, result: ValidationResult) -> None:
+        """Store a validation result.
+
+        Args:
+            path: Relative path
+            result: Result from the compliance engine
+        """
+        entry = [
+            result.is_valid,
+            result.category.value if result.category else None,
+            result.error,
+            (
+                str(result.suggested_path).replace("\\", "/")
+                if result.suggested_path
+                else None
+            ),
+        ]
+        with self._lock:
+            if self._entries.get(path) != entry:
+                self._entries[path] = entry
+                self._dirty = True
+
+    def discard(self, path: str) -> None:
+        """Forget a path (deleted or moved away).
+
+        Args:
+            path: Relative path
+        """
+        with self._lock:
+            if self._entries.pop(path, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed (atomic replace)."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": self.VERSION,
+                "rules": self.fingerprint,
+                "entries": dict(self._entries),
+            }
+            self._dirty = False
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save validation cache: {e}")
+
+    def is_cache_file(self, path: Path) -> bool:
+        """Check whether a path is the cache file or its temporary file."""
+        return (
+            self.path is not None
+            and path.parent == self.path.parent
+            and path.name.startswith(self.path.name)
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class GovernanceFileHandler(FileSystemEventHandler):
-    """File system event handler for .parac/ monitoring."""
+    """File system event handler for .parac/ monitoring.
+
+    Events are only recorded here: the monitor debounces them and
+    validates on its worker pool, so the observer thread never blocks.
+    """
 
     def __init__(self, monitor: "GovernanceMonitor"):
         """Initialize handler.
@@ -121,7 +279,7 @@ class GovernanceFileHandler(FileSystemEventHandler):
             return
 
         logger.debug(f"File created: {path}")
-        self.monitor.check_file(path)
+        self.monitor.schedule_check(path)
 
     def on_moved(self, event: FileSystemEvent) -> None:
         """Handle file move events.
@@ -132,12 +290,30 @@ class GovernanceFileHandler(FileSystemEventHandler):
         if event.is_directory:
             return
 
+        # The source is gone; editors often save by renaming a temp file
+        src_path = Path(event.src_path)
+        if self._is_parac_file(src_path):
+            self.monitor.schedule_check(src_path)
+
         dest_path = Path(event.dest_path)
         if not self._is_parac_file(dest_path):
             return
 
         logger.debug(f"File moved to: {dest_path}")
-        self.monitor.check_file(dest_path)
+        self.monitor.schedule_check(dest_path)
+
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        """Handle file deletion events.
+
+        Args:
+            event: File system event
+        """
+        if event.is_directory:
+            return
+
+        path = Path(event.src_path)
+        if self._is_parac_file(path):
+            self.monitor.schedule_check(path)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events.
@@ -145,7 +321,8 @@ class GovernanceFileHandler(FileSystemEventHandler):
         Args:
             event: File system event
         """
-        # We don't validate on modifications, only on creation/move
+        # Validation depends on the path only, so content changes
+        # cannot change the result
         pass
 
     def _is_parac_file(self, path: Path) -> bool:
@@ -160,7 +337,7 @@ class GovernanceFileHandler(FileSystemEventHandler):
         try:
             # Convert to string and normalize separators
             path_str = str(path).replace("\\", "/")
-            return ".parac/" in path_str
+            return ".parac/" in path_str and not self.monitor.cache.is_cache_file(path)
         except Exception:
             return False
 
@@ -170,6 +347,8 @@ class GovernanceMonitor:
 
     Features:
     - Real-time file system watching
+    - Debounced events: bursts of saves are validated once
+    - Validation on a worker pool with a persistent result cache
     - Automatic violation detection
     - Auto-repair with configurable policies
     - Health dashboard
@@ -189,6 +368,11 @@ class GovernanceMonitor:
         parac_root: Path | None = None,
         auto_repair: bool = False,
         repair_delay_seconds: float = 5.0,
+        debounce_seconds: float = 0.2,
+        max_debounce_seconds: float = 2.0,
+        max_workers: int = 2,
+        cache_path: Path | None = None,
+        persist_cache: bool = True,
     ):
         """Initialize governance monitor.
 
@@ -196,16 +380,45 @@ class GovernanceMonitor:
             parac_root: Root .parac/ directory (auto-detected if None)
             auto_repair: Enable automatic violation repair
             repair_delay_seconds: Delay before auto-repair (allows undo)
+            debounce_seconds: Quiet period before validating changed files
+            max_debounce_seconds: Maximum delay under continuous changes
+            max_workers: Validation worker threads
+            cache_path: Validation cache file
+                (default: .parac/memory/data/governance_validation.json)
+            persist_cache: Persist validation results across restarts
         """
         self.parac_root = parac_root or self._find_parac_root()
         self.auto_repair = auto_repair
         self.repair_delay = repair_delay_seconds
+        self.debounce_seconds = debounce_seconds
+        self.max_debounce_seconds = max_debounce_seconds
+        self.max_workers = max_workers
 
         self.engine = get_compliance_engine()
         self.observer: Observer | None = None
         self.handler: GovernanceFileHandler | None = None
 
+        if persist_cache:
+            cache_path = cache_path or (
+                self.parac_root / "memory" / "data" / "governance_validation.json"
+            )
+        else:
+            cache_path = None
+        self.cache = ValidationCache(cache_path, rules_fingerprint(self.engine.rules))
+
+        # Event debouncing and validation workers
+        self._lock = threading.RLock()
+        self._pending: dict[Path, None] = {}
+        self._first_event: float | None = None
+        self._last_event = 0.0
+        self._debounce_timer: threading.Timer | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._inflight: set[Future] = set()
+
         # State tracking
+        self._files: dict[str, bool] = {}  # relative path -> valid
+        self._scanned = False
+        self._initial_scan_done = threading.Event()
         self.violations: dict[str, Violation] = {}
         self.repaired_violations: list[Violation] = []
         self.start_time: float | None = None
@@ -258,10 +471,11 @@ class GovernanceMonitor:
 
         logger.info("Starting governance monitor...")
 
-        # Initial scan
-        self._scan_all_files()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="governance-monitor"
+        )
 
-        # Start file system watcher
+        # Start file system watcher before scanning so no change is missed
         self.handler = GovernanceFileHandler(self)
         self.observer = Observer()
         self.observer.schedule(self.handler, str(self.parac_root), recursive=True)
@@ -273,7 +487,16 @@ class GovernanceMonitor:
         mode = "auto-repair enabled" if self.auto_repair else "monitoring only"
         logger.info(f"Monitor started ({mode})")
 
-        # Log initial health
+        # Initial scan runs in the background (cached results make it cheap)
+        self._initial_scan_done.clear()
+        self._submit(self._initial_scan)
+
+    def _initial_scan(self) -> None:
+        """Scan the workspace and log the initial health."""
+        try:
+            self._scan_all_files()
+        finally:
+            self._initial_scan_done.set()
         health = self.get_health()
         logger.info(
             f"Initial health: {health.status} "
@@ -295,6 +518,17 @@ class GovernanceMonitor:
 
         self.is_running = False
 
+        with self._lock:
+            if self._debounce_timer is not None:
+                self._debounce_timer.cancel()
+                self._debounce_timer = None
+            self._pending.clear()
+            self._first_event = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.cache.save()
+
         # Log final statistics
         uptime = time.time() - (self.start_time or time.time())
         logger.info(
@@ -305,6 +539,132 @@ class GovernanceMonitor:
             f"Repairs: {self.total_repairs}"
         )
 
+    def schedule_check(self, path: Path) -> None:
+        """Queue a changed path for a debounced check.
+
+        Repeated events for the same path within the debounce window are
+        coalesced; the batch is validated on the worker pool once events
+        stop for ``debounce_seconds`` (or after ``max_debounce_seconds``).
+        Without a running monitor the path is checked immediately.
+
+        Args:
+            path: Created, moved or deleted file path
+        """
+        if self._executor is None:
+            self._process_batch([path])
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._pending[path] = None
+            self._last_event = now
+            if self._first_event is None:
+                self._first_event = now
+            if self._debounce_timer is None:
+                self._start_debounce_timer(self.debounce_seconds)
+
+    def _start_debounce_timer(self, delay: float) -> None:
+        """Arm the debounce timer (caller holds the lock)."""
+        timer = threading.Timer(delay, self._flush_pending)
+        timer.daemon = True
+        timer.start()
+        self._debounce_timer = timer
+
+    def _flush_pending(self) -> None:
+        """Hand the coalesced batch to the workers once events settle."""
+        with self._lock:
+            if not self._pending or self._first_event is None:
+                self._debounce_timer = None
+                return
+            now = time.monotonic()
+            due = min(
+                self._last_event + self.debounce_seconds,
+                self._first_event + self.max_debounce_seconds,
+            )
+            if now < due:
+                self._start_debounce_timer(due - now)
+                return
+
+            batch = list(self._pending)
+            self._pending.clear()
+            self._first_event = None
+            self._debounce_timer = None
+
+        self._submit(self._process_batch, batch)
+
+    def _submit(self, fn: Any, *args: Any) -> None:
+        """Run a task on the worker pool (inline when not running)."""
+        executor = self._executor
+        if executor is None:
+            fn(*args)
+            return
+        try:
+            future = executor.submit(fn, *args)
+        except RuntimeError:
+            return  # Shutting down
+        with self._lock:
+            self._inflight.add(future)
+        future.add_done_callback(self._task_done)
+
+    def _task_done(self, future: Future) -> None:
+        with self._lock:
+            self._inflight.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Governance check failed: {future.exception()}")
+
+    def _process_batch(self, paths: list[Path]) -> None:
+        """Check each path in its current state and save the cache."""
+        for path in paths:
+            if path.is_file():
+                self.check_file(path)
+            else:
+                self._forget(path)
+        self.cache.save()
+
+    def wait_idle(self, timeout: float = 10.0) -> bool:
+        """Wait until pending events and validations are processed.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if idle, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if not self._pending and not self._inflight:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def _relative_path(self, path: Path) -> str | None:
+        """Get the workspace-relative path used as key (None if outside)."""
+        try:
+            rel_path = path.relative_to(self.parac_root.parent)
+        except ValueError:
+            return None
+        return str(rel_path).replace("\\", "/")
+
+    def _validate(self, path_str: str) -> ValidationResult:
+        """Validate a relative path, using cached results."""
+        result = self.cache.get(path_str)
+        if result is None:
+            result = self.engine.validate_file_path(path_str)
+            self.cache.put(path_str, result)
+        return result
+
+    def _forget(self, path: Path) -> None:
+        """Drop a path that no longer exists from the index."""
+        path_str = self._relative_path(path)
+        if path_str is None:
+            return
+        with self._lock:
+            self._files.pop(path_str, None)
+            if self.violations.pop(path_str, None) is not None:
+                logger.info(f"Violation resolved (file removed): {path_str}")
+        self.cache.discard(path_str)
+
     def check_file(self, path: Path) -> Violation | None:
         """Check a single file for violations.
 
@@ -318,36 +678,41 @@ class GovernanceMonitor:
         self.last_check = datetime.now()
 
         # Get relative path for validation
-        try:
-            rel_path = path.relative_to(self.parac_root.parent)
-        except ValueError:
+        path_str = self._relative_path(path)
+        if path_str is None:
             # Path not relative to .parac/, skip
             return None
 
-        path_str = str(rel_path).replace("\\", "/")
-
         # Validate
-        result = self.engine.validate_file_path(path_str)
-
-        if result.is_valid:
-            # Remove from violations if it was there
-            if path_str in self.violations:
-                logger.info(f"Violation resolved: {path_str}")
-                del self.violations[path_str]
-            return None
-
-        # Violation found
-        severity = self._determine_severity(result)
-        violation = Violation(
-            path=path_str,
-            category=result.category,
-            severity=severity,
-            error=result.error,
-            suggested_path=result.suggested_path,
-        )
+        result = self._validate(path_str)
+
+        with self._lock:
+            self._files[path_str] = result.is_valid
+
+            if result.is_valid:
+                # Remove from violations if it was there
+                if path_str in self.violations:
+                    logger.info(f"Violation resolved: {path_str}")
+                    del self.violations[path_str]
+                return None
+
+            # Already reported (e.g. the file was saved again)
+            existing = self.violations.get(path_str)
+            if existing is not None:
+                return existing
+
+            # Violation found
+            severity = self._determine_severity(result)
+            violation = Violation(
+                path=path_str,
+                category=result.category,
+                severity=severity,
+                error=result.error,
+                suggested_path=result.suggested_path,
+            )
 
-        self.violations[path_str] = violation
-        self.total_violations += 1
+            self.violations[path_str] = violation
+            self.total_violations += 1
 
         logger.warning(
             f"Violation detected: {path_str} " f"(severity: {severity.value})"
@@ -356,8 +721,6 @@ class GovernanceMonitor:
         # Auto-repair if enabled
         if self.auto_repair and severity == ViolationSeverity.CRITICAL:
             # Use thread-based delay since watchdog runs in threads
-            import threading
-
             repair_thread = threading.Timer(
                 self.repair_delay, lambda: self._auto_repair_sync(violation)
             )
@@ -429,9 +792,9 @@ class GovernanceMonitor:
             violation.repaired_at = datetime.now()
             violation.repair_action = RepairAction.MOVE
 
-            # Remove from active violations
-            if violation.path in self.violations:
-                del self.violations[violation.path]
+            # Remove from active violations and index the new location
+            self._forget(source)
+            self.check_file(target)
 
             # Add to repaired list
             self.repaired_violations.append(violation)
@@ -460,31 +823,58 @@ class GovernanceMonitor:
         return repaired_count
 
     def _scan_all_files(self) -> None:
-        """Scan all .parac/ files for initial state."""
+        """Scan all .parac/ files and rebuild the file index.
+
+        Paths are validated through the cache, so rescanning an unchanged
+        workspace only walks the directory tree.
+        """
         logger.info("Performing initial scan...")
 
-        # Get all files in .parac/
-        files = list(self.parac_root.rglob("*"))
-        file_count = len([f for f in files if f.is_file()])
+        seen: set[str] = set()
+        for dirpath, _dirnames, filenames in os.walk(self.parac_root):
+            for name in filenames:
+                path = Path(dirpath) / name
+                if self.cache.is_cache_file(path):
+                    continue
+                self.check_file(path)
+                path_str = self._relative_path(path)
+                if path_str is not None:
+                    seen.add(path_str)
 
-        logger.info(f"Scanning {file_count} files...")
+        # Drop files deleted since the last scan
+        with self._lock:
+            gone = [p for p in self._files if p not in seen]
+        for path_str in gone:
+            self._forget(self.parac_root.parent / path_str)
 
-        for path in files:
-            if path.is_file():
-                self.check_file(path)
+        self._scanned = True
+        self.cache.save()
 
-        logger.info(f"Scan complete. " f"Found {len(self.violations)} violations")
+        logger.info(
+            f"Scan complete. Checked {len(seen)} files "
+            f"({self.cache.hits} cached), found {len(self.violations)} violations"
+        )
 
     def get_health(self) -> GovernanceHealth:
         """Get current governance health status.
 
+        Computed from the file index maintained by scans and file events;
+        the tree is only walked if it was never scanned. While the initial
+        scan of a started monitor runs, waits for it to finish.
+
         Returns:
             Health status
         """
+        if not self._scanned:
+            if self.is_running:
+                self._initial_scan_done.wait()
+            else:
+                self._scan_all_files()
+
         # Count files
-        all_files = list(self.parac_root.rglob("*"))
-        total_files = len([f for f in all_files if f.is_file()])
-        valid_files = total_files - len(self.violations)
+        with self._lock:
+            total_files = len(self._files)
+            valid_files = sum(self._files.values())
 
         # Calculate violation rate
         uptime = time.time() - (self.start_time or time.time())
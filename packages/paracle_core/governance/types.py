@@ -36,6 +36,7 @@ class GovernanceActionType(str, Enum):
     ERROR = "ERROR"  # Error logging and recovery
     START = "START"  # Operation start
     COMPLETION = "COMPLETION"  # Operation completion
+    EXECUTION = "EXECUTION"  # Agent/workflow step execution
 
 
 class GovernanceAgentType(str, Enum):
@@ -6,9 +6,18 @@ This module provides core functionality for managing .parac/ workspaces:
 - Session management
 - Action logging
 - File management (logs, ADRs, roadmaps)
+- Artifact registry (agents, workflows, skills, manifests)
+- Compiled workspace cache (fast cold start)
 """
 
 from paracle_core.parac.adr_manager import ADR, ADRManager, ADRMetadata
+from paracle_core.parac.compiled import (
+    CompiledWorkspace,
+    compile_workspace,
+    fresh_workspace,
+    load_file_management,
+    load_workspace,
+)
 from paracle_core.parac.file_config import (  # ADR configuration; Main configuration; Log configuration; Roadmap configuration
     ADRConfig,
     ADRDefaultsConfig,
@@ -40,6 +49,14 @@ from paracle_core.parac.logger import (
     log_action,
     log_to_custom,
 )
+from paracle_core.parac.registry import (
+    Artifact,
+    ArtifactChange,
+    ArtifactKind,
+    ArtifactRegistry,
+    ChangeType,
+    get_registry,
+)
 from paracle_core.parac.roadmap_manager import (
     Roadmap,
     RoadmapManager,
@@ -121,4 +138,17 @@ __all__ = [
     "RoadmapManager",
     "RoadmapValidationResult",
     "SyncResult",
+    # Artifact registry
+    "Artifact",
+    "ArtifactChange",
+    "ArtifactKind",
+    "ArtifactRegistry",
+    "ChangeType",
+    "get_registry",
+    # Compiled workspace
+    "CompiledWorkspace",
+    "compile_workspace",
+    "fresh_workspace",
+    "load_file_management",
+    "load_workspace",
 ]
@@ -12,7 +12,8 @@ from pathlib import Path
 
 from pydantic import BaseModel
 
-from paracle_core.parac.file_config import ADRConfig, FileManagementConfig
+from paracle_core.parac.compiled import load_file_management
+from paracle_core.parac.file_config import ADRConfig
 
 
 class ADRMetadata(BaseModel):
@@ -78,8 +79,7 @@ class ADRManager:
         self.parac_root = parac_root
 
         if config is None:
-            file_config = FileManagementConfig.from_project_yaml(parac_root)
-            config = file_config.adr
+            config = load_file_management(parac_root).adr
 
         self.config = config
         self.adr_dir = parac_root / config.base_path
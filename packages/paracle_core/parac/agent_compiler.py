@@ -9,17 +9,28 @@ from .parac/agents/ to native formats recognized by various IDEs:
 - Codex (AGENTS.md)
 """
 
+import hashlib
 import json
 import logging
 import re
 import shutil
-from dataclasses import dataclass, field
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, is_dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-import yaml
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 
+from paracle_core.parac.compiled import (
+    CompiledWorkspace,
+    load_workspace,
+    workspace_tree_hash,
+)
+
 logger = logging.getLogger("paracle.core.parac.agent_compiler")
 
 
@@ -49,6 +60,19 @@ class ToolInfo:
     description: str
 
 
+@dataclass
+class BuildOutput:
+    """A file produced by a build target.
+
+    ``fingerprint`` covers everything ``render`` reads, so an output whose
+    fingerprint matches the previous build does not need re-rendering.
+    """
+
+    path: Path
+    fingerprint: str
+    render: Callable[[], str]
+
+
 class AgentCompiler:
     """Compiles .parac/agents/ to IDE-native formats.
 
@@ -58,6 +82,21 @@ class AgentCompiler:
 
     TEMPLATES_DIR = Path(__file__).parent / "templates" / "ide"
 
+    BUILD_TARGETS = (
+        "vscode",
+        "claude",
+        "cursor",
+        "windsurf",
+        "codex",
+        "zed",
+        "warp",
+        "gemini",
+    )
+
+    # Per-output fingerprints and content hashes of the last build
+    BUILD_STATE_FILE = ".build-state.json"
+    BUILD_STATE_VERSION = 1
+
     # Handoff definitions for multi-agent collaboration
     AGENT_HANDOFFS = {
         "architect": [
@@ -164,6 +203,10 @@ class AgentCompiler:
         self.workflows_catalog = parac_root / "workflows" / "catalog.yaml"
         self.tools_registry = parac_root / "tools" / "registry.yaml"
         self.mcp_servers_config = parac_root / "tools" / "mcp" / "servers.yaml"
+        self._compiled: CompiledWorkspace | None = None
+        self._agents: tuple[str, list[CompiledAgent]] | None = None
+        self._tools_info: tuple[str, list[ToolInfo]] | None = None
+        self._templates_digest: str | None = None
 
         # Output directories
         self.output_base = parac_root / "integrations" / "ide"
@@ -182,6 +225,13 @@ class AgentCompiler:
             logger.warning(f"Templates directory not found: {self.TEMPLATES_DIR}")
             self.jinja_env = None
 
+    @property
+    def workspace(self) -> CompiledWorkspace:
+        """Compiled .parac/ workspace (loaded on first use)."""
+        if self._compiled is None:
+            self._compiled = load_workspace(self.parac_root)
+        return self._compiled
+
     def load_agents(self) -> list[CompiledAgent]:
         """Load all agents from manifest + specs.
 
@@ -191,8 +241,12 @@ class AgentCompiler:
         if not self.manifest_path.exists():
             raise FileNotFoundError(f"Agent manifest not found: {self.manifest_path}")
 
-        with open(self.manifest_path, encoding="utf-8") as f:
-            manifest = yaml.safe_load(f)
+        # Revalidate once per load; helpers below reuse this snapshot
+        self._compiled = load_workspace(self.parac_root)
+        if self._agents is not None and self._agents[0] == self._compiled.tree_hash:
+            return list(self._agents[1])
+
+        manifest = self.workspace.document("agents/manifest.yaml")
 
         # Load workflows
         workflows = self._load_workflows()
@@ -206,10 +260,7 @@ class AgentCompiler:
         agents = []
         for agent_def in manifest.get("agents", []):
             agent_id = agent_def["id"]
-            spec_path = self.specs_dir / f"{agent_id}.md"
-            spec_content = ""
-            if spec_path.exists():
-                spec_content = spec_path.read_text(encoding="utf-8")
+            spec_content = self.workspace.text(f"agents/specs/{agent_id}.md", "")
 
             agents.append(
                 CompiledAgent(
@@ -230,7 +281,8 @@ class AgentCompiler:
                 )
             )
 
-        return agents
+        self._agents = (self._compiled.tree_hash, agents)
+        return list(agents)
 
     def _get_agent_skills(self, agent_id: str) -> list[str]:
         """Extract skills for an agent from SKILL_ASSIGNMENTS.md.
@@ -241,11 +293,10 @@ class AgentCompiler:
         Returns:
             List of skill names
         """
-        if not self.skills_file.exists():
+        content = self.workspace.text("agents/SKILL_ASSIGNMENTS.md")
+        if content is None:
             return []
 
-        content = self.skills_file.read_text(encoding="utf-8")
-
         # Find the section for this agent
         pattern = rf"### .+ {agent_id.title()}.*?Agent\s*\n.*?\*\*Skills\*\*:\s*\n((?:- `.+`.*\n)+)"
         match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
@@ -288,11 +339,10 @@ class AgentCompiler:
         Returns:
             List of workflow IDs
         """
-        if not self.workflows_catalog.exists():
+        if not self.workspace.has("workflows/catalog.yaml"):
             return []
 
-        with open(self.workflows_catalog, encoding="utf-8") as f:
-            catalog = yaml.safe_load(f)
+        catalog = self.workspace.document("workflows/catalog.yaml")
 
         workflows = []
         for wf in catalog.get("workflows", []):
@@ -314,46 +364,38 @@ class AgentCompiler:
         tools = []
 
         # Load from registry.yaml
-        if self.tools_registry.exists():
-            with open(self.tools_registry, encoding="utf-8") as f:
-                registry = yaml.safe_load(f)
+        if self.workspace.has("tools/registry.yaml"):
+            registry = self.workspace.document("tools/registry.yaml")
             if registry and registry.get("custom"):
                 tools.extend(registry["custom"])
 
         # Scan .parac/tools/custom/ for Python tools
-        custom_dir = self.parac_root / "tools" / "custom"
-        if custom_dir.exists():
-            for py_file in custom_dir.glob("*.py"):
-                if py_file.name.startswith("_"):
-                    continue
-
-                tool_name = py_file.stem
-                # Skip if already in registry
-                if any(t.get("name") == tool_name for t in tools):
-                    continue
-
-                # Try to extract metadata from Python file
-                description = f"Custom tool: {tool_name}"
-                try:
-                    content = py_file.read_text(encoding="utf-8")
-                    # Extract DESCRIPTION
-                    import re
-
-                    desc_match = re.search(
-                        r'^DESCRIPTION\s*=\s*["\'](.+?)["\']', content, re.MULTILINE
-                    )
-                    if desc_match:
-                        description = desc_match.group(1)
-                except Exception:
-                    pass
+        for rel_path in self.workspace.files("tools/custom", (".py",)):
+            py_file = Path(rel_path)
+            if py_file.name.startswith("_"):
+                continue
+
+            tool_name = py_file.stem
+            # Skip if already in registry
+            if any(t.get("name") == tool_name for t in tools):
+                continue
+
+            # Try to extract metadata from Python file
+            description = f"Custom tool: {tool_name}"
+            content = self.workspace.text(rel_path, "")
+            desc_match = re.search(
+                r'^DESCRIPTION\s*=\s*["\'](.+?)["\']', content, re.MULTILINE
+            )
+            if desc_match:
+                description = desc_match.group(1)
 
-                tools.append(
-                    {
-                        "name": tool_name,
-                        "description": description,
-                        "file": str(py_file.relative_to(self.parac_root)),
-                    }
-                )
+            tools.append(
+                {
+                    "name": tool_name,
+                    "description": description,
+                    "file": str(py_file),
+                }
+            )
 
         return tools
 
@@ -368,36 +410,26 @@ class AgentCompiler:
         Returns:
             List of MCP server definitions
         """
-        mcp_dir = self.parac_root / "tools" / "mcp"
-        if not mcp_dir.exists():
-            return []
-
         # Try loading from multiple config files
         config_files = [
-            mcp_dir / "mcp.yaml",
-            mcp_dir / "mcp.json",
-            mcp_dir / "servers.yaml",  # Legacy fallback
+            "tools/mcp/mcp.yaml",
+            "tools/mcp/mcp.json",
+            "tools/mcp/servers.yaml",  # Legacy fallback
         ]
 
         servers_config = []
         for config_file in config_files:
-            if config_file.exists():
-                with open(config_file, encoding="utf-8") as f:
-                    if config_file.suffix == ".json":
-                        config = json.load(f)
-                    else:
-                        config = yaml.safe_load(f) or {}
-
-                    # Handle different config formats
-                    if "servers" in config:
-                        servers_config = config["servers"]
-                    elif "mcpServers" in config:
-                        # VS Code format: convert to list
-                        for name, srv_config in config["mcpServers"].items():
-                            srv_config["id"] = name
-                            srv_config["name"] = name
-                            servers_config.append(srv_config)
-                    break
+            if self.workspace.has(config_file):
+                config = self.workspace.document(config_file) or {}
+
+                # Handle different config formats
+                if "servers" in config:
+                    servers_config = config["servers"]
+                elif "mcpServers" in config:
+                    # VS Code format: convert to list
+                    for name, srv_config in config["mcpServers"].items():
+                        servers_config.append({**srv_config, "id": name, "name": name})
+                break
 
         servers = []
         for server in servers_config:
@@ -420,6 +452,10 @@ class AgentCompiler:
         Returns:
             List of ToolInfo objects
         """
+        tree_hash = self.workspace.tree_hash
+        if self._tools_info is not None and self._tools_info[0] == tree_hash:
+            return list(self._tools_info[1])
+
         # Core agent tools from manifest
         tools = []
         try:
@@ -435,8 +471,7 @@ class AgentCompiler:
             logger.warning("Could not import agent_tool_registry")
             # Fallback to manifest tools
             if self.manifest_path.exists():
-                with open(self.manifest_path, encoding="utf-8") as f:
-                    manifest = yaml.safe_load(f)
+                manifest = self.workspace.document("agents/manifest.yaml")
                 for agent in manifest.get("agents", []):
                     for tool_name in agent.get("tools", []):
                         if not any(t.name == tool_name for t in tools):
@@ -446,7 +481,8 @@ class AgentCompiler:
                                 )
                             )
 
-        return tools
+        self._tools_info = (tree_hash, tools)
+        return list(tools)
 
     def _get_existing_ide_content(self, ide: str) -> str:
         """Get existing IDE-specific rules content to preserve.
@@ -572,6 +608,10 @@ class AgentCompiler:
             except TemplateNotFound:
                 logger.error("Windsurf rules template not found")
 
+        return rules, self._windsurf_mcp_config()
+
+    def _windsurf_mcp_config(self) -> str:
+        """Windsurf mcp_config.json content (static)."""
         mcp_config = {
             "mcpServers": {
                 "paracle": {
@@ -581,8 +621,7 @@ class AgentCompiler:
                 }
             }
         }
-
-        return rules, json.dumps(mcp_config, indent=2)
+        return json.dumps(mcp_config, indent=2)
 
     def compile_for_codex(self) -> str:
         """Generate AGENTS.md for Codex.
@@ -850,182 +889,403 @@ class AgentCompiler:
 
         return mcp_config
 
-    def build(self, target: str, output_dir: Path | None = None) -> dict[str, Any]:
+    def build(
+        self,
+        target: str,
+        output_dir: Path | None = None,
+        incremental: bool = True,
+        parallel: bool = True,
+    ) -> dict[str, Any]:
         """Build for target IDE(s).
 
+        Each output is fingerprinted with the data it is rendered from
+        (agent definitions, tools, workflows, templates). In incremental
+        mode an output is only re-rendered when its fingerprint changed
+        and only rewritten when the rendered content changed. Targets are
+        built concurrently.
+
         Args:
             target: IDE target (vscode, claude, cursor, windsurf, codex,
                     zed, warp, gemini, all)
             output_dir: Optional custom output directory
+            incremental: Reuse the previous build state (False rebuilds all)
+            parallel: Build independent targets concurrently
 
         Returns:
-            Dict with 'files' list and 'output_dir'
+            Dict with 'files' (all outputs), 'written', 'unchanged',
+            'removed' lists and 'output_dir'
         """
         if output_dir is None:
             output_dir = self.agents_output
 
-        all_targets = [
-            "vscode",
-            "claude",
-            "cursor",
-            "windsurf",
-            "codex",
-            "zed",
-            "warp",
-            "gemini",
-        ]
-        targets = all_targets if target == "all" else [target]
-        result: dict[str, Any] = {"files": [], "output_dir": str(output_dir)}
+        targets = list(self.BUILD_TARGETS) if target == "all" else [target]
+        state = self._load_build_state()
+        lock = threading.Lock()
 
-        for t in targets:
-            result["files"].extend(self._build_target(t, output_dir))
+        # Shared inputs are loaded once, before fanning out
+        if self.manifest_path.exists():
+            self.load_agents()
+            self._get_all_tools_info()
+
+        def run(t: str) -> dict[str, list[str]]:
+            return self._build_target(t, output_dir, state, lock, incremental)
 
+        if parallel and len(targets) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(targets), 8)) as pool:
+                reports = list(pool.map(run, targets))
+        else:
+            reports = [run(t) for t in targets]
+
+        result: dict[str, Any] = {
+            "files": [],
+            "written": [],
+            "unchanged": [],
+            "removed": [],
+            "output_dir": str(output_dir),
+        }
+        for report in reports:
+            for key in ("files", "written", "unchanged", "removed"):
+                result[key].extend(report[key])
+
+        self._save_build_state(state)
         return result
 
-    def _build_target(self, target: str, output_dir: Path) -> list[str]:
+    def _build_target(
+        self,
+        target: str,
+        output_dir: Path,
+        state: dict[str, dict[str, Any]],
+        lock: threading.Lock,
+        incremental: bool = True,
+    ) -> dict[str, list[str]]:
         """Build files for a single target IDE.
 
         Args:
             target: IDE target name
             output_dir: Output directory for agent files
+            state: Build state (per-output records), updated in place
+            lock: Guards ``state`` across concurrent targets
+            incremental: Skip outputs whose fingerprint is unchanged
 
         Returns:
-            List of generated file paths
+            Dict with 'files', 'written', 'unchanged' and 'removed' paths
         """
-        files: list[str] = []
+        report: dict[str, list[str]] = {
+            "files": [],
+            "written": [],
+            "unchanged": [],
+            "removed": [],
+        }
+        produced: set[str] = set()
+
+        for output in self._plan_target(target, output_dir):
+            key = str(output.path)
+            with lock:
+                record = state.get(key) if incremental else None
+            written = self._emit(output, record)
+            if written is None:
+                continue
+            new_record, changed = written
+            new_record["target"] = target
+            with lock:
+                state[key] = new_record
+            produced.add(key)
+            report["files"].append(key)
+            report["written" if changed else "unchanged"].append(key)
+
+        # Remove outputs this target produced last time but no longer does
+        # (e.g. a deleted agent), unless they were edited by hand
+        directories = {str(Path(key).parent) for key in produced}
+        with lock:
+            stale = [
+                key
+                for key, record in state.items()
+                if record.get("target") == target
+                and key not in produced
+                and str(Path(key).parent) in directories
+            ]
+            for key in stale:
+                record = state.pop(key)
+                path = Path(key)
+                if path.exists() and _sha256(path.read_bytes()) == record.get("sha256"):
+                    path.unlink()
+                    report["removed"].append(key)
+
+        return report
+
+    def _plan_target(self, target: str, output_dir: Path) -> list[BuildOutput]:
+        """List the outputs of a target with their fingerprints."""
+        if target in ("vscode", "claude"):
+            return self._plan_agent_files(target, output_dir)
+
+        if target == "windsurf":
+            return [
+                BuildOutput(
+                    self.output_base / ".windsurfrules",
+                    self._fingerprint(
+                        target,
+                        self.load_agents(),
+                        self._get_all_tools_info(),
+                        self._get_existing_ide_content("windsurf"),
+                    ),
+                    lambda: self.compile_for_windsurf()[0],
+                ),
+                BuildOutput(
+                    self.mcp_output / "windsurf.mcp.json",
+                    self._fingerprint("windsurf-mcp"),
+                    self._windsurf_mcp_config,
+                ),
+            ]
+
+        single_files = {
+            "cursor": (self.output_base / ".cursorrules", self.compile_for_cursor),
+            "codex": (output_dir / "codex" / "AGENTS.md", self.compile_for_codex),
+            "zed": (output_dir / "zed" / "ai_rules.md", self.compile_for_zed),
+            "warp": (output_dir / "warp" / "ai-rules.yaml", self.compile_for_warp),
+            "gemini": (
+                output_dir / "gemini" / "instructions.md",
+                self.compile_for_gemini,
+            ),
+        }
+        if target not in single_files:
+            return []
+
+        path, render = single_files[target]
+        existing = self._get_existing_ide_content(target) if target == "cursor" else ""
+        return [
+            BuildOutput(
+                path,
+                self._fingerprint(
+                    target, self.load_agents(), self._get_all_tools_info(), existing
+                ),
+                render,
+            )
+        ]
+
+    def _plan_agent_files(self, target: str, output_dir: Path) -> list[BuildOutput]:
+        """Per-agent outputs for vscode/claude (plus VS Code configs)."""
+        agents = self.load_agents()
+        outputs: list[BuildOutput] = []
+
+        template_name = {
+            "vscode": "vscode_agent.md.j2",
+            "claude": "claude_agent.md.j2",
+        }[target]
+        suffix = ".agent.md" if target == "vscode" else ".md"
+        template = self._get_template(template_name)
+        if template is not None:
+            for agent in agents:
+                outputs.append(
+                    BuildOutput(
+                        output_dir / target / f"{agent.id}{suffix}",
+                        self._fingerprint(target, agent),
+                        partial(template.render, agent=agent),
+                    )
+                )
 
         if target == "vscode":
-            files.extend(self._build_vscode(output_dir))
-        elif target == "claude":
-            files.extend(self._build_claude(output_dir))
-        elif target == "cursor":
-            files.extend(self._build_cursor())
-        elif target == "windsurf":
-            files.extend(self._build_windsurf())
-        elif target == "codex":
-            files.extend(self._build_codex(output_dir))
-        elif target == "zed":
-            files.extend(self._build_zed(output_dir))
-        elif target == "warp":
-            files.extend(self._build_warp(output_dir))
-        elif target == "gemini":
-            files.extend(self._build_gemini(output_dir))
-
-        return files
-
-    def _build_vscode(self, output_dir: Path) -> list[str]:
-        """Build VS Code agent files and configs."""
-        files: list[str] = []
-
-        # Agent files
-        target_dir = output_dir / "vscode"
-        target_dir.mkdir(parents=True, exist_ok=True)
-        for name, content in self.compile_for_vscode().items():
-            file_path = target_dir / name
-            file_path.write_text(content, encoding="utf-8")
-            files.append(str(file_path))
-
-        # VS Code tasks.json
-        self.vscode_output.mkdir(parents=True, exist_ok=True)
-        tasks = self.compile_vscode_tasks()
-        tasks_path = self.vscode_output / "tasks.json"
-        tasks_path.write_text(json.dumps(tasks, indent=2), encoding="utf-8")
-        files.append(str(tasks_path))
-
-        # VS Code mcp.json
-        # Detect dev mode: if .venv exists in project root, use uv run
-        project_root = self.parac_root.parent
-        dev_mode = (project_root / ".venv").exists()
-        mcp = self.compile_vscode_mcp(dev_mode=dev_mode)
-        mcp_path = self.vscode_output / "mcp.json"
-        mcp_path.write_text(json.dumps(mcp, indent=2), encoding="utf-8")
-        files.append(str(mcp_path))
-
-        return files
-
-    def _build_claude(self, output_dir: Path) -> list[str]:
-        """Build Claude Code agent files."""
-        files: list[str] = []
-        target_dir = output_dir / "claude"
-        target_dir.mkdir(parents=True, exist_ok=True)
-        for name, content in self.compile_for_claude().items():
-            file_path = target_dir / name
-            file_path.write_text(content, encoding="utf-8")
-            files.append(str(file_path))
-        return files
-
-    def _build_cursor(self) -> list[str]:
-        """Build Cursor rules file."""
-        files: list[str] = []
-        rules = self.compile_for_cursor()
-        if rules:
-            rules_path = self.output_base / ".cursorrules"
-            rules_path.write_text(rules, encoding="utf-8")
-            files.append(str(rules_path))
-        return files
-
-    def _build_windsurf(self) -> list[str]:
-        """Build Windsurf rules and MCP config."""
-        files: list[str] = []
-        rules, mcp_config = self.compile_for_windsurf()
-        if rules:
-            rules_path = self.output_base / ".windsurfrules"
-            rules_path.write_text(rules, encoding="utf-8")
-            files.append(str(rules_path))
-
-        self.mcp_output.mkdir(parents=True, exist_ok=True)
-        mcp_path = self.mcp_output / "windsurf.mcp.json"
-        mcp_path.write_text(mcp_config, encoding="utf-8")
-        files.append(str(mcp_path))
-        return files
-
-    def _build_codex(self, output_dir: Path) -> list[str]:
-        """Build Codex AGENTS.md file."""
-        files: list[str] = []
-        content = self.compile_for_codex()
-        if content:
-            codex_dir = output_dir / "codex"
-            codex_dir.mkdir(parents=True, exist_ok=True)
-            file_path = codex_dir / "AGENTS.md"
-            file_path.write_text(content, encoding="utf-8")
-            files.append(str(file_path))
-        return files
-
-    def _build_zed(self, output_dir: Path) -> list[str]:
-        """Build Zed AI rules file."""
-        files: list[str] = []
-        content = self.compile_for_zed()
-        if content:
-            zed_dir = output_dir / "zed"
-            zed_dir.mkdir(parents=True, exist_ok=True)
-            file_path = zed_dir / "ai_rules.md"
-            file_path.write_text(content, encoding="utf-8")
-            files.append(str(file_path))
-        return files
-
-    def _build_warp(self, output_dir: Path) -> list[str]:
-        """Build Warp AI rules file."""
-        files: list[str] = []
-        content = self.compile_for_warp()
-        if content:
-            warp_dir = output_dir / "warp"
-            warp_dir.mkdir(parents=True, exist_ok=True)
-            file_path = warp_dir / "ai-rules.yaml"
-            file_path.write_text(content, encoding="utf-8")
-            files.append(str(file_path))
-        return files
-
-    def _build_gemini(self, output_dir: Path) -> list[str]:
-        """Build Gemini CLI instructions file."""
-        files: list[str] = []
-        content = self.compile_for_gemini()
-        if content:
-            gemini_dir = output_dir / "gemini"
-            gemini_dir.mkdir(parents=True, exist_ok=True)
-            file_path = gemini_dir / "instructions.md"
-            file_path.write_text(content, encoding="utf-8")
-            files.append(str(file_path))
-        return files
+            outputs.append(
+                BuildOutput(
+                    self.vscode_output / "tasks.json",
+                    self._fingerprint(
+                        "vscode-tasks",
+                        [agent.id for agent in agents],
+                        self._load_workflows(),
+                    ),
+                    lambda: json.dumps(self.compile_vscode_tasks(), indent=2),
+                )
+            )
+            # Detect dev mode: if .venv exists in project root, use uv run
+            dev_mode = (self.parac_root.parent / ".venv").exists()
+            outputs.append(
+                BuildOutput(
+                    self.vscode_output / "mcp.json",
+                    self._fingerprint("vscode-mcp", dev_mode),
+                    lambda: json.dumps(
+                        self.compile_vscode_mcp(dev_mode=dev_mode), indent=2
+                    ),
+                )
+            )
+
+        return outputs
+
+    def _emit(
+        self, output: BuildOutput, record: dict[str, Any] | None
+    ) -> tuple[dict[str, Any], bool] | None:
+        """Render and write one output if needed.
+
+        Args:
+            output: Output to produce
+            record: Build state record from the previous build, if any
+
+        Returns:
+            (new record, whether the file was written), or None if the
+            output rendered empty and was not produced
+        """
+        path = output.path
+        if record and record.get("fingerprint") == output.fingerprint:
+            try:
+                st = path.stat()
+            except OSError:
+                st = None
+            if (
+                st is not None
+                and st.st_size == record.get("size")
+                and st.st_mtime_ns == record.get("mtime_ns")
+            ):
+                return record, False
+
+        content = output.render()
+        if not content:
+            return None
+
+        data = content.encode("utf-8")
+        digest = _sha256(data)
+        try:
+            unchanged = _sha256(path.read_bytes()) == digest
+        except OSError:
+            unchanged = False
+
+        if not unchanged:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+
+        st = path.stat()
+        return (
+            {
+                "fingerprint": output.fingerprint,
+                "sha256": digest,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+            },
+            not unchanged,
+        )
+
+    def _get_template(self, name: str) -> Any | None:
+        """Get a Jinja2 template, or None (logged) if unavailable."""
+        if not self.jinja_env:
+            logger.error("Jinja2 environment not initialized")
+            return None
+        try:
+            return self.jinja_env.get_template(name)
+        except TemplateNotFound:
+            logger.error(f"Template not found: {name}")
+            return None
+
+    def _fingerprint(self, *parts: Any) -> str:
+        """Hash render inputs together with the template sources."""
+        if self._templates_digest is None:
+            digest = hashlib.sha256()
+            if self.TEMPLATES_DIR.exists():
+                for path in sorted(self.TEMPLATES_DIR.iterdir()):
+                    if path.is_file():
+                        digest.update(path.name.encode() + b"\0")
+                        digest.update(path.read_bytes())
+            self._templates_digest = digest.hexdigest()
+
+        payload = json.dumps(
+            [self._templates_digest, *parts], sort_keys=True, default=_jsonable
+        )
+        return _sha256(payload.encode("utf-8"))
+
+    def _build_state_path(self) -> Path:
+        return self.output_base / self.BUILD_STATE_FILE
+
+    def _load_build_state(self) -> dict[str, dict[str, Any]]:
+        """Load per-output records of the previous build."""
+        try:
+            data = json.loads(self._build_state_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != self.BUILD_STATE_VERSION:
+            return {}
+        return data.get("outputs", {})
+
+    def _save_build_state(self, state: dict[str, dict[str, Any]]) -> None:
+        """Persist per-output records for the next incremental build."""
+        path = self._build_state_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps(
+                    {"version": self.BUILD_STATE_VERSION, "outputs": state},
+                    indent=2,
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.warning(f"Could not save build state: {e}")
+
+    def watch(
+        self,
+        target: str,
+        output_dir: Path | None = None,
+        on_build: Callable[[dict[str, Any]], None] | None = None,
+        stop_event: threading.Event | None = None,
+        poll_interval: float = 0.5,
+        debounce: float = 0.05,
+    ) -> None:
+        """Rebuild a target whenever the workspace changes.
+
+        Uses watchdog file system events when available (rebuilds within
+        milliseconds of a save) and polls the workspace tree hash
+        otherwise. Blocks until ``stop_event`` is set.
+
+        Args:
+            target: IDE target (or "all")
+            output_dir: Optional custom output directory
+            on_build: Called with the result of every rebuild
+            stop_event: Set to stop watching
+            poll_interval: Seconds between tree hash checks without events
+            debounce: Seconds to wait for a burst of writes to settle
+        """
+        from paracle_core.parac.registry import WATCHDOG_AVAILABLE
+
+        stop_event = stop_event or threading.Event()
+        changed = threading.Event()
+        observer = None
+
+        if WATCHDOG_AVAILABLE:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+
+            ignored = (str(self.output_base), str(self.parac_root / "memory"))
+
+            class _Handler(FileSystemEventHandler):
+                def on_any_event(self, event: Any) -> None:
+                    if not str(event.src_path).startswith(ignored):
+                        changed.set()
+
+            observer = Observer()
+            observer.schedule(_Handler(), str(self.parac_root), recursive=True)
+            observer.daemon = True
+            observer.start()
+
+        last_hash = workspace_tree_hash(self.parac_root)
+        try:
+            while not stop_event.is_set():
+                changed.wait(poll_interval)
+                if stop_event.is_set():
+                    break
+                if changed.is_set():
+                    time.sleep(debounce)
+                    changed.clear()
+                tree_hash = workspace_tree_hash(self.parac_root)
+                if tree_hash == last_hash:
+                    continue
+                last_hash = tree_hash
+                try:
+                    result = self.build(target, output_dir=output_dir)
+                except Exception as e:
+                    logger.error(f"Rebuild failed: {e}")
+                    continue
+                if on_build is not None:
+                    on_build(result)
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
 
     def copy_to_destinations(self, target: str) -> list[Path]:
         """Copy generated files to expected IDE locations.
@@ -1035,7 +1295,7 @@ class AgentCompiler:
                     zed, warp, gemini, all)
 
         Returns:
-            List of destination paths
+            List of destination paths that were (re)copied; identical copies are skipped
         """
         copied = []
         project_root = self.parac_root.parent
@@ -1061,8 +1321,8 @@ class AgentCompiler:
                     dest_dir.mkdir(parents=True, exist_ok=True)
                     for file in src_dir.glob("*.agent.md"):
                         dest = dest_dir / file.name
-                        shutil.copy2(file, dest)
-                        copied.append(dest)
+                        if _copy_if_changed(file, dest):
+                            copied.append(dest)
 
                 # VS Code config files (tasks.json, mcp.json)
                 vscode_dest = project_root / ".vscode"
@@ -1071,14 +1331,14 @@ class AgentCompiler:
                 tasks_src = self.vscode_output / "tasks.json"
                 if tasks_src.exists():
                     tasks_dest = vscode_dest / "tasks.json"
-                    shutil.copy2(tasks_src, tasks_dest)
-                    copied.append(tasks_dest)
+                    if _copy_if_changed(tasks_src, tasks_dest):
+                        copied.append(tasks_dest)
 
                 mcp_src = self.vscode_output / "mcp.json"
                 if mcp_src.exists():
                     mcp_dest = vscode_dest / "mcp.json"
-                    shutil.copy2(mcp_src, mcp_dest)
-                    copied.append(mcp_dest)
+                    if _copy_if_changed(mcp_src, mcp_dest):
+                        copied.append(mcp_dest)
 
             elif t == "claude":
                 src_dir = self.agents_output / "claude"
@@ -1087,36 +1347,36 @@ class AgentCompiler:
                     dest_dir.mkdir(parents=True, exist_ok=True)
                     for file in src_dir.glob("*.md"):
                         dest = dest_dir / file.name
-                        shutil.copy2(file, dest)
-                        copied.append(dest)
+                        if _copy_if_changed(file, dest):
+                            copied.append(dest)
 
             elif t == "cursor":
                 src = self.output_base / ".cursorrules"
                 if src.exists():
                     dest = project_root / ".cursorrules"
-                    shutil.copy2(src, dest)
-                    copied.append(dest)
+                    if _copy_if_changed(src, dest):
+                        copied.append(dest)
 
             elif t == "windsurf":
                 src = self.output_base / ".windsurfrules"
                 if src.exists():
                     dest = project_root / ".windsurfrules"
-                    shutil.copy2(src, dest)
-                    copied.append(dest)
+                    if _copy_if_changed(src, dest):
+                        copied.append(dest)
 
                 # MCP config - note: user may need to copy to ~/.codeium/windsurf/
                 mcp_src = self.mcp_output / "windsurf.mcp.json"
                 if mcp_src.exists():
                     mcp_dest = project_root / "mcp_config.json"
-                    shutil.copy2(mcp_src, mcp_dest)
-                    copied.append(mcp_dest)
+                    if _copy_if_changed(mcp_src, mcp_dest):
+                        copied.append(mcp_dest)
 
             elif t == "codex":
                 src = self.agents_output / "codex" / "AGENTS.md"
                 if src.exists():
                     dest = project_root / "AGENTS.md"
-                    shutil.copy2(src, dest)
-                    copied.append(dest)
+                    if _copy_if_changed(src, dest):
+                        copied.append(dest)
 
             elif t == "zed":
                 src = self.agents_output / "zed" / "ai_rules.md"
@@ -1124,8 +1384,8 @@ class AgentCompiler:
                     dest_dir = project_root / ".zed"
                     dest_dir.mkdir(parents=True, exist_ok=True)
                     dest = dest_dir / "ai_rules.md"
-                    shutil.copy2(src, dest)
-                    copied.append(dest)
+                    if _copy_if_changed(src, dest):
+                        copied.append(dest)
 
             elif t == "warp":
                 src = self.agents_output / "warp" / "ai-rules.yaml"
@@ -1133,8 +1393,8 @@ class AgentCompiler:
                     dest_dir = project_root / ".warp"
                     dest_dir.mkdir(parents=True, exist_ok=True)
                     dest = dest_dir / "ai-rules.yaml"
-                    shutil.copy2(src, dest)
-                    copied.append(dest)
+                    if _copy_if_changed(src, dest):
+                        copied.append(dest)
 
             elif t == "gemini":
                 src = self.agents_output / "gemini" / "instructions.md"
@@ -1142,10 +1402,36 @@ class AgentCompiler:
                     dest_dir = project_root / ".gemini"
                     dest_dir.mkdir(parents=True, exist_ok=True)
                     dest = dest_dir / "instructions.md"
-                    shutil.copy2(src, dest)
-                    copied.append(dest)
+                    if _copy_if_changed(src, dest):
+                        copied.append(dest)
 
         return copied
 
 
-__all__ = ["AgentCompiler", "CompiledAgent", "ToolInfo"]
+def _copy_if_changed(src: Path, dest: Path) -> bool:
+    """Copy a file unless dest is already an identical copy (copy2 keeps mtime)."""
+    try:
+        src_stat, dest_stat = src.stat(), dest.stat()
+        if (
+            src_stat.st_size == dest_stat.st_size
+            and src_stat.st_mtime_ns == dest_stat.st_mtime_ns
+        ):
+            return False
+    except OSError:
+        pass
+    shutil.copy2(src, dest)
+    return True
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _jsonable(obj: Any) -> Any:
+    """JSON fallback for fingerprinting dataclasses and paths."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+__all__ = ["AgentCompiler", "BuildOutput", "CompiledAgent", "ToolInfo"]
@@ -1,26 +1,24 @@
 """Agent discovery system for .parac/ workspace.
 
 Scans and discovers agents defined in .parac/agents/specs/ directory.
+Parsed specs are served by the shared ``ArtifactRegistry``, so lookups are
+answered from memory and reflect edits immediately.
 """
 
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from paracle_core.parac.registry import ArtifactKind, get_registry
+
 try:
-    from paracle_profiling import cached, profile
+    from paracle_profiling import profile
 
     PROFILING_AVAILABLE = True
 except ImportError:
     # Profiling not available - use no-op decorators
     PROFILING_AVAILABLE = False
 
-    def cached(*args, **kwargs):
-        def decorator(func):
-            return func
-
-        return decorator
-
     def profile(*args, **kwargs):
         def decorator(func):
             return func
@@ -56,7 +54,19 @@ class AgentMetadata:
         Returns:
             AgentMetadata instance with extracted information
         """
-        content = spec_path.read_text(encoding="utf-8")
+        return cls.from_text(spec_path.read_text(encoding="utf-8"), spec_path)
+
+    @classmethod
+    def from_text(cls, content: str, spec_path: Path) -> "AgentMetadata":
+        """Extract metadata from the markdown of an agent spec.
+
+        Args:
+            content: Markdown content
+            spec_path: Path the content was read from (gives the agent ID)
+
+        Returns:
+            AgentMetadata instance with extracted information
+        """
         lines = content.split("\n")
 
         name = ""
@@ -140,7 +150,7 @@ class AgentDiscovery:
         self.parac_root = parac_root
         self.agents_dir = parac_root / "agents" / "specs"
         self.manifest_file = parac_root / "agents" / "manifest.yaml"
-        self._manifest_cache: dict[str, Any] | None = None
+        self.registry = get_registry(parac_root)
 
     def discover_agents(self) -> list[AgentMetadata]:
         """Discover all agents in .parac/agents/specs/.
@@ -156,77 +166,19 @@ class AgentDiscovery:
         if not self.agents_dir.exists():
             raise FileNotFoundError(f"Agents directory not found: {self.agents_dir}")
 
-        # Load manifest for tools/skills enrichment
-        manifest_data = self._load_manifest()
-
         agents = []
-        for spec_file in sorted(self.agents_dir.glob("*.md")):
-            if spec_file.stem.startswith("_"):
-                continue  # Skip files starting with underscore
-
+        for agent_id in self.registry.list_keys(ArtifactKind.AGENT):
             try:
-                agent = AgentMetadata.from_markdown(spec_file)
-                # Enrich with tools and skills from manifest
-                self._enrich_from_manifest(agent, manifest_data)
-                agents.append(agent)
+                agent = self.registry.get_agent(agent_id)
+                if agent is not None:
+                    agents.append(agent)
             except Exception as e:
                 # Log warning but continue with other agents
-                print(f"Warning: Could not parse {spec_file.name}: {e}")
+                print(f"Warning: Could not parse {agent_id}.md: {e}")
 
         return agents
 
-    def _load_manifest(self) -> dict[str, Any]:
-        """Load and cache manifest.yaml.
-
-        Returns:
-            Manifest data as dictionary
-        """
-        if self._manifest_cache is not None:
-            return self._manifest_cache
-
-        if not self.manifest_file.exists():
-            self._manifest_cache = {}
-            return self._manifest_cache
-
-        try:
-            import yaml
-
-            content = self.manifest_file.read_text(encoding="utf-8")
-            self._manifest_cache = yaml.safe_load(content) or {}
-        except Exception as e:
-            print(f"Warning: Could not load manifest.yaml: {e}")
-            self._manifest_cache = {}
-
-        return self._manifest_cache
-
-    def _enrich_from_manifest(
-        self, agent: AgentMetadata, manifest_data: dict[str, Any]
-    ) -> None:
-        """Enrich agent metadata with tools and skills from manifest.
-
-        Args:
-            agent: Agent metadata to enrich
-            manifest_data: Loaded manifest data
-        """
-        agents_list = manifest_data.get("agents", [])
-
-        for manifest_agent in agents_list:
-            if manifest_agent.get("id") == agent.id:
-                # Extract tools (strip comments)
-                tools = manifest_agent.get("tools", [])
-                agent.tools = [
-                    t.split("#")[0].strip() for t in tools if t.split("#")[0].strip()
-                ]
-
-                # Extract skills (strip comments)
-                skills = manifest_agent.get("skills", [])
-                agent.skills = [
-                    s.split("#")[0].strip() for s in skills if s.split("#")[0].strip()
-                ]
-                break
-
-    @cached(ttl=300)  # Cache for 5 minutes
-    @profile(track_memory=True)
+    @profile()
     def get_agent(self, agent_id: str) -> AgentMetadata | None:
         """Get specific agent by ID.
 
@@ -236,19 +188,8 @@ class AgentDiscovery:
         Returns:
             AgentMetadata if found, None otherwise
         """
-        spec_file = self.agents_dir / f"{agent_id}.md"
-        if not spec_file.exists():
-            return None
+        return self.registry.get_agent(agent_id)
 
-        agent = AgentMetadata.from_markdown(spec_file)
-
-        # Enrich with tools and skills from manifest
-        manifest_data = self._load_manifest()
-        self._enrich_from_manifest(agent, manifest_data)
-
-        return agent
-
-    @cached(ttl=300)  # Cache for 5 minutes
     @profile()
     def get_agent_spec_content(self, agent_id: str) -> str | None:
         """Get full content of agent specification.
@@ -259,8 +200,4 @@ class AgentDiscovery:
         Returns:
             Full markdown content of agent spec, or None if not found
         """
-        spec_file = self.agents_dir / f"{agent_id}.md"
-        if not spec_file.exists():
-            return None
-
-        return spec_file.read_text(encoding="utf-8")
+        return self.registry.get_agent_content(agent_id)
@@ -0,0 +1,484 @@
+"""Precompiled cache of a .parac/ workspace.
+
+CLI commands, the API server and the MCP server all need the parsed
+workspace (project configuration, agent manifest and specs, skills,
+workflows, policies, tool registries). Parsing hundreds of YAML and
+markdown files on every start is the dominant cold-start cost, so the
+parsed result is compiled into a single cache file
+(``memory/data/workspace.cache``) and loaded in one read.
+
+The cache is keyed by a tree hash over the path, size and timestamps of
+every input file, so checking freshness costs one ``stat`` per input and
+never parses anything. ``load_workspace()`` recompiles automatically when
+the tree hash no longer matches; ``paracle parac compile`` does the same
+ahead of time.
+
+File layout (little endian)::
+
+    magic (8) | format version (u32) | tree hash (32) | payload size (u64)
+    payload: pickled CompiledWorkspace
+
+The header is validated through a read-only memory map before the payload
+is touched, so a stale or foreign cache is rejected without unpickling it.
+The cache only holds data parsed from the workspace itself and lives inside
+it, so it is trusted like the workspace's own ``tools/custom`` code.
+
+Usage:
+    from paracle_core.parac.compiled import load_workspace
+
+    workspace = load_workspace(parac_root)
+    manifest = workspace.document("agents/manifest.yaml")
+    agents = workspace.agents
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from paracle_core.parac.file_config import FileManagementConfig
+from paracle_core.parac.registry import ArtifactKind, ArtifactRegistry, SkillDefinition
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = Path("memory") / "data" / "workspace.cache"
+FORMAT_VERSION = 1
+
+_MAGIC = b"PARACWS\x00"
+_HEADER = struct.Struct("<8sI32sQ")
+
+# Single files read into the cache (relative to .parac/)
+_INPUT_FILES = (
+    "project.yaml",
+    "GOVERNANCE.md",
+    "agents/manifest.yaml",
+    "agents/SKILL_ASSIGNMENTS.md",
+    "workflows/catalog.yaml",
+    "tools/registry.yaml",
+    "roadmap/decisions.md",
+    "memory/context/open_questions.md",
+)
+
+# Directories read into the cache: (directory, suffixes or None for all, recursive)
+_INPUT_DIRS = (
+    ("config", (".yaml", ".yml"), True),
+    ("agents/specs", (".md",), False),
+    ("agents/skills", None, True),
+    ("workflows/definitions", (".yaml", ".yml"), False),
+    ("workflows/templates", (".yaml", ".yml"), False),
+    ("policies", (".md", ".yaml"), False),
+    ("tools/mcp", (".yaml", ".json"), False),
+    ("tools/custom", (".py",), False),
+)
+
+_DOCUMENT_SUFFIXES = (".yaml", ".yml", ".json")
+
+
+@dataclass
+class CompiledWorkspace:
+    """Parsed contents of a .parac/ workspace.
+
+    Attributes:
+        tree_hash: Hash of the input files this was compiled from
+        compiled_at: Unix timestamp of compilation
+        file_management: Resolved ``file_management`` configuration
+        documents: Parsed YAML/JSON documents, keyed by relative path
+        texts: Markdown and Python sources, keyed by relative path
+        agents: Agent metadata (enriched from the manifest), keyed by ID
+        skills: Parsed skill directories, keyed by ID
+        workflows: Workflow definitions, keyed by name
+        errors: Files that failed to parse, with the error message
+    """
+
+    tree_hash: str
+    compiled_at: float
+    file_management: FileManagementConfig
+    documents: dict[str, Any] = field(default_factory=dict)
+    texts: dict[str, str] = field(default_factory=dict)
+    agents: dict[str, Any] = field(default_factory=dict)
+    skills: dict[str, SkillDefinition] = field(default_factory=dict)
+    workflows: dict[str, dict[str, Any]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    parac_root: Path | None = None
+
+    def document(self, rel_path: str, default: Any = None) -> Any:
+        """Get a parsed YAML/JSON document.
+
+        Documents that failed to compile are parsed again from disk so
+        the caller sees the same exception as without the cache.
+
+        Args:
+            rel_path: Path relative to .parac/ (e.g. ``agents/manifest.yaml``)
+            default: Returned when the file does not exist
+        """
+        if rel_path in self.errors and self.parac_root is not None:
+            return _parse_document(self.parac_root / rel_path)
+        return self.documents.get(rel_path, default)
+
+    def text(self, rel_path: str, default: str | None = None) -> str | None:
+        """Get the contents of a markdown or Python source file."""
+        return self.texts.get(rel_path, default)
+
+    def has(self, rel_path: str) -> bool:
+        """Whether the file existed when the workspace was compiled."""
+        return (
+            rel_path in self.documents
+            or rel_path in self.texts
+            or rel_path in self.errors
+        )
+
+    def files(self, directory: str, suffixes: tuple[str, ...] = ()) -> list[str]:
+        """List compiled files directly inside a directory, sorted.
+
+        Args:
+            directory: Directory relative to .parac/ (e.g. ``tools/custom``)
+            suffixes: Only return files with one of these suffixes
+        """
+        prefix = directory.rstrip("/") + "/"
+        return sorted(
+            path
+            for path in (*self.documents, *self.texts, *self.errors)
+            if path.startswith(prefix)
+            and "/" not in path[len(prefix) :]
+            and (not suffixes or path.endswith(suffixes))
+        )
+
+    @property
+    def policies(self) -> list[str]:
+        """Names of the policy files in ``policies/``."""
+        return sorted(
+            Path(path).stem for path in self.files("policies", (".md", ".yaml"))
+        )
+
+
+# =============================================================================
+# Tree hash
+# =============================================================================
+
+
+def _input_files(parac_root: Path) -> list[tuple[str, os.stat_result]]:
+    """Stat every compile input, sorted by relative path."""
+    found: list[tuple[str, os.stat_result]] = []
+
+    for rel in _INPUT_FILES:
+        try:
+            found.append((rel, os.stat(parac_root / rel)))
+        except OSError:
+            continue
+
+    def scan(directory: Path, rel_dir: str, suffixes, recursive: bool) -> None:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and not entry.name.startswith((".", "__")):
+                    scan(Path(entry.path), rel, suffixes, recursive)
+            elif entry.is_file() and (
+                suffixes is None or entry.name.endswith(suffixes)
+            ):
+                try:
+                    found.append((rel, entry.stat()))
+                except OSError:
+                    continue
+
+    for rel_dir, suffixes, recursive in _INPUT_DIRS:
+        scan(parac_root / rel_dir, rel_dir, suffixes, recursive)
+
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+def workspace_tree_hash(parac_root: Path) -> str:
+    """Compute the tree hash of a workspace's compile inputs.
+
+    Only file metadata is hashed (path, size, mtime, ctime, inode), like
+    a git index, so this never reads file contents.
+
+    Args:
+        parac_root: Path to .parac/ directory
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    from paracle_core import __version__
+
+    digest = hashlib.sha256(
+        f"{FORMAT_VERSION}:{__version__}:{sys.version_info[:2]}".encode()
+    )
+    for rel, st in _input_files(parac_root):
+        digest.update(
+            f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_ctime_ns}\0"
+            f"{st.st_ino}\n".encode()
+        )
+    return digest.hexdigest()
+
+
+# =============================================================================
+# Compilation
+# =============================================================================
+
+
+def _parse_document(path: Path) -> Any:
+    with open(path, encoding="utf-8") as f:
+        if path.suffix == ".json":
+            return json.load(f)
+        return yaml.safe_load(f)
+
+
+def compile_workspace(
+    parac_root: Path, tree_hash: str | None = None
+) -> CompiledWorkspace:
+    """Parse a workspace into a CompiledWorkspace (nothing is written).
+
+    Files that fail to parse are recorded in ``errors`` instead of
+    aborting the compilation.
+
+    Args:
+        parac_root: Path to .parac/ directory
+        tree_hash: Precomputed tree hash (computed if omitted)
+
+    Returns:
+        The compiled workspace
+    """
+    parac_root = Path(parac_root).absolute()
+    if tree_hash is None:
+        tree_hash = workspace_tree_hash(parac_root)
+
+    workspace = CompiledWorkspace(
+        tree_hash=tree_hash,
+        compiled_at=time.time(),
+        file_management=FileManagementConfig.from_project_yaml(parac_root),
+        parac_root=parac_root,
+    )
+
+    for rel, _ in _input_files(parac_root):
+        if rel.startswith(
+            ("agents/skills/", "workflows/definitions/", "workflows/templates/")
+        ):
+            continue  # parsed through the registry below
+        path = parac_root / rel
+        try:
+            if path.suffix in _DOCUMENT_SUFFIXES:
+                workspace.documents[rel] = _parse_document(path)
+            else:
+                workspace.texts[rel] = path.read_text(encoding="utf-8")
+        except Exception as e:
+            workspace.errors[rel] = str(e)
+
+    # A private registry, so compiling does not populate the shared one
+    registry = ArtifactRegistry(parac_root)
+    for agent in registry.list_agents():
+        workspace.agents[agent.id] = agent
+    for skill_id in registry.list_keys(ArtifactKind.SKILL):
+        try:
+            skill = registry.get_skill(skill_id)
+        except Exception as e:
+            workspace.errors[f"agents/skills/{skill_id}"] = str(e)
+            continue
+        if skill is not None:
+            workspace.skills[skill_id] = skill
+    for name in registry.list_keys(ArtifactKind.WORKFLOW):
+        try:
+            workflow = registry.get_workflow(name)
+        except Exception as e:
+            workspace.errors[f"workflows/{name}"] = str(e)
+            continue
+        if workflow is not None:
+            workspace.workflows[name] = workflow
+
+    return workspace
+
+
+# =============================================================================
+# Cache file
+# =============================================================================
+
+
+def write_workspace(workspace: CompiledWorkspace, path: Path) -> int:
+    """Atomically write a compiled workspace to a cache file.
+
+    Args:
+        workspace: Workspace to write
+        path: Destination cache file
+
+    Returns:
+        Size of the written file in bytes
+    """
+    payload = pickle.dumps(workspace, protocol=pickle.HIGHEST_PROTOCOL)
+    header = _HEADER.pack(
+        _MAGIC, FORMAT_VERSION, bytes.fromhex(workspace.tree_hash), len(payload)
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return len(header) + len(payload)
+
+
+def read_workspace(
+    path: Path, tree_hash: str | None = None
+) -> CompiledWorkspace | None:
+    """Read a compiled workspace from a cache file.
+
+    Args:
+        path: Cache file
+        tree_hash: Expected tree hash; the cache is rejected if it differs
+
+    Returns:
+        The workspace, or None if the file is missing, from another
+        format version, stale or corrupt
+    """
+    try:
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            if len(mapped) < _HEADER.size:
+                return None
+            magic, version, digest, size = _HEADER.unpack_from(mapped)
+            if magic != _MAGIC or version != FORMAT_VERSION:
+                return None
+            if tree_hash is not None and digest.hex() != tree_hash:
+                return None
+            if len(mapped) < _HEADER.size + size:
+                return None
+            with memoryview(mapped) as view:
+                payload = view[_HEADER.size : _HEADER.size + size]
+                try:
+                    # The cache is written by this module into the workspace
+                    # and trusted like the workspace's tools/custom code
+                    workspace = pickle.loads(payload)  # nosec B301
+                finally:
+                    payload.release()
+    except (OSError, ValueError):
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable workspace cache {path}: {e}")
+        return None
+
+    if not isinstance(workspace, CompiledWorkspace):
+        return None
+    return workspace
+
+
+def cache_path(parac_root: Path) -> Path:
+    """Location of the workspace cache file."""
+    return Path(parac_root) / CACHE_FILE
+
+
+_workspaces: dict[Path, CompiledWorkspace] = {}
+_workspaces_lock = threading.Lock()
+
+
+def fresh_workspace(
+    parac_root: Path, tree_hash: str | None = None
+) -> CompiledWorkspace | None:
+    """Get the compiled workspace only if it is already up to date.
+
+    Unlike ``load_workspace``, this never compiles and never writes, so it
+    suits callers that need one small piece of the workspace and can read
+    it directly otherwise.
+
+    Args:
+        parac_root: Path to .parac/ directory
+        tree_hash: Precomputed tree hash (computed if omitted)
+
+    Returns:
+        The in-process or cached workspace, or None if neither is fresh
+    """
+    parac_root = Path(parac_root).absolute()
+    if tree_hash is None:
+        tree_hash = workspace_tree_hash(parac_root)
+
+    with _workspaces_lock:
+        workspace = _workspaces.get(parac_root)
+    if workspace is not None and workspace.tree_hash == tree_hash:
+        return workspace
+
+    workspace = read_workspace(cache_path(parac_root), tree_hash)
+    if workspace is not None:
+        workspace.parac_root = parac_root
+        with _workspaces_lock:
+            _workspaces[parac_root] = workspace
+    return workspace
+
+
+def load_file_management(parac_root: Path) -> FileManagementConfig:
+    """Get the ``file_management`` configuration of a workspace.
+
+    Served from the compiled workspace when it is fresh, otherwise read
+    from ``project.yaml`` without compiling the whole workspace.
+
+    Args:
+        parac_root: Path to .parac/ directory
+
+    Returns:
+        Resolved file management configuration
+    """
+    workspace = fresh_workspace(parac_root)
+    if workspace is not None:
+        return workspace.file_management
+    return FileManagementConfig.from_project_yaml(Path(parac_root))
+
+
+def load_workspace(
+    parac_root: Path, rebuild: bool = False, save: bool = True
+) -> CompiledWorkspace:
+    """Load the compiled workspace, recompiling it if it is stale.
+
+    Lookup order: the in-process copy, then the cache file, then a fresh
+    compilation (saved to the cache file unless ``save`` is False). Each
+    call re-checks the tree hash, so edits are always picked up.
+
+    Args:
+        parac_root: Path to .parac/ directory
+        rebuild: Recompile even if the cache is fresh
+        save: Write a recompiled workspace to the cache file
+
+    Returns:
+        The compiled workspace
+    """
+    parac_root = Path(parac_root).absolute()
+    tree_hash = workspace_tree_hash(parac_root)
+
+    if not rebuild:
+        workspace = fresh_workspace(parac_root, tree_hash)
+        if workspace is not None:
+            return workspace
+
+    workspace = compile_workspace(parac_root, tree_hash)
+    if save:
+        try:
+            write_workspace(workspace, cache_path(parac_root))
+        except OSError as e:
+            logger.debug(f"Could not write workspace cache: {e}")
+    with _workspaces_lock:
+        _workspaces[parac_root] = workspace
+    return workspace
+
+
+def clear_workspace_cache() -> None:
+    """Forget in-process compiled workspaces (cache files are kept)."""
+    with _workspaces_lock:
+        _workspaces.clear()
@@ -11,7 +11,8 @@ from typing import Any
 
 import yaml
 
-from paracle_core.parac.agent_discovery import AgentDiscovery, AgentMetadata
+from paracle_core.parac.agent_discovery import AgentMetadata
+from paracle_core.parac.compiled import CompiledWorkspace, load_workspace
 from paracle_core.parac.state import ParacState, load_state
 
 
@@ -106,6 +107,14 @@ class ContextBuilder:
         self.parac_root = parac_root
         self.max_size = max_size or self.IDE_SIZE_LIMITS["default"]
         self._sections: list[ContextSection] = []
+        self._compiled: CompiledWorkspace | None = None
+
+    @property
+    def workspace(self) -> CompiledWorkspace:
+        """Compiled .parac/ workspace (loaded on first use)."""
+        if self._compiled is None:
+            self._compiled = load_workspace(self.parac_root)
+        return self._compiled
 
     def collect(self) -> ContextData:
         """Collect all context data from .parac/.
@@ -118,12 +127,11 @@ class ContextBuilder:
         # Load state
         data.state = load_state(self.parac_root)
 
+        # Parsed .parac/ files come from the compiled workspace
+        self._compiled = load_workspace(self.parac_root)
+
         # Discover agents
-        try:
-            discovery = AgentDiscovery(self.parac_root)
-            data.agents = discovery.discover_agents()
-        except FileNotFoundError:
-            data.agents = []
+        data.agents = list(self.workspace.agents.values())
 
         # Load governance summary
         data.governance_summary = self._load_governance_summary()
@@ -148,12 +156,10 @@ class ContextBuilder:
 
     def _load_governance_summary(self) -> str:
         """Load and summarize governance rules."""
-        governance_file = self.parac_root / "GOVERNANCE.md"
-        if not governance_file.exists():
+        content = self.workspace.text("GOVERNANCE.md")
+        if content is None:
             return "No governance file found."
 
-        content = governance_file.read_text(encoding="utf-8")
-
         # Extract key sections (first 2000 chars or until ## Usage)
         lines = content.split("\n")
         summary_lines = []
@@ -174,11 +180,9 @@ class ContextBuilder:
 
     def _load_recent_decisions(self, count: int = 3) -> list[dict[str, str]]:
         """Load recent architecture decisions."""
-        decisions_file = self.parac_root / "roadmap" / "decisions.md"
-        if not decisions_file.exists():
+        content = self.workspace.text("roadmap/decisions.md")
+        if content is None:
             return []
-
-        content = decisions_file.read_text(encoding="utf-8")
         decisions = []
 
         # Parse ADRs (format: ### ADR-XXX: Title)
@@ -215,11 +219,9 @@ class ContextBuilder:
 
     def _load_open_questions(self) -> list[dict[str, str]]:
         """Load open questions."""
-        questions_file = self.parac_root / "memory" / "context" / "open_questions.md"
-        if not questions_file.exists():
+        content = self.workspace.text("memory/context/open_questions.md")
+        if content is None:
             return []
-
-        content = questions_file.read_text(encoding="utf-8")
         questions = []
 
         # Parse questions (format: ### Q#: Title or ### Title)
@@ -233,11 +235,9 @@ class ContextBuilder:
 
     def _load_skill_assignments(self) -> str:
         """Load agent skill assignments summary."""
-        skills_file = self.parac_root / "agents" / "SKILL_ASSIGNMENTS.md"
-        if not skills_file.exists():
+        content = self.workspace.text("agents/SKILL_ASSIGNMENTS.md")
+        if content is None:
             return ""
-
-        content = skills_file.read_text(encoding="utf-8")
         # Return first 1500 chars (summary section usually)
         lines = content.split("\n")
         summary = []
@@ -249,15 +249,7 @@ class ContextBuilder:
 
     def _list_available_policies(self) -> list[str]:
         """List available policy files in .parac/policies/."""
-        policies_dir = self.parac_root / "policies"
-        if not policies_dir.exists():
-            return []
-
-        policy_files = []
-        for item in policies_dir.iterdir():
-            if item.is_file() and item.suffix in [".md", ".yaml"]:
-                policy_files.append(item.stem)
-        return sorted(policy_files)
+        return self.workspace.policies
 
     def build_sections(self, data: ContextData) -> list[ContextSection]:
         """Build context sections with priorities.
@@ -135,9 +135,9 @@ class AgentLogger:
     def _load_config(self) -> "FileManagementConfig | None":
         """Load configuration from project.yaml."""
         try:
-            from paracle_core.parac.file_config import FileManagementConfig
+            from paracle_core.parac.compiled import load_file_management
 
-            return FileManagementConfig.from_project_yaml(self.parac_root)
+            return load_file_management(self.parac_root)
         except (ImportError, FileNotFoundError):
             return None
 
@@ -0,0 +1,683 @@
+"""Artifact registry for .parac/ workspaces.
+
+Parses agent specs, workflow definitions, skills and YAML manifests once
+and serves them from memory. Every entry is validated against the
+fingerprint of its file (mtime, size, content hash), so lookups never
+return stale data:
+
+- without a watcher, a lookup costs one ``stat`` call; the file is re-read
+  only when mtime or size changed, and re-parsed only when its hash changed
+- with ``start_watching()`` (watchdog), file system events revalidate
+  entries in the background and lookups are plain dictionary hits
+
+Other subsystems can ``subscribe()`` to be told when an artifact is added,
+modified or removed.
+
+Usage:
+    from paracle_core.parac.registry import get_registry
+
+    registry = get_registry()          # .parac/ found from cwd
+    agent = registry.get_agent("coder")
+    workflow = registry.get_workflow("feature_development")
+    unsubscribe = registry.subscribe(lambda change: print(change))
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from paracle_core.parac.state import find_parac_root
+
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    FileSystemEventHandler = object  # type: ignore[misc,assignment]
+
+logger = logging.getLogger(__name__)
+
+AGENT_SPECS_DIR = Path("agents") / "specs"
+SKILLS_DIR = Path("agents") / "skills"
+WORKFLOW_DIRS = (Path("workflows") / "definitions", Path("workflows") / "templates")
+AGENT_MANIFEST = "agents/manifest.yaml"
+SKILL_FILE = "SKILL.md"
+SKILL_SUBDIRS = ("assets", "scripts", "references")
+
+_FRONTMATTER = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+
+class ArtifactKind(str, Enum):
+    """Kinds of artifacts served by the registry."""
+
+    AGENT = "agent"  # agents/specs/<id>.md
+    WORKFLOW = "workflow"  # workflows/{definitions,templates}/<name>.yaml
+    SKILL = "skill"  # agents/skills/<id>/
+    MANIFEST = "manifest"  # any YAML document, keyed by relative path
+
+
+class ChangeType(str, Enum):
+    """Type of artifact change."""
+
+    ADDED = "added"
+    MODIFIED = "modified"
+    REMOVED = "removed"
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Identity of an artifact's file contents.
+
+    ``stat_key`` is (mtime_ns, size) for files and a tuple of
+    (name, mtime_ns, size) for directory artifacts such as skills.
+    """
+
+    stat_key: Any
+    digest: str
+
+
+@dataclass
+class Artifact:
+    """A parsed artifact and the fingerprint it was parsed from."""
+
+    kind: ArtifactKind
+    key: str
+    path: Path
+    fingerprint: Fingerprint
+    value: Any
+    text: str | None = None
+    version: int = 1
+
+
+@dataclass(frozen=True)
+class ArtifactChange:
+    """Notification sent to subscribers."""
+
+    kind: ArtifactKind
+    key: str
+    path: Path
+    change: ChangeType
+
+
+@dataclass
+class SkillDefinition:
+    """Parsed contents of a skill directory."""
+
+    skill_id: str
+    name: str
+    description: str
+    content: str
+    assets: dict[str, str] = field(default_factory=dict)
+    scripts: dict[str, str] = field(default_factory=dict)
+    references: dict[str, str] = field(default_factory=dict)
+
+
+def parse_skill_markdown(raw_content: str, skill_id: str) -> tuple[str, str, str]:
+    """Parse SKILL.md, extracting name and description from frontmatter.
+
+    Args:
+        raw_content: Raw file content
+        skill_id: Skill identifier (folder name)
+
+    Returns:
+        Tuple of (name, description, content)
+    """
+    name = skill_id.replace("-", " ").title()
+    description = f"Skill: {name}"
+    content = raw_content
+
+    match = _FRONTMATTER.match(raw_content)
+    if match:
+        try:
+            content = match.group(2)
+            frontmatter = yaml.safe_load(match.group(1))
+            if frontmatter:
+                name = frontmatter.get("name", skill_id)
+                description = frontmatter.get("description", f"Skill: {name}")
+
+                metadata = frontmatter.get("metadata", {})
+                if metadata and metadata.get("display_name"):
+                    name = metadata["display_name"]
+        except Exception as e:
+            logger.warning(f"Failed to parse frontmatter for {skill_id}: {e}")
+
+    return name, description, content
+
+
+def _strip_comments(items: list[Any] | None) -> list[str]:
+    """Strip ``# comment`` suffixes from manifest list entries."""
+    cleaned = []
+    for item in items or []:
+        value = str(item).split("#")[0].strip()
+        if value:
+            cleaned.append(value)
+    return cleaned
+
+
+class _EventHandler(FileSystemEventHandler):
+    """Forwards watchdog events to the registry."""
+
+    def __init__(self, registry: "ArtifactRegistry"):
+        self.registry = registry
+
+    def on_any_event(self, event: "FileSystemEvent") -> None:
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            if path:
+                self.registry._on_path_event(Path(os.fsdecode(path)))
+
+
+class ArtifactRegistry:
+    """In-memory, always-fresh view of a .parac/ workspace.
+
+    Returned objects are shared between callers and must be treated as
+    read-only.
+
+    Args:
+        parac_root: Path to the .parac/ directory
+    """
+
+    def __init__(self, parac_root: Path | str):
+        self.parac_root = Path(parac_root)
+        self._entries: dict[tuple[ArtifactKind, str], Artifact | None] = {}
+        self._dirty: set[tuple[ArtifactKind, str]] = set()
+        self._listings: dict[ArtifactKind, list[str]] = {}
+        self._enriched: dict[str, tuple[Artifact, dict, Any]] = {}
+        self._manifest_index: tuple[Artifact | None, dict] | None = None
+        self._subscribers: list[Callable[[ArtifactChange], None]] = []
+        self._lock = threading.RLock()
+        self._observer: Any = None
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def artifact(self, kind: ArtifactKind, key: str) -> Artifact | None:
+        """Get a validated artifact.
+
+        Args:
+            kind: Artifact kind
+            key: Agent id, workflow name, skill id or manifest path
+                (relative to .parac/)
+
+        Returns:
+            The artifact, or None if its file does not exist
+
+        Raises:
+            yaml.YAMLError: If a YAML artifact cannot be parsed
+        """
+        ident = (kind, key)
+        changes: list[ArtifactChange] = []
+        with self._lock:
+            if self._observer is not None and ident not in self._dirty:
+                try:
+                    return self._entries[ident]
+                except KeyError:
+                    pass
+            artifact = self._revalidate(kind, key, changes)
+        self._notify(changes)
+        return artifact
+
+    def get_agent(self, agent_id: str) -> Any | None:
+        """Get agent metadata enriched with tools and skills from manifest.yaml.
+
+        Returns:
+            AgentMetadata, or None if agents/specs/<agent_id>.md is missing
+        """
+        artifact = self.artifact(ArtifactKind.AGENT, agent_id)
+        if artifact is None:
+            return None
+        index = self._agent_manifest_index()
+        with self._lock:
+            cached = self._enriched.get(agent_id)
+            if cached is not None and cached[0] is artifact and cached[1] is index:
+                return cached[2]
+            tools, skills = index.get(agent_id, ([], []))
+            agent = replace(artifact.value, tools=list(tools), skills=list(skills))
+            self._enriched[agent_id] = (artifact, index, agent)
+            return agent
+
+    def get_agent_content(self, agent_id: str) -> str | None:
+        """Get the full markdown of an agent spec."""
+        artifact = self.artifact(ArtifactKind.AGENT, agent_id)
+        return artifact.text if artifact else None
+
+    def get_workflow(self, name: str) -> dict[str, Any] | None:
+        """Get a workflow definition (definitions/ first, then templates/)."""
+        artifact = self.artifact(ArtifactKind.WORKFLOW, name)
+        return artifact.value if artifact else None
+
+    def get_skill(self, skill_id: str) -> SkillDefinition | None:
+        """Get a skill with its assets, scripts and references."""
+        artifact = self.artifact(ArtifactKind.SKILL, skill_id)
+        return artifact.value if artifact else None
+
+    def get_manifest(self, rel_path: str = AGENT_MANIFEST) -> dict[str, Any]:
+        """Get a YAML document under .parac/ (empty dict if missing or empty).
+
+        Args:
+            rel_path: Path relative to .parac/ (defaults to agents/manifest.yaml)
+        """
+        artifact = self.artifact(ArtifactKind.MANIFEST, rel_path)
+        if artifact is None or not isinstance(artifact.value, dict):
+            return {}
+        return artifact.value
+
+    def list_keys(self, kind: ArtifactKind) -> list[str]:
+        """List artifact keys on disk, sorted.
+
+        Args:
+            kind: AGENT, WORKFLOW or SKILL
+        """
+        if kind == ArtifactKind.MANIFEST:
+            raise ValueError("Manifests are not listable")
+        with self._lock:
+            if self._observer is not None and kind in self._listings:
+                return list(self._listings[kind])
+        keys = self._scan(kind)
+        with self._lock:
+            if self._observer is not None:
+                self._listings[kind] = keys
+        return list(keys)
+
+    def list_agents(self) -> list[Any]:
+        """All agents (AgentMetadata), skipping specs that fail to parse."""
+        agents = []
+        for agent_id in self.list_keys(ArtifactKind.AGENT):
+            try:
+                agent = self.get_agent(agent_id)
+            except Exception as e:
+                logger.warning(f"Could not parse agent spec {agent_id}: {e}")
+                continue
+            if agent is not None:
+                agents.append(agent)
+        return agents
+
+    # =========================================================================
+    # Change tracking
+    # =========================================================================
+
+    def subscribe(
+        self, callback: Callable[[ArtifactChange], None]
+    ) -> Callable[[], None]:
+        """Register a change callback.
+
+        Callbacks run on the thread that detected the change (a lookup,
+        ``refresh()`` or the watcher thread) and must not block.
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def refresh(self) -> list[ArtifactChange]:
+        """Revalidate every known and on-disk artifact (polling mode).
+
+        Returns:
+            Changes found (also sent to subscribers)
+        """
+        changes: list[ArtifactChange] = []
+        with self._lock:
+            self._listings.clear()
+            idents = set(self._entries)
+            for kind in (ArtifactKind.AGENT, ArtifactKind.WORKFLOW, ArtifactKind.SKILL):
+                idents.update((kind, key) for key in self._scan(kind))
+            for kind, key in sorted(idents):
+                try:
+                    self._revalidate(kind, key, changes)
+                except Exception as e:
+                    logger.warning(f"Could not load {kind.value} {key}: {e}")
+        self._notify(changes)
+        return changes
+
+    def clear(self) -> None:
+        """Drop all parsed artifacts (they are reloaded on next lookup)."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty.clear()
+            self._listings.clear()
+            self._enriched.clear()
+            self._manifest_index = None
+
+    def start_watching(self) -> bool:
+        """Watch .parac/ for changes and revalidate in the background.
+
+        Returns:
+            True if watching, False if watchdog is unavailable or .parac/
+            does not exist
+        """
+        if not WATCHDOG_AVAILABLE or not self.parac_root.is_dir():
+            return False
+        with self._lock:
+            if self._observer is not None:
+                return True
+            observer = Observer()
+            observer.schedule(_EventHandler(self), str(self.parac_root), recursive=True)
+            observer.daemon = True
+            observer.start()
+            # Entries validated before the watch began may be out of date
+            self._dirty.update(self._entries)
+            self._listings.clear()
+            self._observer = observer
+        logger.debug(f"Watching {self.parac_root}")
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop the file watcher (lookups fall back to stat validation)."""
+        with self._lock:
+            observer, self._observer = self._observer, None
+            self._listings.clear()
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5)
+
+    @property
+    def is_watching(self) -> bool:
+        """Whether a file watcher is active."""
+        return self._observer is not None
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _revalidate(
+        self, kind: ArtifactKind, key: str, changes: list[ArtifactChange]
+    ) -> Artifact | None:
+        """Bring one entry up to date with disk. Caller holds the lock."""
+        ident = (kind, key)
+        entry = self._entries.get(ident)
+        located = self._locate(kind, key)
+
+        if located is None:
+            self._entries[ident] = None
+            self._dirty.discard(ident)
+            if entry is not None:
+                changes.append(
+                    ArtifactChange(kind, key, entry.path, ChangeType.REMOVED)
+                )
+            return None
+
+        path, stat_key = located
+        if entry is not None and entry.path == path:
+            if entry.fingerprint.stat_key == stat_key:
+                self._dirty.discard(ident)
+                return entry
+
+        data = self._read(kind, path)
+        digest = _digest(data)
+        if (
+            entry is not None
+            and entry.path == path
+            and entry.fingerprint.digest == digest
+        ):
+            # Touched but unchanged
+            entry.fingerprint = Fingerprint(stat_key, digest)
+            self._dirty.discard(ident)
+            return entry
+
+        value, text = self._parse(kind, key, path, data)
+        artifact = Artifact(
+            kind=kind,
+            key=key,
+            path=path,
+            fingerprint=Fingerprint(stat_key, digest),
+            value=value,
+            text=text,
+            version=entry.version + 1 if entry is not None else 1,
+        )
+        self._entries[ident] = artifact
+        self._dirty.discard(ident)
+        change = ChangeType.ADDED if entry is None else ChangeType.MODIFIED
+        changes.append(ArtifactChange(kind, key, path, change))
+        return artifact
+
+    def _locate(self, kind: ArtifactKind, key: str) -> tuple[Path, Any] | None:
+        """Find the file(s) of an artifact and their stat key."""
+        if kind == ArtifactKind.SKILL:
+            skill_dir = self.parac_root / SKILLS_DIR / key
+            stat_key = _skill_stat_key(skill_dir)
+            return (skill_dir, stat_key) if stat_key is not None else None
+
+        if kind == ArtifactKind.AGENT:
+            candidates = [self.parac_root / AGENT_SPECS_DIR / f"{key}.md"]
+        elif kind == ArtifactKind.WORKFLOW:
+            candidates = [self.parac_root / d / f"{key}.yaml" for d in WORKFLOW_DIRS]
+        else:
+            candidates = [self.parac_root / key]
+
+        for path in candidates:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if not path.is_dir():
+                return path, (st.st_mtime_ns, st.st_size)
+        return None
+
+    def _read(self, kind: ArtifactKind, path: Path) -> dict[str, bytes]:
+        if kind != ArtifactKind.SKILL:
+            return {"": path.read_bytes()}
+        files = {SKILL_FILE: (path / SKILL_FILE).read_bytes()}
+        for sub in SKILL_SUBDIRS:
+            directory = path / sub
+            if directory.is_dir():
+                for file_path in sorted(directory.iterdir()):
+                    if file_path.is_file():
+                        files[f"{sub}/{file_path.name}"] = file_path.read_bytes()
+        return files
+
+    def _parse(
+        self, kind: ArtifactKind, key: str, path: Path, data: dict[str, bytes]
+    ) -> tuple[Any, str | None]:
+        if kind == ArtifactKind.AGENT:
+            from paracle_core.parac.agent_discovery import AgentMetadata
+
+            text = data[""].decode("utf-8")
+            return AgentMetadata.from_text(text, path), text
+
+        if kind == ArtifactKind.SKILL:
+            raw = data[SKILL_FILE].decode("utf-8")
+            name, description, content = parse_skill_markdown(raw, key)
+            groups: dict[str, dict[str, str]] = {sub: {} for sub in SKILL_SUBDIRS}
+            for rel, payload in data.items():
+                sub, _, filename = rel.partition("/")
+                if sub in groups:
+                    try:
+                        groups[sub][filename] = payload.decode("utf-8")
+                    except UnicodeDecodeError as e:
+                        logger.warning(f"Could not read {path / rel}: {e}")
+            return (
+                SkillDefinition(
+                    skill_id=key,
+                    name=name,
+                    description=description,
+                    content=content,
+                    **groups,
+                ),
+                None,
+            )
+
+        return yaml.safe_load(data[""].decode("utf-8")), None
+
+    def _scan(self, kind: ArtifactKind) -> list[str]:
+        if kind == ArtifactKind.AGENT:
+            directory = self.parac_root / AGENT_SPECS_DIR
+            if not directory.is_dir():
+                return []
+            return sorted(
+                p.stem for p in directory.glob("*.md") if not p.stem.startswith("_")
+            )
+        if kind == ArtifactKind.WORKFLOW:
+            names: set[str] = set()
+            for sub in WORKFLOW_DIRS:
+                directory = self.parac_root / sub
+                if directory.is_dir():
+                    names.update(
+                        p.stem
+                        for p in directory.glob("*.yaml")
+                        if p.stem != "_manifest"
+                    )
+            return sorted(names)
+        directory = self.parac_root / SKILLS_DIR
+        if not directory.is_dir():
+            return []
+        return sorted(p.name for p in directory.iterdir() if (p / SKILL_FILE).is_file())
+
+    def _agent_manifest_index(self) -> dict[str, tuple[list[str], list[str]]]:
+        """Map agent id -> (tools, skills) for the current manifest."""
+        try:
+            manifest = self.artifact(ArtifactKind.MANIFEST, AGENT_MANIFEST)
+        except Exception as e:
+            logger.warning(f"Could not load manifest.yaml: {e}")
+            manifest = None
+        with self._lock:
+            if self._manifest_index is not None and self._manifest_index[0] is manifest:
+                return self._manifest_index[1]
+            index = {}
+            data = (
+                manifest.value if manifest and isinstance(manifest.value, dict) else {}
+            )
+            for entry in data.get("agents", None) or []:
+                if isinstance(entry, dict) and entry.get("id"):
+                    index[entry["id"]] = (
+                        _strip_comments(entry.get("tools")),
+                        _strip_comments(entry.get("skills")),
+                    )
+            self._manifest_index = (manifest, index)
+            return index
+
+    def _classify(self, path: Path) -> tuple[ArtifactKind, str] | None:
+        """Map a changed path to the artifact it belongs to."""
+        try:
+            rel = path.relative_to(self.parac_root)
+        except ValueError:
+            return None
+        parts = rel.parts
+        if len(parts) == 3 and rel.parent == AGENT_SPECS_DIR and rel.suffix == ".md":
+            return ArtifactKind.AGENT, rel.stem
+        if len(parts) >= 3 and Path(*parts[:2]) == SKILLS_DIR:
+            return ArtifactKind.SKILL, parts[2]
+        if rel.suffix == ".yaml" and rel.parent in WORKFLOW_DIRS:
+            return ArtifactKind.WORKFLOW, rel.stem
+        key = rel.as_posix()
+        if (ArtifactKind.MANIFEST, key) in self._entries or key == AGENT_MANIFEST:
+            return ArtifactKind.MANIFEST, key
+        return None
+
+    def _on_path_event(self, path: Path) -> None:
+        """Handle a watcher event: revalidate eagerly so subscribers hear of it."""
+        ident = self._classify(path)
+        if ident is None:
+            return
+        changes: list[ArtifactChange] = []
+        with self._lock:
+            self._listings.pop(ident[0], None)
+            self._dirty.add(ident)
+            try:
+                self._revalidate(*ident, changes)
+            except Exception as e:
+                # Keep it dirty: the next lookup retries and raises
+                logger.debug(f"Could not reload {ident[0].value} {ident[1]}: {e}")
+        self._notify(changes)
+
+    def _notify(self, changes: list[ArtifactChange]) -> None:
+        if not changes:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for change in changes:
+            for callback in subscribers:
+                try:
+                    callback(change)
+                except Exception:
+                    logger.exception("Artifact subscriber failed")
+
+
+def _skill_stat_key(skill_dir: Path) -> tuple | None:
+    """Stat key of a skill: its SKILL.md plus files in the known subdirs."""
+    try:
+        st = (skill_dir / SKILL_FILE).stat()
+    except OSError:
+        return None
+    key = [(SKILL_FILE, st.st_mtime_ns, st.st_size)]
+    for sub in SKILL_SUBDIRS:
+        try:
+            entries = sorted(os.scandir(skill_dir / sub), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_file():
+                est = entry.stat()
+                key.append((f"{sub}/{entry.name}", est.st_mtime_ns, est.st_size))
+    return tuple(key)
+
+
+def _digest(data: dict[str, bytes]) -> str:
+    h = hashlib.sha256()
+    for name in sorted(data):
+        h.update(name.encode("utf-8"))
+        h.update(b"\0")
+        h.update(hashlib.sha256(data[name]).digest())
+    return h.hexdigest()
+
+
+_registries: dict[Path, ArtifactRegistry] = {}
+_roots_by_cwd: dict[Path, Path] = {}
+_registries_lock = threading.Lock()
+
+
+def resolve_parac_root(start_path: Path | None = None) -> Path | None:
+    """Find .parac/ from a directory, remembering the answer per directory.
+
+    Unlike ``find_parac_root``, repeated calls from the same directory
+    cost a single ``is_dir`` check instead of a walk up the tree.
+    """
+    start = Path(start_path) if start_path is not None else Path.cwd()
+    cached = _roots_by_cwd.get(start)
+    if cached is not None and cached.is_dir():
+        return cached
+    root = find_parac_root(start)
+    if root is not None:
+        _roots_by_cwd[start] = root
+    return root
+
+
+def get_registry(parac_root: Path | str | None = None) -> ArtifactRegistry:
+    """Get the shared registry for a .parac/ directory.
+
+    Args:
+        parac_root: Path to .parac/ (found from cwd if None)
+
+    Raises:
+        FileNotFoundError: If parac_root is None and no .parac/ is found
+    """
+    if parac_root is None:
+        parac_root = resolve_parac_root()
+        if parac_root is None:
+            raise FileNotFoundError(
+                ".parac/ directory not found in current or parent directories"
+            )
+    root = Path(parac_root).absolute()
+    with _registries_lock:
+        registry = _registries.get(root)
+        if registry is None:
+            registry = _registries[root] = ArtifactRegistry(root)
+        return registry
@@ -13,7 +13,8 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, Field
 
-from paracle_core.parac.file_config import FileManagementConfig, RoadmapConfig
+from paracle_core.parac.compiled import load_file_management
+from paracle_core.parac.file_config import RoadmapConfig
 
 
 class RoadmapPhase(BaseModel):
@@ -100,8 +101,7 @@ class RoadmapManager:
         self.parac_root = parac_root
 
         if config is None:
-            file_config = FileManagementConfig.from_project_yaml(parac_root)
-            config = file_config.roadmap
+            config = load_file_management(parac_root).roadmap
 
         self.config = config
         self.roadmap_dir = parac_root / config.base_path
@@ -3,6 +3,7 @@
 This package provides the Knowledge Engine for Retrieval Augmented Generation:
 - Document ingestion and chunking
 - Vector store integration (ChromaDB, pgvector)
+- Hybrid BM25 + vector search with a local lexical index
 - RAG engine for context-aware queries
 - Reranking for improved relevance
 - Source attribution and citations
@@ -50,6 +51,7 @@ from paracle_knowledge.chunkers import (
     TextChunker,
 )
 from paracle_knowledge.ingestion import DocumentIngestor, IngestResult
+from paracle_knowledge.lexical import HybridConfig, LexicalIndex, tokenize_code
 from paracle_knowledge.rag import RAGConfig, RAGContext, RAGEngine, RAGResponse
 from paracle_knowledge.reranker import CrossEncoderReranker, Reranker
 
@@ -72,6 +74,10 @@ __all__ = [
     # Ingestion
     "DocumentIngestor",
     "IngestResult",
+    # Lexical / hybrid search
+    "LexicalIndex",
+    "HybridConfig",
+    "tokenize_code",
     # RAG
     "RAGEngine",
     "RAGConfig",
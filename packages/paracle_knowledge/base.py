@@ -5,6 +5,7 @@ This module defines core data structures for documents, chunks, and the knowledg
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 from enum import Enum
@@ -14,8 +15,12 @@ from paracle_core.compat import UTC, datetime
 from paracle_core.ids import generate_ulid
 from pydantic import BaseModel, Field
 
+from paracle_knowledge.lexical import HybridConfig, LexicalIndex, fuse_rankings
+
 if TYPE_CHECKING:
     from paracle_vector import VectorStore
+    from paracle_vector.base import Document as VectorDocument
+    from paracle_vector.base import SearchResult
     from paracle_vector.embeddings import EmbeddingService
 
 logger = logging.getLogger(__name__)
@@ -192,6 +197,9 @@ class KnowledgeBase:
         vector_store: VectorStore,
         embedding_service: EmbeddingService,
         collection_name: str = "knowledge",
+        *,
+        lexical_index: LexicalIndex | None = None,
+        hybrid: HybridConfig | None = None,
     ):
         """Initialize knowledge base.
 
@@ -199,10 +207,14 @@ class KnowledgeBase:
             vector_store: Vector store for embeddings
             embedding_service: Service for generating embeddings
             collection_name: Name of the vector collection
+            lexical_index: Optional BM25 index; enables hybrid search
+            hybrid: How lexical and vector results are fused
         """
         self._vector_store = vector_store
         self._embedding_service = embedding_service
         self._collection_name = collection_name
+        self._lexical = lexical_index
+        self._hybrid = hybrid or HybridConfig()
         self._documents: dict[str, Document] = {}
         self._initialized = False
 
@@ -274,6 +286,10 @@ class KnowledgeBase:
                 await self._vector_store.add_documents(
                     self._collection_name, vector_docs
                 )
+                if self._lexical is not None:
+                    self._lexical.add(
+                        [(d.id, d.content, d.metadata) for d in vector_docs]
+                    )
 
         logger.debug(
             "Added document %s with %d chunks", document.id, len(document.chunks)
@@ -298,6 +314,8 @@ class KnowledgeBase:
         # Remove chunks from vector store
         for chunk in document.chunks:
             await self._vector_store.delete_document(self._collection_name, chunk.id)
+        if self._lexical is not None:
+            self._lexical.remove_document(document_id)
 
         logger.debug("Removed document %s", document_id)
         return True
@@ -312,6 +330,11 @@ class KnowledgeBase:
     ) -> list[tuple[Chunk, float]]:
         """Search for relevant chunks.
 
+        With a lexical index, vector and BM25 candidates are fused (see
+        :func:`~paracle_knowledge.lexical.fuse_rankings`); ``min_score``
+        then applies to vector similarities, while lexical matches are
+        always eligible.
+
         Args:
             query: Search query
             top_k: Number of results
@@ -330,37 +353,135 @@ class KnowledgeBase:
         results = await self._vector_store.search(
             self._collection_name,
             query_embedding,
-            top_k=top_k,
+            top_k=self._candidates(top_k),
             filter_metadata=filter_metadata,
         )
 
-        # Convert to chunks with scores
-        chunk_results = []
-        for result in results:
-            if result.score < min_score:
-                continue
-
-            # Reconstruct chunk from result
-            metadata = ChunkMetadata(
-                document_id=result.document.metadata.get("document_id", ""),
-                chunk_index=result.document.metadata.get("chunk_index", 0),
-                start_line=result.document.metadata.get("start_line"),
-                end_line=result.document.metadata.get("end_line"),
-                language=result.document.metadata.get("language"),
-                section=result.document.metadata.get("section"),
-            )
+        return self._rank(query, results, top_k, filter_metadata, min_score)
+
+    async def search_many(
+        self,
+        queries: list[str],
+        *,
+        top_k: int = 10,
+        filter_metadata: dict[str, Any] | None = None,
+        min_score: float = 0.0,
+    ) -> list[list[tuple[Chunk, float]]]:
+        """Search for several queries with one embedding call and batch search.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query
+            filter_metadata: Optional metadata filter
+            min_score: Minimum similarity score
+
+        Returns:
+            One list of (chunk, score) tuples per query, in order
+        """
+        if not queries:
+            return []
+        await self.initialize()
 
-            chunk = Chunk(
-                id=result.document.id,
-                content=result.document.content,
-                embedding=result.document.embedding,
-                metadata=metadata,
+        query_embeddings = await self._embedding_service.embed(queries)
+
+        search_batch = getattr(self._vector_store, "search_batch", None)
+        if search_batch is not None:
+            batches = await search_batch(
+                self._collection_name,
+                query_embeddings,
+                top_k=self._candidates(top_k),
+                filter_metadata=filter_metadata,
+            )
+        else:
+            # Stores implementing only the single-query interface
+            batches = await asyncio.gather(
+                *(
+                    self._vector_store.search(
+                        self._collection_name,
+                        embedding,
+                        top_k=self._candidates(top_k),
+                        filter_metadata=filter_metadata,
+                    )
+                    for embedding in query_embeddings
+                )
             )
 
-            chunk_results.append((chunk, result.score))
+        return [
+            self._rank(query, results, top_k, filter_metadata, min_score)
+            for query, results in zip(queries, batches, strict=True)
+        ]
+
+    def _candidates(self, top_k: int) -> int:
+        """Number of vector candidates to fetch for ``top_k`` results."""
+        if self._lexical is None:
+            return top_k
+        return top_k * self._hybrid.candidate_multiplier
+
+    def _rank(
+        self,
+        query: str,
+        results: list[SearchResult],
+        top_k: int,
+        filter_metadata: dict[str, Any] | None,
+        min_score: float,
+    ) -> list[tuple[Chunk, float]]:
+        """Turn vector results (fused with lexical hits) into chunks."""
+        results = [r for r in results if r.score >= min_score]
+        if self._lexical is None:
+            return [(self._document_chunk(r.document), r.score) for r in results]
+
+        hits = self._lexical.search(
+            query,
+            top_k=self._candidates(top_k),
+            filter_metadata=filter_metadata,
+        )
+        vector_docs = {r.document.id: r.document for r in results}
+        lexical_hits = {hit.chunk_id: hit for hit in hits}
+        fused = fuse_rankings(
+            [(r.document.id, r.score) for r in results],
+            [(hit.chunk_id, hit.score) for hit in hits],
+            self._hybrid,
+        )
 
+        chunk_results = []
+        for chunk_id, score in fused[:top_k]:
+            if chunk_id in vector_docs:
+                chunk = self._document_chunk(vector_docs[chunk_id])
+            else:
+                hit = lexical_hits[chunk_id]
+                chunk = self._to_chunk(chunk_id, hit.content, hit.metadata)
+            chunk_results.append((chunk, score))
         return chunk_results
 
+    @classmethod
+    def _document_chunk(cls, document: VectorDocument) -> Chunk:
+        """Reconstruct a chunk from a vector store document."""
+        return cls._to_chunk(
+            document.id, document.content, document.metadata, document.embedding
+        )
+
+    @staticmethod
+    def _to_chunk(
+        chunk_id: str,
+        content: str,
+        metadata: dict[str, Any],
+        embedding: list[float] | None = None,
+    ) -> Chunk:
+        """Reconstruct a chunk from stored fields."""
+        return Chunk(
+            id=chunk_id,
+            content=content,
+            embedding=embedding,
+            metadata=ChunkMetadata(
+                document_id=metadata.get("document_id", ""),
+                chunk_index=metadata.get("chunk_index", 0),
+                start_line=metadata.get("start_line"),
+                end_line=metadata.get("end_line"),
+                language=metadata.get("language"),
+                section=metadata.get("section"),
+            ),
+        )
+
     async def get_document(self, document_id: str) -> Document | None:
         """Get a document by ID.
 
@@ -402,5 +523,7 @@ class KnowledgeBase:
     async def close(self) -> None:
         """Close the knowledge base."""
         await self._vector_store.close()
+        if self._lexical is not None:
+            self._lexical.close()
         self._documents.clear()
         self._initialized = False
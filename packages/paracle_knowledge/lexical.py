@@ -0,0 +1,277 @@
+"""Lexical (BM25) index for hybrid retrieval.
+
+Dense vectors are good at paraphrases but often miss exact identifiers
+such as function names or error codes. This module provides a local
+SQLite FTS5 index with BM25 ranking and a code-aware tokenizer, plus the
+fusion of lexical and vector rankings used by KnowledgeBase.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+_WORD = re.compile(r"\w+")
+# Words too common to help ranking (identifiers like ``is_valid`` are kept)
+_STOPWORDS = frozenset(
+    "a an and are as at be by do does for from how i in is it of on or "
+    "that the this to was what when where which who why with you".split()
+)
+_CAMEL_PART = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+# Chunk rows live in a regular table (indexed by chunk and document ID);
+# the FTS5 table shares their rowid. Tokens are pre-split in Python, so
+# FTS5 only splits on the spaces between them.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    rowid INTEGER PRIMARY KEY,
+    chunk_id TEXT NOT NULL UNIQUE,
+    document_id TEXT NOT NULL,
+    content TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_document ON chunks(document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunk_tokens USING fts5(
+    tokens,
+    tokenize = "unicode61 tokenchars '_'"
+);
+"""
+
+
+def tokenize_code(text: str) -> list[str]:
+    """Split text into lowercase search tokens.
+
+    Identifiers are kept whole and also split into their snake_case and
+    camelCase parts, so ``getUserName`` matches both the exact identifier
+    and a query for ``user name``. Common English words are dropped.
+
+    Args:
+        text: Text or code to tokenize
+
+    Returns:
+        Tokens in order of appearance
+    """
+    tokens = []
+    for match in _WORD.finditer(text):
+        word = match.group()
+        lowered = word.lower()
+        if lowered in _STOPWORDS:
+            continue
+        tokens.append(lowered)
+        parts = [
+            part.lower()
+            for piece in word.split("_")
+            for part in _CAMEL_PART.findall(piece)
+        ]
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+@dataclass
+class LexicalHit:
+    """Result from the lexical index.
+
+    Attributes:
+        chunk_id: ID of the matching chunk
+        content: Chunk content
+        metadata: Chunk metadata as stored at indexing time
+        score: BM25 score (higher is better)
+    """
+
+    chunk_id: str
+    content: str
+    metadata: dict[str, Any]
+    score: float
+
+
+class HybridConfig(BaseModel):
+    """Configuration for fusing lexical and vector results.
+
+    Attributes:
+        fusion: "rrf" ranks by reciprocal-rank fusion, "weighted" by the
+            weighted sum of normalized scores
+        rrf_k: Rank offset for reciprocal-rank fusion
+        vector_weight: Weight of the vector score (lexical gets the rest)
+        candidate_multiplier: Candidates fetched from each side per result
+    """
+
+    fusion: Literal["rrf", "weighted"] = "rrf"
+    rrf_k: int = Field(default=60, ge=1)
+    vector_weight: float = Field(default=0.5, ge=0.0, le=1.0)
+    candidate_multiplier: int = Field(default=2, ge=1)
+
+
+def fuse_rankings(
+    vector: list[tuple[str, float]],
+    lexical: list[tuple[str, float]],
+    config: HybridConfig,
+) -> list[tuple[str, float]]:
+    """Fuse vector and lexical rankings.
+
+    Lexical scores are normalized by the best lexical score. The returned
+    score is always the weighted sum of the vector score and the
+    normalized lexical score, so it stays in [0, 1] and can be compared
+    with a relevance threshold; ``config.fusion`` only decides the order.
+
+    Args:
+        vector: (chunk_id, similarity) pairs, best first
+        lexical: (chunk_id, BM25 score) pairs, best first
+        config: Fusion configuration
+
+    Returns:
+        (chunk_id, fused score) pairs in fused order
+    """
+    best_lexical = lexical[0][1] if lexical and lexical[0][1] > 0 else 1.0
+    vector_scores = dict(vector)
+    lexical_scores = {chunk_id: score / best_lexical for chunk_id, score in lexical}
+
+    weight = config.vector_weight
+    scores = {
+        chunk_id: weight * vector_scores.get(chunk_id, 0.0)
+        + (1 - weight) * lexical_scores.get(chunk_id, 0.0)
+        for chunk_id in vector_scores.keys() | lexical_scores.keys()
+    }
+
+    if config.fusion == "weighted":
+        order = sorted(scores, key=scores.__getitem__, reverse=True)
+    else:
+        rrf: dict[str, float] = {}
+        for ranking in (vector, lexical):
+            for rank, (chunk_id, _) in enumerate(ranking, 1):
+                rrf[chunk_id] = rrf.get(chunk_id, 0.0) + 1.0 / (config.rrf_k + rank)
+        order = sorted(
+            rrf, key=lambda chunk_id: (rrf[chunk_id], scores[chunk_id]), reverse=True
+        )
+    return [(chunk_id, scores[chunk_id]) for chunk_id in order]
+
+
+class LexicalIndex:
+    """SQLite FTS5 index of chunk contents with BM25 ranking.
+
+    Usage:
+        index = LexicalIndex(".paracle/knowledge/lexical.db")
+        index.add([("chunk-1", "def get_user(): ...", {"document_id": "d1"})])
+        hits = index.search("get_user", top_k=5)
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """Initialize the index.
+
+        Args:
+            path: Database file (None for an in-memory index)
+        """
+        self._path = str(path) if path else ":memory:"
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self._path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def add(self, chunks: list[tuple[str, str, dict[str, Any]]]) -> None:
+        """Index chunks, replacing earlier versions with the same IDs.
+
+        Args:
+            chunks: (chunk_id, content, metadata) tuples; ``metadata`` may
+                contain ``document_id`` and is used for filtering
+        """
+        with self._lock, self._db:
+            self._delete(
+                "SELECT rowid FROM chunks WHERE chunk_id = ?",
+                [(chunk_id,) for chunk_id, _, _ in chunks],
+            )
+            for chunk_id, content, metadata in chunks:
+                rowid = self._db.execute(
+                    "INSERT INTO chunks (chunk_id, document_id, content, metadata) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        chunk_id,
+                        str(metadata.get("document_id", "")),
+                        content,
+                        json.dumps(metadata),
+                    ),
+                ).lastrowid
+                self._db.execute(
+                    "INSERT INTO chunk_tokens (rowid, tokens) VALUES (?, ?)",
+                    (rowid, " ".join(tokenize_code(content))),
+                )
+
+    def remove_document(self, document_id: str) -> int:
+        """Remove all chunks of a document.
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            Number of chunks removed
+        """
+        with self._lock, self._db:
+            return self._delete(
+                "SELECT rowid FROM chunks WHERE document_id = ?", [(document_id,)]
+            )
+
+    def _delete(self, select: str, params: list[tuple[Any, ...]]) -> int:
+        """Delete the chunks whose rowids ``select`` returns."""
+        rowids = [
+            row for args in params for row in self._db.execute(select, args).fetchall()
+        ]
+        self._db.executemany("DELETE FROM chunk_tokens WHERE rowid = ?", rowids)
+        self._db.executemany("DELETE FROM chunks WHERE rowid = ?", rowids)
+        return len(rowids)
+
+    def search(
+        self,
+        query: str,
+        *,
+        top_k: int = 10,
+        filter_metadata: dict[str, Any] | None = None,
+    ) -> list[LexicalHit]:
+        """Search chunks matching any query token, ranked by BM25.
+
+        Args:
+            query: Search query
+            top_k: Number of results
+            filter_metadata: Optional exact-match metadata filter
+
+        Returns:
+            Hits ordered by relevance
+        """
+        tokens = dict.fromkeys(tokenize_code(query))
+        if not tokens:
+            return []
+
+        match = " OR ".join(f'"{token}"' for token in tokens)
+        sql = (
+            "SELECT c.chunk_id, c.content, c.metadata, bm25(chunk_tokens) "
+            "FROM chunk_tokens JOIN chunks c ON c.rowid = chunk_tokens.rowid "
+            "WHERE chunk_tokens MATCH ?"
+        )
+        params: list[Any] = [match]
+        for key, value in (filter_metadata or {}).items():
+            sql += " AND json_extract(c.metadata, ?) = ?"
+            params.extend([f'$."{key}"', value])
+        sql += " ORDER BY bm25(chunk_tokens) LIMIT ?"
+        params.append(top_k)
+
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        # FTS5 reports BM25 as a negative number (lower is better)
+        return [
+            LexicalHit(chunk_id, content, json.loads(metadata), -rank)
+            for chunk_id, content, metadata, rank in rows
+        ]
+
+    def count(self) -> int:
+        """Return the number of indexed chunks."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            self._db.close()
@@ -2,13 +2,14 @@
 
 This module provides the core RAG engine for context-aware queries:
 - Query processing and expansion
-- Multi-step retrieval
+- Multi-step retrieval (batched, with reciprocal-rank fusion)
 - Context building
 - Source attribution
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -34,6 +35,7 @@ class RAGConfig(BaseModel):
         include_sources: Whether to include source citations
         enable_query_expansion: Enable query expansion
         enable_reranking: Enable reranking step
+        rrf_k: Rank offset for reciprocal-rank fusion of multi-query results
     """
 
     retrieval_top_k: int = 20
@@ -43,6 +45,7 @@ class RAGConfig(BaseModel):
     include_sources: bool = True
     enable_query_expansion: bool = False
     enable_reranking: bool = True
+    rrf_k: int = 60
 
 
 class RAGContext(BaseModel):
@@ -98,6 +101,35 @@ class RAGResponse(BaseModel):
         return "\n".join(lines)
 
 
+def reciprocal_rank_fusion(
+    rankings: list[list[tuple[Chunk, float]]],
+    k: int = 60,
+) -> list[tuple[Chunk, float]]:
+    """Merge ranked result lists with reciprocal-rank fusion.
+
+    A chunk scores ``sum(1 / (k + rank))`` over the lists it appears in.
+    Each chunk is returned once, in fused order, paired with its best
+    similarity score so that thresholds and confidence keep their meaning.
+
+    Args:
+        rankings: Ranked (chunk, score) lists, best first
+        k: Rank offset; larger values flatten the weight of top ranks
+
+    Returns:
+        Deduplicated (chunk, score) tuples in fused order
+    """
+    fused: dict[str, float] = {}
+    best: dict[str, tuple[Chunk, float]] = {}
+    for ranking in rankings:
+        for rank, (chunk, score) in enumerate(ranking, 1):
+            fused[chunk.id] = fused.get(chunk.id, 0.0) + 1.0 / (k + rank)
+            if chunk.id not in best or score > best[chunk.id][1]:
+                best[chunk.id] = (chunk, score)
+
+    order = sorted(fused, key=fused.__getitem__, reverse=True)
+    return [best[chunk_id] for chunk_id in order]
+
+
 class RAGEngine:
     """RAG (Retrieval Augmented Generation) Engine.
 
@@ -136,6 +168,11 @@ class RAGEngine:
         self._config = config or RAGConfig()
         self._reranker = reranker
 
+    @property
+    def config(self) -> RAGConfig:
+        """Get the engine configuration."""
+        return self._config
+
     async def query(
         self,
         question: str,
@@ -153,52 +190,18 @@ class RAGEngine:
         start_time = datetime.now(UTC)
         context = context or RAGContext()
 
-        # Determine parameters
-        retrieval_top_k = context.retrieval_top_k or self._config.retrieval_top_k
-        final_top_k = context.final_top_k or self._config.final_top_k
-
-        # Query expansion (if enabled)
-        expanded_query = None
-        if self._config.enable_query_expansion:
-            expanded_query = await self._expand_query(question)
-            search_query = expanded_query
-        else:
-            search_query = question
+        search_query, expanded_query = await self._search_query(question)
 
         # Retrieve chunks
         chunks_with_scores = await self._kb.search(
             search_query,
-            top_k=retrieval_top_k,
+            top_k=context.retrieval_top_k or self._config.retrieval_top_k,
             filter_metadata=context.filters,
             min_score=self._config.min_relevance_score,
         )
 
-        # Rerank (if enabled and reranker available)
-        if self._config.enable_reranking and self._reranker and chunks_with_scores:
-            rerank_results = await self._reranker.rerank(
-                question, chunks_with_scores, top_k=final_top_k
-            )
-            chunks_with_scores = [(r.chunk, r.combined_score) for r in rerank_results]
-        else:
-            chunks_with_scores = chunks_with_scores[:final_top_k]
-
-        # Build context
-        context_text, sources = self._build_context(chunks_with_scores)
-
-        # Calculate confidence
-        confidence = self._calculate_confidence(chunks_with_scores)
-
-        # Calculate time
-        retrieval_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
-
-        return RAGResponse(
-            context=context_text,
-            sources=sources,
-            chunks=[chunk for chunk, _ in chunks_with_scores],
-            query=question,
-            expanded_query=expanded_query,
-            confidence=confidence,
-            retrieval_time_ms=retrieval_time,
+        return await self._respond(
+            question, chunks_with_scores, context, start_time, expanded_query
         )
 
     async def query_with_history(
@@ -230,7 +233,10 @@ class RAGEngine:
         questions: list[str],
         context: RAGContext | None = None,
     ) -> list[RAGResponse]:
-        """Execute multiple RAG queries.
+        """Execute multiple RAG queries with one batched retrieval.
+
+        All questions are embedded in a single call and searched as one
+        batch; reranking then runs concurrently per question.
 
         Args:
             questions: List of questions
@@ -239,11 +245,114 @@ class RAGEngine:
         Returns:
             List of RAG responses
         """
-        responses = []
-        for question in questions:
-            response = await self.query(question, context)
-            responses.append(response)
-        return responses
+        start_time = datetime.now(UTC)
+        context = context or RAGContext()
+
+        prepared = [await self._search_query(q) for q in questions]
+        results = await self._kb.search_many(
+            [search_query for search_query, _ in prepared],
+            top_k=context.retrieval_top_k or self._config.retrieval_top_k,
+            filter_metadata=context.filters,
+            min_score=self._config.min_relevance_score,
+        )
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self._respond(question, chunks, context, start_time, expanded)
+                    for question, (_, expanded), chunks in zip(
+                        questions, prepared, results, strict=True
+                    )
+                )
+            )
+        )
+
+    async def fused_query(
+        self,
+        question: str,
+        sub_questions: list[str],
+        context: RAGContext | None = None,
+        *,
+        final_top_k: int | None = None,
+    ) -> RAGResponse:
+        """Answer a question from the combined retrieval of sub-questions.
+
+        Sub-questions are retrieved in one batch, their candidates merged
+        with reciprocal-rank fusion (each chunk once) and reranked in a
+        single pass against the original question.
+
+        Args:
+            question: Original question
+            sub_questions: Questions to retrieve context for
+            context: Shared query context
+            final_top_k: Number of chunks to keep (overrides context/config)
+
+        Returns:
+            RAG response for the original question
+        """
+        start_time = datetime.now(UTC)
+        context = context or RAGContext()
+
+        search_queries = [(await self._search_query(q))[0] for q in sub_questions]
+        results = await self._kb.search_many(
+            search_queries,
+            top_k=context.retrieval_top_k or self._config.retrieval_top_k,
+            filter_metadata=context.filters,
+            min_score=self._config.min_relevance_score,
+        )
+        candidates = reciprocal_rank_fusion(results, k=self._config.rrf_k)
+
+        return await self._respond(
+            question, candidates, context, start_time, final_top_k=final_top_k
+        )
+
+    async def _search_query(self, question: str) -> tuple[str, str | None]:
+        """Return (search query, expanded query or None) for a question."""
+        if self._config.enable_query_expansion:
+            expanded_query = await self._expand_query(question)
+            return expanded_query, expanded_query
+        return question, None
+
+    async def _respond(
+        self,
+        question: str,
+        chunks_with_scores: list[tuple[Chunk, float]],
+        context: RAGContext,
+        start_time: datetime,
+        expanded_query: str | None = None,
+        *,
+        final_top_k: int | None = None,
+    ) -> RAGResponse:
+        """Rerank retrieved chunks and build the response."""
+        final_top_k = final_top_k or context.final_top_k or self._config.final_top_k
+
+        # Rerank (if enabled and reranker available)
+        if self._config.enable_reranking and self._reranker and chunks_with_scores:
+            rerank_results = await self._reranker.rerank(
+                question, chunks_with_scores, top_k=final_top_k
+            )
+            chunks_with_scores = [(r.chunk, r.combined_score) for r in rerank_results]
+        else:
+            chunks_with_scores = chunks_with_scores[:final_top_k]
+
+        # Build context
+        context_text, sources = self._build_context(chunks_with_scores)
+
+        # Calculate confidence
+        confidence = self._calculate_confidence(chunks_with_scores)
+
+        # Calculate time
+        retrieval_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
+
+        return RAGResponse(
+            context=context_text,
+            sources=sources,
+            chunks=[chunk for chunk, _ in chunks_with_scores],
+            query=question,
+            expanded_query=expanded_query,
+            confidence=confidence,
+            retrieval_time_ms=retrieval_time,
+        )
 
     async def _expand_query(self, query: str) -> str:
         """Expand query for better retrieval.
@@ -373,8 +482,8 @@ class RAGChain:
     ) -> RAGResponse:
         """Execute a chained RAG query.
 
-        For complex questions, decomposes into sub-questions
-        and retrieves context for each.
+        For complex questions, decomposes into sub-questions and
+        retrieves context for all of them in one fused retrieval.
         """
         # Decompose question
         sub_questions = self._decompose_question(question)
@@ -383,32 +492,15 @@ class RAGChain:
             # Simple question, use direct retrieval
             return await self._rag.query(question, context)
 
-        # Multi-step retrieval
-        all_chunks = []
-        all_sources = []
-
-        for sub_q in sub_questions[: self._max_steps]:
-            response = await self._rag.query(sub_q, context)
-            all_chunks.extend(response.chunks)
-            all_sources.extend(response.sources)
-
-        # Deduplicate chunks
-        seen_ids = set()
-        unique_chunks = []
-        for chunk in all_chunks:
-            if chunk.id not in seen_ids:
-                seen_ids.add(chunk.id)
-                unique_chunks.append(chunk)
-
-        # Build combined context
-        context_text = "\n\n---\n\n".join(c.content for c in unique_chunks)
-
-        return RAGResponse(
-            context=context_text,
-            sources=all_sources,
-            chunks=unique_chunks,
-            query=question,
-            confidence=self._calculate_chain_confidence(all_sources),
+        # One batched retrieval for all sub-questions, keeping as many
+        # chunks overall as separate queries would have returned
+        sub_questions = sub_questions[: self._max_steps]
+        final_top_k = (context and context.final_top_k) or self._rag.config.final_top_k
+        return await self._rag.fused_query(
+            question,
+            sub_questions,
+            context,
+            final_top_k=final_top_k * len(sub_questions),
         )
 
     def _decompose_question(self, question: str) -> list[str]:
@@ -430,11 +522,3 @@ class RAGChain:
             return [p.strip() + "?" for p in parts if p.strip()]
 
         return [question]
-
-    def _calculate_chain_confidence(self, sources: list[Source]) -> float:
-        """Calculate confidence for chained query."""
-        if not sources:
-            return 0.0
-
-        scores = [s.score for s in sources]
-        return sum(scores) / len(scores)
@@ -6,10 +6,15 @@ the relevance of search results from vector similarity.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from paracle_knowledge.base import Chunk
@@ -63,7 +68,14 @@ class CrossEncoderReranker(Reranker):
     Uses a cross-encoder model to compute query-document
     relevance scores for better ranking.
 
-    Requires: sentence-transformers package
+    Inference never runs on the event loop: pairs are scored in a worker
+    thread, and pairs from concurrent ``rerank`` calls are merged into one
+    micro-batch, sent when it reaches ``batch_size`` pairs or
+    ``max_wait_ms`` after its first pair. Scores are cached by (query,
+    chunk content) hash.
+
+    Requires: sentence-transformers package (the ONNX backend also needs
+    onnxruntime)
     """
 
     def __init__(
@@ -72,6 +84,11 @@ class CrossEncoderReranker(Reranker):
         *,
         batch_size: int = 32,
         score_weight: float = 0.7,
+        max_wait_ms: float = 5.0,
+        cache_size: int = 10_000,
+        backend: Literal["torch", "onnx"] = "torch",
+        onnx_file: str = "onnx/model_quint8_avx2.onnx",
+        executor: Executor | None = None,
     ):
         """Initialize cross-encoder reranker.
 
@@ -79,28 +96,66 @@ class CrossEncoderReranker(Reranker):
             model_name: Name of cross-encoder model
             batch_size: Batch size for inference
             score_weight: Weight of rerank score in combined score
+            max_wait_ms: Longest time a pair waits for its batch to fill
+            cache_size: Maximum number of cached scores (0 disables)
+            backend: "onnx" runs a (quantized) ONNX export on CPU
+            onnx_file: ONNX file within the model repository
+            executor: Executor running inference (default: one dedicated
+                thread, which the model's own intra-op threads saturate)
         """
         self._model_name = model_name
         self._batch_size = batch_size
         self._score_weight = score_weight
+        self._max_wait = max_wait_ms / 1000
+        self._cache_size = cache_size
+        self._backend = backend
+        self._onnx_file = onnx_file
         self._model: Any = None
+        self._model_lock = threading.Lock()
+        self._executor = executor
+        self._owns_executor = executor is None
+
+        # (query hash, content hash) -> raw score, least recently used first
+        self._cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._pending: list[tuple[list[tuple[str, str]], asyncio.Future]] = []
+        self._pending_pairs = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task] = set()
+        self._stats = {"requests": 0, "cache_hits": 0, "pairs_scored": 0, "batches": 0}
 
     def _get_model(self) -> Any:
-        """Lazy initialization of cross-encoder model."""
-        if self._model is None:
-            try:
-                from sentence_transformers import CrossEncoder
-            except ImportError as e:
-                raise ImportError(
-                    "sentence-transformers package not installed. "
-                    "Install with: pip install sentence-transformers"
-                ) from e
-
-            self._model = CrossEncoder(self._model_name)
-            logger.info("Loaded cross-encoder model: %s", self._model_name)
+        """Lazy initialization of cross-encoder model (worker thread)."""
+        with self._model_lock:
+            if self._model is None:
+                try:
+                    from sentence_transformers import CrossEncoder
+                except ImportError as e:
+                    raise ImportError(
+                        "sentence-transformers package not installed. "
+                        "Install with: pip install sentence-transformers"
+                    ) from e
+
+                if self._backend == "onnx":
+                    self._model = CrossEncoder(
+                        self._model_name,
+                        backend="onnx",
+                        model_kwargs={"file_name": self._onnx_file},
+                    )
+                else:
+                    self._model = CrossEncoder(self._model_name)
+                logger.info(
+                    "Loaded cross-encoder model: %s (%s)",
+                    self._model_name,
+                    self._backend,
+                )
 
         return self._model
 
+    def _predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Score pairs with the model (runs in the executor)."""
+        scores = self._get_model().predict(pairs, batch_size=self._batch_size)
+        return [float(score) for score in scores]
+
     async def rerank(
         self,
         query: str,
@@ -111,18 +166,34 @@ class CrossEncoderReranker(Reranker):
         if not chunks:
             return []
 
-        model = self._get_model()
-
-        # Prepare query-document pairs
-        pairs = [(query, chunk.content) for chunk, _ in chunks]
-
-        # Get cross-encoder scores
-        scores = model.predict(pairs, batch_size=self._batch_size)
+        self._stats["requests"] += 1
+        query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
+        keys = [(query_hash, chunk.content_hash) for chunk, _ in chunks]
+
+        # Score each distinct uncached passage once
+        scores: dict[tuple[str, str], float] = {}
+        missing: dict[tuple[str, str], str] = {}
+        for key, (chunk, _) in zip(keys, chunks, strict=True):
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                scores[key] = cached
+                self._stats["cache_hits"] += 1
+            elif key not in missing:
+                missing[key] = chunk.content
+
+        if missing:
+            new_scores = await self._score(
+                [(query, content) for content in missing.values()]
+            )
+            for key, score in zip(missing, new_scores, strict=True):
+                scores[key] = score
+                self._remember(key, score)
 
         # Combine with original scores
         results = []
-        for i, (chunk, original_score) in enumerate(chunks):
-            rerank_score = float(scores[i])
+        for key, (chunk, original_score) in zip(keys, chunks, strict=True):
+            rerank_score = scores[key]
 
             # Normalize rerank score to [0, 1]
             rerank_score_normalized = (
@@ -149,6 +220,80 @@ class CrossEncoderReranker(Reranker):
 
         return results[:top_k]
 
+    def _remember(self, key: tuple[str, str], score: float) -> None:
+        """Add a score to the LRU cache."""
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = score
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    async def _score(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Queue pairs for the next micro-batch and wait for their scores."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((pairs, future))
+        self._pending_pairs += len(pairs)
+
+        if self._pending_pairs >= self._batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Send all pending pairs to the executor as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending, self._pending_pairs = self._pending, [], 0
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(
+        self, batch: list[tuple[list[tuple[str, str]], asyncio.Future]]
+    ) -> None:
+        """Score a micro-batch off the loop and resolve its waiters."""
+        pairs = [pair for request_pairs, _ in batch for pair in request_pairs]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="paracle-rerank"
+            )
+        try:
+            scores = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._predict, pairs
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self._stats["batches"] += 1
+        self._stats["pairs_scored"] += len(pairs)
+        offset = 0
+        for request_pairs, future in batch:
+            if not future.done():
+                future.set_result(scores[offset : offset + len(request_pairs)])
+            offset += len(request_pairs)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching and cache statistics."""
+        stats: dict[str, Any] = dict(self._stats)
+        stats["cache_size"] = len(self._cache)
+        stats["avg_batch_size"] = (
+            stats["pairs_scored"] / stats["batches"] if stats["batches"] else 0.0
+        )
+        return stats
+
+    def close(self) -> None:
+        """Shut down the inference thread (if owned)."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
 
 class LLMReranker(Reranker):
     """LLM-based reranker using relevance scoring.
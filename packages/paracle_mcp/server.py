@@ -25,6 +25,11 @@ from pathlib import Path
 from typing import Any
 
 import yaml
+from paracle_core.parac.compiled import (
+    CompiledWorkspace,
+    load_workspace,
+    workspace_tree_hash,
+)
 
 from paracle_mcp.api_bridge import TOOL_API_MAPPINGS, MCPAPIBridge
 
@@ -92,6 +97,10 @@ class ParacleMCPServer:
             api_base_url: Base URL for REST API (for API bridge)
         """
         self.parac_root = parac_root or self._find_parac_root()
+        # Parsed .parac/ files, served from the compiled workspace cache
+        self.workspace: CompiledWorkspace | None = (
+            load_workspace(self.parac_root) if self.parac_root else None
+        )
         self.tools = self._load_all_tools()
         self.custom_tools: list[CustomTool] = []
         self.external_mcp_servers: list[ExternalMCPServer] = []
@@ -148,6 +157,25 @@ class ParacleMCPServer:
 
         return all_tools
 
+    def _refresh_workspace(self) -> None:
+        """Reload the .parac/ catalog if the workspace changed on disk.
+
+        Checking costs one ``stat`` per workspace input file, so a
+        long-running server picks up new custom tools, MCP servers and
+        workflows without a restart.
+        """
+        if self.workspace is None or self.parac_root is None:
+            return
+        if workspace_tree_hash(self.parac_root) == self.workspace.tree_hash:
+            return
+
+        logger.info("Workspace changed, reloading .parac/ tools")
+        self.workspace = load_workspace(self.parac_root)
+        self.custom_tools = []
+        self.external_mcp_servers = []
+        self._load_custom_tools()
+        self._load_external_mcp_servers()
+
     def _load_custom_tools(self) -> None:
         """Load custom Python tools from .parac/tools/custom/.
 
@@ -161,14 +189,11 @@ class ParacleMCPServer:
             return
 
         # Also check registry.yaml for custom tool definitions
-        registry_path = self.parac_root / "tools" / "registry.yaml"
         custom_defs = {}
-        if registry_path.exists():
-            with open(registry_path, encoding="utf-8") as f:
-                registry = yaml.safe_load(f) or {}
-                for tool_def in registry.get("custom", []):
-                    if tool_def.get("name"):
-                        custom_defs[tool_def["name"]] = tool_def
+        registry = self.workspace.document("tools/registry.yaml") or {}
+        for tool_def in registry.get("custom", []):
+            if tool_def.get("name"):
+                custom_defs[tool_def["name"]] = tool_def
 
         # Load Python tools from custom directory
         for py_file in custom_dir.glob("*.py"):
@@ -218,36 +243,26 @@ class ParacleMCPServer:
         if not self.parac_root:
             return
 
-        mcp_dir = self.parac_root / "tools" / "mcp"
-        if not mcp_dir.exists():
-            return
-
         # Try loading from mcp.yaml, mcp.json, or servers.yaml
         config_files = [
-            mcp_dir / "mcp.yaml",
-            mcp_dir / "mcp.json",
-            mcp_dir / "servers.yaml",
+            "tools/mcp/mcp.yaml",
+            "tools/mcp/mcp.json",
+            "tools/mcp/servers.yaml",
         ]
 
         servers_config = []
         for config_file in config_files:
-            if config_file.exists():
-                with open(config_file, encoding="utf-8") as f:
-                    if config_file.suffix == ".json":
-                        config = json.load(f)
-                    else:
-                        config = yaml.safe_load(f) or {}
-
-                    # Handle different config formats
-                    if "servers" in config:
-                        servers_config = config["servers"]
-                    elif "mcpServers" in config:
-                        # VS Code format: convert to list
-                        for name, srv_config in config["mcpServers"].items():
-                            srv_config["id"] = name
-                            srv_config["name"] = name
-                            servers_config.append(srv_config)
-                    break
+            if self.workspace.has(config_file):
+                config = self.workspace.document(config_file) or {}
+
+                # Handle different config formats
+                if "servers" in config:
+                    servers_config = config["servers"]
+                elif "mcpServers" in config:
+                    # VS Code format: convert to list
+                    for name, srv_config in config["mcpServers"].items():
+                        servers_config.append({**srv_config, "id": name, "name": name})
+                break
 
         # Create ExternalMCPServer instances
         for srv in servers_config:
@@ -408,14 +423,11 @@ class ParacleMCPServer:
         """
         # Load available workflows
         workflows = []
-        if self.parac_root:
-            catalog_path = self.parac_root / "workflows" / "catalog.yaml"
-            if catalog_path.exists():
-                with open(catalog_path, encoding="utf-8") as f:
-                    catalog = yaml.safe_load(f)
-                    for wf in catalog.get("workflows", []):
-                        if wf.get("status") == "active":
-                            workflows.append(wf["name"])
+        if self.workspace is not None:
+            catalog = self.workspace.document("workflows/catalog.yaml") or {}
+            for wf in catalog.get("workflows", []):
+                if wf.get("status") == "active":
+                    workflows.append(wf["name"])
 
         return [
             {
@@ -1019,6 +1031,7 @@ class ParacleMCPServer:
         Returns:
             Dict with tools list
         """
+        self._refresh_workspace()
         return {"tools": self.get_tool_schemas()}
 
     async def handle_call_tool(self, name: str, arguments: dict) -> dict:
@@ -1031,6 +1044,8 @@ class ParacleMCPServer:
         Returns:
             Tool execution result
         """
+        self._refresh_workspace()
+
         # Special router tool
         if name == "set_active_agent":
             self.active_agent = arguments.get("agent_id")
@@ -23,6 +23,13 @@ Example:
     >>>
     >>> # Will try Anthropic first, then OpenAI, then Mock
     >>> response = await chain.complete(request)
+
+Latency-aware routing with hedged requests:
+    >>> chain = ProviderChain(
+    ...     providers=[AnthropicProvider(), OpenAIProvider()],
+    ...     strategy=FallbackStrategy.LATENCY_AWARE,
+    ...     hedge_requests=True,  # Fire a backup after the primary's p95
+    ... )
 """
 
 from __future__ import annotations
@@ -30,6 +37,7 @@ from __future__ import annotations
 import asyncio
 import random
 import time
+from collections import deque
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -42,7 +50,6 @@ from paracle_meta.capabilities.provider_protocol import (
     LLMRequest,
     LLMResponse,
     ProviderError,
-    ProviderRateLimitError,
     StreamChunk,
 )
 
@@ -68,6 +75,9 @@ class FallbackStrategy(Enum):
     # Random selection (for load balancing)
     RANDOM = "random"
 
+    # Lowest EWMA latency x in-flight load (power-of-two-choices)
+    LATENCY_AWARE = "latency_aware"
+
 
 @dataclass
 class ProviderMetrics:
@@ -80,6 +90,11 @@ class ProviderMetrics:
         last_failure: Timestamp of last failure.
         last_success: Timestamp of last success.
         consecutive_failures: Number of consecutive failures.
+        ewma_latency_ms: Peak-sensitive moving average of request latency.
+        ewma_ttft_ms: Moving average of stream time-to-first-token.
+        in_flight: Requests currently outstanding.
+        recent_latencies_ms: Sliding window of latencies for percentiles.
+        last_sample_at: Monotonic time of the last latency sample.
     """
 
     success_count: int = 0
@@ -88,6 +103,11 @@ class ProviderMetrics:
     last_failure: datetime | None = None
     last_success: datetime | None = None
     consecutive_failures: int = 0
+    ewma_latency_ms: float = 0.0
+    ewma_ttft_ms: float = 0.0
+    in_flight: int = 0
+    recent_latencies_ms: deque[float] = field(default_factory=lambda: deque(maxlen=128))
+    last_sample_at: float = 0.0
 
     @property
     def total_requests(self) -> int:
@@ -108,6 +128,34 @@ class ProviderMetrics:
             return 0.0
         return self.total_latency_ms / self.success_count
 
+    def percentile_latency_ms(self, q: float) -> float | None:
+        """Latency percentile over the recent window (None without samples)."""
+        if not self.recent_latencies_ms:
+            return None
+        ordered = sorted(self.recent_latencies_ms)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def observe_latency(self, latency_ms: float, alpha: float = 0.3) -> None:
+        """Update latency statistics with a new sample.
+
+        Increases are taken immediately (peak EWMA) so a degrading provider
+        loses traffic at once; decreases are smoothed.
+        """
+        self.recent_latencies_ms.append(latency_ms)
+        if latency_ms > self.ewma_latency_ms:
+            self.ewma_latency_ms = latency_ms
+        else:
+            self.ewma_latency_ms += alpha * (latency_ms - self.ewma_latency_ms)
+        self.last_sample_at = time.monotonic()
+
+    def observe_ttft(self, ttft_ms: float, alpha: float = 0.3) -> None:
+        """Update the time-to-first-token average with a new sample."""
+        if ttft_ms > self.ewma_ttft_ms:
+            self.ewma_ttft_ms = ttft_ms
+        else:
+            self.ewma_ttft_ms += alpha * (ttft_ms - self.ewma_ttft_ms)
+        self.last_sample_at = time.monotonic()
+
 
 @dataclass
 class CircuitBreaker:
@@ -205,6 +253,15 @@ PROVIDER_QUALITY: dict[str, int] = {
 }
 
 
+# Idle providers have their latency estimate halved every this many seconds,
+# so a provider that was slow once is eventually probed again
+LATENCY_HALF_LIFE_SECONDS = 30.0
+
+# Hedge delay used before a provider has enough latency samples
+DEFAULT_HEDGE_DELAY_MS = 1000.0
+HEDGE_MIN_SAMPLES = 10
+
+
 class ProviderChainError(Exception):
     """All providers in chain failed."""
 
@@ -231,6 +288,9 @@ class ProviderChain(BaseProvider):
         providers: list[CapabilityProvider],
         strategy: FallbackStrategy = FallbackStrategy.PRIMARY_WITH_FALLBACK,
         circuit_breaker: CircuitBreaker | None = None,
+        hedge_requests: bool = False,
+        hedge_delay_ms: float | None = None,
+        ewma_alpha: float = 0.3,
     ):
         """Initialize provider chain.
 
@@ -238,6 +298,12 @@ class ProviderChain(BaseProvider):
             providers: List of providers (in priority order for PRIMARY strategy).
             strategy: Provider selection strategy.
             circuit_breaker: Circuit breaker configuration.
+            hedge_requests: Send the request to the next provider too when the
+                first one has not answered after the hedge delay; the slower
+                response is cancelled.
+            hedge_delay_ms: Fixed hedge delay (None = the primary provider's
+                p95 latency).
+            ewma_alpha: Smoothing factor of the latency moving averages.
         """
         super().__init__()
         self._providers = providers
@@ -245,6 +311,10 @@ class ProviderChain(BaseProvider):
         self._circuit_breaker = circuit_breaker or CircuitBreaker()
         self._metrics: dict[str, ProviderMetrics] = {}
         self._round_robin_index = 0
+        self._hedge_requests = hedge_requests
+        self._hedge_delay_ms = hedge_delay_ms
+        self._ewma_alpha = ewma_alpha
+        self.hedge_stats: dict[str, int] = {"fired": 0, "won": 0}
 
     @property
     def name(self) -> str:
@@ -299,40 +369,110 @@ class ProviderChain(BaseProvider):
         Raises:
             ProviderChainError: If all providers fail.
         """
-        providers = self._select_providers()
+        providers = [
+            p
+            for p in self._select_providers()
+            if not self._circuit_breaker.is_open(p.name)
+        ]
         errors: list[tuple[str, Exception]] = []
 
-        for provider in providers:
-            if self._circuit_breaker.is_open(provider.name):
-                continue
+        i = 0
+        while i < len(providers):
+            primary = providers[i]
+            backup = (
+                providers[i + 1]
+                if self._hedge_requests and i + 1 < len(providers)
+                else None
+            )
 
-            try:
-                start_time = time.time()
-                response = await provider.complete(request)
-                latency_ms = (time.time() - start_time) * 1000
+            if backup is None:
+                # Rate limits and provider errors alike: try the next provider
+                try:
+                    return await self._attempt(primary, request)
+                except Exception as e:
+                    errors.append((primary.name, e))
+                i += 1
+                continue
 
-                self._record_success(provider.name, latency_ms)
+            response = await self._hedged(primary, backup, request, errors)
+            if response is not None:
                 return response
+            i += 2
 
-            except ProviderRateLimitError as e:
-                # Rate limit - definitely try next provider
-                self._record_failure(provider.name)
-                errors.append((provider.name, e))
-                continue
-
-            except ProviderError as e:
-                # Provider error - record and try next
-                self._record_failure(provider.name)
-                errors.append((provider.name, e))
+        raise ProviderChainError(errors)
 
-                if not e.recoverable:
-                    continue  # Skip to next provider
+    async def _attempt(
+        self, provider: CapabilityProvider, request: LLMRequest
+    ) -> LLMResponse:
+        """Call one provider, recording latency, load and failures."""
+        metrics = self.get_metrics(provider.name)
+        metrics.in_flight += 1
+        start_time = time.perf_counter()
+        try:
+            response = await provider.complete(request)
+        except asyncio.CancelledError:
+            # Lost a hedge race: neither a success nor a failure
+            raise
+        except Exception:
+            self._record_failure(provider.name)
+            raise
+        finally:
+            metrics.in_flight -= 1
 
-            except Exception as e:
-                self._record_failure(provider.name)
-                errors.append((provider.name, e))
+        self._record_success(provider.name, (time.perf_counter() - start_time) * 1000)
+        return response
 
-        raise ProviderChainError(errors)
+    async def _hedged(
+        self,
+        primary: CapabilityProvider,
+        backup: CapabilityProvider,
+        request: LLMRequest,
+        errors: list[tuple[str, Exception]],
+    ) -> LLMResponse | None:
+        """Race primary against a delayed backup; return the first success.
+
+        Failures are appended to ``errors``; None means both failed.
+        """
+        tasks = {asyncio.create_task(self._attempt(primary, request)): primary}
+        try:
+            done, _ = await asyncio.wait(
+                tasks, timeout=self._hedge_delay_seconds(primary.name)
+            )
+            hedged = not done
+            if hedged:
+                self.hedge_stats["fired"] += 1
+            elif next(iter(done)).exception() is None:
+                return next(iter(done)).result()
+            # Primary slow (hedge) or already failed (plain fallback)
+            tasks[asyncio.create_task(self._attempt(backup, request))] = backup
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if hedged and tasks[task] is backup:
+                            self.hedge_stats["won"] += 1
+                        return task.result()
+                    errors.append((tasks[task].name, error))
+            return None
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _hedge_delay_seconds(self, provider_name: str) -> float:
+        """Delay before hedging: fixed, or the provider's recent p95 latency."""
+        if self._hedge_delay_ms is not None:
+            return self._hedge_delay_ms / 1000
+        metrics = self.get_metrics(provider_name)
+        if len(metrics.recent_latencies_ms) < HEDGE_MIN_SAMPLES:
+            return DEFAULT_HEDGE_DELAY_MS / 1000
+        return (metrics.percentile_latency_ms(0.95) or DEFAULT_HEDGE_DELAY_MS) / 1000
 
     async def stream(self, request: LLMRequest) -> AsyncIterator[StreamChunk]:
         """Stream using provider chain with fallback.
@@ -346,20 +486,29 @@ class ProviderChain(BaseProvider):
         Raises:
             ProviderChainError: If all providers fail.
         """
-        providers = self._select_providers()
+        providers = self._select_providers(streaming=True)
         errors: list[tuple[str, Exception]] = []
 
         for provider in providers:
             if self._circuit_breaker.is_open(provider.name):
                 continue
 
+            metrics = self.get_metrics(provider.name)
+            metrics.in_flight += 1
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
+                first_chunk = True
 
                 async for chunk in provider.stream(request):
+                    if first_chunk:
+                        first_chunk = False
+                        metrics.observe_ttft(
+                            (time.perf_counter() - start_time) * 1000,
+                            self._ewma_alpha,
+                        )
                     yield chunk
                     if chunk.is_final:
-                        latency_ms = (time.time() - start_time) * 1000
+                        latency_ms = (time.perf_counter() - start_time) * 1000
                         self._record_success(provider.name, latency_ms)
 
                 return  # Successfully completed
@@ -373,10 +522,17 @@ class ProviderChain(BaseProvider):
                 self._record_failure(provider.name)
                 errors.append((provider.name, e))
 
+            finally:
+                metrics.in_flight -= 1
+
         raise ProviderChainError(errors)
 
-    def _select_providers(self) -> list[CapabilityProvider]:
-        """Select providers based on strategy."""
+    def _select_providers(self, streaming: bool = False) -> list[CapabilityProvider]:
+        """Select providers based on strategy.
+
+        Args:
+            streaming: Rank by time-to-first-token (LATENCY_AWARE only).
+        """
         available = [p for p in self._providers if p.is_available]
 
         if not available:
@@ -415,13 +571,51 @@ class ProviderChain(BaseProvider):
             random.shuffle(shuffled)
             return shuffled
 
+        if self._strategy == FallbackStrategy.LATENCY_AWARE:
+            return self._latency_order(available, streaming)
+
         return available
 
+    def _latency_score(self, provider_name: str, streaming: bool) -> float:
+        """Expected wait on a provider (lower is better).
+
+        EWMA latency (or TTFT for streams) decayed while the provider is
+        idle, times outstanding requests + 1, times consecutive failures + 1.
+        Providers without samples score 0 so they get probed.
+        """
+        metrics = self.get_metrics(provider_name)
+        latency = metrics.ewma_latency_ms
+        if streaming and metrics.ewma_ttft_ms:
+            latency = metrics.ewma_ttft_ms
+        if metrics.last_sample_at:
+            idle = time.monotonic() - metrics.last_sample_at
+            latency *= 0.5 ** (idle / LATENCY_HALF_LIFE_SECONDS)
+        return latency * (metrics.in_flight + 1) * (metrics.consecutive_failures + 1)
+
+    def _latency_order(
+        self, available: list[CapabilityProvider], streaming: bool
+    ) -> list[CapabilityProvider]:
+        """Power-of-two-choices primary, remaining providers by score.
+
+        Comparing two random providers instead of always taking the global
+        best avoids herding every concurrent request onto the same provider.
+        """
+        scores = {p.name: self._latency_score(p.name, streaming) for p in available}
+        if len(available) <= 2:
+            return sorted(available, key=lambda p: scores[p.name])
+        a, b = random.sample(available, 2)
+        first = a if scores[a.name] <= scores[b.name] else b
+        rest = sorted(
+            (p for p in available if p is not first), key=lambda p: scores[p.name]
+        )
+        return [first, *rest]
+
     def _record_success(self, provider_name: str, latency_ms: float) -> None:
         """Record successful request."""
         metrics = self.get_metrics(provider_name)
         metrics.success_count += 1
         metrics.total_latency_ms += latency_ms
+        metrics.observe_latency(latency_ms, self._ewma_alpha)
         metrics.consecutive_failures = 0
         metrics.last_success = datetime.now(timezone.utc)
 
@@ -448,6 +642,7 @@ class ProviderChain(BaseProvider):
         self._metrics.clear()
         self._circuit_breaker.reset()
         self._round_robin_index = 0
+        self.hedge_stats = {"fired": 0, "won": 0}
 
 
 class SmartProviderChain(ProviderChain):
@@ -7,16 +7,25 @@ Provides scheduled task execution:
 - Task queue management
 - Task cancellation
 
-Uses asyncio for in-process scheduling.
+Uses asyncio for in-process scheduling: pending tasks sit in a min-heap
+keyed by next run time and the scheduler sleeps until the earliest deadline
+(or until the schedule changes), so idle cost does not grow with the number
+of tasks. Schedules can optionally be persisted to SQLite.
 For distributed scheduling, use with Celery or APScheduler.
 """
 
 import asyncio
 import hashlib
+import heapq
+import itertools
+import json
+import sqlite3
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from pathlib import Path
 from typing import Any, Callable, Coroutine
 
 from pydantic import Field
@@ -64,6 +73,8 @@ class ScheduledTask:
     max_runs: int | None = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     error: str | None = None
+    paused_next_run: datetime | None = None
+    misfire_count: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -79,6 +90,8 @@ class ScheduledTask:
             "max_runs": self.max_runs,
             "created_at": self.created_at.isoformat(),
             "error": self.error,
+            "paused": self.paused_next_run is not None,
+            "misfire_count": self.misfire_count,
         }
 
 
@@ -95,12 +108,156 @@ class SchedulerConfig(CapabilityConfig):
     )
     check_interval: float = Field(
         default=1.0,
-        description="Interval for checking scheduled tasks (seconds)",
+        description="Back-off after an unexpected scheduler loop error (seconds)",
     )
     persist_tasks: bool = Field(
         default=False,
         description="Persist tasks across restarts",
     )
+    persist_path: str = Field(
+        default=".parac/memory/data/scheduler.db",
+        description="SQLite file used when persist_tasks is enabled",
+    )
+    misfire_grace_seconds: float | None = Field(
+        default=None,
+        description=(
+            "Runs later than this are skipped as misfires; a skipped "
+            "one-time task is marked failed (None = always run, however late)"
+        ),
+    )
+    coalesce: bool = Field(
+        default=True,
+        description=(
+            "Collapse several missed cron runs into one run "
+            "instead of replaying each of them"
+        ),
+    )
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _ts(dt: datetime) -> float:
+    """Seconds since epoch of a naive UTC datetime."""
+    return (dt - _EPOCH).total_seconds()
+
+
+def _dt(ts: float | None) -> datetime | None:
+    return _EPOCH + timedelta(seconds=ts) if ts is not None else None
+
+
+class SchedulerStore:
+    """SQLite persistence for scheduled tasks."""
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS scheduled_tasks (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        schedule TEXT NOT NULL,
+        callback_name TEXT NOT NULL,
+        args TEXT NOT NULL,
+        kwargs TEXT NOT NULL,
+        status TEXT NOT NULL,
+        next_run REAL,
+        last_run REAL,
+        run_count INTEGER NOT NULL,
+        max_runs INTEGER,
+        created_at REAL NOT NULL,
+        error TEXT,
+        paused_next_run REAL,
+        misfire_count INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS idx_scheduled_tasks_status_next
+        ON scheduled_tasks(status, next_run);
+    """
+
+    def __init__(self, db_path: str | Path):
+        """Open (and create if needed) the schedule database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+
+    def save(self, task: ScheduledTask) -> None:
+        """Insert or replace a task.
+
+        Raises:
+            TypeError: If the task arguments are not JSON serializable
+        """
+        self.save_row(self.to_row(task))
+
+    @staticmethod
+    def to_row(task: ScheduledTask) -> tuple:
+        """Serialize a task into a ``scheduled_tasks`` row.
+
+        Raises:
+            TypeError: If the task arguments are not JSON serializable
+        """
+        return (
+            task.id,
+            task.name,
+            task.schedule,
+            task.callback_name,
+            json.dumps(list(task.args)),
+            json.dumps(task.kwargs),
+            task.status.value,
+            _ts(task.next_run) if task.next_run else None,
+            _ts(task.last_run) if task.last_run else None,
+            task.run_count,
+            task.max_runs,
+            _ts(task.created_at),
+            task.error,
+            _ts(task.paused_next_run) if task.paused_next_run else None,
+            task.misfire_count,
+        )
+
+    def save_row(self, row: tuple) -> None:
+        """Insert or replace a row built by ``to_row``."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scheduled_tasks VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+
+    def load(self) -> list[ScheduledTask]:
+        """Load every stored task."""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM scheduled_tasks").fetchall()
+        return [
+            ScheduledTask(
+                id=row[0],
+                name=row[1],
+                schedule=row[2],
+                callback_name=row[3],
+                args=tuple(json.loads(row[4])),
+                kwargs=json.loads(row[5]),
+                status=TaskStatus(row[6]),
+                next_run=_dt(row[7]),
+                last_run=_dt(row[8]),
+                run_count=row[9],
+                max_runs=row[10],
+                created_at=_dt(row[11]) or datetime.utcnow(),
+                error=row[12],
+                paused_next_run=_dt(row[13]),
+                misfire_count=row[14],
+            )
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
 
 class SchedulerCapability(BaseCapability):
@@ -152,9 +309,27 @@ class SchedulerCapability(BaseCapability):
         self._running = False
         self._semaphore: asyncio.Semaphore | None = None
 
+        # Min-heap of (deadline, seq, task_id). Entries are invalidated lazily:
+        # only the key recorded in _heap_keys for a task is live.
+        self._heap: list[tuple[float, int, str]] = []
+        self._heap_keys: dict[str, tuple[float, int]] = {}
+        self._seq = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self._cron_cache: dict[str, Any] = {}
+        self._store: SchedulerStore | None = None
+        # Keeps store writes in the order they were issued
+        self._store_lock = asyncio.Lock()
+
     async def initialize(self) -> None:
         """Initialize scheduler."""
         self._semaphore = asyncio.Semaphore(self.config.max_concurrent_tasks)
+        self._wakeup = asyncio.Event()
+        if self.config.persist_tasks and self._store is None:
+            self._store = await asyncio.to_thread(
+                SchedulerStore, self.config.persist_path
+            )
+            await self._restore_tasks()
         self._running = True
         self._scheduler_task = asyncio.create_task(self._scheduler_loop())
         await super().initialize()
@@ -170,10 +345,18 @@ class SchedulerCapability(BaseCapability):
                 pass
             self._scheduler_task = None
 
-        # Cancel all pending tasks
+        # Cancel all pending tasks (persisted schedules stay pending so they
+        # resume after a restart)
         for task in self._tasks.values():
             if task.status == TaskStatus.PENDING:
                 task.status = TaskStatus.CANCELLED
+        self._heap.clear()
+        self._heap_keys.clear()
+
+        if self._store is not None:
+            async with self._store_lock:
+                await asyncio.to_thread(self._store.close)
+            self._store = None
 
         await super().shutdown()
 
@@ -247,20 +430,32 @@ class SchedulerCapability(BaseCapability):
             )
 
     async def _scheduler_loop(self) -> None:
-        """Main scheduler loop that checks and runs due tasks."""
+        """Main scheduler loop: sleep until the next deadline, run due tasks."""
+        assert self._wakeup is not None
         while self._running:
             try:
-                now = datetime.utcnow()
+                deadline = self._peek_deadline()
+                self._wakeup.clear()
+                if deadline is None:
+                    await self._wakeup.wait()
+                    continue
+
+                delay = deadline - _ts(datetime.utcnow())
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
 
-                for task in list(self._tasks.values()):
-                    if task.status != TaskStatus.PENDING:
-                        continue
-
-                    if task.next_run and task.next_run <= now:
-                        # Run the task
-                        asyncio.create_task(self._execute_task(task))
-
-                await asyncio.sleep(self.config.check_interval)
+                now = datetime.utcnow()
+                now_ts = _ts(now)
+                while self._heap and self._heap[0][0] <= now_ts:
+                    deadline, seq, task_id = heapq.heappop(self._heap)
+                    if self._heap_keys.get(task_id) != (deadline, seq):
+                        continue  # Stale entry (rescheduled, paused, cancelled)
+                    del self._heap_keys[task_id]
+                    await self._dispatch_due(task_id, now)
 
             except asyncio.CancelledError:
                 break
@@ -268,14 +463,90 @@ class SchedulerCapability(BaseCapability):
                 # Log error but keep running
                 await asyncio.sleep(self.config.check_interval)
 
+    def _peek_deadline(self) -> float | None:
+        """Return the earliest live deadline, dropping stale heap entries."""
+        while self._heap:
+            deadline, seq, task_id = self._heap[0]
+            if self._heap_keys.get(task_id) == (deadline, seq):
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    async def _dispatch_due(self, task_id: str, now: datetime) -> None:
+        """Start (or skip as misfired) a task whose deadline has passed."""
+        task = self._tasks.get(task_id)
+        if task is None or task.status != TaskStatus.PENDING or not task.next_run:
+            return
+
+        grace = self.config.misfire_grace_seconds
+        lateness = (now - task.next_run).total_seconds()
+        if grace is not None and lateness > grace:
+            task.misfire_count += 1
+            if task.schedule == "once":
+                task.status = TaskStatus.FAILED
+                task.error = f"Misfired: run was due {lateness:.0f}s ago"
+            else:
+                task.next_run = self._get_next_run(task.schedule, now)
+                self._push(task)
+            await self._save(task)
+            return
+
+        # Marked running right away so a concurrent run_now cannot double-start
+        task.status = TaskStatus.RUNNING
+        running = asyncio.create_task(self._execute_task(task))
+        self._inflight.add(running)
+        running.add_done_callback(self._inflight.discard)
+
+    def _push(self, task: ScheduledTask) -> None:
+        """(Re)schedule a pending task in the heap and wake the loop."""
+        if task.next_run is None or task.status != TaskStatus.PENDING:
+            self._heap_keys.pop(task.id, None)
+            return
+        key = (_ts(task.next_run), next(self._seq))
+        self._heap_keys[task.id] = key
+        heapq.heappush(self._heap, (*key, task.id))
+        # Rebuild when stale entries dominate the heap
+        if len(self._heap) > 2 * len(self._heap_keys) + 1024:
+            self._heap = [(*k, tid) for tid, k in self._heap_keys.items()]
+            heapq.heapify(self._heap)
+        if self._wakeup is not None and self._heap[0][2] == task.id:
+            self._wakeup.set()
+
+    def _unschedule(self, task: ScheduledTask) -> None:
+        self._heap_keys.pop(task.id, None)
+
+    async def _save(self, task: ScheduledTask) -> None:
+        """Persist a task without blocking the event loop on SQLite."""
+        if self._store is None:
+            return
+        # Serialized here, so later changes to the task cannot race the write
+        row = self._store.to_row(task)
+        async with self._store_lock:
+            await asyncio.to_thread(self._store.save_row, row)
+
+    async def _restore_tasks(self) -> None:
+        """Load persisted tasks; runs interrupted by a restart become pending."""
+        assert self._store is not None
+        for task in await asyncio.to_thread(self._store.load):
+            if task.status == TaskStatus.RUNNING:
+                task.status = TaskStatus.PENDING
+            self._tasks[task.id] = task
+            if task.status == TaskStatus.PENDING and task.paused_next_run is None:
+                self._push(task)
+
     async def _execute_task(self, task: ScheduledTask) -> None:
         """Execute a scheduled task."""
         if not self._semaphore:
             return
 
         async with self._semaphore:
-            task.status = TaskStatus.RUNNING
+            # A manual run ahead of the slot (run_now) keeps the slot
+            scheduled_for = task.next_run
             task.last_run = datetime.utcnow()
+            due = scheduled_for is not None and scheduled_for <= task.last_run
+            task.status = TaskStatus.RUNNING
+            if due:
+                self._unschedule(task)
 
             try:
                 callback = self._callbacks.get(task.callback_name)
@@ -296,10 +567,22 @@ class SchedulerCapability(BaseCapability):
                     task.status = TaskStatus.COMPLETED
                 elif task.schedule == "once":
                     task.status = TaskStatus.COMPLETED
+                elif due:
+                    # Schedule next run from the slot that just ran so cron
+                    # runs do not drift; with coalesce, missed slots collapse
+                    task.status = TaskStatus.PENDING
+                    base = scheduled_for
+                    if self.config.coalesce:
+                        base = max(base, datetime.utcnow())
+                    task.next_run = self._get_next_run(task.schedule, base)
+                    self._push(task)
                 else:
-                    # Schedule next run
                     task.status = TaskStatus.PENDING
-                    task.next_run = self._get_next_run(task.schedule)
+                    if task.next_run is None and task.paused_next_run is None:
+                        task.next_run = self._get_next_run(task.schedule)
+                    # Re-queue in case the slot came up while this run held
+                    # the task; paused tasks stay unscheduled
+                    self._push(task)
 
             except asyncio.TimeoutError:
                 task.status = TaskStatus.FAILED
@@ -308,6 +591,10 @@ class SchedulerCapability(BaseCapability):
                 task.status = TaskStatus.FAILED
                 task.error = str(e)
 
+            if task.status != TaskStatus.PENDING:
+                self._unschedule(task)
+            await self._save(task)
+
     def _get_next_run(self, schedule: str, base: datetime | None = None) -> datetime:
         """Calculate next run time from cron expression."""
         base = base or datetime.utcnow()
@@ -318,12 +605,19 @@ class SchedulerCapability(BaseCapability):
         if not CRONITER_AVAILABLE:
             raise RuntimeError("croniter required for cron scheduling: pip install croniter")
 
-        cron = croniter(schedule, base)
+        # Parsing an expression is the expensive part: reuse one iterator
+        # per expression and only move its start time
+        cron = self._cron_cache.get(schedule)
+        if cron is None or not hasattr(cron, "set_current"):
+            cron = croniter(schedule, base)
+            self._cron_cache[schedule] = cron
+        else:
+            cron.set_current(base)
         return cron.get_next(datetime)
 
     def _generate_task_id(self, name: str) -> str:
         """Generate unique task ID."""
-        unique = f"{name}-{time.time()}"
+        unique = f"{name}-{time.time()}-{next(self._seq)}"
         return hashlib.md5(unique.encode()).hexdigest()[:12]
 
     async def _schedule_task(
@@ -363,7 +657,9 @@ class SchedulerCapability(BaseCapability):
             max_runs=max_runs,
         )
 
+        await self._save(task)
         self._tasks[task_id] = task
+        self._push(task)
 
         return {
             "task_id": task_id,
@@ -414,7 +710,9 @@ class SchedulerCapability(BaseCapability):
             max_runs=1,
         )
 
+        await self._save(task)
         self._tasks[task_id] = task
+        self._push(task)
 
         return {
             "task_id": task_id,
@@ -441,6 +739,8 @@ class SchedulerCapability(BaseCapability):
             raise ValueError("Cannot cancel running task")
 
         task.status = TaskStatus.CANCELLED
+        self._unschedule(task)
+        await self._save(task)
 
         return {
             "task_id": task_id,
@@ -499,8 +799,10 @@ class SchedulerCapability(BaseCapability):
             raise ValueError(f"Cannot pause task with status: {task.status.value}")
 
         # Store original next_run and clear it
-        task.kwargs["_paused_next_run"] = task.next_run
+        task.paused_next_run = task.next_run
         task.next_run = None
+        self._unschedule(task)
+        await self._save(task)
 
         return {
             "task_id": task_id,
@@ -521,7 +823,8 @@ class SchedulerCapability(BaseCapability):
             raise ValueError(f"Task not found: {task_id}")
 
         task = self._tasks[task_id]
-        paused_next_run = task.kwargs.pop("_paused_next_run", None)
+        paused_next_run = task.paused_next_run
+        task.paused_next_run = None
 
         if paused_next_run:
             # Reschedule from now if paused time has passed
@@ -531,6 +834,8 @@ class SchedulerCapability(BaseCapability):
                 task.next_run = paused_next_run
         else:
             task.next_run = self._get_next_run(task.schedule)
+        self._push(task)
+        await self._save(task)
 
         return {
             "task_id": task_id,
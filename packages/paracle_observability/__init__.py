@@ -18,7 +18,9 @@ from paracle_observability.alerting import (
     AlertManager,
     AlertRule,
     AlertSeverity,
+    DeliveryConfig,
     NotificationChannel,
+    NotificationDispatcher,
     get_alert_manager,
 )
 from paracle_observability.error_dashboard import ErrorDashboard
@@ -94,5 +96,7 @@ __all__ = [
     "AlertSeverity",
     "AlertManager",
     "NotificationChannel",
+    "NotificationDispatcher",
+    "DeliveryConfig",
     "get_alert_manager",
 ]
@@ -5,14 +5,42 @@ Provides rule-based alerting with multiple notification channels:
 - Notification channels (Slack, Email, PagerDuty, Webhook)
 - Alert aggregation and deduplication
 - Silence rules
+- Asynchronous, batched delivery (per-channel workers, retries, digests)
 """
 
+import asyncio
+import logging
+import random
+import smtplib
+import threading
 import time
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from email.message import EmailMessage
 from enum import Enum
 from typing import Any
 
+import httpx
+
+from paracle_observability.exceptions import AlertChannelError
+
+try:
+    import aiosmtplib
+
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+    aiosmtplib = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_SEVERITY_ORDER = {
+    "info": 0,
+    "warning": 1,
+    "error": 2,
+    "critical": 3,
+}
+
 
 class AlertSeverity(str, Enum):
     """Alert severity levels."""
@@ -71,6 +99,20 @@ class Alert:
         end = self.ends_at or time.time()
         return end - self.starts_at
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a notification payload."""
+        return {
+            "rule_name": self.rule_name,
+            "severity": self.severity.value,
+            "message": self.message,
+            "state": self.state.value,
+            "labels": self.labels,
+            "annotations": self.annotations,
+            "starts_at": self.starts_at,
+            "ends_at": self.ends_at,
+            "fingerprint": self.fingerprint,
+        }
+
 
 class AlertRule:
     """Alert rule definition."""
@@ -135,8 +177,83 @@ class AlertRule:
         return None
 
 
+@dataclass
+class AlertGroup:
+    """Alerts of one rule in one state, reported together in a digest."""
+
+    rule_name: str
+    state: AlertState
+    severity: AlertSeverity
+    message: str
+    alerts: list[Alert] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        """Number of alerts in the group."""
+        return len(self.alerts)
+
+
+def group_alerts(alerts: list[Alert]) -> list[AlertGroup]:
+    """Group alerts by rule and state, most severe groups first.
+
+    Args:
+        alerts: Alerts to group
+
+    Returns:
+        Alert groups
+    """
+    groups: dict[tuple[str, AlertState], AlertGroup] = {}
+    for alert in alerts:
+        key = (alert.rule_name, alert.state)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = AlertGroup(
+                rule_name=alert.rule_name,
+                state=alert.state,
+                severity=alert.severity,
+                message=alert.message,
+            )
+        elif (
+            _SEVERITY_ORDER[alert.severity.value]
+            > _SEVERITY_ORDER[group.severity.value]
+        ):
+            group.severity = alert.severity
+        group.alerts.append(alert)
+    return sorted(groups.values(), key=lambda g: -_SEVERITY_ORDER[g.severity.value])
+
+
+def digest_summary(alerts: list[Alert]) -> str:
+    """Summarize a batch of alerts in one line.
+
+    Args:
+        alerts: Alerts in the batch
+
+    Returns:
+        Summary such as ``"5 alerts (4 firing, 1 resolved) from 2 rules"``
+    """
+    if len(alerts) == 1:
+        alert = alerts[0]
+        if alert.state == AlertState.RESOLVED:
+            return f"RESOLVED: {alert.message}"
+        return f"{alert.severity.value.upper()}: {alert.message}"
+
+    states: dict[str, int] = {}
+    for alert in alerts:
+        states[alert.state.value] = states.get(alert.state.value, 0) + 1
+    breakdown = ", ".join(f"{count} {state}" for state, count in states.items())
+    rules = len({alert.rule_name for alert in alerts})
+    return f"{len(alerts)} alerts ({breakdown}) from {rules} rules"
+
+
 class NotificationChannel:
-    """Base notification channel."""
+    """Base notification channel.
+
+    ``send`` handles a single alert synchronously. ``deliver`` sends a
+    batch of alerts as one notification from the ``NotificationDispatcher``
+    event loop; the default runs ``send`` for each alert in a worker thread
+    so blocking channels never stall other channels. Channels that talk
+    HTTP should override ``deliver`` and use the pooled client.
+    """
 
     def __init__(self, name: str, config: dict[str, Any]):
         self.name = name
@@ -146,34 +263,75 @@ class NotificationChannel:
         """Send alert notification."""
         raise NotImplementedError
 
+    async def deliver(self, alerts: list[Alert], client: httpx.AsyncClient) -> None:
+        """Deliver a batch of alerts.
 
-class SlackChannel(NotificationChannel):
-    """Slack notification channel."""
+        Args:
+            alerts: Alerts to deliver
+            client: Pooled HTTP client shared by all channels
+
+        Raises:
+            AlertChannelError: If the notification could not be sent
+        """
+        for alert in alerts:
+            if not await asyncio.to_thread(self.send, alert):
+                raise AlertChannelError(self.name, f"send failed: {alert.fingerprint}")
 
-    def send(self, alert: Alert) -> bool:
-        """Send to Slack."""
-        # Implementation would use Slack API
-        webhook_url = self.config.get("webhook_url")
-        if not webhook_url:
-            return False
 
-        payload = {
-            "text": f"🚨 {alert.severity.value.upper()}: {alert.message}",
+class SlackChannel(NotificationChannel):
+    """Slack notification channel (incoming webhook)."""
+
+    def payload(self, alerts: list[Alert]) -> dict[str, Any]:
+        """Build the Slack message for a batch of alerts."""
+        if len(alerts) == 1:
+            alert = alerts[0]
+            return {
+                "text": f"🚨 {digest_summary(alerts)}",
+                "attachments": [
+                    {
+                        "color": self._severity_color(alert.severity),
+                        "fields": [
+                            {"title": k, "value": v, "short": True}
+                            for k, v in alert.labels.items()
+                        ],
+                    }
+                ],
+            }
+
+        return {
+            "text": f"🚨 {digest_summary(alerts)}",
             "attachments": [
                 {
-                    "color": self._severity_color(alert.severity),
-                    "fields": [
-                        {"title": k, "value": v, "short": True}
-                        for k, v in alert.labels.items()
-                    ],
+                    "color": self._severity_color(group.severity),
+                    "title": (
+                        f"{group.severity.value.upper()} {group.rule_name} "
+                        f"({group.state.value}, x{group.count})"
+                    ),
+                    "text": group.message,
                 }
+                for group in group_alerts(alerts)
             ],
         }
 
-        # Would send HTTP POST to webhook_url
+    def send(self, alert: Alert) -> bool:
+        """Render a Slack message for one alert without network I/O."""
+        webhook_url = self.config.get("webhook_url")
+        if not webhook_url:
+            return False
+
+        self.payload([alert])
         print(f"[Slack] {alert.message}")
         return True
 
+    async def deliver(self, alerts: list[Alert], client: httpx.AsyncClient) -> None:
+        """Post one Slack message for the batch."""
+        webhook_url = self.config.get("webhook_url")
+        if not webhook_url:
+            raise AlertChannelError(self.name, "webhook_url not configured")
+
+        response = await client.post(webhook_url, json=self.payload(alerts))
+        response.raise_for_status()
+
     def _severity_color(self, severity: AlertSeverity) -> str:
         """Get color for severity."""
         colors = {
@@ -186,17 +344,36 @@ class SlackChannel(NotificationChannel):
 
 
 class EmailChannel(NotificationChannel):
-    """Email notification channel."""
+    """Email notification channel.
 
-    def send(self, alert: Alert) -> bool:
-        """Send email."""
+    Config keys: ``to`` (address or list), ``from``, ``smtp_host``
+    (default localhost), ``smtp_port`` (default 25), ``smtp_user``,
+    ``smtp_password``, ``smtp_use_tls`` and ``timeout``. Uses aiosmtplib
+    when installed, otherwise smtplib in a worker thread.
+    """
+
+    def message(self, alerts: list[Alert]) -> EmailMessage:
+        """Build one email for a batch of alerts."""
         to_address = self.config.get("to")
-        if not to_address:
-            return False
+        recipients = [to_address] if isinstance(to_address, str) else to_address
 
-        subject = f"[{alert.severity.value.upper()}] {alert.rule_name}"
-        body = f"""
-Alert: {alert.rule_name}
+        if len(alerts) == 1:
+            alert = alerts[0]
+            subject = f"[{alert.severity.value.upper()}] {alert.rule_name}"
+        else:
+            severity = group_alerts(alerts)[0].severity
+            subject = f"[{severity.value.upper()}] {digest_summary(alerts)}"
+
+        message = EmailMessage()
+        message["Subject"] = subject
+        message["From"] = self.config.get("from", "paracle-alerts@localhost")
+        message["To"] = ", ".join(recipients)
+        message.set_content("\n\n".join(self._body(alert) for alert in alerts))
+        return message
+
+    def _body(self, alert: Alert) -> str:
+        """Format one alert as plain text."""
+        return f"""Alert: {alert.rule_name}
 Severity: {alert.severity.value}
 Message: {alert.message}
 State: {alert.state.value}
@@ -206,48 +383,412 @@ Labels:
 {chr(10).join(f"  {k}: {v}" for k, v in alert.labels.items())}
 
 Annotations:
-{chr(10).join(f"  {k}: {v}" for k, v in alert.annotations.items())}
-        """
+{chr(10).join(f"  {k}: {v}" for k, v in alert.annotations.items())}"""
+
+    def send(self, alert: Alert) -> bool:
+        """Render an email for one alert without network I/O."""
+        to_address = self.config.get("to")
+        if not to_address:
+            return False
 
-        # Would send email via SMTP
-        print(f"[Email] To: {to_address}, Subject: {subject}")
+        message = self.message([alert])
+        print(f"[Email] To: {to_address}, Subject: {message['Subject']}")
         return True
 
+    async def deliver(self, alerts: list[Alert], client: httpx.AsyncClient) -> None:
+        """Send one email for the batch over SMTP."""
+        if not self.config.get("to"):
+            raise AlertChannelError(self.name, "recipient not configured")
+
+        message = self.message(alerts)
+        if AIOSMTPLIB_AVAILABLE:
+            await aiosmtplib.send(
+                message,
+                hostname=self.config.get("smtp_host", "localhost"),
+                port=self.config.get("smtp_port", 25),
+                start_tls=self.config.get("smtp_use_tls", False),
+                username=self.config.get("smtp_user"),
+                password=self.config.get("smtp_password"),
+                timeout=self.config.get("timeout", 10.0),
+            )
+        else:
+            await asyncio.to_thread(self._send_smtp, message)
+
+    def _send_smtp(self, message: EmailMessage) -> None:
+        """Send an email with the blocking smtplib client."""
+        with smtplib.SMTP(
+            self.config.get("smtp_host", "localhost"),
+            self.config.get("smtp_port", 25),
+            timeout=self.config.get("timeout", 10.0),
+        ) as smtp:
+            if self.config.get("smtp_use_tls", False):
+                smtp.starttls()
+            if self.config.get("smtp_user"):
+                smtp.login(self.config["smtp_user"], self.config["smtp_password"])
+            smtp.send_message(message)
+
 
 class WebhookChannel(NotificationChannel):
-    """Generic webhook notification channel."""
+    """Generic webhook notification channel.
+
+    Posts ``{"status", "count", "groups", "alerts"}``; ``status`` is
+    ``firing``, ``resolved`` or ``mixed``. Extra request headers can be set
+    with the ``headers`` config key.
+    """
+
+    def payload(self, alerts: list[Alert]) -> dict[str, Any]:
+        """Build the webhook body for a batch of alerts."""
+        states = {alert.state.value for alert in alerts}
+        return {
+            "status": states.pop() if len(states) == 1 else "mixed",
+            "count": len(alerts),
+            "groups": [
+                {
+                    "rule_name": group.rule_name,
+                    "state": group.state.value,
+                    "severity": group.severity.value,
+                    "message": group.message,
+                    "count": group.count,
+                }
+                for group in group_alerts(alerts)
+            ],
+            "alerts": [alert.to_dict() for alert in alerts],
+        }
 
     def send(self, alert: Alert) -> bool:
-        """Send to webhook."""
+        """Render the webhook body for one alert without network I/O."""
         url = self.config.get("url")
         if not url:
             return False
 
-        payload = {
-            "rule_name": alert.rule_name,
-            "severity": alert.severity.value,
-            "message": alert.message,
-            "state": alert.state.value,
-            "labels": alert.labels,
-            "annotations": alert.annotations,
-            "starts_at": alert.starts_at,
-            "ends_at": alert.ends_at,
-        }
-
-        # Would send HTTP POST
+        self.payload([alert])
         print(f"[Webhook] {url}: {alert.message}")
         return True
 
+    async def deliver(self, alerts: list[Alert], client: httpx.AsyncClient) -> None:
+        """Post one webhook request for the batch."""
+        url = self.config.get("url")
+        if not url:
+            raise AlertChannelError(self.name, "url not configured")
+
+        response = await client.post(
+            url, json=self.payload(alerts), headers=self.config.get("headers")
+        )
+        response.raise_for_status()
+
+
+@dataclass
+class DeliveryConfig:
+    """Notification delivery settings, applied to every channel worker.
+
+    Attributes:
+        group_wait: Seconds to collect alerts before sending a batch
+        min_interval: Minimum seconds between two messages on a channel;
+            alerts arriving meanwhile are sent together as one digest
+        max_batch_size: Maximum alerts per message
+        queue_size: Maximum undelivered alerts per channel (extra are dropped)
+        max_retries: Retries after a failed delivery
+        retry_backoff: First retry delay in seconds (doubles per attempt)
+        max_backoff: Maximum retry delay in seconds
+        timeout: Seconds allowed per delivery attempt
+        max_connections: HTTP connection pool size
+    """
+
+    group_wait: float = 1.0
+    min_interval: float = 10.0
+    max_batch_size: int = 100
+    queue_size: int = 1000
+    max_retries: int = 3
+    retry_backoff: float = 1.0
+    max_backoff: float = 30.0
+    timeout: float = 10.0
+    max_connections: int = 20
+
+
+@dataclass
+class DeliveryStats:
+    """Delivery metrics of one channel."""
+
+    queued: int = 0
+    dropped: int = 0
+    messages_sent: int = 0
+    alerts_sent: int = 0
+    messages_failed: int = 0
+    alerts_failed: int = 0
+    retries: int = 0
+    total_latency_ms: float = 0.0
+    last_error: str | None = None
+
+    @property
+    def avg_latency_ms(self) -> float:
+        """Average latency from enqueue to successful delivery."""
+        if not self.alerts_sent:
+            return 0.0
+        return self.total_latency_ms / self.alerts_sent
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {**asdict(self), "avg_latency_ms": self.avg_latency_ms}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Client errors (except timeouts and rate limits) will not succeed later."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status in (408, 429)
+    return True
+
+
+class NotificationDispatcher:
+    """Delivers notifications off the caller's thread.
+
+    A background thread runs an event loop with one worker per channel.
+    ``submit`` only enqueues, so rule evaluation never waits on network
+    I/O and a slow or unreachable endpoint only delays its own channel.
+    Each worker waits ``group_wait`` (and at least ``min_interval`` since
+    its previous message) to batch alerts into one digest, then delivers
+    it with exponential backoff retries. HTTP channels share one pooled
+    ``httpx.AsyncClient``. Delivery is at least once: a retried batch is
+    sent again in full.
+
+    Example:
+        >>> dispatcher = NotificationDispatcher(DeliveryConfig(group_wait=0.5))
+        >>> dispatcher.submit(channel, alert)
+        >>> dispatcher.flush(timeout=5.0)
+        >>> dispatcher.stats()[channel.name]["messages_sent"]
+    """
+
+    def __init__(self, config: DeliveryConfig | None = None):
+        """Initialize the dispatcher (the thread starts on first submit).
+
+        Args:
+            config: Delivery settings
+        """
+        self.config = config or DeliveryConfig()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._channels: dict[str, NotificationChannel] = {}
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._stats: dict[str, DeliveryStats] = {}
+        self._pending: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        """Start the delivery thread (caller holds the lock)."""
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=loop.run_forever, name="paracle-alert-delivery", daemon=True
+            )
+            self._thread.start()
+            self._loop = loop
+        return self._loop
+
+    def submit(self, channel: NotificationChannel, alert: Alert) -> bool:
+        """Queue an alert for delivery on a channel without blocking.
+
+        Args:
+            channel: Target channel
+            alert: Alert to deliver
+
+        Returns:
+            False if the channel queue is full and the alert was dropped
+        """
+        with self._lock:
+            stats = self._stats.setdefault(channel.name, DeliveryStats())
+            pending = self._pending.get(channel.name, 0)
+            if pending >= self.config.queue_size:
+                stats.dropped += 1
+                return False
+            self._pending[channel.name] = pending + 1
+            stats.queued += 1
+            loop = self._start()
+        loop.call_soon_threadsafe(self._enqueue, channel, alert, time.monotonic())
+        return True
+
+    def _enqueue(
+        self, channel: NotificationChannel, alert: Alert, queued_at: float
+    ) -> None:
+        """Put an alert on the channel queue (runs in the delivery loop)."""
+        self._channels[channel.name] = channel
+        queue = self._queues.get(channel.name)
+        if queue is None:
+            queue = self._queues[channel.name] = asyncio.Queue()
+            self._workers[channel.name] = asyncio.ensure_future(
+                self._worker(channel.name, queue)
+            )
+        queue.put_nowait((alert, queued_at))
+
+    async def _worker(self, name: str, queue: asyncio.Queue) -> None:
+        """Batch and deliver alerts for one channel."""
+        loop = asyncio.get_running_loop()
+        config = self.config
+        last_sent = float("-inf")
+
+        while True:
+            batch = [await queue.get()]
+            send_at = max(
+                loop.time() + config.group_wait, last_sent + config.min_interval
+            )
+            while len(batch) < config.max_batch_size:
+                remaining = send_at - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await asyncio.sleep(max(0.0, last_sent + config.min_interval - loop.time()))
+
+            try:
+                await self._deliver(self._channels[name], batch)
+            finally:
+                last_sent = loop.time()
+                self._done(name, len(batch))
+
+    async def _deliver(
+        self, channel: NotificationChannel, batch: list[tuple[Alert, float]]
+    ) -> bool:
+        """Deliver one batch with retries and record metrics."""
+        config = self.config
+        alerts = [alert for alert, _ in batch]
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=config.timeout,
+                limits=httpx.Limits(max_connections=config.max_connections),
+            )
+
+        for attempt in range(config.max_retries + 1):
+            try:
+                await asyncio.wait_for(
+                    channel.deliver(alerts, self._client), config.timeout
+                )
+            except Exception as e:
+                with self._lock:
+                    stats = self._stats[channel.name]
+                    stats.last_error = f"{type(e).__name__}: {e}"
+                    if attempt == config.max_retries or not _is_retryable(e):
+                        stats.messages_failed += 1
+                        stats.alerts_failed += len(alerts)
+                        break
+                    stats.retries += 1
+                delay = min(config.max_backoff, config.retry_backoff * 2**attempt)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            else:
+                now = time.monotonic()
+                with self._lock:
+                    stats = self._stats[channel.name]
+                    stats.messages_sent += 1
+                    stats.alerts_sent += len(alerts)
+                    stats.total_latency_ms += sum(
+                        (now - queued_at) * 1000 for _, queued_at in batch
+                    )
+                return True
+
+        logger.warning(
+            "Failed to deliver %d alert(s) to %s: %s",
+            len(alerts),
+            channel.name,
+            self._stats[channel.name].last_error,
+        )
+        return False
+
+    def _done(self, name: str, count: int) -> None:
+        """Mark alerts as handled and wake up ``flush`` waiters."""
+        with self._idle:
+            self._pending[name] -= count
+            self._idle.notify_all()
+
+    def pending(self) -> int:
+        """Number of alerts queued or being delivered."""
+        with self._lock:
+            return sum(self._pending.values())
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued alert was delivered or given up on.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if nothing is pending
+        """
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: not any(self._pending.values()), timeout=timeout
+            )
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get delivery metrics per channel.
+
+        Returns:
+            Dictionary of channel name to metrics
+        """
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Flush pending alerts, then stop the delivery thread.
+
+        Args:
+            timeout: Maximum seconds to wait for pending alerts
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        self.flush(timeout)
+        asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+        with self._idle:
+            # Alerts still queued after the timeout are abandoned
+            self._pending.clear()
+            self._idle.notify_all()
+
+    async def _shutdown(self) -> None:
+        """Cancel workers and close the HTTP client."""
+        for task in self._workers.values():
+            task.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._workers.clear()
+        self._queues.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
 
 class AlertManager:
-    """Manages alerts and notifications."""
+    """Manages alerts and notifications.
 
-    def __init__(self):
+    Notifications are queued on a ``NotificationDispatcher`` and delivered
+    in the background, so ``evaluate_rules`` never waits on channels.
+    """
+
+    def __init__(
+        self,
+        delivery: DeliveryConfig | None = None,
+        dispatcher: NotificationDispatcher | None = None,
+    ):
+        """Initialize the alert manager.
+
+        Args:
+            delivery: Delivery settings for the default dispatcher
+            dispatcher: Dispatcher to deliver notifications with
+        """
         self._rules: dict[str, AlertRule] = {}
         self._channels: dict[str, NotificationChannel] = {}
         self._active_alerts: dict[str, Alert] = {}
         self._alert_history: list[Alert] = []
         self._silences: dict[str, float] = {}  # fingerprint -> until timestamp
+        self._dispatcher = dispatcher or NotificationDispatcher(delivery)
 
     def add_rule(self, rule: AlertRule):
         """Add alert rule."""
@@ -319,15 +860,31 @@ class AlertManager:
             self._notify(alert)
 
     def _notify(self, alert: Alert):
-        """Send notifications for alert."""
+        """Queue notifications for alert (never blocks on delivery)."""
         if alert.state == AlertState.SILENCED:
             return
 
         for channel in self._channels.values():
-            try:
-                channel.send(alert)
-            except Exception as e:
-                print(f"[AlertManager] Failed to send to {channel.name}: {e}")
+            self._dispatcher.submit(channel, alert)
+
+    def flush_notifications(self, timeout: float | None = None) -> bool:
+        """Wait for queued notifications to be delivered.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if no notification is pending
+        """
+        return self._dispatcher.flush(timeout)
+
+    def get_delivery_stats(self) -> dict[str, dict[str, Any]]:
+        """Get notification delivery metrics per channel."""
+        return self._dispatcher.stats()
+
+    def close(self, timeout: float | None = 5.0):
+        """Flush notifications and stop the delivery worker."""
+        self._dispatcher.close(timeout)
 
     def get_active_alerts(self, severity: AlertSeverity | None = None) -> list[Alert]:
         """Get active alerts."""
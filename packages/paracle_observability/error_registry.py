@@ -27,9 +27,10 @@ Example:
 """
 
 import json
+import threading
 import time
 import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -90,32 +91,108 @@ class ErrorRecord:
         return asdict(self)
 
 
+class SlidingWindowCounter:
+    """Per-key occurrence counts over a sliding time window.
+
+    Occurrences are counted in one-second buckets; buckets leaving the
+    window are subtracted from running totals, so adding and reading are
+    O(1) amortized regardless of the number of occurrences.
+    """
+
+    def __init__(self, window_seconds: int = 60):
+        """Initialize counter.
+
+        Args:
+            window_seconds: Window length in seconds
+        """
+        self.window_seconds = window_seconds
+        self._buckets: deque[tuple[int, dict[str, int]]] = deque()
+        self._totals: dict[str, int] = defaultdict(int)
+
+    def add(self, key: str, now: float) -> None:
+        """Count one occurrence of ``key`` at time ``now``."""
+        second = int(now)
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append((second, defaultdict(int)))
+        self._buckets[-1][1][key] += 1
+        self._totals[key] += 1
+        self._expire(second)
+
+    def _expire(self, second: int) -> None:
+        cutoff = second - self.window_seconds
+        while self._buckets and self._buckets[0][0] <= cutoff:
+            _, counts = self._buckets.popleft()
+            for key, count in counts.items():
+                remaining = self._totals[key] - count
+                if remaining:
+                    self._totals[key] = remaining
+                else:
+                    del self._totals[key]
+
+    def counts(self, now: float) -> dict[str, int]:
+        """Get counts of all keys seen within the window ending at ``now``."""
+        self._expire(int(now))
+        return dict(self._totals)
+
+    def clear(self) -> None:
+        """Reset all counts."""
+        self._buckets.clear()
+        self._totals.clear()
+
+
 class ErrorRegistry:
     """Centralized error tracking and analytics.
 
     Tracks errors across components, provides frequency analysis,
     pattern detection, and correlation.
 
+    Recording is O(1): records live in a ring buffer, per-component
+    history is bounded, and the pattern detectors read one-minute sliding
+    window counters. Patterns are re-evaluated at most once per
+    ``pattern_interval`` while recording, and on read when new errors
+    arrived since the last evaluation.
+
     Attributes:
-        errors: List of error records
+        errors: Ring buffer of error records (oldest first)
         error_counts: Error counts by type
-        component_errors: Errors by component
+        component_errors: Most recent errors by component
         error_patterns: Detected error patterns
         max_errors: Maximum errors to store
     """
 
-    def __init__(self, max_errors: int = 10000):
+    # Occurrences within a minute that make a pattern
+    HIGH_FREQUENCY_THRESHOLD = 10
+    CASCADING_THRESHOLD = 5
+
+    def __init__(
+        self,
+        max_errors: int = 10000,
+        max_errors_per_component: int = 1000,
+        pattern_interval: float = 1.0,
+    ):
         """Initialize error registry.
 
         Args:
             max_errors: Maximum errors to store (default: 10000)
+            max_errors_per_component: Maximum errors kept per component
+            pattern_interval: Minimum seconds between pattern evaluations
+                while recording
         """
         self.max_errors = max_errors
-        self.errors: list[ErrorRecord] = []
+        self.max_errors_per_component = max_errors_per_component
+        self.pattern_interval = pattern_interval
+        self.errors: deque[ErrorRecord] = deque(maxlen=max_errors)
         self.error_counts: dict[str, int] = defaultdict(int)
-        self.component_errors: dict[str, list[ErrorRecord]] = defaultdict(list)
+        self.component_errors: dict[str, deque[ErrorRecord]] = defaultdict(
+            lambda: deque(maxlen=self.max_errors_per_component)
+        )
         self.error_patterns: list[dict[str, Any]] = []
         self._error_index: dict[str, ErrorRecord] = {}  # For deduplication
+        self._type_window = SlidingWindowCounter(60)
+        self._component_window = SlidingWindowCounter(60)
+        self._patterns_evaluated_at = 0.0
+        self._patterns_dirty = False
+        self._lock = threading.RLock()
         self._start_time = time.time()
 
     def _generate_error_id(self, error: Exception, component: str) -> str:
@@ -188,19 +265,52 @@ class ErrorRegistry:
         """
         error_id = self._generate_error_id(error, component)
         timestamp = time.time()
+        error_type = type(error).__name__
 
-        # Check for duplicate (deduplicate similar errors)
-        if error_id in self._error_index:
-            existing = self._error_index[error_id]
-            existing.count += 1
-            existing.last_seen = timestamp
-            return existing
+        with self._lock:
+            # Every occurrence counts towards patterns, duplicates included
+            self._type_window.add(error_type, timestamp)
+            self._component_window.add(component, timestamp)
+            self._patterns_dirty = True
+
+            # Check for duplicate (deduplicate similar errors)
+            record = self._error_index.get(error_id)
+            if record is not None:
+                record.count += 1
+                record.last_seen = timestamp
+            else:
+                record = self._store(
+                    error,
+                    error_id,
+                    error_type,
+                    component,
+                    timestamp,
+                    severity,
+                    context,
+                    include_traceback,
+                )
 
-        # Create new record
+            if timestamp - self._patterns_evaluated_at >= self.pattern_interval:
+                self._detect_patterns(timestamp)
+
+        return record
+
+    def _store(
+        self,
+        error: Exception,
+        error_id: str,
+        error_type: str,
+        component: str,
+        timestamp: float,
+        severity: ErrorSeverity | None,
+        context: dict[str, Any] | None,
+        include_traceback: bool,
+    ) -> ErrorRecord:
+        """Create and store a new record, evicting the oldest when full."""
         error_record = ErrorRecord(
             id=error_id,
             timestamp=timestamp,
-            error_type=type(error).__name__,
+            error_type=error_type,
             error_code=self._extract_error_code(error),
             message=str(error),
             component=component,
@@ -213,65 +323,57 @@ class ErrorRegistry:
             ),
         )
 
-        # Store record
+        # Store record (the ring buffer drops the oldest record when full)
+        if len(self.errors) == self.errors.maxlen:
+            removed = self.errors[0]
+            if self._error_index.get(removed.id) is removed:
+                del self._error_index[removed.id]
         self.errors.append(error_record)
         self._error_index[error_id] = error_record
-        self.error_counts[error_record.error_type] += 1
+        self.error_counts[error_type] += 1
         self.component_errors[component].append(error_record)
 
-        # Trim if needed
-        if len(self.errors) > self.max_errors:
-            removed = self.errors.pop(0)
-            del self._error_index[removed.id]
-
-        # Detect patterns
-        self._detect_patterns()
-
         return error_record
 
-    def _detect_patterns(self):
-        """Detect error patterns (high frequency, cascading errors)."""
-        # Pattern: High frequency errors (> 10 in last minute)
-        one_minute_ago = time.time() - 60
-        recent_errors = [e for e in self.errors if e.timestamp >= one_minute_ago]
-
-        error_type_counts = defaultdict(int)
-        for error in recent_errors:
-            error_type_counts[error.error_type] += 1
+    def _detect_patterns(self, now: float | None = None):
+        """Detect error patterns (high frequency, cascading errors).
 
-        # Clear old patterns
-        self.error_patterns = []
+        Reads the sliding window counters, so the cost depends on the
+        number of error types and components, not on the number of errors.
+        """
+        now = now if now is not None else time.time()
+        patterns = []
 
-        # High frequency pattern
-        for error_type, count in error_type_counts.items():
-            if count >= 10:
-                self.error_patterns.append(
+        # High frequency pattern (many errors of one type in last minute)
+        for error_type, count in self._type_window.counts(now).items():
+            if count >= self.HIGH_FREQUENCY_THRESHOLD:
+                patterns.append(
                     {
                         "pattern_type": "high_frequency",
                         "error_type": error_type,
                         "count": count,
                         "time_window": "1_minute",
-                        "detected_at": time.time(),
+                        "detected_at": now,
                     }
                 )
 
         # Cascading errors pattern (multiple errors in same component)
-        component_counts = defaultdict(int)
-        for error in recent_errors:
-            component_counts[error.component] += 1
-
-        for component, count in component_counts.items():
-            if count >= 5:
-                self.error_patterns.append(
+        for component, count in self._component_window.counts(now).items():
+            if count >= self.CASCADING_THRESHOLD:
+                patterns.append(
                     {
                         "pattern_type": "cascading",
                         "component": component,
                         "count": count,
                         "time_window": "1_minute",
-                        "detected_at": time.time(),
+                        "detected_at": now,
                     }
                 )
 
+        self.error_patterns = patterns
+        self._patterns_evaluated_at = now
+        self._patterns_dirty = False
+
     def get_errors(
         self,
         limit: int | None = None,
@@ -290,7 +392,8 @@ class ErrorRegistry:
         Returns:
             List of error records
         """
-        results = self.errors
+        with self._lock:
+            results = list(self.errors)
 
         # Filter by timestamp
         if since:
@@ -322,11 +425,9 @@ class ErrorRegistry:
         Returns:
             List of error records
         """
-        return sorted(
-            self.component_errors[component],
-            key=lambda e: e.timestamp,
-            reverse=True,
-        )
+        with self._lock:
+            errors = list(self.component_errors.get(component, ()))
+        return sorted(errors, key=lambda e: e.timestamp, reverse=True)
 
     def get_errors_by_type(self, error_type: str) -> list[ErrorRecord]:
         """Get all errors of a specific type.
@@ -337,7 +438,8 @@ class ErrorRegistry:
         Returns:
             List of error records
         """
-        return [e for e in self.errors if e.error_type == error_type]
+        with self._lock:
+            return [e for e in self.errors if e.error_type == error_type]
 
     def get_error_count(
         self,
@@ -361,36 +463,39 @@ class ErrorRegistry:
         Returns:
             Statistics dictionary
         """
-        uptime = time.time() - self._start_time
+        # Snapshot under the lock: recording mutates these concurrently
+        with self._lock:
+            errors = list(self.errors)
+            error_counts = list(self.error_counts.items())
+            component_counts = {
+                comp: len(records) for comp, records in self.component_errors.items()
+            }
+            unique_errors = len(self._error_index)
+            uptime = time.time() - self._start_time
 
         # Recent errors (last hour)
         one_hour_ago = time.time() - 3600
-        recent_errors = [e for e in self.errors if e.timestamp >= one_hour_ago]
+        recent_errors = [e for e in errors if e.timestamp >= one_hour_ago]
 
         # Error rate (per minute)
         error_rate = (len(recent_errors) / 60) if uptime >= 60 else 0
 
         # Top error types
-        top_errors = sorted(
-            self.error_counts.items(), key=lambda x: x[1], reverse=True
-        )[:5]
+        top_errors = sorted(error_counts, key=lambda x: x[1], reverse=True)[:5]
 
         # Top components
-        component_counts = {
-            comp: len(errors) for comp, errors in self.component_errors.items()
-        }
         top_components = sorted(
             component_counts.items(), key=lambda x: x[1], reverse=True
         )[:5]
 
         # Severity breakdown
         severity_counts = defaultdict(int)
-        for error in self.errors:
+        for error in errors:
             severity_counts[error.severity.value] += 1
 
         return {
-            "total_count": len(self.errors),
-            "unique_errors": len(self._error_index),
+            "total_count": len(errors),
+            "unique_errors": unique_errors,
             "uptime_seconds": uptime,
             "error_rate_per_minute": error_rate,
             "recent_errors_1h": len(recent_errors),
@@ -399,7 +504,7 @@ class ErrorRegistry:
                 {"component": c, "count": cnt} for c, cnt in top_components
             ],
             "severity_breakdown": dict(severity_counts),
-            "patterns_detected": len(self.error_patterns),
+            "patterns_detected": len(self.get_patterns()),
         }
 
     def get_patterns(self) -> list[dict[str, Any]]:
@@ -408,7 +513,13 @@ class ErrorRegistry:
         Returns:
             List of pattern dictionaries
         """
-        return self.error_patterns
+        with self._lock:
+            if self._patterns_dirty or (
+                self.error_patterns
+                and time.time() - self._patterns_evaluated_at >= self.pattern_interval
+            ):
+                self._detect_patterns()
+            return self.error_patterns
 
     def search_errors(
         self,
@@ -429,8 +540,11 @@ class ErrorRegistry:
         if not case_sensitive:
             query = query.lower()
 
+        with self._lock:
+            errors = list(self.errors)
+
         results = []
-        for error in self.errors:
+        for error in errors:
             value = getattr(error, field, "")
             if not case_sensitive:
                 value = value.lower()
@@ -466,14 +580,24 @@ class ErrorRegistry:
 
         raise ValueError(f"Unsupported format: {format}")
 
-    def clear(self):
-        """Clear all error records."""
-        self.errors.clear()
-        self.error_counts.clear()
-        self.component_errors.clear()
-        self.error_patterns.clear()
-        self._error_index.clear()
-        self._start_time = time.time()
+    def clear(self) -> int:
+        """Clear all error records.
+
+        Returns:
+            Number of records cleared
+        """
+        with self._lock:
+            count = len(self.errors)
+            self.errors.clear()
+            self.error_counts.clear()
+            self.component_errors.clear()
+            self.error_patterns = []
+            self._error_index.clear()
+            self._type_window.clear()
+            self._component_window.clear()
+            self._patterns_dirty = False
+            self._start_time = time.time()
+        return count
 
 
 # Global error registry instance
@@ -21,6 +21,11 @@ from paracle_orchestration.approval import (
     ApprovalTimeoutError,
     UnauthorizedApproverError,
 )
+from paracle_orchestration.approval_store import (
+    ApprovalStore,
+    InMemoryApprovalStore,
+    SQLiteApprovalStore,
+)
 from paracle_orchestration.context import ExecutionContext, ExecutionStatus
 from paracle_orchestration.coordinator import AgentCoordinator
 from paracle_orchestration.dry_run import (
@@ -86,6 +91,9 @@ __all__ = [
     "ApprovalAlreadyDecidedError",
     "ApprovalTimeoutError",
     "UnauthorizedApproverError",
+    "ApprovalStore",
+    "InMemoryApprovalStore",
+    "SQLiteApprovalStore",
     # Retry
     "RetryManager",
     "RetryError",
@@ -10,8 +10,11 @@ from pathlib import Path
 from typing import Any
 
 from paracle_core.governance import log_agent_action
+from paracle_core.parac.registry import get_registry, resolve_parac_root
 from paracle_domain.models import WorkflowStep
+from paracle_providers.middleware import ProviderMiddleware, SingleFlight
 from paracle_providers.registry import ProviderRegistry
+from paracle_runs.exceptions import ReplayError
 from rich.console import Console
 
 console = Console()
@@ -24,8 +27,10 @@ class AgentExecutor:
     This executor:
     - Loads agent specs from .parac/agents/specs/
     - Resolves agent configuration and prompts
-    - Calls LLM providers with appropriate parameters
-    - Tracks token usage and costs
+    - Calls LLM providers with appropriate parameters, marking stable
+      prompt prefixes for provider caching and merging identical
+      concurrent requests into one upstream call
+    - Tracks token usage and costs (including prompt cache savings)
     - Handles errors gracefully with fallbacks
 
     Example:
@@ -50,8 +55,10 @@ class AgentExecutor:
         """
         self.parac_root = parac_root or self._find_parac_root()
         self.provider_registry = provider_registry or ProviderRegistry()
-        self.agent_specs_cache: dict[str, dict[str, Any]] = {}
+        self.artifacts = get_registry(self.parac_root)
         self._cost_tracker = cost_tracker
+        # Merges identical concurrent temperature-0 requests across steps
+        self._single_flight = SingleFlight()
         self._init_cost_tracker()
 
     def _init_cost_tracker(self) -> None:
@@ -74,6 +81,8 @@ class AgentExecutor:
         agent_id: str | None = None,
         workflow_id: str | None = None,
         execution_id: str | None = None,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> dict[str, Any]:
         """Calculate and track cost for a step.
 
@@ -86,6 +95,8 @@ class AgentExecutor:
             agent_id: Optional agent ID
             workflow_id: Optional workflow ID
             execution_id: Optional execution ID
+            cached_tokens: Prompt tokens served from the provider's cache
+            cache_write_tokens: Prompt tokens written to the provider's cache
 
         Returns:
             Cost information dictionary
@@ -96,6 +107,7 @@ class AgentExecutor:
                 "prompt_tokens": prompt_tokens,
                 "completion_tokens": completion_tokens,
                 "total_tokens": prompt_tokens + completion_tokens,
+                "cached_tokens": cached_tokens,
                 "prompt_cost": 0.0,
                 "completion_cost": 0.0,
                 "total_cost": 0.0,
@@ -105,7 +117,12 @@ class AgentExecutor:
 
         # Calculate costs
         prompt_cost, completion_cost, total_cost = self._cost_tracker.calculate_cost(
-            provider, model, prompt_tokens, completion_tokens
+            provider,
+            model,
+            prompt_tokens,
+            completion_tokens,
+            cached_tokens,
+            cache_write_tokens,
         )
 
         # Track usage
@@ -118,12 +135,15 @@ class AgentExecutor:
             agent_id=agent_id,
             workflow_id=workflow_id,
             execution_id=execution_id,
+            cached_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens,
         )
 
         return {
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
             "total_tokens": prompt_tokens + completion_tokens,
+            "cached_tokens": cached_tokens,
             "prompt_cost": prompt_cost,
             "completion_cost": completion_cost,
             "total_cost": total_cost,
@@ -140,11 +160,9 @@ class AgentExecutor:
         Raises:
             FileNotFoundError: If .parac/ not found
         """
-        current = Path.cwd()
-        for parent in [current, *current.parents]:
-            parac_dir = parent / ".parac"
-            if parac_dir.is_dir():
-                return parac_dir
+        parac_dir = resolve_parac_root()
+        if parac_dir is not None:
+            return parac_dir
 
         raise FileNotFoundError(
             ".parac/ directory not found in current or parent directories"
@@ -162,14 +180,9 @@ class AgentExecutor:
         Raises:
             FileNotFoundError: If agent spec not found
         """
-        # Check cache first
-        if agent_name in self.agent_specs_cache:
-            return self.agent_specs_cache[agent_name]
+        agent = self.artifacts.get_agent(agent_name)
 
-        # Try to load from file
-        spec_file = self.parac_root / "agents" / "specs" / f"{agent_name}.md"
-
-        if not spec_file.exists():
+        if agent is None:
             # Fallback: return minimal spec
             console.print(
                 f"[yellow]Warning: Agent spec not found for '{agent_name}', "
@@ -182,18 +195,15 @@ class AgentExecutor:
                 "model": "gpt-4",
             }
 
-        # Parse agent spec from markdown
-        # For now, return basic structure - full parsing would read frontmatter
-        spec = {
+        return {
             "name": agent_name,
-            "role": f"{agent_name} agent",
+            "role": agent.role,
             "provider": "openai",  # Default
             "model": "gpt-4",  # Default
+            "tools": agent.tools,
+            "skills": agent.skills,
         }
 
-        self.agent_specs_cache[agent_name] = spec
-        return spec
-
     def _build_prompt(
         self,
         step: WorkflowStep,
@@ -280,7 +290,10 @@ class AgentExecutor:
 
             # Try to get provider
             try:
-                provider = self.provider_registry.create_provider(provider_name)
+                provider = ProviderMiddleware(
+                    self.provider_registry.create_provider(provider_name),
+                    single_flight=self._single_flight,
+                )
 
                 # Execute with LLM
                 from paracle_providers.base import ChatMessage, LLMConfig
@@ -320,6 +333,8 @@ class AgentExecutor:
                     response.usage.completion_tokens,
                     step.id,
                     step.agent,
+                    cached_tokens=response.usage.cached_tokens,
+                    cache_write_tokens=response.usage.cache_write_tokens,
                 )
 
                 console.print("[green]  ✓ Completed[/green]")
@@ -341,6 +356,10 @@ class AgentExecutor:
                     "cost": cost_info,
                 }
 
+            except ReplayError:
+                # A replay must not silently turn into a mock execution
+                raise
+
             except Exception as provider_error:
                 # Fallback to mock execution if provider fails
                 console.print(
@@ -15,11 +15,18 @@ Usage:
     ... )
     >>> # Later, human approves
     >>> await manager.approve(request.id, approver="user@example.com")
+
+Waiting steps park on a future each and all expirations share a single
+timer task driven by a deadline heap, so thousands of paused executions
+cost almost nothing while idle. With a persistent ``SQLiteApprovalStore``,
+pending requests survive a restart and are picked up by ``rehydrate()``;
+its I/O runs in worker threads so it never blocks the event loop.
 """
 
 from __future__ import annotations
 
 import asyncio
+import heapq
 from typing import TYPE_CHECKING, Any
 
 from paracle_core.compat import UTC, datetime, timedelta
@@ -30,6 +37,8 @@ from paracle_domain.models import (
     ApprovalStatus,
 )
 
+from paracle_orchestration.approval_store import ApprovalStore, InMemoryApprovalStore
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -102,7 +111,7 @@ class ApprovalManager:
     - Supports webhook notifications (future)
 
     Approval requests are stored in-memory by default.
-    For persistence, inject a repository.
+    For persistence, inject a ``SQLiteApprovalStore``.
 
     Example:
         >>> manager = ApprovalManager(event_bus)
@@ -133,6 +142,7 @@ class ApprovalManager:
         on_approval_decided: Callable[[ApprovalRequest], None] | None = None,
         auto_approve: bool = False,
         auto_approver: str = "system:auto",
+        store: ApprovalStore | None = None,
     ) -> None:
         """Initialize the approval manager.
 
@@ -142,19 +152,33 @@ class ApprovalManager:
             on_approval_decided: Callback when approval is decided.
             auto_approve: If True, automatically approve all requests (YOLO mode).
             auto_approver: Approver name for auto-approvals.
+            store: Approval storage (in-memory if None).
         """
         self._event_bus = event_bus
         self._on_approval_created = on_approval_created
         self._on_approval_decided = on_approval_decided
         self.auto_approve = auto_approve
         self.auto_approver = auto_approver
+        self.store = store or InMemoryApprovalStore()
+
+        # Futures of coroutines waiting on a decision, with their timeout
+        self._waiters: dict[str, list[tuple[asyncio.Future, float]]] = {}
 
-        # In-memory storage (can be replaced with repository)
-        self._pending_approvals: dict[str, ApprovalRequest] = {}
-        self._decided_approvals: dict[str, ApprovalRequest] = {}
+        # Expiration heap of (deadline, approval_id); _deadlines holds the
+        # current deadline of each pending request so stale entries are skipped
+        self._expirations: list[tuple[datetime, str]] = []
+        self._deadlines: dict[str, datetime] = {}
+        self._timer_task: asyncio.Task | None = None
+        self._timer_wakeup: asyncio.Event | None = None
 
-        # Condition variables for waiting on decisions
-        self._decision_events: dict[str, asyncio.Event] = {}
+        # Serializes read-check-save of decisions now that store I/O awaits
+        self._decision_lock = asyncio.Lock()
+
+    async def _io(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call a store method, in a thread if the store blocks on I/O."""
+        if self.store.blocking_io:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
 
     async def create_request(
         self,
@@ -203,11 +227,9 @@ class ApprovalManager:
             metadata=metadata or {},
         )
 
-        # Store in pending
-        self._pending_approvals[request.id] = request
-
-        # Create decision event for waiting
-        self._decision_events[request.id] = asyncio.Event()
+        # Store in pending and schedule expiration
+        await self._io(self.store.save, request)
+        self._schedule_expiration(request.id, expires_at)
 
         # Emit event
         await self._emit_event("approval.created", request)
@@ -243,29 +265,30 @@ class ApprovalManager:
             ApprovalAlreadyDecidedError: If already decided.
             UnauthorizedApproverError: If approver not authorized.
         """
-        request = self._get_pending_or_raise(approval_id)
+        async with self._decision_lock:
+            request = await self._get_pending_or_raise(approval_id)
 
-        # Check authorization
-        self._check_authorization(request, approver)
+            # Check authorization
+            self._check_authorization(request, approver)
 
-        # Check if reason required
-        if request.config.reason_required and not reason:
-            raise ApprovalError(
-                "Reason required for this approval",
-                code="REASON_REQUIRED",
-            )
+            # Check if reason required
+            if request.config.reason_required and not reason:
+                raise ApprovalError(
+                    "Reason required for this approval",
+                    code="REASON_REQUIRED",
+                )
 
-        # Approve
-        request.approve(approver, reason)
+            # Approve
+            request.approve(approver, reason)
 
-        # Move to decided
-        self._move_to_decided(request)
+            # Move to decided
+            await self._move_to_decided(request)
 
         # Emit event
         await self._emit_event("approval.approved", request)
 
         # Signal waiting coroutines
-        self._signal_decision(request.id)
+        self._signal_decision(request)
 
         # Call callback
         if self._on_approval_decided:
@@ -279,20 +302,25 @@ class ApprovalManager:
         Args:
             request: Approval request to auto-approve.
         """
-        # Approve the request
-        request.approve(
-            approver=self.auto_approver,
-            reason="Auto-approved: YOLO mode enabled",
-        )
+        async with self._decision_lock:
+            current = await self._io(self.store.get, request.id)
+            if current is None or not current.is_pending:
+                return  # Decided while the request was being created
+
+            # Approve the request
+            request.approve(
+                approver=self.auto_approver,
+                reason="Auto-approved: YOLO mode enabled",
+            )
 
-        # Move to decided
-        self._move_to_decided(request)
+            # Move to decided
+            await self._move_to_decided(request)
 
         # Emit special event for audit trail
         await self._emit_event("approval.auto_approved", request)
 
         # Signal waiting coroutines
-        self._signal_decision(request.id)
+        self._signal_decision(request)
 
         # Call callback
         if self._on_approval_decided:
@@ -319,29 +347,30 @@ class ApprovalManager:
             ApprovalAlreadyDecidedError: If already decided.
             UnauthorizedApproverError: If approver not authorized.
         """
-        request = self._get_pending_or_raise(approval_id)
+        async with self._decision_lock:
+            request = await self._get_pending_or_raise(approval_id)
 
-        # Check authorization
-        self._check_authorization(request, approver)
+            # Check authorization
+            self._check_authorization(request, approver)
 
-        # Check if reason required
-        if request.config.reason_required and not reason:
-            raise ApprovalError(
-                "Reason required for this rejection",
-                code="REASON_REQUIRED",
-            )
+            # Check if reason required
+            if request.config.reason_required and not reason:
+                raise ApprovalError(
+                    "Reason required for this rejection",
+                    code="REASON_REQUIRED",
+                )
 
-        # Reject
-        request.reject(approver, reason)
+            # Reject
+            request.reject(approver, reason)
 
-        # Move to decided
-        self._move_to_decided(request)
+            # Move to decided
+            await self._move_to_decided(request)
 
         # Emit event
         await self._emit_event("approval.rejected", request)
 
         # Signal waiting coroutines
-        self._signal_decision(request.id)
+        self._signal_decision(request)
 
         # Call callback
         if self._on_approval_decided:
@@ -358,13 +387,14 @@ class ApprovalManager:
         Returns:
             Updated ApprovalRequest with CANCELLED status.
         """
-        request = self._get_pending_or_raise(approval_id)
+        async with self._decision_lock:
+            request = await self._get_pending_or_raise(approval_id)
 
-        request.cancel()
-        self._move_to_decided(request)
+            request.cancel()
+            await self._move_to_decided(request)
 
         await self._emit_event("approval.cancelled", request)
-        self._signal_decision(request.id)
+        self._signal_decision(request)
 
         return request
 
@@ -388,58 +418,114 @@ class ApprovalManager:
             ApprovalTimeoutError: If timeout expires.
             ApprovalNotFoundError: If request not found.
         """
-        # Check if already decided
-        if approval_id in self._decided_approvals:
-            return self._decided_approvals[approval_id].is_approved
-
-        # Get pending request
-        request = self._pending_approvals.get(approval_id)
+        request = await self._io(self.store.get, approval_id)
         if request is None:
             raise ApprovalNotFoundError(approval_id)
 
-        # Determine timeout
+        # Check if already decided
+        if not request.is_pending:
+            return request.is_approved
+
+        # Determine timeout; a wait shorter than the request's own timeout
+        # expires the request when it runs out
         if timeout_seconds is None:
             timeout_seconds = request.config.timeout_seconds
+        deadline = datetime.now(UTC) + timedelta(seconds=timeout_seconds)
+        self._schedule_expiration(approval_id, deadline)
 
-        # Get or create event
-        event = self._decision_events.get(approval_id)
-        if event is None:
-            event = asyncio.Event()
-            self._decision_events[approval_id] = event
-
+        future = asyncio.get_running_loop().create_future()
+        waiter = (future, timeout_seconds)
+        self._waiters.setdefault(approval_id, []).append(waiter)
         try:
-            # Wait for decision with timeout
-            await asyncio.wait_for(event.wait(), timeout=timeout_seconds)
-        except asyncio.TimeoutError:
-            # Handle timeout
-            await self._handle_timeout(request)
-            raise ApprovalTimeoutError(approval_id, int(timeout_seconds))
-
-        # Get final status
-        decided = self._decided_approvals.get(approval_id)
-        if decided is None:
-            # This shouldn't happen, but handle gracefully
-            raise ApprovalError(
-                f"Approval {approval_id} in unexpected state",
-                code="UNEXPECTED_STATE",
-            )
+            return await future
+        finally:
+            waiters = self._waiters.get(approval_id)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[approval_id]
+
+    async def rehydrate(self) -> list[ApprovalRequest]:
+        """Resume tracking pending requests after a restart.
 
-        return decided.is_approved
+        Requests that expired while the process was down are expired now;
+        the others get their expiration scheduled again.
 
-    async def _handle_timeout(self, request: ApprovalRequest) -> None:
+        Returns:
+            Requests still pending, sorted by priority and time.
+        """
+        for request in await self._io(self.store.list_expiring, datetime.now(UTC)):
+            await self._handle_timeout(request.id)
+
+        pending = await self._io(self.store.list_pending)
+        for request in pending:
+            if request.expires_at is not None:
+                self._schedule_expiration(request.id, request.expires_at)
+        return pending
+
+    def _schedule_expiration(self, approval_id: str, deadline: datetime) -> None:
+        """Expire a pending request at ``deadline`` unless already due earlier."""
+        current = self._deadlines.get(approval_id)
+        if current is not None and current <= deadline:
+            return
+        self._deadlines[approval_id] = deadline
+        heapq.heappush(self._expirations, (deadline, approval_id))
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._timer_task is None
+            or self._timer_task.done()
+            or self._timer_task.get_loop() is not loop
+        ):
+            self._timer_wakeup = asyncio.Event()
+            self._timer_task = loop.create_task(self._run_expirations())
+        elif self._expirations[0][1] == approval_id:
+            # New earliest deadline, wake the timer to re-arm
+            self._timer_wakeup.set()
+
+    async def _run_expirations(self) -> None:
+        """Expire requests in deadline order (one timer for all requests)."""
+        while self._expirations:
+            deadline, approval_id = self._expirations[0]
+            if self._deadlines.get(approval_id) != deadline:
+                heapq.heappop(self._expirations)  # Decided or rescheduled
+                continue
+
+            delay = (deadline - datetime.now(UTC)).total_seconds()
+            if delay > 0:
+                self._timer_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._timer_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._expirations)
+            await self._handle_timeout(approval_id)
+
+    async def _handle_timeout(self, approval_id: str) -> None:
         """Handle approval timeout.
 
+        Waiting coroutines get an ApprovalTimeoutError.
+
         Args:
-            request: The approval request that timed out.
+            approval_id: ID of the approval request that timed out.
         """
-        if request.id not in self._pending_approvals:
-            return  # Already decided
+        async with self._decision_lock:
+            request = await self._io(self.store.get, approval_id)
+            if request is None or not request.is_pending:
+                self._deadlines.pop(approval_id, None)
+                return  # Gone or already decided
 
-        request.expire()
-        self._move_to_decided(request)
+            request.expire()
+            await self._move_to_decided(request)
 
         await self._emit_event("approval.expired", request)
-        self._signal_decision(request.id)
+        for future, timeout_seconds in self._waiters.pop(request.id, []):
+            if not future.done():
+                future.set_exception(
+                    ApprovalTimeoutError(request.id, int(timeout_seconds))
+                )
 
         if self._on_approval_decided:
             self._on_approval_decided(request)
@@ -453,43 +539,25 @@ class ApprovalManager:
         Returns:
             ApprovalRequest or None if not found.
         """
-        return self._pending_approvals.get(approval_id) or self._decided_approvals.get(
-            approval_id
-        )
+        return self.store.get(approval_id)
 
     def list_pending(
         self,
         workflow_id: str | None = None,
         priority: ApprovalPriority | None = None,
+        limit: int | None = None,
     ) -> list[ApprovalRequest]:
         """List pending approval requests.
 
         Args:
             workflow_id: Filter by workflow ID.
             priority: Filter by priority.
+            limit: Maximum number of results (None for all).
 
         Returns:
             List of pending ApprovalRequests, sorted by priority and time.
         """
-        requests = list(self._pending_approvals.values())
-
-        if workflow_id:
-            requests = [r for r in requests if r.workflow_id == workflow_id]
-
-        if priority:
-            requests = [r for r in requests if r.priority == priority]
-
-        # Sort by priority (CRITICAL first) then by creation time
-        priority_order = {
-            ApprovalPriority.CRITICAL: 0,
-            ApprovalPriority.HIGH: 1,
-            ApprovalPriority.MEDIUM: 2,
-            ApprovalPriority.LOW: 3,
-        }
-        return sorted(
-            requests,
-            key=lambda r: (priority_order.get(r.priority, 99), r.created_at),
-        )
+        return self.store.list_pending(workflow_id, priority, limit)
 
     def list_decided(
         self,
@@ -507,22 +575,7 @@ class ApprovalManager:
         Returns:
             List of decided ApprovalRequests, most recent first.
         """
-        requests = list(self._decided_approvals.values())
-
-        if workflow_id:
-            requests = [r for r in requests if r.workflow_id == workflow_id]
-
-        if status:
-            requests = [r for r in requests if r.status == status]
-
-        # Sort by decision time, most recent first
-        requests = sorted(
-            requests,
-            key=lambda r: r.decided_at or r.created_at,
-            reverse=True,
-        )
-
-        return requests[:limit]
+        return self.store.list_decided(workflow_id, status, limit)
 
     def get_stats(self) -> dict[str, Any]:
         """Get approval statistics.
@@ -530,34 +583,27 @@ class ApprovalManager:
         Returns:
             Dictionary with approval statistics.
         """
-        decided = list(self._decided_approvals.values())
+        counts = self.store.count_by_status()
+        pending = counts[ApprovalStatus.PENDING]
         return {
-            "pending_count": len(self._pending_approvals),
-            "decided_count": len(self._decided_approvals),
-            "approved_count": sum(1 for r in decided if r.is_approved),
-            "rejected_count": sum(
-                1 for r in decided if r.status == ApprovalStatus.REJECTED
-            ),
-            "expired_count": sum(
-                1 for r in decided if r.status == ApprovalStatus.EXPIRED
-            ),
-            "cancelled_count": sum(
-                1 for r in decided if r.status == ApprovalStatus.CANCELLED
-            ),
+            "pending_count": pending,
+            "decided_count": sum(counts.values()) - pending,
+            "approved_count": counts[ApprovalStatus.APPROVED],
+            "rejected_count": counts[ApprovalStatus.REJECTED],
+            "expired_count": counts[ApprovalStatus.EXPIRED],
+            "cancelled_count": counts[ApprovalStatus.CANCELLED],
         }
 
-    def _get_pending_or_raise(self, approval_id: str) -> ApprovalRequest:
+    async def _get_pending_or_raise(self, approval_id: str) -> ApprovalRequest:
         """Get pending request or raise appropriate error."""
-        # Check if already decided
-        if approval_id in self._decided_approvals:
-            decided = self._decided_approvals[approval_id]
-            raise ApprovalAlreadyDecidedError(approval_id, decided.status)
-
-        # Get pending
-        request = self._pending_approvals.get(approval_id)
+        request = await self._io(self.store.get, approval_id)
         if request is None:
             raise ApprovalNotFoundError(approval_id)
 
+        # Check if already decided
+        if not request.is_pending:
+            raise ApprovalAlreadyDecidedError(approval_id, request.status)
+
         return request
 
     def _check_authorization(self, request: ApprovalRequest, approver: str) -> None:
@@ -569,16 +615,16 @@ class ApprovalManager:
         if approver not in request.config.approvers:
             raise UnauthorizedApproverError(approver, request.id)
 
-    def _move_to_decided(self, request: ApprovalRequest) -> None:
+    async def _move_to_decided(self, request: ApprovalRequest) -> None:
         """Move request from pending to decided."""
-        self._pending_approvals.pop(request.id, None)
-        self._decided_approvals[request.id] = request
-
-    def _signal_decision(self, approval_id: str) -> None:
-        """Signal that a decision has been made and clean up event."""
-        event = self._decision_events.pop(approval_id, None)
-        if event:
-            event.set()
+        await self._io(self.store.save, request)
+        self._deadlines.pop(request.id, None)
+
+    def _signal_decision(self, request: ApprovalRequest) -> None:
+        """Wake coroutines waiting on a decision."""
+        for future, _ in self._waiters.pop(request.id, []):
+            if not future.done():
+                future.set_result(request.is_approved)
 
     async def _emit_event(
         self,
@@ -0,0 +1,425 @@
+"""Storage backends for Human-in-the-Loop approval requests.
+
+``ApprovalManager`` keeps its requests in an ``ApprovalStore``:
+
+- ``InMemoryApprovalStore``: the default, nothing survives a restart
+- ``SQLiteApprovalStore``: durable storage with indexes on status,
+  priority, workflow and expiry, so queue queries do not scan every
+  request and paused workflows can be resumed after a restart
+
+Example:
+    >>> store = SQLiteApprovalStore(".parac/memory/data/approvals.db")
+    >>> manager = ApprovalManager(event_bus, store=store)
+    >>> pending = await manager.rehydrate()  # after a restart
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from paracle_core.compat import UTC, datetime
+from paracle_domain.models import ApprovalPriority, ApprovalRequest, ApprovalStatus
+from pydantic_core import PydanticSerializationError
+
+# Queue order: CRITICAL first
+PRIORITY_ORDER = {
+    ApprovalPriority.CRITICAL: 0,
+    ApprovalPriority.HIGH: 1,
+    ApprovalPriority.MEDIUM: 2,
+    ApprovalPriority.LOW: 3,
+}
+
+
+def _priority_key(request: ApprovalRequest) -> tuple[int, datetime]:
+    return (PRIORITY_ORDER.get(request.priority, 99), request.created_at)
+
+
+class ApprovalStore(ABC):
+    """Storage for approval requests.
+
+    Stores return requests that the caller may modify; changes are
+    persisted by calling ``save`` again.
+
+    Attributes:
+        blocking_io: Calls block on I/O, so ``ApprovalManager`` runs them
+            in a worker thread instead of on the event loop
+    """
+
+    blocking_io: bool = False
+
+    @abstractmethod
+    def save(self, request: ApprovalRequest) -> None:
+        """Insert or update a request.
+
+        Args:
+            request: Approval request
+
+        Raises:
+            ValueError: If the store persists requests and the request holds
+                data that is not JSON-serializable
+        """
+
+    @abstractmethod
+    def get(self, approval_id: str) -> ApprovalRequest | None:
+        """Get a request by ID.
+
+        Args:
+            approval_id: ID of the approval request
+
+        Returns:
+            ApprovalRequest or None if not found
+        """
+
+    @abstractmethod
+    def list_pending(
+        self,
+        workflow_id: str | None = None,
+        priority: ApprovalPriority | None = None,
+        limit: int | None = None,
+    ) -> list[ApprovalRequest]:
+        """List pending requests, sorted by priority then creation time.
+
+        Args:
+            workflow_id: Filter by workflow ID
+            priority: Filter by priority
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            Pending requests
+        """
+
+    @abstractmethod
+    def list_decided(
+        self,
+        workflow_id: str | None = None,
+        status: ApprovalStatus | None = None,
+        limit: int = 100,
+    ) -> list[ApprovalRequest]:
+        """List decided requests, most recently decided first.
+
+        Args:
+            workflow_id: Filter by workflow ID
+            status: Filter by status
+            limit: Maximum number of results
+
+        Returns:
+            Decided requests
+        """
+
+    @abstractmethod
+    def list_expiring(self, before: datetime) -> list[ApprovalRequest]:
+        """List pending requests that expire before a given time.
+
+        Args:
+            before: Expiry cutoff
+
+        Returns:
+            Pending requests, earliest expiry first
+        """
+
+    @abstractmethod
+    def count_by_status(self) -> dict[ApprovalStatus, int]:
+        """Count requests per status.
+
+        Returns:
+            Number of requests for each status
+        """
+
+
+class InMemoryApprovalStore(ApprovalStore):
+    """Approval storage in process memory (default)."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._pending: dict[str, ApprovalRequest] = {}
+        self._decided: dict[str, ApprovalRequest] = {}
+
+    def save(self, request: ApprovalRequest) -> None:
+        """Insert or update a request."""
+        if request.is_pending:
+            self._decided.pop(request.id, None)
+            self._pending[request.id] = request
+        else:
+            self._pending.pop(request.id, None)
+            self._decided[request.id] = request
+
+    def get(self, approval_id: str) -> ApprovalRequest | None:
+        """Get a request by ID."""
+        return self._pending.get(approval_id) or self._decided.get(approval_id)
+
+    def list_pending(
+        self,
+        workflow_id: str | None = None,
+        priority: ApprovalPriority | None = None,
+        limit: int | None = None,
+    ) -> list[ApprovalRequest]:
+        """List pending requests, sorted by priority then creation time."""
+        requests = [
+            r
+            for r in self._pending.values()
+            if (not workflow_id or r.workflow_id == workflow_id)
+            and (not priority or r.priority == priority)
+        ]
+        return sorted(requests, key=_priority_key)[:limit]
+
+    def list_decided(
+        self,
+        workflow_id: str | None = None,
+        status: ApprovalStatus | None = None,
+        limit: int = 100,
+    ) -> list[ApprovalRequest]:
+        """List decided requests, most recently decided first."""
+        requests = [
+            r
+            for r in self._decided.values()
+            if (not workflow_id or r.workflow_id == workflow_id)
+            and (not status or r.status == status)
+        ]
+        requests.sort(key=lambda r: r.decided_at or r.created_at, reverse=True)
+        return requests[:limit]
+
+    def list_expiring(self, before: datetime) -> list[ApprovalRequest]:
+        """List pending requests that expire before a given time."""
+        requests = [
+            r
+            for r in self._pending.values()
+            if r.expires_at is not None and r.expires_at < before
+        ]
+        return sorted(requests, key=lambda r: r.expires_at)
+
+    def count_by_status(self) -> dict[ApprovalStatus, int]:
+        """Count requests per status."""
+        counts = dict.fromkeys(ApprovalStatus, 0)
+        counts[ApprovalStatus.PENDING] = len(self._pending)
+        for request in self._decided.values():
+            counts[request.status] += 1
+        return counts
+
+
+CREATE_APPROVALS_TABLE = """
+CREATE TABLE IF NOT EXISTS approvals (
+    id TEXT PRIMARY KEY,
+    workflow_id TEXT NOT NULL,
+    execution_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority_rank INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    decided_at TEXT,
+    expires_at TEXT,
+    data TEXT NOT NULL
+);
+"""
+
+CREATE_APPROVALS_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_approvals_queue
+    ON approvals(status, priority_rank, created_at);
+CREATE INDEX IF NOT EXISTS idx_approvals_workflow
+    ON approvals(workflow_id, status, priority_rank, created_at);
+CREATE INDEX IF NOT EXISTS idx_approvals_expiry ON approvals(status, expires_at);
+CREATE INDEX IF NOT EXISTS idx_approvals_status_decided
+    ON approvals(status, decided_at);
+CREATE INDEX IF NOT EXISTS idx_approvals_decided ON approvals(decided_at);
+"""
+
+
+def _timestamp(value: datetime | None) -> str | None:
+    """Format a datetime as a sortable UTC string."""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+class SQLiteApprovalStore(ApprovalStore):
+    """SQLite-backed approval storage.
+
+    Each request is stored as JSON along with indexed columns for the
+    queries the manager and the API run: the pending queue (status,
+    priority, creation time), per-workflow lookups, decision history and
+    expiry. Requests holding data that is not JSON-serializable are
+    rejected rather than stored in a form that would not round-trip.
+
+    Example:
+        >>> store = SQLiteApprovalStore("approvals.db")
+        >>> store.list_pending(priority=ApprovalPriority.CRITICAL, limit=20)
+    """
+
+    blocking_io = True
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        *,
+        in_memory: bool = False,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            db_path: Path to SQLite database file
+            in_memory: Use in-memory database (for testing)
+        """
+        if in_memory:
+            self._db_path = ":memory:"
+        elif db_path:
+            self._db_path = str(db_path)
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        else:
+            self._db_path = "paracle_approvals.db"
+
+        # One connection shared by the manager's worker threads
+        self._lock = threading.RLock()
+        self._connection: sqlite3.Connection | None = None
+
+        self._init_database()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the database connection (callers hold ``_lock``)."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self._db_path,
+                check_same_thread=False,
+            )
+            self._connection.row_factory = sqlite3.Row
+        return self._connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Context manager for database transactions."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        with self._lock:
+            with self._transaction() as cursor:
+                cursor.execute(CREATE_APPROVALS_TABLE)
+                cursor.executescript(CREATE_APPROVALS_INDEXES)
+
+    def _query(self, sql: str, params: tuple) -> list[ApprovalRequest]:
+        with self._lock:
+            rows = self._get_connection().execute(sql, params).fetchall()
+        return [ApprovalRequest.model_validate_json(row["data"]) for row in rows]
+
+    def save(self, request: ApprovalRequest) -> None:
+        """Insert or update a request.
+
+        Raises:
+            ValueError: If the request holds data that is not
+                JSON-serializable
+        """
+        try:
+            data = request.model_dump_json()
+        except PydanticSerializationError as e:
+            raise ValueError(
+                f"Approval request {request.id} is not JSON-serializable: {e}"
+            ) from e
+        with self._lock:
+            with self._transaction() as cursor:
+                cursor.execute(
+                    """
+                    INSERT OR REPLACE INTO approvals (
+                        id, workflow_id, execution_id, status, priority_rank,
+                        created_at, decided_at, expires_at, data
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        request.id,
+                        request.workflow_id,
+                        request.execution_id,
+                        request.status.value,
+                        PRIORITY_ORDER.get(request.priority, 99),
+                        _timestamp(request.created_at),
+                        _timestamp(request.decided_at),
+                        _timestamp(request.expires_at),
+                        data,
+                    ),
+                )
+
+    def get(self, approval_id: str) -> ApprovalRequest | None:
+        """Get a request by ID."""
+        requests = self._query(
+            "SELECT data FROM approvals WHERE id = ?", (approval_id,)
+        )
+        return requests[0] if requests else None
+
+    def list_pending(
+        self,
+        workflow_id: str | None = None,
+        priority: ApprovalPriority | None = None,
+        limit: int | None = None,
+    ) -> list[ApprovalRequest]:
+        """List pending requests, sorted by priority then creation time."""
+        sql = "SELECT data FROM approvals WHERE status = ?"
+        params: list = [ApprovalStatus.PENDING.value]
+        if workflow_id:
+            sql += " AND workflow_id = ?"
+            params.append(workflow_id)
+        if priority:
+            sql += " AND priority_rank = ?"
+            params.append(PRIORITY_ORDER.get(priority, 99))
+        sql += " ORDER BY priority_rank, created_at"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._query(sql, tuple(params))
+
+    def list_decided(
+        self,
+        workflow_id: str | None = None,
+        status: ApprovalStatus | None = None,
+        limit: int = 100,
+    ) -> list[ApprovalRequest]:
+        """List decided requests, most recently decided first."""
+        if status == ApprovalStatus.PENDING:
+            return []
+        sql = "SELECT data FROM approvals WHERE decided_at IS NOT NULL"
+        params: list = []
+        if status:
+            sql += " AND status = ?"
+            params.append(status.value)
+        if workflow_id:
+            sql += " AND workflow_id = ?"
+            params.append(workflow_id)
+        sql += " ORDER BY decided_at DESC LIMIT ?"
+        params.append(limit)
+        return self._query(sql, tuple(params))
+
+    def list_expiring(self, before: datetime) -> list[ApprovalRequest]:
+        """List pending requests that expire before a given time."""
+        return self._query(
+            "SELECT data FROM approvals WHERE status = ? AND expires_at < ? "
+            "ORDER BY expires_at",
+            (ApprovalStatus.PENDING.value, _timestamp(before)),
+        )
+
+    def count_by_status(self) -> dict[ApprovalStatus, int]:
+        """Count requests per status."""
+        counts = dict.fromkeys(ApprovalStatus, 0)
+        with self._lock:
+            rows = (
+                self._get_connection()
+                .execute("SELECT status, COUNT(*) AS n FROM approvals GROUP BY status")
+                .fetchall()
+            )
+        for row in rows:
+            counts[ApprovalStatus(row["status"])] = row["n"]
+        return counts
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
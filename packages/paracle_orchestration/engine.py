@@ -9,12 +9,13 @@ with support for:
 """
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any
 
 from paracle_domain.models import (
     ApprovalConfig,
     ApprovalPriority,
+    ApprovalRequest,
     Workflow,
     WorkflowStep,
     generate_id,
@@ -26,8 +27,9 @@ from paracle_events.events import (
     workflow_failed,
     workflow_started,
 )
+from pydantic_core import PydanticSerializationError, to_jsonable_python
 
-from paracle_orchestration.approval import ApprovalManager
+from paracle_orchestration.approval import ApprovalManager, ApprovalNotFoundError
 from paracle_orchestration.approval import ApprovalTimeoutError as ApprovalTimeout
 from paracle_orchestration.context import ExecutionContext
 from paracle_orchestration.dag import DAG
@@ -61,6 +63,10 @@ class WorkflowOrchestrator:
         3. Pause execution and wait for human decision
         4. Continue if approved, fail if rejected
 
+        The execution state is saved with the approval request, so with a
+        persistent approval store paused executions can be resumed after a
+        restart with `resume_pending()`.
+
     Example:
         >>> orchestrator = WorkflowOrchestrator(
         ...     event_bus=event_bus,
@@ -133,6 +139,7 @@ class WorkflowOrchestrator:
                 self.event_bus,
                 auto_approve=True,
                 auto_approver="system:orchestrator",
+                store=self.approval_manager.store,
             )
 
         # Check if context already exists (from async execution)
@@ -162,19 +169,114 @@ class WorkflowOrchestrator:
                 }
             )
 
+        return await self._run(workflow, context, dag, timeout_seconds)
+
+    async def resume(
+        self,
+        workflow: Workflow,
+        approval_id: str,
+        timeout_seconds: float | None = None,
+    ) -> ExecutionContext:
+        """Resume an execution paused at an approval gate.
+
+        Restores the execution state saved with the approval request (for
+        example after a restart), waits for the decision and runs the
+        remaining steps. The gated step is not executed again; steps that
+        ran in parallel with it are.
+
+        Args:
+            workflow: Workflow of the paused execution
+            approval_id: ID of the pending (or decided) approval request
+            timeout_seconds: Optional timeout for the remaining execution
+
+        Returns:
+            ExecutionContext with results and status
+
+        Raises:
+            ApprovalNotFoundError: If the approval request is not found
+            InvalidWorkflowError: If the request has no saved execution state
+        """
+        request = self.approval_manager.get_request(approval_id)
+        if request is None:
+            raise ApprovalNotFoundError(approval_id)
+
+        state = request.metadata.get("execution_state")
+        if state is None:
+            raise InvalidWorkflowError(
+                f"approval {approval_id} has no saved execution state"
+            )
+
+        dag = DAG(workflow.spec.steps)
+        dag.validate()
+
+        context = ExecutionContext.model_validate(state)
+        context.await_approval(request.step_id, request.id)
+        self.active_executions[context.execution_id] = context
+
+        return await self._run(workflow, context, dag, timeout_seconds, request)
+
+    async def resume_pending(
+        self, workflows: Mapping[str, Workflow]
+    ) -> list[asyncio.Task]:
+        """Resume every execution paused at an approval gate after a restart.
+
+        Rehydrates the approval manager and resumes each pending request
+        whose workflow is known. A paused execution only holds a waiting
+        task until its request is decided.
+
+        Args:
+            workflows: Workflows by ID
+
+        Returns:
+            One task per resumed execution, resolving to its ExecutionContext
+        """
+        tasks = []
+        for request in await self.approval_manager.rehydrate():
+            workflow = workflows.get(request.workflow_id)
+            if (
+                workflow is None
+                or "execution_state" not in request.metadata
+                or request.execution_id in self.active_executions
+            ):
+                continue
+            tasks.append(asyncio.create_task(self.resume(workflow, request.id)))
+        return tasks
+
+    async def _run(
+        self,
+        workflow: Workflow,
+        context: ExecutionContext,
+        dag: DAG,
+        timeout_seconds: float | None,
+        resumed_approval: ApprovalRequest | None = None,
+    ) -> ExecutionContext:
+        """Run the workflow steps and record the outcome in the context.
+
+        Args:
+            workflow: Workflow to execute
+            context: Execution context (registered in active_executions)
+            dag: Validated DAG of workflow steps
+            timeout_seconds: Optional execution timeout
+            resumed_approval: Approval gate the execution resumes at
+
+        Returns:
+            ExecutionContext with results and status
+        """
+        execution_id = context.execution_id
         try:
             # Start execution
-            context.start()
-            await self._emit_event("workflow.started", context)
+            if resumed_approval is None:
+                context.start()
+                await self._emit_event("workflow.started", context)
 
             # Execute with optional timeout
             if timeout_seconds:
                 await asyncio.wait_for(
-                    self._execute_workflow(workflow, context, dag),
+                    self._execute_workflow(workflow, context, dag, resumed_approval),
                     timeout=timeout_seconds,
                 )
             else:
-                await self._execute_workflow(workflow, context, dag)
+                await self._execute_workflow(workflow, context, dag, resumed_approval)
 
             # Collect final outputs from workflow specification
             self._collect_outputs(workflow, context)
@@ -208,24 +310,34 @@ class WorkflowOrchestrator:
         workflow: Workflow,
         context: ExecutionContext,
         dag: DAG,
+        resumed_approval: ApprovalRequest | None = None,
     ) -> None:
         """Execute workflow steps in DAG order.
 
+        Steps that already have a result (restored execution state) are
+        skipped.
+
         Args:
             workflow: Workflow being executed
             context: Execution context
             dag: Validated DAG of workflow steps
+            resumed_approval: Approval gate the execution resumes at
         """
         # Get execution levels for parallel execution
         levels = dag.get_execution_levels()
 
         # Execute each level sequentially, steps within level in parallel
-        for step_names in levels:
+        for level in levels:
+            step_names = [name for name in level if name not in context.step_results]
+
             # Execute all steps in this level in parallel
             tasks = []
             for step_name in step_names:
                 step = dag.steps[step_name]
-                task = self._execute_step(workflow, step, context)
+                approval = None
+                if resumed_approval and resumed_approval.step_id == step_name:
+                    approval = resumed_approval
+                task = self._execute_step(workflow, step, context, approval)
                 tasks.append(task)
 
             # Wait for all steps in this level to complete
@@ -244,6 +356,7 @@ class WorkflowOrchestrator:
         workflow: Workflow,
         step: WorkflowStep,
         context: ExecutionContext,
+        approval: ApprovalRequest | None = None,
     ) -> Any:
         """Execute a single workflow step with optional approval gate.
 
@@ -254,6 +367,8 @@ class WorkflowOrchestrator:
             workflow: Parent workflow
             step: Step to execute
             context: Execution context
+            approval: Pending approval of a resumed step; the step's saved
+                output is awaited instead of executing the step again
 
         Returns:
             Step execution result
@@ -270,19 +385,24 @@ class WorkflowOrchestrator:
         )
 
         try:
-            # Resolve step inputs from workflow inputs and previous results
-            step_inputs = self._resolve_step_inputs(
-                step, context.inputs, context.step_results
-            )
+            if approval is not None:
+                result = await self._await_approval(
+                    step, context, approval, approval.context.get("step_output")
+                )
+            else:
+                # Resolve step inputs from workflow inputs and previous results
+                step_inputs = self._resolve_step_inputs(
+                    step, context.inputs, context.step_results
+                )
 
-            # Execute the step
-            result = await self.step_executor(step, step_inputs)
+                # Execute the step
+                result = await self.step_executor(step, step_inputs)
 
-            # Check if step requires approval (Human-in-the-Loop)
-            if step.requires_approval:
-                result = await self._handle_approval_gate(
-                    workflow, step, context, result, step_inputs
-                )
+                # Check if step requires approval (Human-in-the-Loop)
+                if step.requires_approval:
+                    result = await self._handle_approval_gate(
+                        workflow, step, context, result, step_inputs
+                    )
 
             await self._emit_event(
                 "workflow.step.completed",
@@ -331,13 +451,25 @@ class WorkflowOrchestrator:
         # Determine priority from config or default to MEDIUM
         priority = approval_config.priority or ApprovalPriority.MEDIUM
 
-        # Create approval request with execution context
-        approval_context = {
-            "step_output": result,
-            "step_inputs": step_inputs,
-            "workflow_name": workflow.spec.name,
-            "previous_steps": list(context.step_results.keys()),
-        }
+        # Create approval request with execution context. Everything is
+        # converted to JSON types so it round-trips through persistent
+        # stores; values that cannot be serialized fail the gate instead of
+        # coming back altered after a resume
+        try:
+            approval_context = to_jsonable_python(
+                {
+                    "step_output": result,
+                    "step_inputs": step_inputs,
+                    "workflow_name": workflow.spec.name,
+                    "previous_steps": list(context.step_results.keys()),
+                }
+            )
+            execution_state = context.model_dump(mode="json")
+        except PydanticSerializationError as e:
+            raise StepExecutionError(
+                step.name,
+                ValueError(f"approval state is not JSON-serializable: {e}"),
+            ) from e
 
         request = await self.approval_manager.create_request(
             workflow_id=workflow.id,
@@ -349,8 +481,10 @@ class WorkflowOrchestrator:
             config=approval_config,
             priority=priority,
             metadata={
-                "workflow_inputs": context.inputs,
+                "workflow_inputs": execution_state["inputs"],
                 "total_steps": context.metadata.get("total_steps", 0),
+                # Durable execution state for resuming after a restart
+                "execution_state": execution_state,
             },
         )
 
@@ -368,6 +502,30 @@ class WorkflowOrchestrator:
             },
         )
 
+        return await self._await_approval(step, context, request, result)
+
+    async def _await_approval(
+        self,
+        step: WorkflowStep,
+        context: ExecutionContext,
+        request: ApprovalRequest,
+        result: Any,
+    ) -> Any:
+        """Wait for the decision on a step's approval request.
+
+        Args:
+            step: Step requiring approval
+            context: Execution context
+            request: Approval request of the step
+            result: Step execution result to be approved
+
+        Returns:
+            Original result if approved.
+
+        Raises:
+            StepExecutionError: If rejected or approval timeout.
+        """
+        approval_config = request.config
         try:
             # Wait for human decision
             is_approved = await self.approval_manager.wait_for_decision(
@@ -10,12 +10,19 @@ Phase 4 - API Server Enhancement.
 
 import asyncio
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from paracle_domain.models import Workflow
 from paracle_events import EventBus
 from paracle_profiling import profile_async
+from paracle_runs.recording import (
+    LLMRecording,
+    RecordingProviderRegistry,
+    record_llm_calls,
+)
 
+from paracle_orchestration.approval import ApprovalManager
 from paracle_orchestration.context import ExecutionContext, ExecutionStatus
 from paracle_orchestration.engine import WorkflowOrchestrator
 from paracle_orchestration.exceptions import OrchestrationError, WorkflowNotFoundError
@@ -38,12 +45,19 @@ class WorkflowEngine:
         >>> print(status.progress)  # 0.5
     """
 
-    def __init__(self, event_bus: EventBus | None = None, step_executor: Any = None):
+    def __init__(
+        self,
+        event_bus: EventBus | None = None,
+        step_executor: Any = None,
+        approval_manager: ApprovalManager | None = None,
+    ):
         """Initialize WorkflowEngine.
 
         Args:
             event_bus: Event bus for publishing events (optional)
             step_executor: Step executor (optional, uses AgentExecutor)
+            approval_manager: Approval manager for approval gates (optional,
+                in-memory by default)
         """
         # Create default event bus if not provided
         if event_bus is None:
@@ -55,10 +69,16 @@ class WorkflowEngine:
             from paracle_orchestration.agent_executor import AgentExecutor
 
             agent_executor = AgentExecutor()
+            # Record LLM calls so stored runs can be replayed deterministically
+            agent_executor.provider_registry = RecordingProviderRegistry(
+                agent_executor.provider_registry
+            )
             step_executor = agent_executor.execute_step
 
         self.orchestrator = WorkflowOrchestrator(
-            event_bus=event_bus, step_executor=step_executor
+            event_bus=event_bus,
+            step_executor=step_executor,
+            approval_manager=approval_manager,
         )
 
         # Store completed executions for history
@@ -82,14 +102,15 @@ class WorkflowEngine:
             OrchestrationError: If execution fails
         """
         try:
-            context = await self.orchestrator.execute(workflow, inputs)
+            with record_llm_calls() as recording:
+                context = await self.orchestrator.execute(workflow, inputs)
 
             # Store in history with thread-safe access
             async with self._history_lock:
                 self.execution_history[context.execution_id] = context
 
             # Save run to storage
-            await self._save_run(context, workflow, inputs)
+            await self._save_run(context, workflow, inputs, recording)
 
             return context
 
@@ -153,16 +174,17 @@ class WorkflowEngine:
         try:
             # Execute workflow with pre-generated execution_id
             # Pass execution_id to orchestrator so it uses this one
-            context = await self.orchestrator.execute(
-                workflow, inputs, execution_id=execution_id
-            )
+            with record_llm_calls() as recording:
+                context = await self.orchestrator.execute(
+                    workflow, inputs, execution_id=execution_id
+                )
 
             # Move to history after completion with thread-safe access
             async with self._history_lock:
                 self.execution_history[execution_id] = context
 
             # Save run to storage
-            await self._save_run(context, workflow, inputs)
+            await self._save_run(context, workflow, inputs, recording)
 
             # Clean up task tracking
             if hasattr(self, "_pending_tasks") and execution_id in self._pending_tasks:
@@ -186,6 +208,47 @@ class WorkflowEngine:
                     exc_info=True,
                 )
 
+    async def resume_pending(
+        self, workflows: Mapping[str, Workflow]
+    ) -> list[asyncio.Task]:
+        """Resume executions paused at an approval gate before a restart.
+
+        Resumed executions are tracked like background executions: their
+        status can be polled and they are saved to run storage when done.
+
+        Args:
+            workflows: Workflows by ID
+
+        Returns:
+            One task per resumed execution
+        """
+        self._pending_tasks = getattr(self, "_pending_tasks", {})
+        tasks = []
+        for resume_task in await self.orchestrator.resume_pending(workflows):
+            task = asyncio.create_task(self._background_resume(resume_task, workflows))
+            tasks.append(task)
+        return tasks
+
+    async def _background_resume(
+        self, resume_task: asyncio.Task, workflows: Mapping[str, Workflow]
+    ) -> None:
+        """Background task waiting for a resumed execution to finish.
+
+        Args:
+            resume_task: Task returned by ``WorkflowOrchestrator.resume_pending``
+            workflows: Workflows by ID
+        """
+        try:
+            context = await resume_task
+        except Exception as e:
+            logger.error(f"Resumed execution failed: {e}", exc_info=True)
+            return
+
+        async with self._history_lock:
+            self.execution_history[context.execution_id] = context
+
+        await self._save_run(context, workflows[context.workflow_id], context.inputs)
+
     async def get_execution_status(self, execution_id: str) -> ExecutionStatus:
         """Get execution status (for polling).
 
@@ -309,13 +372,18 @@ class WorkflowEngine:
         context: ExecutionContext,
         workflow: Workflow,
         inputs: dict[str, Any],
+        recording: LLMRecording | None = None,
     ) -> None:
         """Save workflow run to storage.
 
+        The workflow spec and recorded LLM calls are stored in the trace so
+        the run can be re-executed with ``paracle_runs.replay_workflow_run``.
+
         Args:
             context: Execution context
             workflow: Workflow definition
             inputs: Workflow inputs
+            recording: LLM calls recorded during execution
         """
         try:
             from datetime import datetime
@@ -372,6 +440,10 @@ class WorkflowEngine:
                 inputs=inputs,
                 outputs=context.outputs,
                 steps=context.step_results,
+                trace={
+                    "workflow_spec": workflow.spec.model_dump(mode="json"),
+                    "llm_calls": recording.to_list() if recording else [],
+                },
             )
 
             logger.info(f"Saved workflow run {context.execution_id} to storage")
@@ -6,14 +6,22 @@ available during agent execution.
 Skills can be assigned to agents in two ways (in order of priority):
 1. manifest.yaml - agents.[].skills field (preferred, structured)
 2. SKILL_ASSIGNMENTS.md - markdown format (fallback, legacy)
+
+Skill directories and manifest.yaml are parsed by the shared
+``ArtifactRegistry`` and revalidated against disk on every lookup.
 """
 
 import logging
 from pathlib import Path
 from typing import Any
 
-import yaml
-from paracle_profiling import cached, profile
+from paracle_core.parac.registry import (
+    ArtifactKind,
+    SkillDefinition,
+    get_registry,
+    parse_skill_markdown,
+)
+from paracle_profiling import profile
 
 logger = logging.getLogger(__name__)
 
@@ -80,9 +88,9 @@ class SkillLoader:
         self.skills_dir = self.parac_dir / "agents" / "skills"
         self.manifest_file = self.parac_dir / "agents" / "manifest.yaml"
         self.assignments_file = self.parac_dir / "agents" / "SKILL_ASSIGNMENTS.md"
+        self.registry = get_registry(self.parac_dir)
         self._skill_cache: dict[str, Skill] = {}
-        self._assignments_cache: dict[str, list[str]] = {}
-        self._manifest_cache: dict[str, Any] | None = None
+        self._skill_sources: dict[str, SkillDefinition] = {}
 
     def discover_skills(self) -> list[str]:
         """Discover all available skills.
@@ -94,66 +102,45 @@ class SkillLoader:
             logger.warning(f"Skills directory not found: {self.skills_dir}")
             return []
 
-        skills = []
-        for skill_dir in self.skills_dir.iterdir():
-            if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-                skills.append(skill_dir.name)
+        skills = self.registry.list_keys(ArtifactKind.SKILL)
 
         logger.info(f"Discovered {len(skills)} skills: {skills}")
         return skills
 
-    @cached(ttl=300)  # Cache skills for 5 minutes
-    @profile(track_memory=True)
+    @profile()
     def load_skill(self, skill_id: str) -> Skill | None:
         """Load a specific skill.
 
+        The same Skill object is returned until the skill's files change.
+
         Args:
             skill_id: Skill identifier (directory name)
 
         Returns:
             Skill object or None if not found
         """
-        # Check cache
-        if skill_id in self._skill_cache:
-            return self._skill_cache[skill_id]
-
-        skill_path = self.skills_dir / skill_id
-        if not skill_path.exists():
+        definition = self.registry.get_skill(skill_id)
+        if definition is None:
             logger.warning(f"Skill not found: {skill_id}")
             return None
 
-        skill_file = skill_path / "SKILL.md"
-        if not skill_file.exists():
-            logger.warning(f"SKILL.md not found for: {skill_id}")
-            return None
-
-        # Load main content
-        raw_content = skill_file.read_text(encoding="utf-8")
-
-        # Parse YAML frontmatter and extract name/description
-        name, description, content = self._parse_skill_md(raw_content, skill_id)
-
-        # Load assets
-        assets = self._load_directory_files(skill_path / "assets")
-
-        # Load scripts
-        scripts = self._load_directory_files(skill_path / "scripts")
-
-        # Load references
-        references = self._load_directory_files(skill_path / "references")
+        # Check cache
+        if self._skill_sources.get(skill_id) is definition:
+            return self._skill_cache[skill_id]
 
         skill = Skill(
             skill_id=skill_id,
-            name=name,
-            description=description,
-            content=content,
-            assets=assets,
-            scripts=scripts,
-            references=references,
+            name=definition.name,
+            description=definition.description,
+            content=definition.content,
+            assets=definition.assets,
+            scripts=definition.scripts,
+            references=definition.references,
         )
 
         # Cache it
         self._skill_cache[skill_id] = skill
+        self._skill_sources[skill_id] = definition
         logger.debug(f"Loaded skill: {skill_id}")
 
         return skill
@@ -194,10 +181,6 @@ class SkillLoader:
         Returns:
             List of skill IDs
         """
-        # Check cache
-        if agent_name in self._assignments_cache:
-            return self._assignments_cache[agent_name]
-
         # Try manifest.yaml first (preferred source)
         skills = self._get_skills_from_manifest(agent_name)
 
@@ -205,8 +188,6 @@ class SkillLoader:
         if not skills:
             skills = self._get_skills_from_assignments_md(agent_name)
 
-        # Cache it
-        self._assignments_cache[agent_name] = skills
         return skills
 
     def _get_skills_from_manifest(self, agent_name: str) -> list[str]:
@@ -218,23 +199,10 @@ class SkillLoader:
         Returns:
             List of skill IDs or empty list if not found
         """
-        if not self.manifest_file.exists():
-            logger.debug(f"Manifest file not found: {self.manifest_file}")
-            return []
-
-        # Load and cache manifest
-        if self._manifest_cache is None:
-            try:
-                content = self.manifest_file.read_text(encoding="utf-8")
-                self._manifest_cache = yaml.safe_load(content) or {}
-                logger.debug("Loaded manifest.yaml")
-            except Exception as e:
-                logger.warning(f"Failed to load manifest.yaml: {e}")
-                self._manifest_cache = {}
-                return []
+        manifest = self._load_manifest()
 
         # Find agent by id
-        agents = self._manifest_cache.get("agents", [])
+        agents = manifest.get("agents", [])
         for agent in agents:
             if agent.get("id") == agent_name:
                 skills = agent.get("skills", [])
@@ -328,66 +296,15 @@ class SkillLoader:
         Returns:
             Tuple of (name, description, content)
         """
-        import re
-
-        # Default values
-        name = skill_id.replace("-", " ").title()
-        description = f"Skill: {name}"
-        content = raw_content
-
-        # Check for YAML frontmatter (content between --- markers)
-        frontmatter_pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-        match = re.match(frontmatter_pattern, raw_content, re.DOTALL)
-
-        if match:
-            try:
-                import yaml
-
-                frontmatter_text = match.group(1)
-                content = match.group(2)
-
-                frontmatter = yaml.safe_load(frontmatter_text)
-                if frontmatter:
-                    # Extract name and description from frontmatter
-                    name = frontmatter.get("name", skill_id)
-                    description = frontmatter.get("description", f"Skill: {name}")
-
-                    # Also try metadata.display_name if available
-                    metadata = frontmatter.get("metadata", {})
-                    if metadata and metadata.get("display_name"):
-                        name = metadata["display_name"]
-
-                logger.debug(
-                    f"Parsed frontmatter for {skill_id}: "
-                    f"name={name}, desc={description[:50]}..."
-                )
-            except Exception as e:
-                logger.warning(f"Failed to parse frontmatter for {skill_id}: {e}")
-
-        return name, description, content
-
-    def _load_directory_files(self, directory: Path) -> dict[str, str]:
-        """Load all files from a directory.
-
-        Args:
-            directory: Directory path
-
-        Returns:
-            Dictionary mapping filename to content
-        """
-        files = {}
-        if not directory.exists():
-            return files
-
-        for file_path in directory.iterdir():
-            if file_path.is_file():
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    files[file_path.name] = content
-                except Exception as e:
-                    logger.warning(f"Could not read {file_path}: {e}")
-
-        return files
+        return parse_skill_markdown(raw_content, skill_id)
+
+    def _load_manifest(self) -> dict[str, Any]:
+        """Get manifest.yaml from the registry ({} if missing or invalid)."""
+        try:
+            return self.registry.get_manifest()
+        except Exception as e:
+            logger.warning(f"Failed to load manifest.yaml: {e}")
+            return {}
 
     def validate_agent_skills(self, agent_name: str) -> list[str]:
         """Validate that all assigned skills exist.
@@ -413,19 +330,7 @@ class SkillLoader:
         Returns:
             Dictionary mapping agent names to their missing skill IDs
         """
-        if not self.manifest_file.exists():
-            return {}
-
-        # Load manifest if not cached
-        if self._manifest_cache is None:
-            try:
-                content = self.manifest_file.read_text(encoding="utf-8")
-                self._manifest_cache = yaml.safe_load(content) or {}
-            except Exception as e:
-                logger.warning(f"Failed to load manifest.yaml: {e}")
-                return {}
-
-        agents = self._manifest_cache.get("agents", [])
+        agents = self._load_manifest().get("agents", [])
         validation_results = {}
 
         for agent in agents:
@@ -440,5 +345,4 @@ class SkillLoader:
     def clear_cache(self) -> None:
         """Clear all caches."""
         self._skill_cache.clear()
-        self._assignments_cache.clear()
-        self._manifest_cache = None
+        self._skill_sources.clear()
@@ -6,29 +6,30 @@ Loads workflows from .parac/workflows/ directory structure:
 - content/templates/: Template workflows
 
 Supports both API and CLI usage for workflow discovery and loading.
+Parsed YAML is served by the shared ``ArtifactRegistry``, so repeated loads
+do not re-parse and edits are picked up immediately.
 """
 
 from pathlib import Path
 from typing import Any
 
 import yaml
+from paracle_core.parac.registry import (
+    ArtifactKind,
+    get_registry,
+    resolve_parac_root,
+)
 from paracle_domain.models import WorkflowSpec, WorkflowStep
 from pydantic import ValidationError
 
 try:
-    from paracle_profiling import cached, profile
+    from paracle_profiling import profile
 
     PROFILING_AVAILABLE = True
 except ImportError:
     # Profiling not available - use no-op decorators
     PROFILING_AVAILABLE = False
 
-    def cached(*_args, **_kwargs):
-        def decorator(func):
-            return func
-
-        return decorator
-
     def profile(*_args, **_kwargs):
         def decorator(func):
             return func
@@ -78,6 +79,7 @@ class WorkflowLoader:
             raise WorkflowLoadError(
                 f"Workflows directory not found: {self.workflows_dir}"
             )
+        self.registry = get_registry(self.parac_root)
 
     def _find_parac_root(self) -> Path:
         """Find .parac/ directory by searching upward from cwd.
@@ -88,17 +90,9 @@ class WorkflowLoader:
         Raises:
             WorkflowLoadError: If .parac/ not found
         """
-        current = Path.cwd()
-
-        # Search upward for .parac/
-        for _ in range(10):  # Limit search depth
-            parac_path = current / ".parac"
-            if parac_path.exists() and parac_path.is_dir():
-                return parac_path
-            parent = current.parent
-            if parent == current:  # Reached root
-                break
-            current = parent
+        parac_path = resolve_parac_root()
+        if parac_path is not None:
+            return parac_path
 
         raise WorkflowLoadError(
             ".parac/ directory not found. Run from project root or "
@@ -114,13 +108,9 @@ class WorkflowLoader:
         Raises:
             WorkflowLoadError: If catalog not found or invalid
         """
-        if not self.catalog_file.exists():
-            return {"workflows": []}
-
         try:
-            with open(self.catalog_file, encoding="utf-8") as f:
-                catalog = yaml.safe_load(f)
-                return catalog or {"workflows": []}
+            catalog = self.registry.get_manifest("workflows/catalog.yaml")
+            return catalog or {"workflows": []}
         except Exception as e:
             raise WorkflowLoadError(
                 f"Failed to load catalog {self.catalog_file}: {e}"
@@ -185,7 +175,6 @@ class WorkflowLoader:
             "content/templates/"
         )
 
-    @cached(ttl=120)  # Cache for 2 minutes
     @profile()
     def load_workflow_yaml(self, workflow_name: str) -> dict[str, Any]:
         """Load workflow YAML as dictionary.
@@ -194,27 +183,27 @@ class WorkflowLoader:
             workflow_name: Name of workflow
 
         Returns:
-            Workflow YAML as dict
+            Workflow YAML as dict (shared; do not mutate)
 
         Raises:
             WorkflowLoadError: If loading fails
         """
-        file_path = self.get_workflow_file_path(workflow_name)
-
         try:
-            with open(file_path, encoding="utf-8") as f:
-                workflow_yaml = yaml.safe_load(f)
-                if not workflow_yaml:
-                    raise WorkflowLoadError(f"Empty workflow file: {file_path}")
-                return workflow_yaml
-        except FileNotFoundError as exc:
-            raise WorkflowLoadError(
-                f"Failed to load {file_path}: File not found"
-            ) from exc
+            artifact = self.registry.artifact(ArtifactKind.WORKFLOW, workflow_name)
         except yaml.YAMLError as e:
+            file_path = self.get_workflow_file_path(workflow_name)
             raise WorkflowLoadError(f"Invalid YAML in {file_path}: {e}") from e
         except Exception as e:
-            raise WorkflowLoadError(f"Failed to load {file_path}: {e}") from e
+            raise WorkflowLoadError(f"Failed to load {workflow_name}: {e}") from e
+
+        if artifact is None:
+            raise WorkflowLoadError(
+                f"Workflow '{workflow_name}' not found in definitions/ or "
+                "content/templates/"
+            )
+        if not artifact.value:
+            raise WorkflowLoadError(f"Empty workflow file: {artifact.path}")
+        return artifact.value
 
     @profile(track_memory=True)
     def load_workflow_spec(self, workflow_name: str) -> WorkflowSpec:
@@ -427,20 +416,7 @@ class WorkflowLoader:
         Example:
             all_workflows = loader.scan_all_workflows()
         """
-        workflow_names = []
-
-        # Scan definitions directory
-        if self.definitions_dir.exists():
-            for file_path in self.definitions_dir.glob("*.yaml"):
-                if file_path.stem != "_manifest":
-                    workflow_names.append(file_path.stem)
-
-        # Scan templates directory
-        if self.templates_dir.exists():
-            for file_path in self.templates_dir.glob("*.yaml"):
-                workflow_names.append(file_path.stem)
-
-        return sorted(set(workflow_names))
+        return self.registry.list_keys(ArtifactKind.WORKFLOW)
 
 
 # =============================================================================
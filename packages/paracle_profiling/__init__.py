@@ -3,15 +3,23 @@
 Provides tools for profiling, monitoring, and optimizing performance:
 - Request profiling middleware
 - Function-level profiling decorators
+- Runtime stack sampling with flamegraph export
 - Multi-level caching (response, query, LLM)
 - Benchmarking suite with regression detection
 - Database query profiling
 - Memory profiling
 - Performance analysis and reporting
+- Import-time budgets for cold start
 
 Phase 8 - Performance & Scale deliverables included.
+
+The stack sampler and import-time budgets are loaded on first use, so
+importing the profiler does not pull them in.
 """
 
+import importlib
+from typing import Any
+
 from paracle_profiling.analyzer import PerformanceAnalyzer
 from paracle_profiling.benchmark import (
     Benchmark,
@@ -37,13 +45,36 @@ from paracle_profiling.cache import (
     get_multi_level_cache,
 )
 from paracle_profiling.profiler import (
+    ProfileAggregate,
     Profiler,
+    QuantileSketch,
     clear_profile_stats,
     get_profile_stats,
     profile,
     profile_async,
 )
 
+# Exported names loaded from their submodule on first access
+_LAZY_ATTRS = {
+    "StackSampler": "sampler",
+    "get_sampler": "sampler",
+    "start_sampling": "sampler",
+    "stop_sampling": "sampler",
+    "ImportBudgetResult": "import_time",
+    "ImportTimeReport": "import_time",
+    "check_cli_import_budget": "import_time",
+    "check_import_budget": "import_time",
+    "measure_import_time": "import_time",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_ATTRS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+
+
 # Optional middleware - only available if starlette is installed
 try:
     from paracle_profiling.middleware import ProfilerMiddleware
@@ -57,6 +88,13 @@ try:
         "profile_async",
         "get_profile_stats",
         "clear_profile_stats",
+        "ProfileAggregate",
+        "QuantileSketch",
+        # Sampling profiler
+        "StackSampler",
+        "get_sampler",
+        "start_sampling",
+        "stop_sampling",
         # Analyzer
         "PerformanceAnalyzer",
         # Single-level cache
@@ -81,6 +119,12 @@ try:
         "benchmark",
         "get_default_suite",
         "run_benchmarks",
+        # Import-time budgets
+        "ImportBudgetResult",
+        "ImportTimeReport",
+        "check_cli_import_budget",
+        "check_import_budget",
+        "measure_import_time",
     ]
 except ImportError:
     # Starlette not available - middleware disabled
@@ -91,6 +135,13 @@ except ImportError:
         "profile_async",
         "get_profile_stats",
         "clear_profile_stats",
+        "ProfileAggregate",
+        "QuantileSketch",
+        # Sampling profiler
+        "StackSampler",
+        "get_sampler",
+        "start_sampling",
+        "stop_sampling",
         # Analyzer
         "PerformanceAnalyzer",
         # Single-level cache
@@ -115,6 +166,12 @@ except ImportError:
         "benchmark",
         "get_default_suite",
         "run_benchmarks",
+        # Import-time budgets
+        "ImportBudgetResult",
+        "ImportTimeReport",
+        "check_cli_import_budget",
+        "check_import_budget",
+        "measure_import_time",
     ]
 
 __version__ = "0.1.0"
@@ -60,22 +60,20 @@ class PerformanceAnalyzer:
         bottlenecks = []
 
         # Calculate total time across all profiled functions
-        total_time = sum(sum(e.duration for e in entries) for entries in stats.values())
+        total_time = sum(aggregate.total_time for aggregate in stats.values())
 
         if total_time == 0:
             return []
 
         # Analyze each function
-        for name, entries in stats.items():
-            if len(entries) < min_calls:
+        for name, aggregate in stats.items():
+            if aggregate.count < min_calls:
                 continue
 
-            durations = [e.duration for e in entries]
-            avg_time = sum(durations) / len(durations)
-            max_time = max(durations)
-            sorted_durations = sorted(durations)
-            p95_time = sorted_durations[int(len(durations) * 0.95)]
-            function_total_time = sum(durations)
+            avg_time = aggregate.avg_time
+            max_time = aggregate.max_time
+            p95_time = aggregate.quantile(0.95)
+            function_total_time = aggregate.total_time
             percentage = (function_total_time / total_time) * 100
 
             # Determine severity
@@ -96,7 +94,7 @@ class PerformanceAnalyzer:
                     avg_time=avg_time,
                     max_time=max_time,
                     p95_time=p95_time,
-                    calls=len(entries),
+                    calls=aggregate.count,
                     total_time=function_total_time,
                     percentage_of_total=percentage,
                     severity=severity,
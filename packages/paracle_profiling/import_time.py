@@ -0,0 +1,233 @@
+"""Import-time regression checks.
+
+Measures module import cost with ``python -X importtime`` in a fresh
+interpreter and enforces a budget, so a stray top-level import of a heavy
+dependency in the CLI entry point is caught in CI rather than by users.
+
+Example:
+    from paracle_profiling.import_time import check_import_budget
+
+    result = check_import_budget("paracle_cli.main", budget_ms=300)
+    if not result.passed:
+        print(result.format())
+"""
+
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+# Modules that must never be imported just to build the CLI command table
+CLI_FORBIDDEN_IMPORTS = (
+    "paracle_api",
+    "paracle_meta",
+    "paracle_mcp",
+    "paracle_a2a",
+    "paracle_sandbox",
+    "paracle_orchestration",
+    "paracle_providers",
+    "fastapi",
+    "docker",
+    "anthropic",
+)
+
+# Budget for ``import paracle_cli.main`` (cumulative import time). The lazy
+# CLI measures roughly 50-150ms depending on the machine; eager loading of
+# the command modules costs seconds, so this leaves headroom for slow CI
+# runners while still catching that regression.
+CLI_IMPORT_BUDGET_MS = 300.0
+
+_IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<name>.*)$"
+)
+
+
+@dataclass
+class ImportTimeEntry:
+    """A single line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportTimeReport:
+    """Import cost of a module measured in a fresh interpreter."""
+
+    module: str
+    entries: list[ImportTimeEntry]
+    wall_ms: float
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative import time of the target module in milliseconds."""
+        for entry in reversed(self.entries):
+            if entry.module == self.module and entry.depth == 0:
+                return entry.cumulative_us / 1000
+        return sum(e.self_us for e in self.entries) / 1000
+
+    @property
+    def modules(self) -> set[str]:
+        """All modules imported while importing the target."""
+        return {entry.module for entry in self.entries}
+
+    def top(self, n: int = 10) -> list[ImportTimeEntry]:
+        """Return the n modules with the highest self time."""
+        return sorted(self.entries, key=lambda e: e.self_us, reverse=True)[:n]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "module": self.module,
+            "total_ms": round(self.total_ms, 3),
+            "wall_ms": round(self.wall_ms, 3),
+            "module_count": len(self.entries),
+            "top": [
+                {"module": e.module, "self_ms": round(e.self_us / 1000, 3)}
+                for e in self.top()
+            ],
+        }
+
+
+@dataclass
+class ImportBudgetResult:
+    """Outcome of an import budget check."""
+
+    report: ImportTimeReport
+    budget_ms: float
+    forbidden: list[str] = field(default_factory=list)
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether the import took longer than the budget."""
+        return self.report.total_ms > self.budget_ms
+
+    @property
+    def passed(self) -> bool:
+        """Whether the module is within budget and imports nothing forbidden."""
+        return not self.over_budget and not self.forbidden
+
+    def format(self) -> str:
+        """Format the result for terminal output."""
+        status = "PASS" if self.passed else "FAIL"
+        lines = [
+            f"[{status}] import {self.report.module}: "
+            f"{self.report.total_ms:.1f}ms (budget {self.budget_ms:.0f}ms, "
+            f"{len(self.report.entries)} modules)"
+        ]
+        if self.forbidden:
+            lines.append("  Forbidden imports: " + ", ".join(sorted(self.forbidden)))
+        lines.append("  Slowest modules (self time):")
+        for entry in self.report.top(5):
+            lines.append(f"    {entry.self_us / 1000:8.2f}ms  {entry.module}")
+        return "\n".join(lines)
+
+
+def parse_importtime(output: str) -> list[ImportTimeEntry]:
+    """Parse ``-X importtime`` stderr output.
+
+    Args:
+        output: Raw stderr of the interpreter
+
+    Returns:
+        Entries in the order they were reported
+    """
+    entries = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        raw_name = match.group("name")
+        name = raw_name.lstrip()
+        entries.append(
+            ImportTimeEntry(
+                module=name,
+                self_us=int(match.group("self")),
+                cumulative_us=int(match.group("cumulative")),
+                depth=(len(raw_name) - len(name) - 1) // 2,
+            )
+        )
+    return entries
+
+
+def measure_import_time(
+    module: str,
+    runs: int = 3,
+    python: str | None = None,
+) -> ImportTimeReport:
+    """Measure the import cost of a module in fresh interpreters.
+
+    The fastest of ``runs`` measurements is kept to filter out noise from
+    cold filesystem caches.
+
+    Args:
+        module: Dotted module name to import
+        runs: Number of interpreter launches
+        python: Interpreter to use (defaults to the current one)
+
+    Returns:
+        ImportTimeReport of the fastest run
+
+    Raises:
+        RuntimeError: If the module fails to import
+    """
+    best: ImportTimeReport | None = None
+    for _ in range(max(1, runs)):
+        start = time.perf_counter()
+        proc = subprocess.run(  # nosec B603 - fixed argv, no shell
+            [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if proc.returncode != 0:
+            raise RuntimeError(f"Failed to import {module}:\n{proc.stderr[-2000:]}")
+
+        report = ImportTimeReport(
+            module=module, entries=parse_importtime(proc.stderr), wall_ms=wall_ms
+        )
+        if best is None or report.total_ms < best.total_ms:
+            best = report
+    assert best is not None
+    return best
+
+
+def check_import_budget(
+    module: str,
+    budget_ms: float,
+    forbidden: tuple[str, ...] = (),
+    runs: int = 3,
+) -> ImportBudgetResult:
+    """Check that importing a module stays within a time budget.
+
+    Args:
+        module: Dotted module name to import
+        budget_ms: Maximum cumulative import time in milliseconds
+        forbidden: Top-level packages that must not be imported
+        runs: Number of interpreter launches (fastest is kept)
+
+    Returns:
+        ImportBudgetResult
+    """
+    report = measure_import_time(module, runs=runs)
+    roots = {name.split(".")[0] for name in report.modules}
+    return ImportBudgetResult(
+        report=report,
+        budget_ms=budget_ms,
+        forbidden=[name for name in forbidden if name in roots],
+    )
+
+
+def check_cli_import_budget(runs: int = 3) -> ImportBudgetResult:
+    """Check the cold-start import budget of the ``paracle`` CLI."""
+    return check_import_budget(
+        "paracle_cli.main",
+        budget_ms=CLI_IMPORT_BUDGET_MS,
+        forbidden=CLI_FORBIDDEN_IMPORTS,
+        runs=runs,
+    )
@@ -1,15 +1,20 @@
 """Performance profiler with timing and metrics collection."""
 
 import functools
+import itertools
 import logging
+import math
+import threading
 import time
-from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Durations at or below this are counted in the sketch's zero bucket
+_MIN_SKETCH_VALUE = 1e-9
+
 
 @dataclass
 class ProfileEntry:
@@ -31,12 +36,132 @@ class ProfileEntry:
         return None
 
 
+class QuantileSketch:
+    """Streaming quantile sketch with bounded memory.
+
+    Values are counted in logarithmic buckets (DDSketch-style), so any
+    quantile is returned within ``relative_accuracy`` of the true value.
+    When more than ``max_buckets`` buckets are in use, the lowest ones are
+    merged, which only loses accuracy on the fastest calls.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Add a non-negative value."""
+        self.count += 1
+        if value <= _MIN_SKETCH_VALUE:
+            self._zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> float | None:
+        """Return the approximate ``q`` quantile (0 <= q <= 1)."""
+        if self.count == 0:
+            return None
+        # Same rank convention as sorting: values[int(q * n)]
+        rank = min(int(q * self.count), self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                return 2 * self._gamma**key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+    def _collapse(self) -> None:
+        keys = sorted(self._buckets)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            self._buckets[target] += self._buckets.pop(key)
+
+
+@dataclass
+class ProfileAggregate:
+    """Running statistics for one profiled name, in constant memory."""
+
+    name: str
+    count: int = 0
+    total_time: float = 0.0
+    min_time: float = math.inf
+    max_time: float = 0.0
+    memory_samples: int = 0
+    memory_total: int = 0
+    memory_max: int | None = None
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def add(self, duration: float, memory_delta: int | None = None) -> None:
+        """Fold one call into the aggregate."""
+        self.count += 1
+        self.total_time += duration
+        if duration < self.min_time:
+            self.min_time = duration
+        if duration > self.max_time:
+            self.max_time = duration
+        self.sketch.add(duration)
+        if memory_delta is not None:
+            self.memory_samples += 1
+            self.memory_total += memory_delta
+            if self.memory_max is None or memory_delta > self.memory_max:
+                self.memory_max = memory_delta
+
+    @property
+    def avg_time(self) -> float:
+        """Mean duration in seconds."""
+        return self.total_time / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Approximate duration quantile, clamped to the observed range."""
+        value = self.sketch.quantile(q)
+        if value is None:
+            return 0.0
+        return min(max(value, self.min_time), self.max_time)
+
+    def summary(self) -> dict[str, Any]:
+        """Summary statistics in the ``get_summary`` format."""
+        return {
+            "name": self.name,
+            "calls": self.count,
+            "total_time": self.total_time,
+            "avg_time": self.avg_time,
+            "min_time": self.min_time,
+            "max_time": self.max_time,
+            "p50_time": self.quantile(0.50),
+            "p95_time": self.quantile(0.95),
+            "p99_time": self.quantile(0.99),
+            "memory_avg": (
+                self.memory_total / self.memory_samples if self.memory_samples else None
+            ),
+            "memory_max": self.memory_max,
+        }
+
+
 class Profiler:
-    """Global profiler for collecting performance metrics."""
+    """Global profiler for collecting performance metrics.
 
-    _stats: dict[str, list[ProfileEntry]] = defaultdict(list)
+    Calls are folded into one ``ProfileAggregate`` per name, so memory use
+    does not grow with the number of calls.
+    """
+
+    _stats: dict[str, ProfileAggregate] = {}
+    _lock = threading.Lock()
     _enabled: bool = True
 
+    # track_memory decorators read RSS on one call out of N
+    memory_sample_every: int = 16
+
     @classmethod
     def enable(cls) -> None:
         """Enable profiling."""
@@ -57,57 +182,70 @@ class Profiler:
     @classmethod
     def record(cls, entry: ProfileEntry) -> None:
         """Record a profile entry."""
-        if cls._enabled:
-            cls._stats[entry.name].append(entry)
+        cls.observe(entry.name, entry.duration, entry.memory_delta)
 
     @classmethod
-    def get_stats(cls, name: str | None = None) -> dict[str, list[ProfileEntry]]:
+    def observe(
+        cls, name: str, duration: float, memory_delta: int | None = None
+    ) -> None:
+        """Record one call without building a ``ProfileEntry``.
+
+        Args:
+            name: Profiled name
+            duration: Call duration in seconds
+            memory_delta: RSS change in bytes, if it was measured
+        """
+        if not cls._enabled:
+            return
+        with cls._lock:
+            aggregate = cls._stats.get(name)
+            if aggregate is None:
+                aggregate = cls._stats[name] = ProfileAggregate(name)
+            aggregate.add(duration, memory_delta)
+
+    @classmethod
+    def get_stats(cls, name: str | None = None) -> dict[str, ProfileAggregate]:
         """Get profiling statistics."""
         if name:
-            return {name: cls._stats.get(name, [])}
+            aggregate = cls._stats.get(name)
+            return {name: aggregate} if aggregate else {}
         return dict(cls._stats)
 
     @classmethod
     def clear(cls, name: str | None = None) -> None:
         """Clear profiling statistics."""
-        if name:
-            cls._stats.pop(name, None)
-        else:
-            cls._stats.clear()
+        with cls._lock:
+            if name:
+                cls._stats.pop(name, None)
+            else:
+                cls._stats.clear()
 
     @classmethod
     def get_summary(cls, name: str) -> dict[str, Any]:
         """Get summary statistics for a profiled function."""
-        entries = cls._stats.get(name, [])
-        if not entries:
+        aggregate = cls._stats.get(name)
+        if aggregate is None or aggregate.count == 0:
             return {}
+        with cls._lock:
+            return aggregate.summary()
 
-        durations = [e.duration for e in entries]
-        memory_deltas = [e.memory_delta for e in entries if e.memory_delta is not None]
 
-        return {
-            "name": name,
-            "calls": len(entries),
-            "total_time": sum(durations),
-            "avg_time": sum(durations) / len(durations),
-            "min_time": min(durations),
-            "max_time": max(durations),
-            "p50_time": sorted(durations)[len(durations) // 2],
-            "p95_time": (
-                sorted(durations)[int(len(durations) * 0.95)]
-                if len(durations) > 1
-                else durations[0]
-            ),
-            "p99_time": (
-                sorted(durations)[int(len(durations) * 0.99)]
-                if len(durations) > 1
-                else durations[0]
-            ),
-            "memory_avg": (
-                sum(memory_deltas) / len(memory_deltas) if memory_deltas else None
-            ),
-            "memory_max": max(memory_deltas) if memory_deltas else None,
-        }
+_process: Any = None
+
+
+def _current_rss() -> int | None:
+    """Resident set size of this process, or None without psutil."""
+    global _process
+    if _process is None:
+        try:
+            import psutil
+        except ImportError:
+            _process = False
+        else:
+            _process = psutil.Process()
+    if _process is False:
+        return None
+    return _process.memory_info().rss
 
 
 def profile(name: str | None = None, track_memory: bool = False) -> Callable:
@@ -115,7 +253,8 @@ def profile(name: str | None = None, track_memory: bool = False) -> Callable:
 
     Args:
         name: Name for the profile entry (defaults to function name)
-        track_memory: Whether to track memory usage
+        track_memory: Whether to track memory usage (RSS is read on one
+            call out of ``Profiler.memory_sample_every``)
 
     Example:
         @profile("my_function")
@@ -126,51 +265,30 @@ def profile(name: str | None = None, track_memory: bool = False) -> Callable:
     def decorator(func: Callable) -> Callable:
         # Use simple function name by default for easier querying
         profile_name = name or func.__name__
+        calls = itertools.count()
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             if not Profiler.is_enabled():
                 return func(*args, **kwargs)
 
-            # Track memory if requested
+            # Track memory on a sample of calls (reading RSS is a syscall)
             memory_start = None
-            if track_memory:
-                try:
-                    import psutil
-
-                    process = psutil.Process()
-                    memory_start = process.memory_info().rss
-                except ImportError:
-                    pass
+            if track_memory and next(calls) % Profiler.memory_sample_every == 0:
+                memory_start = _current_rss()
 
             start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                end_time = time.perf_counter()
-                duration = end_time - start_time
-
-                memory_end = None
-                if track_memory and memory_start is not None:
-                    try:
-                        import psutil
-
-                        process = psutil.Process()
-                        memory_end = process.memory_info().rss
-                    except ImportError:
-                        pass
-
-                entry = ProfileEntry(
-                    name=profile_name,
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration=duration,
-                    memory_start=memory_start,
-                    memory_end=memory_end,
-                    metadata={"args_count": len(args), "kwargs_count": len(kwargs)},
-                )
-                Profiler.record(entry)
+                duration = time.perf_counter() - start_time
+
+                memory_delta = None
+                if memory_start is not None:
+                    memory_delta = _current_rss() - memory_start
+
+                Profiler.observe(profile_name, duration, memory_delta)
 
                 # Log slow operations
                 if duration > 1.0:  # > 1 second
@@ -188,7 +306,8 @@ def profile_async(name: str | None = None, track_memory: bool = False) -> Callab
 
     Args:
         name: Name for the profile entry (defaults to function name)
-        track_memory: Whether to track memory usage
+        track_memory: Whether to track memory usage (RSS is read on one
+            call out of ``Profiler.memory_sample_every``)
 
     Example:
         @profile_async("my_async_function")
@@ -199,51 +318,30 @@ def profile_async(name: str | None = None, track_memory: bool = False) -> Callab
     def decorator(func: Callable) -> Callable:
         # Use simple function name by default for easier querying
         profile_name = name or func.__name__
+        calls = itertools.count()
 
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             if not Profiler.is_enabled():
                 return await func(*args, **kwargs)
 
-            # Track memory if requested
+            # Track memory on a sample of calls (reading RSS is a syscall)
             memory_start = None
-            if track_memory:
-                try:
-                    import psutil
-
-                    process = psutil.Process()
-                    memory_start = process.memory_info().rss
-                except ImportError:
-                    pass
+            if track_memory and next(calls) % Profiler.memory_sample_every == 0:
+                memory_start = _current_rss()
 
             start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
                 return result
             finally:
-                end_time = time.perf_counter()
-                duration = end_time - start_time
-
-                memory_end = None
-                if track_memory and memory_start is not None:
-                    try:
-                        import psutil
-
-                        process = psutil.Process()
-                        memory_end = process.memory_info().rss
-                    except ImportError:
-                        pass
-
-                entry = ProfileEntry(
-                    name=profile_name,
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration=duration,
-                    memory_start=memory_start,
-                    memory_end=memory_end,
-                    metadata={"args_count": len(args), "kwargs_count": len(kwargs)},
-                )
-                Profiler.record(entry)
+                duration = time.perf_counter() - start_time
+
+                memory_delta = None
+                if memory_start is not None:
+                    memory_delta = _current_rss() - memory_start
+
+                Profiler.observe(profile_name, duration, memory_delta)
 
                 # Log slow operations
                 if duration > 1.0:  # > 1 second
@@ -0,0 +1,277 @@
+"""Statistical stack sampler for profiling running processes.
+
+A background thread snapshots the Python stacks of all other threads at a
+fixed interval (``sys._current_frames``) and counts identical stacks. The
+profiled code is not instrumented, so overhead is one snapshot per
+interval, and the sampler can be started and stopped at runtime (see the
+``/api/profiling/sampler`` endpoints and ``paracle observability profile``).
+
+Results export as collapsed stacks (``flamegraph.pl``, speedscope,
+inferno) or as a speedscope JSON document.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# (function, file, first line) of a sampled frame
+FrameKey = tuple[str, str, int]
+
+DEFAULT_INTERVAL = 0.01
+DEFAULT_MAX_STACKS = 10_000
+DEFAULT_MAX_DEPTH = 128
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class StackSampler:
+    """Thread-based sampling profiler with bounded memory.
+
+    Args:
+        interval: Seconds between samples
+        max_stacks: Maximum distinct stacks kept; samples of new stacks
+            beyond this are counted in ``dropped`` instead
+        max_depth: Frames kept per stack (innermost frames are kept)
+        include_threads: Prefix each stack with its thread name
+
+    Example:
+        >>> sampler = StackSampler(interval=0.005)
+        >>> sampler.start()
+        >>> run_workload()
+        >>> sampler.stop()
+        >>> Path("profile.folded").write_text(sampler.to_collapsed())
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        max_stacks: int = DEFAULT_MAX_STACKS,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        include_threads: bool = False,
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self.include_threads = include_threads
+
+        self._stacks: Counter[tuple[FrameKey, ...]] = Counter()
+        self._frames: dict[CodeType, FrameKey] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._samples = 0
+        self._dropped = 0
+        self._started_at: float | None = None
+        self._elapsed = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the sampler thread is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling. Does nothing if already running."""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name="paracle-stack-sampler", daemon=True
+        )
+        self._thread.start()
+        logger.info("Stack sampler started (interval=%.4fs)", self.interval)
+
+    def stop(self) -> None:
+        """Stop sampling. Collected samples are kept."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join()
+        self._thread = None
+        if self._started_at is not None:
+            self._elapsed += time.monotonic() - self._started_at
+            self._started_at = None
+        logger.info("Stack sampler stopped (%d samples)", self._samples)
+
+    def reset(self) -> None:
+        """Discard collected samples."""
+        with self._lock:
+            self._stacks.clear()
+            self._frames.clear()
+            self._samples = 0
+            self._dropped = 0
+            self._elapsed = 0.0
+            if self._started_at is not None:
+                self._started_at = time.monotonic()
+
+    def status(self) -> dict[str, Any]:
+        """Current sampler state and counters."""
+        elapsed = self._elapsed
+        if self._started_at is not None:
+            elapsed += time.monotonic() - self._started_at
+        return {
+            "running": self.is_running,
+            "interval": self.interval,
+            "samples": self._samples,
+            "distinct_stacks": len(self._stacks),
+            "dropped": self._dropped,
+            "elapsed_seconds": elapsed,
+        }
+
+    def sample(self) -> None:
+        """Take one snapshot of all other threads' stacks."""
+        own = threading.get_ident()
+        names = (
+            {t.ident: t.name for t in threading.enumerate()}
+            if self.include_threads
+            else {}
+        )
+        frames = sys._current_frames()
+        with self._lock:
+            for thread_id, frame in frames.items():
+                if thread_id == own:
+                    continue
+                stack = self._walk(frame)
+                if self.include_threads:
+                    name = names.get(thread_id, str(thread_id))
+                    stack = ((f"thread:{name}", "", 0), *stack)
+                if stack not in self._stacks and len(self._stacks) >= self.max_stacks:
+                    self._dropped += 1
+                    continue
+                self._stacks[stack] += 1
+            self._samples += 1
+
+    def stacks(self) -> dict[tuple[FrameKey, ...], int]:
+        """Sample counts per stack (root frame first)."""
+        with self._lock:
+            return dict(self._stacks)
+
+    def to_collapsed(self) -> str:
+        """Export in collapsed-stack format (``a;b;c count`` per line)."""
+        lines = []
+        for stack, count in sorted(self.stacks().items()):
+            names = ";".join(_frame_label(frame).replace(";", ":") for frame in stack)
+            lines.append(f"{names} {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self, name: str = "paracle") -> dict[str, Any]:
+        """Export as a speedscope ``sampled`` profile document."""
+        frame_index: dict[FrameKey, int] = {}
+        frames: list[dict[str, Any]] = []
+        samples: list[list[int]] = []
+        weights: list[float] = []
+
+        for stack, count in self.stacks().items():
+            indices = []
+            for frame in stack:
+                index = frame_index.get(frame)
+                if index is None:
+                    index = frame_index[frame] = len(frames)
+                    func, filename, line = frame
+                    entry: dict[str, Any] = {"name": func}
+                    if filename:
+                        entry.update(file=filename, line=line)
+                    frames.append(entry)
+                indices.append(index)
+            samples.append(indices)
+            weights.append(count * self.interval)
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "paracle_profiling",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:  # pragma: no cover - never kill the sampler
+                logger.exception("Stack sample failed")
+
+    def _walk(self, frame: FrameType | None) -> tuple[FrameKey, ...]:
+        stack: list[FrameKey] = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            key = self._frames.get(code)
+            if key is None:
+                key = self._frames[code] = (
+                    code.co_name,
+                    code.co_filename,
+                    code.co_firstlineno,
+                )
+            stack.append(key)
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
+
+
+def _frame_label(frame: FrameKey) -> str:
+    func, filename, line = frame
+    if not filename:
+        return func
+    return f"{func} ({filename}:{line})"
+
+
+_sampler: StackSampler | None = None
+_sampler_lock = threading.Lock()
+
+
+def get_sampler() -> StackSampler:
+    """Get the process-wide stack sampler."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = StackSampler()
+        return _sampler
+
+
+def start_sampling(interval: float | None = None, reset: bool = True) -> StackSampler:
+    """Start the process-wide stack sampler.
+
+    Args:
+        interval: Seconds between samples (keeps the current one if None)
+        reset: Discard samples from a previous session
+
+    Returns:
+        The running sampler
+    """
+    sampler = get_sampler()
+    if interval is not None and interval != sampler.interval:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        sampler.stop()
+        sampler.interval = interval
+    if reset and not sampler.is_running:
+        sampler.reset()
+    sampler.start()
+    return sampler
+
+
+def stop_sampling() -> StackSampler:
+    """Stop the process-wide stack sampler, keeping its samples."""
+    sampler = get_sampler()
+    sampler.stop()
+    return sampler
@@ -29,6 +29,7 @@ from paracle_providers.exceptions import (
     ProviderRateLimitError,
     ProviderTimeoutError,
 )
+from paracle_providers.middleware import ProviderMiddleware, SingleFlight
 from paracle_providers.openai_compatible import (
     OpenAICompatibleProvider,
     create_anyscale_provider,
@@ -71,6 +72,9 @@ __all__ = [
     "ProviderTimeoutError",
     # Registry
     "ProviderRegistry",
+    # Middleware
+    "ProviderMiddleware",
+    "SingleFlight",
     # Retry utilities
     "RetryConfig",
     "RetryResult",
@@ -104,19 +104,9 @@ class AnthropicProvider(LLMProvider, RetryableProvider):
         """Raw chat completion without retry wrapper."""
         try:
             # Separate system message from conversation
-            system_message = None
-            conversation_messages = []
-
-            for msg in messages:
-                if msg.role == "system":
-                    system_message = msg.content
-                else:
-                    conversation_messages.append(
-                        {
-                            "role": msg.role,
-                            "content": msg.content,
-                        }
-                    )
+            system_message, conversation_messages = self._split_messages(
+                messages, kwargs.pop("cache_breakpoints", None)
+            )
 
             # Build request parameters
             params = {
@@ -149,14 +139,21 @@ class AnthropicProvider(LLMProvider, RetryableProvider):
                     block.text for block in response.content if hasattr(block, "text")
                 )
 
+            # input_tokens only counts tokens after the last cache breakpoint
+            usage = response.usage
+            cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+            cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+            prompt_tokens = usage.input_tokens + cache_read + cache_write
+
             return LLMResponse(
                 content=content,
                 finish_reason=response.stop_reason,
                 usage=TokenUsage(
-                    prompt_tokens=response.usage.input_tokens,
-                    completion_tokens=response.usage.output_tokens,
-                    total_tokens=response.usage.input_tokens
-                    + response.usage.output_tokens,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=usage.output_tokens,
+                    total_tokens=prompt_tokens + usage.output_tokens,
+                    cached_tokens=cache_read,
+                    cache_write_tokens=cache_write,
                 ),
                 model=response.model,
                 metadata={
@@ -206,19 +203,9 @@ class AnthropicProvider(LLMProvider, RetryableProvider):
         """
         try:
             # Separate system message
-            system_message = None
-            conversation_messages = []
-
-            for msg in messages:
-                if msg.role == "system":
-                    system_message = msg.content
-                else:
-                    conversation_messages.append(
-                        {
-                            "role": msg.role,
-                            "content": msg.content,
-                        }
-                    )
+            system_message, conversation_messages = self._split_messages(
+                messages, kwargs.pop("cache_breakpoints", None)
+            )
 
             # Build request parameters
             params = {
@@ -260,6 +247,45 @@ class AnthropicProvider(LLMProvider, RetryableProvider):
                 str(e), provider="anthropic", model=model, original_error=e
             ) from e
 
+    @staticmethod
+    def _split_messages(
+        messages: list[ChatMessage],
+        cache_breakpoints: list[int] | None = None,
+    ) -> tuple[str | list[dict[str, Any]] | None, list[dict[str, Any]]]:
+        """Split messages into the system prompt and the conversation.
+
+        Messages whose index is in ``cache_breakpoints`` get a
+        ``cache_control`` marker, so Anthropic caches the prompt up to and
+        including them.
+
+        Args:
+            messages: Chat messages
+            cache_breakpoints: Indices of messages that end a cached prefix
+
+        Returns:
+            (system prompt, conversation messages)
+        """
+        breakpoints = set(cache_breakpoints or ())
+        system_message: str | list[dict[str, Any]] | None = None
+        conversation_messages: list[dict[str, Any]] = []
+
+        for index, msg in enumerate(messages):
+            content: str | list[dict[str, Any]] = msg.content
+            if index in breakpoints:
+                content = [
+                    {
+                        "type": "text",
+                        "text": msg.content,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            if msg.role == "system":
+                system_message = content
+            else:
+                conversation_messages.append({"role": msg.role, "content": content})
+
+        return system_message, conversation_messages
+
     def validate_config(self, config: dict[str, Any]) -> bool:
         """
         Validate Anthropic-specific configuration.
@@ -293,6 +319,11 @@ class AnthropicProvider(LLMProvider, RetryableProvider):
         """Return provider name."""
         return "anthropic"
 
+    @property
+    def supports_prompt_caching(self) -> bool:
+        """Anthropic caches prefixes marked with ``cache_control``."""
+        return True
+
     @property
     def supported_models(self) -> list[str]:
         """Return list of supported models."""
@@ -61,6 +61,12 @@ class TokenUsage(BaseModel):
     prompt_tokens: int = Field(default=0, ge=0)
     completion_tokens: int = Field(default=0, ge=0)
     total_tokens: int = Field(default=0, ge=0)
+    cached_tokens: int = Field(
+        default=0, ge=0, description="Prompt tokens read from the prompt cache"
+    )
+    cache_write_tokens: int = Field(
+        default=0, ge=0, description="Prompt tokens written to the prompt cache"
+    )
 
 
 class LLMResponse(BaseModel):
@@ -203,5 +209,14 @@ class LLMProvider(ABC):
         """Return list of supported model identifiers."""
         pass
 
+    @property
+    def supports_prompt_caching(self) -> bool:
+        """Whether stable prompt prefixes can be marked for caching.
+
+        Providers returning True accept a ``cache_breakpoints`` keyword
+        argument: indices of the messages that end a cacheable prefix.
+        """
+        return False
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(provider={self.provider_name})"
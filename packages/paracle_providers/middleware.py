@@ -0,0 +1,325 @@
+"""Provider middleware: prompt prefix caching and request deduplication.
+
+Agent calls usually share a long, stable prefix (system prompt, injected
+skills, earlier turns) and fan-out workflows often send the very same
+request several times at once. ``ProviderMiddleware`` wraps any provider
+and:
+
+- marks the stable prefix for provider-native prompt caching when the
+  provider supports it (``cache_breakpoints``, e.g. Anthropic
+  ``cache_control``); cached tokens are reported in ``TokenUsage``
+- single-flights identical in-flight greedy (``temperature == 0``)
+  requests: concurrent duplicates wait for one upstream call and get its
+  response with zero usage, so the call is only paid (and cost-tracked)
+  once. Sampled requests are independent draws and always go upstream.
+"""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from paracle_providers.base import (
+    ChatMessage,
+    LLMConfig,
+    LLMProvider,
+    LLMResponse,
+    StreamChunk,
+    TokenUsage,
+)
+
+# Prefixes shorter than this are below provider caching minimums
+# (about 1024 tokens for most models)
+DEFAULT_MIN_CACHE_PREFIX_CHARS = 4096
+
+
+def stable_prefix_breakpoints(
+    messages: list[ChatMessage],
+    min_prefix_chars: int = DEFAULT_MIN_CACHE_PREFIX_CHARS,
+) -> list[int]:
+    """Find the messages that end stable, cacheable prompt prefixes.
+
+    The last system message (system prompt plus injected skills) and the
+    message right before the final user turn (conversation history) are
+    stable across calls; everything after them changes per call.
+
+    Args:
+        messages: Chat messages
+        min_prefix_chars: Minimum prefix length worth caching
+
+    Returns:
+        Sorted message indices, empty if no prefix is long enough
+    """
+    last_user = max(
+        (i for i, m in enumerate(messages) if m.role == "user"), default=None
+    )
+    if last_user is None:
+        return []
+
+    candidates = {i for i in range(last_user) if messages[i].role == "system"}
+    if candidates:
+        candidates = {max(candidates)}
+    if last_user > 0:
+        candidates.add(last_user - 1)
+
+    breakpoints = []
+    for index in sorted(candidates):
+        if messages[index].role == "system":
+            # The provider sends the system prompt ahead of all messages
+            size = sum(len(m.content) for m in messages if m.role == "system")
+        else:
+            size = sum(len(m.content) for m in messages[: index + 1])
+        if size >= min_prefix_chars:
+            breakpoints.append(index)
+    return breakpoints
+
+
+def request_key(
+    provider: str,
+    model: str,
+    messages: list[ChatMessage],
+    config: LLMConfig,
+    kwargs: dict[str, Any],
+) -> str:
+    """Compute a key identifying identical requests.
+
+    Args:
+        provider: Provider name
+        model: Model identifier
+        messages: Chat messages
+        config: Generation parameters (the timeout is ignored)
+        kwargs: Extra provider parameters
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "provider": provider,
+        "model": model,
+        "messages": [m.model_dump(mode="json") for m in messages],
+        "config": config.model_dump(mode="json", exclude={"timeout"}),
+        "kwargs": kwargs,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key.
+
+    A group can be shared by several ``ProviderMiddleware`` instances (for
+    example one per step) so duplicates are merged across all of them.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future] = {}
+        self.shared = 0
+
+    async def do(
+        self, key: str, call: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """Run ``call`` unless an identical call is already in flight.
+
+        Cancelling one caller does not cancel the shared call.
+
+        Args:
+            key: Request key
+            call: Starts the upstream call
+
+        Returns:
+            (result, True if it was shared from another caller's call)
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+        if shared:
+            self.shared += 1
+        else:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task), shared
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the error as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+class ProviderMiddleware(LLMProvider):
+    """Provider wrapper adding prompt prefix caching and single-flight.
+
+    Example:
+        >>> group = SingleFlight()
+        >>> provider = ProviderMiddleware(
+        ...     ProviderRegistry.create_provider("anthropic"), single_flight=group
+        ... )
+        >>> response = await provider.chat_completion(messages, config, model)
+        >>> response.usage.cached_tokens
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        *,
+        prompt_caching: bool = True,
+        single_flight: SingleFlight | bool = True,
+        min_cache_prefix_chars: int = DEFAULT_MIN_CACHE_PREFIX_CHARS,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            provider: Provider to wrap
+            prompt_caching: Mark stable prefixes for provider caching
+            single_flight: Group used to merge duplicate greedy requests
+                (True for a private group, False to disable)
+            min_cache_prefix_chars: Minimum prefix length worth caching
+        """
+        super().__init__(api_key=getattr(provider, "api_key", None))
+        self.inner = provider
+        self.prompt_caching = prompt_caching
+        self.single_flight: SingleFlight | None
+        if isinstance(single_flight, SingleFlight):
+            self.single_flight = single_flight
+        else:
+            self.single_flight = SingleFlight() if single_flight else None
+        self.min_cache_prefix_chars = min_cache_prefix_chars
+        self._stats = {
+            "requests": 0,
+            "upstream_calls": 0,
+            "deduplicated": 0,
+            "cached_tokens": 0,
+            "cache_write_tokens": 0,
+        }
+
+    def _with_cache_breakpoints(
+        self, messages: list[ChatMessage], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Add cache breakpoints to the request parameters if supported."""
+        if (
+            not self.prompt_caching
+            or "cache_breakpoints" in kwargs
+            or not self.inner.supports_prompt_caching
+        ):
+            return kwargs
+        breakpoints = stable_prefix_breakpoints(messages, self.min_cache_prefix_chars)
+        if not breakpoints:
+            return kwargs
+        return {**kwargs, "cache_breakpoints": breakpoints}
+
+    async def _upstream(
+        self,
+        messages: list[ChatMessage],
+        config: LLMConfig,
+        model: str,
+        kwargs: dict[str, Any],
+    ) -> LLMResponse:
+        self._stats["upstream_calls"] += 1
+        response = await self.inner.chat_completion(
+            messages=messages, config=config, model=model, **kwargs
+        )
+        self._stats["cached_tokens"] += response.usage.cached_tokens
+        self._stats["cache_write_tokens"] += response.usage.cache_write_tokens
+        return response
+
+    async def chat_completion(
+        self,
+        messages: list[ChatMessage],
+        config: LLMConfig,
+        model: str,
+        **kwargs,
+    ) -> LLMResponse:
+        """Generate a chat completion through the wrapped provider.
+
+        Identical concurrent requests are merged only at temperature 0.
+        Responses shared from another caller's request report zero usage;
+        the upstream usage is kept in ``metadata["shared_usage"]``.
+
+        Args:
+            messages: List of chat messages
+            config: LLM configuration parameters
+            model: Model identifier
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            LLMResponse from the provider
+        """
+        self._stats["requests"] += 1
+        kwargs = self._with_cache_breakpoints(messages, kwargs)
+        if self.single_flight is None or config.temperature > 0:
+            return await self._upstream(messages, config, model, kwargs)
+
+        key = request_key(self.provider_name, model, messages, config, kwargs)
+        response, shared = await self.single_flight.do(
+            key, lambda: self._upstream(messages, config, model, kwargs)
+        )
+        if not shared:
+            return response
+
+        self._stats["deduplicated"] += 1
+        return response.model_copy(
+            update={
+                "usage": TokenUsage(),
+                "metadata": {
+                    **response.metadata,
+                    "deduplicated": True,
+                    "shared_usage": response.usage.model_dump(),
+                },
+            }
+        )
+
+    async def stream_chat_completion(
+        self,
+        messages: list[ChatMessage],
+        config: LLMConfig,
+        model: str,
+        **kwargs,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a chat completion (prompt caching only, no deduplication).
+
+        Args:
+            messages: List of chat messages
+            config: LLM configuration parameters
+            model: Model identifier
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            StreamChunk objects from the provider
+        """
+        kwargs = self._with_cache_breakpoints(messages, kwargs)
+        async for chunk in self.inner.stream_chat_completion(
+            messages=messages, config=config, model=model, **kwargs
+        ):
+            yield chunk
+
+    def validate_config(self, config: dict[str, Any]) -> bool:
+        """Validate configuration with the wrapped provider."""
+        return self.inner.validate_config(config)
+
+    @property
+    def provider_name(self) -> str:
+        """Return the wrapped provider's name."""
+        return self.inner.provider_name
+
+    @property
+    def supported_models(self) -> list[str]:
+        """Return the wrapped provider's models."""
+        return self.inner.supported_models
+
+    @property
+    def supports_prompt_caching(self) -> bool:
+        """Whether the wrapped provider supports prompt caching."""
+        return self.inner.supports_prompt_caching
+
+    def stats(self) -> dict[str, int]:
+        """Get request, deduplication and prompt cache counters.
+
+        Returns:
+            Dictionary of counters
+        """
+        return dict(self._stats)
@@ -157,6 +157,8 @@ class OpenAIProvider(LLMProvider, RetryableProvider):
             # Extract response
             choice = response.choices[0]
             usage = response.usage
+            # OpenAI caches long prompt prefixes automatically
+            details = getattr(usage, "prompt_tokens_details", None)
 
             return LLMResponse(
                 content=choice.message.content or "",
@@ -165,6 +167,7 @@ class OpenAIProvider(LLMProvider, RetryableProvider):
                     prompt_tokens=usage.prompt_tokens if usage else 0,
                     completion_tokens=usage.completion_tokens if usage else 0,
                     total_tokens=usage.total_tokens if usage else 0,
+                    cached_tokens=getattr(details, "cached_tokens", None) or 0,
                 ),
                 model=response.model,
                 tool_calls=(
@@ -6,6 +6,7 @@ filesystems, allowing automatic rollback on execution failures.
 Components:
 - RollbackManager: Manages snapshots and rollback operations
 - SnapshotStrategy: Different snapshot strategies
+- ChunkedSnapshotStrategy: Deduplicated, incremental snapshots
 - RollbackPolicy: Rollback trigger policies
 
 Example:
@@ -27,16 +28,25 @@ Example:
     ```
 """
 
+from paracle_rollback.chunkstore import ChunkStore
 from paracle_rollback.config import RollbackConfig, RollbackPolicy
 from paracle_rollback.exceptions import RollbackError, SnapshotError
 from paracle_rollback.manager import RollbackManager
-from paracle_rollback.snapshot import SnapshotStrategy, VolumeSnapshot
+from paracle_rollback.snapshot import (
+    ChunkedSnapshotStrategy,
+    SnapshotStrategy,
+    TarballSnapshotStrategy,
+    VolumeSnapshot,
+)
 
 __all__ = [
     "RollbackManager",
     "RollbackConfig",
     "RollbackPolicy",
     "SnapshotStrategy",
+    "ChunkedSnapshotStrategy",
+    "TarballSnapshotStrategy",
+    "ChunkStore",
     "VolumeSnapshot",
     "RollbackError",
     "SnapshotError",
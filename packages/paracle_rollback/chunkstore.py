@@ -0,0 +1,355 @@
+"""Content-addressed chunk store for snapshots.
+
+File contents are split into content-defined chunks, compressed and stored
+once under their SHA-256 digest. Snapshots only reference chunks, so data
+shared between snapshots (or between files) is stored a single time.
+Reference counts are kept in a small SQLite index so that deleting a
+snapshot can garbage-collect exactly the chunks nobody else uses, and
+storage totals are answered without walking the directory.
+
+Chunk boundaries are content-defined: a cut may only happen right after an
+anchor byte whose preceding window hashes to zero under a mask. Anchors are
+found by a C-level regex scan and windows are hashed with CRC32, which keeps
+chunking fast in pure Python while an insertion only disturbs the chunks
+around it.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+MIN_CHUNK_SIZE = 16 * 1024
+AVG_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 256 * 1024
+
+# Newline anchors text roughly once per line; the high bytes anchor binary
+# data about once every 50 bytes
+_ANCHOR = re.compile(rb"[\n\x1f\x8f\xa7\xd3\xe5]")
+_ANCHOR_SPACING = 48
+_WINDOW = 32
+
+_CODEC_RAW = b"R"
+_CODEC_ZLIB = b"D"
+_CODEC_ZSTD = b"Z"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    refs INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_unreferenced ON chunks(refs) WHERE refs <= 0;
+CREATE TABLE IF NOT EXISTS manifests (
+    snapshot_id TEXT PRIMARY KEY,
+    container_id TEXT NOT NULL,
+    path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_manifests_key
+    ON manifests(container_id, path, snapshot_id);
+"""
+
+
+def chunk_spans(
+    data: bytes | memoryview,
+    min_size: int = MIN_CHUNK_SIZE,
+    avg_size: int = AVG_CHUNK_SIZE,
+    max_size: int = MAX_CHUNK_SIZE,
+) -> Iterator[tuple[int, int]]:
+    """Split data into content-defined chunks.
+
+    Args:
+        data: Bytes to split
+        min_size: Minimum chunk size (data this small is one chunk)
+        avg_size: Target average chunk size
+        max_size: Maximum chunk size
+
+    Yields:
+        (start, end) offsets of consecutive chunks covering ``data``
+    """
+    size = len(data)
+    view = memoryview(data)
+    search = _ANCHOR.search
+    # Probability that an anchor is a cut point, as a power-of-two mask
+    mask = (
+        1 << max(0, ((avg_size - min_size) // _ANCHOR_SPACING).bit_length() - 1)
+    ) - 1
+
+    start = 0
+    while size - start > min_size:
+        limit = min(start + max_size, size)
+        cut = limit
+        pos = start + min_size
+        while match := search(data, pos, limit):
+            end = match.end()
+            if not zlib.crc32(view[end - _WINDOW : end]) & mask:
+                cut = end
+                break
+            pos = end
+        yield start, cut
+        start = cut
+    if start < size:
+        yield start, size
+
+
+class ChunkStore:
+    """Content-addressed, reference-counted, compressed chunk store.
+
+    Layout::
+
+        <root>/index.db            chunk sizes, reference counts and the
+                                   manifests that reference them
+        <root>/chunks/ab/abcd...   one file per chunk (codec byte + payload)
+
+    Chunks are written before their references are counted, so a crash
+    can leave unreferenced chunks (removed by ``collect_garbage``) but
+    never references to missing chunks.
+
+    Attributes:
+        root: Store directory
+    """
+
+    def __init__(self, root: Path, compress: bool = True, compression_level: int = 3):
+        """Initialize the chunk store.
+
+        Args:
+            root: Store directory (created if missing)
+            compress: Compress chunks (zstd, or zlib when zstandard is not
+                installed)
+            compression_level: zstd compression level
+        """
+        self.root = Path(root)
+        self.compress = compress
+        self._chunks_dir = self.root / "chunks"
+        self._chunks_dir.mkdir(parents=True, exist_ok=True)
+        self._level = compression_level
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.root / "index.db", check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def _path(self, digest: str) -> Path:
+        return self._chunks_dir / digest[:2] / digest
+
+    def _compress(self, data: bytes | memoryview) -> bytes:
+        if not self.compress:
+            return _CODEC_RAW + bytes(data)
+        if ZSTD_AVAILABLE:
+            codec, payload = (
+                _CODEC_ZSTD,
+                zstandard.ZstdCompressor(level=self._level).compress(data),
+            )
+        else:
+            codec, payload = _CODEC_ZLIB, zlib.compress(data, 1)
+        # Already-compressed data is kept as is
+        if len(payload) >= len(data):
+            return _CODEC_RAW + bytes(data)
+        return codec + payload
+
+    @staticmethod
+    def _decompress(blob: bytes) -> bytes:
+        codec, payload = blob[:1], blob[1:]
+        if codec == _CODEC_RAW:
+            return payload
+        if codec == _CODEC_ZLIB:
+            return zlib.decompress(payload)
+        if codec == _CODEC_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("Chunk is zstd-compressed but zstandard is missing")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        raise ValueError(f"Unknown chunk codec: {codec!r}")
+
+    def put(self, data: bytes | memoryview) -> tuple[str, int]:
+        """Store a chunk unless it already exists.
+
+        The chunk is not referenced until ``add_refs`` is called.
+
+        Args:
+            data: Chunk contents
+
+        Returns:
+            (digest, bytes newly written to disk)
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            known = self._db.execute(
+                "SELECT 1 FROM chunks WHERE digest = ?", (digest,)
+            ).fetchone()
+        if known:
+            return digest, 0
+
+        blob = self._compress(data)
+        path = self._path(digest)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f".{digest}.{os.getpid()}.{threading.get_ident()}")
+        tmp.write_bytes(blob)
+        os.replace(tmp, path)
+        with self._lock:
+            inserted = self._db.execute(
+                "INSERT OR IGNORE INTO chunks (digest, size, stored_size, refs) "
+                "VALUES (?, ?, ?, 0)",
+                (digest, len(data), len(blob)),
+            ).rowcount
+        return digest, len(blob) if inserted else 0
+
+    def put_file(self, data: bytes | memoryview) -> tuple[list[str], int]:
+        """Chunk and store a file's contents.
+
+        Args:
+            data: File contents
+
+        Returns:
+            (chunk digests in order, bytes newly written to disk)
+        """
+        digests = []
+        written = 0
+        view = memoryview(data)
+        for start, end in chunk_spans(view):
+            digest, stored = self.put(view[start:end])
+            digests.append(digest)
+            written += stored
+        return digests, written
+
+    def get(self, digest: str) -> bytes:
+        """Read a chunk.
+
+        Args:
+            digest: Chunk digest
+
+        Returns:
+            Chunk contents
+
+        Raises:
+            FileNotFoundError: If the chunk is missing
+        """
+        return self._decompress(self._path(digest).read_bytes())
+
+    def add_refs(self, digests: Iterable[str], delta: int = 1) -> None:
+        """Adjust reference counts.
+
+        Args:
+            digests: Referenced chunks (repeats count repeatedly)
+            delta: +1 to reference, -1 to release
+        """
+        counts: dict[str, int] = {}
+        for digest in digests:
+            counts[digest] = counts.get(digest, 0) + delta
+        if not counts:
+            return
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "UPDATE chunks SET refs = refs + ? WHERE digest = ?",
+                    [(count, digest) for digest, count in counts.items()],
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def collect_garbage(self) -> tuple[int, int]:
+        """Delete chunks that no snapshot references.
+
+        Returns:
+            (chunks deleted, stored bytes freed)
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT digest, stored_size FROM chunks WHERE refs <= 0"
+            ).fetchall()
+            if not rows:
+                return 0, 0
+            self._db.executemany(
+                "DELETE FROM chunks WHERE digest = ? AND refs <= 0",
+                [(digest,) for digest, _ in rows],
+            )
+        for digest, _ in rows:
+            try:
+                self._path(digest).unlink()
+            except FileNotFoundError:
+                pass
+        freed = sum(size for _, size in rows)
+        logger.debug(f"Collected {len(rows)} chunks ({freed} bytes)")
+        return len(rows), freed
+
+    def stats(self) -> dict[str, int]:
+        """Return chunk count, logical size and stored (compressed) size."""
+        with self._lock:
+            count, size, stored = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), "
+                "COALESCE(SUM(stored_size), 0) FROM chunks"
+            ).fetchone()
+        return {"chunks": count, "bytes": size, "stored_bytes": stored}
+
+    def refs(self, digest: str) -> int:
+        """Return the reference count of a chunk (0 if unknown)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT refs FROM chunks WHERE digest = ?", (digest,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def add_manifest(self, snapshot_id: str, container_id: str, path: str) -> None:
+        """Record a manifest under its (container, path) key.
+
+        Args:
+            snapshot_id: Snapshot ID (ULIDs sort by creation time)
+            container_id: Snapshotted container
+            path: Snapshotted path
+        """
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO manifests (snapshot_id, container_id, path) "
+                "VALUES (?, ?, ?)",
+                (snapshot_id, container_id, path),
+            )
+
+    def remove_manifest(self, snapshot_id: str) -> None:
+        """Forget a recorded manifest."""
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM manifests WHERE snapshot_id = ?", (snapshot_id,)
+            )
+
+    def latest_manifest(self, container_id: str, path: str) -> str | None:
+        """Return the newest recorded snapshot ID for (container, path)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT snapshot_id FROM manifests WHERE container_id = ? "
+                "AND path = ? ORDER BY snapshot_id DESC LIMIT 1",
+                (container_id, path),
+            ).fetchone()
+        return row[0] if row else None
+
+    def has_manifests(self) -> bool:
+        """Return whether any manifest is recorded."""
+        with self._lock:
+            return (
+                self._db.execute("SELECT 1 FROM manifests LIMIT 1").fetchone()
+                is not None
+            )
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            self._db.close()
@@ -53,6 +53,9 @@ class RollbackConfig(BaseModel):
 
     Attributes:
         policy: Rollback policy
+        snapshot_strategy: How snapshots are stored ("chunked" keeps
+            deduplicated, incremental chunk manifests; "tarball" keeps one
+            full archive per snapshot)
         snapshot_compression: Compress snapshots
         verify_after_restore: Verify filesystem after restore
         backup_before_rollback: Create backup before rollback
@@ -62,6 +65,10 @@ class RollbackConfig(BaseModel):
         default_factory=RollbackPolicy, description="Rollback policy"
     )
 
+    snapshot_strategy: Literal["chunked", "tarball"] = Field(
+        default="chunked", description="Snapshot storage strategy"
+    )
+
     snapshot_compression: bool = Field(
         default=True, description="Compress snapshots to save space"
     )
@@ -6,7 +6,11 @@ from pathlib import Path
 
 from paracle_rollback.config import RollbackConfig
 from paracle_rollback.exceptions import RollbackError, SnapshotNotFoundError
-from paracle_rollback.snapshot import TarballSnapshotStrategy, VolumeSnapshot
+from paracle_rollback.snapshot import (
+    ChunkedSnapshotStrategy,
+    TarballSnapshotStrategy,
+    VolumeSnapshot,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +39,13 @@ class RollbackManager:
         """
         self.config = config or RollbackConfig()
         self.snapshots: dict[str, VolumeSnapshot] = {}
-        self._strategy = TarballSnapshotStrategy(storage_dir)
+        self._strategy: ChunkedSnapshotStrategy | TarballSnapshotStrategy
+        if self.config.snapshot_strategy == "chunked":
+            self._strategy = ChunkedSnapshotStrategy(
+                storage_dir, compress=self.config.snapshot_compression
+            )
+        else:
+            self._strategy = TarballSnapshotStrategy(storage_dir)
         # sandbox_id -> snapshot_ids
         self._sandbox_snapshots: dict[str, list[str]] = {}
 
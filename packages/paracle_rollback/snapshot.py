@@ -1,15 +1,27 @@
 """Snapshot strategies for filesystem state capture."""
 
+import asyncio
+import io
+import json
 import logging
+import os
+import posixpath
+import tarfile
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol
 
 from paracle_core.ids import generate_ulid
 
 import docker
 from docker.errors import APIError
+from paracle_rollback.chunkstore import ChunkStore
 from paracle_rollback.exceptions import RestoreError, SnapshotError
 
 logger = logging.getLogger(__name__)
@@ -278,3 +290,546 @@ class TarballSnapshotStrategy:
         if self._client:
             self._client.close()
             self._client = None
+
+
+MANIFEST_VERSION = 2
+
+# Fetch changed files one by one up to this many; beyond, one full archive
+# is cheaper than many API round trips
+PER_FILE_FETCH_LIMIT = 32
+
+# find(1) output: type, size, mtime, ctime, inode, mode, link target,
+# relative path
+_LIST_FORMAT = "%y\\t%s\\t%T@\\t%C@\\t%i\\t%m\\t%l\\t%P\\0"
+
+# Files modified this close to their listing (or archive) may change again
+# within the same timestamp tick; they are re-read by the next snapshot
+RACY_WINDOW_NS = 1_000_000_000
+
+# Entry fields that must all match for a file to be reused unread
+_IDENTITY_KEYS = ("s", "mt", "m", "mn", "ct", "i")
+
+
+class _ChunkReader(io.RawIOBase):
+    """File-like view over an iterator of byte chunks (for tarfile)."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class ChunkedSnapshotStrategy:
+    """Incremental snapshot strategy backed by a content-addressed store.
+
+    Each snapshot is a JSON manifest listing every entry under the snapshot
+    path; regular files point to chunks in a shared ChunkStore. Creating a
+    snapshot compares the container's file listing (size, nanosecond
+    mtime and ctime, inode, mode) with the previous snapshot of the same
+    path and only fetches, chunks and stores files that changed, so
+    snapshot cost follows the amount of changed data. Files modified
+    within ``RACY_WINDOW_NS`` of a listing are re-read next time.
+    Manifests are self-contained, so any snapshot can be deleted
+    independently; chunk reference counts decide what is freed. The
+    chunk index records each manifest's (container, path) so the parent
+    of a new snapshot is found without reading other manifests.
+
+    Layout::
+
+        <storage_dir>/manifests/<snapshot_id>.json
+        <storage_dir>/chunks/...  and  <storage_dir>/index.db
+    """
+
+    def __init__(
+        self,
+        storage_dir: Path | None = None,
+        compress: bool = True,
+        restore_workers: int = 4,
+    ):
+        """Initialize chunked snapshot strategy.
+
+        Args:
+            storage_dir: Directory to store snapshots (default: ./snapshots)
+            compress: Compress stored chunks
+            restore_workers: Threads reading chunks in parallel on restore
+        """
+        self.storage_dir = storage_dir or Path("./snapshots")
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._manifests_dir = self.storage_dir / "manifests"
+        self._manifests_dir.mkdir(exist_ok=True)
+        self.store = ChunkStore(self.storage_dir, compress=compress)
+        self.restore_workers = restore_workers
+        self._client: docker.DockerClient | None = None
+        # Serializes snapshot writes with garbage collection
+        self._mutex = threading.Lock()
+        self._index_manifests()
+
+    def _get_client(self) -> docker.DockerClient:
+        """Get or create Docker client."""
+        if not self._client:
+            self._client = docker.from_env()
+        return self._client
+
+    def _manifest_path(self, snapshot_id: str) -> Path:
+        return self._manifests_dir / f"{snapshot_id}.json"
+
+    def load_manifest(self, snapshot_id: str) -> dict[str, Any]:
+        """Load a snapshot manifest.
+
+        Args:
+            snapshot_id: Snapshot ID
+
+        Returns:
+            Manifest dict with ``entries`` keyed by relative path
+        """
+        return json.loads(self._manifest_path(snapshot_id).read_text())
+
+    def _index_manifests(self) -> None:
+        """Record manifests written before the index tracked them."""
+        if self.store.has_manifests():
+            return
+        for file in self._manifests_dir.glob("*.json"):
+            try:
+                manifest = json.loads(file.read_text())
+            except (OSError, ValueError):
+                continue
+            self.store.add_manifest(
+                manifest["snapshot_id"], manifest["container_id"], manifest["path"]
+            )
+
+    def _parent_manifest(self, container_id: str, path: str) -> dict | None:
+        """Return the latest manifest for the same container path."""
+        snapshot_id = self.store.latest_manifest(container_id, path)
+        if snapshot_id is None:
+            return None
+        try:
+            return self.load_manifest(snapshot_id)
+        except (OSError, ValueError):
+            # Manifest lost outside of delete: snapshot from scratch
+            self.store.remove_manifest(snapshot_id)
+            return None
+
+    async def create_snapshot(
+        self,
+        container_id: str,
+        path: str = "/workspace",
+    ) -> VolumeSnapshot:
+        """Create an incremental snapshot of container path.
+
+        Args:
+            container_id: Container to snapshot
+            path: Path to snapshot
+
+        Returns:
+            VolumeSnapshot metadata (``size_bytes`` is the new data stored)
+
+        Raises:
+            SnapshotError: If snapshot creation fails
+        """
+        snapshot_id = generate_ulid()
+        try:
+            return await asyncio.to_thread(
+                self._create_snapshot, snapshot_id, container_id, path
+            )
+        except APIError as e:
+            raise SnapshotError(
+                f"Failed to create snapshot: {e}",
+                snapshot_id=snapshot_id,
+            ) from e
+        except Exception as e:
+            raise SnapshotError(
+                f"Snapshot creation failed: {e}",
+                snapshot_id=snapshot_id,
+            ) from e
+
+    def _create_snapshot(
+        self, snapshot_id: str, container_id: str, path: str
+    ) -> VolumeSnapshot:
+        """Create a snapshot (blocking)."""
+        container = self._get_client().containers.get(container_id)
+        timestamp = datetime.utcnow()
+        logger.info(f"Creating snapshot {snapshot_id} from {container_id}:{path}")
+
+        with self._mutex:
+            parent = self._parent_manifest(container_id, path)
+            previous = parent["entries"] if parent else {}
+            listing = self._list_files(container, path)
+
+            entries: dict[str, dict] = {}
+            written = 0
+            changed: list[str] = []
+            if parent is None or listing is None:
+                # First snapshot (or no usable find): ingest the full archive,
+                # still reusing files whose tar headers match
+                bits, _ = container.get_archive(path)
+                written += self._ingest(bits, _strip_root, previous, entries)
+                changed = list(entries)
+            else:
+                for rel, entry in listing.items():
+                    if entry["t"] != "f":
+                        entries[rel] = entry
+                    elif _same_file(previous.get(rel), entry):
+                        entries[rel] = previous[rel]
+                    else:
+                        changed.append(rel)
+                written += self._fetch_changed(container, path, changed, entries)
+
+            if listing is not None:
+                # Archived entries only have second mtimes: add the listing's
+                # identity (taken before the archive) for the next snapshot
+                for rel in changed:
+                    entry, listed = entries.get(rel), listing.get(rel)
+                    if entry and listed and entry["t"] == listed["t"] == "f":
+                        entry.update(mn=listed["mn"], ct=listed["ct"], i=listed["i"])
+                        if listed.get("r"):
+                            entry["r"] = 1
+
+            # Reference chunks before the manifest exists: a crash leaves
+            # garbage, never a manifest pointing at freed chunks
+            self.store.add_refs(_chunk_refs(entries))
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "snapshot_id": snapshot_id,
+                "container_id": container_id,
+                "path": path,
+                "parent": parent["snapshot_id"] if parent else None,
+                "created": timestamp.isoformat(),
+                "entries": entries,
+            }
+            manifest_path = self._manifest_path(snapshot_id)
+            tmp = manifest_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(manifest, separators=(",", ":")))
+            os.replace(tmp, manifest_path)
+            self.store.add_manifest(snapshot_id, container_id, path)
+
+        logical = sum(e.get("s", 0) for e in entries.values() if e["t"] == "f")
+        logger.info(
+            f"Snapshot {snapshot_id} created: {len(entries)} entries, "
+            f"{written / 1024 / 1024:.2f} MB new data"
+        )
+        return VolumeSnapshot(
+            snapshot_id=snapshot_id,
+            sandbox_id=container_id,
+            timestamp=timestamp,
+            size_bytes=written,
+            compressed=self.store.compress,
+            metadata={
+                "source_path": path,
+                "container_id": container_id,
+                "parent_snapshot": manifest["parent"] or "",
+                "files": str(sum(1 for e in entries.values() if e["t"] == "f")),
+                "changed_files": str(len(changed) if parent is not None else -1),
+                "logical_bytes": str(logical),
+            },
+            storage_path=manifest_path,
+        )
+
+    def _list_files(self, container, path: str) -> dict[str, dict] | None:
+        """List entries under path with find(1), or None if unsupported."""
+        racy_after = time.time_ns() - RACY_WINDOW_NS
+        try:
+            result = container.exec_run(
+                ["find", path, "-mindepth", "1", "-printf", _LIST_FORMAT]
+            )
+        except Exception as e:
+            logger.debug(f"Listing {path} failed, using full archive: {e}")
+            return None
+        if result.exit_code != 0:
+            return None
+
+        listing = {}
+        for record in result.output.decode("utf-8", errors="surrogateescape").split(
+            "\0"
+        ):
+            if not record:
+                continue
+            kind, size, mtime, ctime, inode, mode, link, rel = record.split("\t", 7)
+            mtime_ns = _stamp_ns(mtime)
+            entry = {"t": kind, "m": int(mode, 8), "mt": mtime_ns // 1_000_000_000}
+            if kind == "f":
+                entry.update(
+                    s=int(size), mn=mtime_ns, ct=_stamp_ns(ctime), i=int(inode)
+                )
+                if mtime_ns >= racy_after:
+                    entry["r"] = 1
+            elif kind == "l":
+                entry["l"] = link
+            elif kind != "d":
+                continue
+            listing[rel] = entry
+        return listing
+
+    def _fetch_changed(
+        self, container, path: str, changed: list[str], entries: dict[str, dict]
+    ) -> int:
+        """Fetch and store changed files; returns bytes written."""
+        if not changed:
+            return 0
+        if len(changed) > PER_FILE_FETCH_LIMIT:
+            wanted = set(changed)
+            bits, _ = container.get_archive(path)
+            return self._ingest(
+                bits, _strip_root, {}, entries, only=wanted, overwrite=True
+            )
+
+        written = 0
+        for rel in changed:
+            bits, _ = container.get_archive(posixpath.join(path, rel))
+            parent = posixpath.dirname(rel)
+            written += self._ingest(
+                bits,
+                lambda name, parent=parent: posixpath.join(parent, name),
+                {},
+                entries,
+                overwrite=True,
+            )
+        return written
+
+    def _ingest(
+        self,
+        bits: Iterable[bytes],
+        rel_name,
+        previous: dict[str, dict],
+        entries: dict[str, dict],
+        only: set[str] | None = None,
+        overwrite: bool = False,
+    ) -> int:
+        """Store the members of a tar stream; returns bytes written."""
+        racy_after = (time.time_ns() - RACY_WINDOW_NS) // 1_000_000_000
+        written = 0
+        with tarfile.open(fileobj=_ChunkReader(bits), mode="r|") as archive:
+            for member in archive:
+                rel = rel_name(member.name)
+                if not rel or (only is not None and rel not in only):
+                    continue
+                if rel in entries and not overwrite:
+                    continue
+                entry: dict[str, Any] = {
+                    "m": member.mode & 0o7777,
+                    "mt": int(member.mtime),
+                }
+                if member.isfile():
+                    entry.update(t="f", s=member.size)
+                    old = previous.get(rel)
+                    if _same_file(old, entry):
+                        entry = old
+                    else:
+                        data = archive.extractfile(member).read()
+                        entry["c"], stored = self.store.put_file(data)
+                        written += stored
+                        if entry["mt"] >= racy_after:
+                            entry["r"] = 1
+                elif member.isdir():
+                    entry["t"] = "d"
+                elif member.issym():
+                    entry.update(t="l", l=member.linkname)
+                else:
+                    continue
+                entries[rel] = entry
+        return written
+
+    async def restore_snapshot(
+        self,
+        snapshot: VolumeSnapshot,
+        container_id: str,
+        path: str = "/workspace",
+    ) -> None:
+        """Restore snapshot to container.
+
+        Chunks are read and decompressed in parallel while the archive is
+        assembled.
+
+        Args:
+            snapshot: Snapshot to restore
+            container_id: Target container
+            path: Path to restore to
+
+        Raises:
+            RestoreError: If restore fails
+        """
+        if not snapshot.storage_path.exists():
+            raise RestoreError(
+                f"Snapshot manifest not found: {snapshot.storage_path}",
+                snapshot.snapshot_id,
+            )
+        try:
+            await asyncio.to_thread(
+                self._restore_snapshot, snapshot, container_id, path
+            )
+        except APIError as e:
+            raise RestoreError(
+                f"Failed to restore snapshot: {e}",
+                snapshot.snapshot_id,
+            ) from e
+        except Exception as e:
+            raise RestoreError(
+                f"Restore failed: {e}",
+                snapshot.snapshot_id,
+            ) from e
+
+    def _restore_snapshot(
+        self, snapshot: VolumeSnapshot, container_id: str, path: str
+    ) -> None:
+        """Restore a snapshot (blocking)."""
+        container = self._get_client().containers.get(container_id)
+        logger.info(
+            f"Restoring snapshot {snapshot.snapshot_id} to {container_id}:{path}"
+        )
+        with self._mutex:
+            entries = self.load_manifest(snapshot.snapshot_id)["entries"]
+            with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buffer:
+                self.build_archive(entries, buffer)
+                buffer.seek(0)
+                container.put_archive(path, buffer)
+        logger.info(f"Snapshot {snapshot.snapshot_id} restored successfully")
+
+    def build_archive(self, entries: dict[str, dict], fileobj) -> None:
+        """Write manifest entries as a tar archive.
+
+        Args:
+            entries: Manifest entries keyed by relative path
+            fileobj: Binary file object to write the archive to
+        """
+        ordered = sorted(entries.items())
+        digests = [d for _, e in ordered if e["t"] == "f" for d in e.get("c", ())]
+        chunks = self._read_chunks(digests)
+        with tarfile.open(fileobj=fileobj, mode="w|") as archive:
+            for rel, entry in ordered:
+                info = tarfile.TarInfo(rel)
+                info.mode = entry["m"]
+                info.mtime = entry["mt"]
+                if entry["t"] == "d":
+                    info.type = tarfile.DIRTYPE
+                    archive.addfile(info)
+                elif entry["t"] == "l":
+                    info.type = tarfile.SYMTYPE
+                    info.linkname = entry["l"]
+                    archive.addfile(info)
+                else:
+                    info.size = entry["s"]
+                    # tarfile expects full reads: buffer the chunk reader
+                    data = io.BufferedReader(
+                        _ChunkReader(next(chunks) for _ in entry.get("c", ()))
+                    )
+                    archive.addfile(info, data)
+
+    def _read_chunks(self, digests: list[str]) -> Iterator[bytes]:
+        """Read chunks in order, prefetching with a thread pool."""
+        window = self.restore_workers * 4
+        with ThreadPoolExecutor(max_workers=self.restore_workers) as pool:
+            pending = [pool.submit(self.store.get, d) for d in digests[:window]]
+            submitted = len(pending)
+            while pending:
+                data = pending.pop(0).result()
+                if submitted < len(digests):
+                    pending.append(pool.submit(self.store.get, digests[submitted]))
+                    submitted += 1
+                yield data
+
+    async def delete_snapshot(self, snapshot: VolumeSnapshot) -> None:
+        """Delete snapshot manifest and free chunks no longer referenced.
+
+        Args:
+            snapshot: Snapshot to delete
+        """
+        try:
+            await asyncio.to_thread(self._delete_snapshots, [snapshot.snapshot_id])
+            logger.info(f"Deleted snapshot {snapshot.snapshot_id}")
+        except Exception as e:
+            logger.error(f"Failed to delete snapshot {snapshot.snapshot_id}: {e}")
+
+    def _delete_snapshots(self, snapshot_ids: list[str]) -> int:
+        """Delete manifests, release their chunks and collect garbage."""
+        deleted = 0
+        with self._mutex:
+            for snapshot_id in snapshot_ids:
+                path = self._manifest_path(snapshot_id)
+                try:
+                    manifest = json.loads(path.read_text())
+                except FileNotFoundError:
+                    logger.warning(f"Snapshot manifest not found: {path}")
+                    self.store.remove_manifest(snapshot_id)
+                    continue
+                self.store.remove_manifest(snapshot_id)
+                path.unlink()
+                self.store.add_refs(_chunk_refs(manifest["entries"]), delta=-1)
+                deleted += 1
+            self.store.collect_garbage()
+        return deleted
+
+    def get_total_size(self) -> int:
+        """Get total stored size of all snapshots.
+
+        Returns:
+            Total size in bytes (compressed chunks)
+        """
+        return self.store.stats()["stored_bytes"]
+
+    def cleanup_old_snapshots(self, max_age_hours: int) -> int:
+        """Clean up snapshots older than specified age.
+
+        Args:
+            max_age_hours: Maximum age in hours
+
+        Returns:
+            Number of snapshots deleted
+        """
+        cutoff = datetime.utcnow().timestamp() - (max_age_hours * 3600)
+        expired = [
+            file.stem
+            for file in self._manifests_dir.glob("*.json")
+            if file.stat().st_mtime < cutoff
+        ]
+        return self._delete_snapshots(expired) if expired else 0
+
+    def close(self) -> None:
+        """Close Docker client and chunk index."""
+        if self._client:
+            self._client.close()
+            self._client = None
+        self.store.close()
+
+
+def _strip_root(name: str) -> str:
+    """Map a member of ``get_archive(path)`` to its path relative to path."""
+    return name.partition("/")[2]
+
+
+def _stamp_ns(stamp: str) -> int:
+    """Parse a find(1) ``%T@`` timestamp to integer nanoseconds."""
+    seconds, _, fraction = stamp.partition(".")
+    return int(seconds) * 1_000_000_000 + int(fraction[:9].ljust(9, "0"))
+
+
+def _same_file(old: dict | None, new: dict) -> bool:
+    """Whether a stored file entry still matches the current file.
+
+    Every identity field of the new entry must match, so an entry without
+    the listing's nanosecond mtime, ctime and inode never vouches for a
+    listed file. Racy entries never match.
+    """
+    return (
+        old is not None
+        and old["t"] == "f"
+        and not old.get("r")
+        and all(old.get(key) == new.get(key) for key in _IDENTITY_KEYS if key in new)
+    )
+
+
+def _chunk_refs(entries: dict[str, dict]) -> Iterator[str]:
+    """Yield every chunk reference of a manifest."""
+    for entry in entries.values():
+        yield from entry.get("c", ())
@@ -24,8 +24,30 @@ from paracle_runs.exceptions import (
     RunSaveError,
     RunStorageError,
 )
-from paracle_runs.models import AgentRunMetadata, RunStatus, WorkflowRunMetadata
-from paracle_runs.replay import replay_agent_run, replay_workflow_run
+from paracle_runs.index import RunIndex
+from paracle_runs.models import (
+    AgentRunMetadata,
+    RunQuery,
+    RunStatus,
+    WorkflowRunMetadata,
+)
+from paracle_runs.recording import (
+    LLMCallRecord,
+    LLMRecording,
+    RecordingProviderRegistry,
+    ReplayProviderRegistry,
+    record_llm_calls,
+    request_hash,
+)
+from paracle_runs.replay import (
+    ReplayMode,
+    ReplayResult,
+    load_agent_run,
+    load_workflow_run,
+    record_agent_run,
+    replay_agent_run,
+    replay_workflow_run,
+)
 from paracle_runs.storage import RunStorage, get_run_storage, set_run_storage
 
 __version__ = "1.0.1"
@@ -44,11 +66,25 @@ __all__ = [
     "AgentRunMetadata",
     "WorkflowRunMetadata",
     "RunStatus",
+    "RunQuery",
     # Storage
+    "RunIndex",
     "RunStorage",
     "get_run_storage",
     "set_run_storage",
     # Replay
+    "load_agent_run",
+    "load_workflow_run",
+    "record_agent_run",
     "replay_agent_run",
     "replay_workflow_run",
+    "ReplayMode",
+    "ReplayResult",
+    # Recording
+    "LLMCallRecord",
+    "LLMRecording",
+    "RecordingProviderRegistry",
+    "ReplayProviderRegistry",
+    "record_llm_calls",
+    "request_hash",
 ]
@@ -0,0 +1,226 @@
+"""SQLite index over stored runs.
+
+The index holds one row per run with the columns needed for filtering
+(status, agent, workflow, start time, duration) plus the serialized
+metadata, so listing runs never touches the per-run payload files.
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from paracle_runs.exceptions import RunQueryError
+from paracle_runs.models import AgentRunMetadata, RunQuery, WorkflowRunMetadata
+
+RunMetadata = AgentRunMetadata | WorkflowRunMetadata
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    run_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    agent_id TEXT,
+    workflow_id TEXT,
+    started_at REAL NOT NULL,
+    completed_at REAL,
+    duration_seconds REAL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_type_started
+    ON runs(run_type, started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_type_status_started
+    ON runs(run_type, status, started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_agent_started
+    ON runs(agent_id, started_at DESC) WHERE agent_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_runs_workflow_started
+    ON runs(workflow_id, started_at DESC) WHERE workflow_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_runs_type_duration
+    ON runs(run_type, duration_seconds);
+"""
+
+
+def _ts(dt: datetime | None) -> float | None:
+    return dt.timestamp() if dt is not None else None
+
+
+class RunIndex:
+    """Indexed catalogue of agent and workflow runs."""
+
+    def __init__(self, db_path: Path):
+        """Open (and create if needed) the index database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = db_path
+        self.created = not db_path.exists()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def upsert(self, run_type: str, metadata: RunMetadata) -> None:
+        """Insert or replace the index row of a run.
+
+        Args:
+            run_type: 'agent' or 'workflow'
+            metadata: Run metadata
+        """
+        self.upsert_many(run_type, [metadata])
+
+    def upsert_many(self, run_type: str, items: list[RunMetadata]) -> None:
+        """Insert or replace several index rows in one transaction."""
+        rows = [self._row(run_type, metadata) for metadata in items]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO runs (run_id, run_type, status, "
+                    "agent_id, workflow_id, started_at, completed_at, "
+                    "duration_seconds, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def remove(self, run_id: str, run_type: str) -> bool:
+        """Remove a run from the index.
+
+        Returns:
+            True if a row was removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM runs WHERE run_id = ? AND run_type = ?",
+                (run_id, run_type),
+            )
+        return cursor.rowcount > 0
+
+    def contains(self, run_id: str, run_type: str) -> bool:
+        """Check whether a run is indexed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM runs WHERE run_id = ? AND run_type = ?",
+                (run_id, run_type),
+            ).fetchone()
+        return row is not None
+
+    def count(self, run_type: str | None = None) -> int:
+        """Count indexed runs, optionally of a single type."""
+        sql = "SELECT COUNT(*) FROM runs"
+        params: tuple[Any, ...] = ()
+        if run_type:
+            sql += " WHERE run_type = ?"
+            params = (run_type,)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def query(
+        self,
+        run_type: str,
+        query: RunQuery,
+        limit: int | None = -1,
+    ) -> list[dict[str, Any]]:
+        """Return metadata dicts matching a query, newest first.
+
+        Args:
+            run_type: 'agent' or 'workflow'
+            query: Filters, limit and offset
+            limit: Override for ``query.limit`` (None = unlimited)
+
+        Returns:
+            Serialized metadata of matching runs
+        """
+        return [
+            json.loads(raw) for raw in self._select("metadata", run_type, query, limit)
+        ]
+
+    def query_ids(
+        self,
+        run_type: str,
+        query: RunQuery,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Return run IDs matching a query, newest first."""
+        return list(self._select("run_id", run_type, query, limit))
+
+    def clear(self) -> None:
+        """Drop every row (used before a rebuild)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM runs")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _select(
+        self,
+        column: str,
+        run_type: str,
+        query: RunQuery,
+        limit: int | None,
+    ) -> Iterator[Any]:
+        clauses = ["run_type = ?"]
+        params: list[Any] = [run_type]
+
+        if query.agent_id and run_type == "agent":
+            clauses.append("agent_id = ?")
+            params.append(query.agent_id)
+        if query.workflow_id and run_type == "workflow":
+            clauses.append("workflow_id = ?")
+            params.append(query.workflow_id)
+        if query.status:
+            clauses.append("status = ?")
+            params.append(query.status.value)
+        if query.since:
+            clauses.append("started_at >= ?")
+            params.append(_ts(query.since))
+        if query.until:
+            clauses.append("started_at <= ?")
+            params.append(_ts(query.until))
+        if query.min_duration_seconds is not None:
+            clauses.append("duration_seconds >= ?")
+            params.append(query.min_duration_seconds)
+        if query.max_duration_seconds is not None:
+            clauses.append("duration_seconds <= ?")
+            params.append(query.max_duration_seconds)
+
+        if limit == -1:
+            limit = query.limit
+        # Column and clauses are fixed strings; every value is a parameter
+        sql = (
+            f"SELECT {column} FROM runs WHERE {' AND '.join(clauses)} "  # nosec B608
+            "ORDER BY started_at DESC, run_id DESC LIMIT ? OFFSET ?"
+        )
+        params.extend([limit if limit is not None else -1, query.offset])
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise RunQueryError(str(e), query.model_dump_json()) from e
+        return (row[0] for row in rows)
+
+    @staticmethod
+    def _row(run_type: str, metadata: RunMetadata) -> tuple[Any, ...]:
+        return (
+            metadata.run_id,
+            run_type,
+            metadata.status.value,
+            getattr(metadata, "agent_id", None),
+            getattr(metadata, "workflow_id", None),
+            _ts(metadata.started_at),
+            _ts(metadata.completed_at),
+            metadata.duration_seconds,
+            metadata.model_dump_json(),
+        )
@@ -96,5 +96,7 @@ class RunQuery(BaseModel):
     status: RunStatus | None = None
     since: datetime | None = None
     until: datetime | None = None
+    min_duration_seconds: float | None = None
+    max_duration_seconds: float | None = None
     limit: int = 20
     offset: int = 0
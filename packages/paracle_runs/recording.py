@@ -0,0 +1,362 @@
+"""Recording and replay of LLM calls.
+
+During a normal run, ``RecordingProvider`` captures every chat completion,
+streamed or not (request hash, request and response), into the
+``LLMRecording`` that is active in the current context. The recording is
+stored in the run trace under ``llm_calls``: ``WorkflowEngine`` does this
+for workflow runs and ``record_agent_run`` for single agent runs.
+
+During replay, ``RecordedProvider`` answers each call from the recording by
+request hash instead of calling the network:
+
+- ``recorded`` mode: every call must be in the recording; misses are
+  reported and answered with an error
+- ``hybrid`` mode: misses (e.g. a step whose prompt was edited) go to the
+  live provider, everything else is served from the recording
+"""
+
+import hashlib
+import json
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from paracle_providers.base import (
+    ChatMessage,
+    LLMConfig,
+    LLMProvider,
+    LLMResponse,
+    StreamChunk,
+    TokenUsage,
+)
+from pydantic import BaseModel, Field
+
+from paracle_runs.exceptions import ReplayError
+
+# Config fields that change what the model produces (timeout does not)
+_HASHED_CONFIG_FIELDS = (
+    "temperature",
+    "max_tokens",
+    "top_p",
+    "frequency_penalty",
+    "presence_penalty",
+    "stop_sequences",
+)
+
+
+def request_hash(
+    provider: str,
+    model: str,
+    messages: list[ChatMessage],
+    config: LLMConfig,
+) -> str:
+    """Compute a stable hash of an LLM request.
+
+    Args:
+        provider: Provider name
+        model: Model identifier
+        messages: Chat messages
+        config: Generation parameters
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "provider": provider,
+        "model": model,
+        "messages": [m.model_dump(mode="json", exclude_none=True) for m in messages],
+        "config": {f: getattr(config, f) for f in _HASHED_CONFIG_FIELDS},
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMCallRecord(BaseModel):
+    """A single recorded chat completion."""
+
+    request_hash: str
+    provider: str
+    model: str
+    messages: list[dict[str, Any]]
+    config: dict[str, Any] = Field(default_factory=dict)
+    response: dict[str, Any]
+
+
+class LLMRecording:
+    """Ordered collection of recorded LLM calls, looked up by request hash.
+
+    Identical requests made several times are served back in the order they
+    were recorded (and the last one is reused once they run out).
+    """
+
+    def __init__(self, calls: list[LLMCallRecord] | None = None):
+        self.calls: list[LLMCallRecord] = []
+        self._by_hash: dict[str, deque[LLMCallRecord]] = defaultdict(deque)
+        self._last: dict[str, LLMCallRecord] = {}
+        for call in calls or []:
+            self.add(call)
+
+    def add(self, call: LLMCallRecord) -> None:
+        """Append a call to the recording."""
+        self.calls.append(call)
+        self._by_hash[call.request_hash].append(call)
+        self._last[call.request_hash] = call
+
+    def lookup(self, digest: str) -> LLMCallRecord | None:
+        """Return the next recorded call for a request hash, if any."""
+        queue = self._by_hash.get(digest)
+        if queue:
+            return queue.popleft()
+        return self._last.get(digest)
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Serialize for storage in a run trace."""
+        return [call.model_dump(mode="json") for call in self.calls]
+
+    @classmethod
+    def from_trace(cls, trace: dict[str, Any] | None) -> "LLMRecording":
+        """Load the recording stored in a run trace."""
+        calls = (trace or {}).get("llm_calls", [])
+        return cls([LLMCallRecord(**call) for call in calls])
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+
+_active_recording: ContextVar[LLMRecording | None] = ContextVar(
+    "paracle_active_llm_recording", default=None
+)
+
+
+@contextmanager
+def record_llm_calls() -> Iterator[LLMRecording]:
+    """Capture LLM calls made through ``RecordingProvider`` in this context.
+
+    Example:
+        >>> with record_llm_calls() as recording:
+        ...     await orchestrator.execute(workflow, inputs)
+        >>> trace = {"llm_calls": recording.to_list()}
+    """
+    recording = LLMRecording()
+    token = _active_recording.set(recording)
+    try:
+        yield recording
+    finally:
+        _active_recording.reset(token)
+
+
+class _ProviderWrapper(LLMProvider):
+    """Base for providers that delegate to another provider."""
+
+    def __init__(self, name: str):
+        super().__init__()
+        self._name = name
+
+    def validate_config(self, config: dict[str, Any]) -> bool:
+        return True
+
+    @property
+    def provider_name(self) -> str:
+        return self._name
+
+    @property
+    def supported_models(self) -> list[str]:
+        return []
+
+
+class RecordingProvider(_ProviderWrapper):
+    """Provider wrapper that records calls into the active recording."""
+
+    def __init__(self, inner: LLMProvider, name: str):
+        super().__init__(name)
+        self.inner = inner
+
+    @property
+    def supports_prompt_caching(self) -> bool:
+        return self.inner.supports_prompt_caching
+
+    def _record(
+        self,
+        messages: list[ChatMessage],
+        config: LLMConfig,
+        model: str,
+        response: LLMResponse,
+    ) -> None:
+        recording = _active_recording.get()
+        if recording is None:
+            return
+        recording.add(
+            LLMCallRecord(
+                request_hash=request_hash(self._name, model, messages, config),
+                provider=self._name,
+                model=model,
+                messages=[m.model_dump(mode="json") for m in messages],
+                config=config.model_dump(mode="json"),
+                response=response.model_dump(mode="json"),
+            )
+        )
+
+    async def chat_completion(
+        self,
+        messages: list[ChatMessage],
+        config: LLMConfig,
+        model: str,
+        **kwargs,
+    ) -> LLMResponse:
+        response = await self.inner.chat_completion(
+            messages=messages, config=config, model=model, **kwargs
+        )
+        self._record(messages, config, model, response)
+        return response
+
+    async def stream_chat_completion(
+        self,
+        messages: list[ChatMessage],
+        config: LLMConfig,
+        model: str,
+        **kwargs,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream from the inner provider and record the assembled response.
+
+        Only streams that finish are recorded; a replay serves them back as
+        a single chunk.
+        """
+        content: list[str] = []
+        tool_calls: list[dict[str, Any]] = []
+        finish_reason = None
+        async for chunk in self.inner.stream_chat_completion(
+            messages=messages, config=config, model=model, **kwargs
+        ):
+            content.append(chunk.content)
+            tool_calls.extend(chunk.tool_calls or [])
+            finish_reason = chunk.finish_reason or finish_reason
+            yield chunk
+
+        self._record(
+            messages,
+            config,
+            model,
+            LLMResponse(
+                content="".join(content),
+                finish_reason=finish_reason,
+                model=model,
+                tool_calls=tool_calls or None,
+                metadata={"streamed": True},
+            ),
+        )
+
+
+class RecordedProvider(_ProviderWrapper):
+    """Provider that serves chat completions from a recording.
+
+    Recorded responses are returned with zero token usage (they cost
+    nothing); the original usage is kept in ``metadata["recorded_usage"]``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        recording: LLMRecording,
+        stats: "ReplayStats",
+        live: LLMProvider | None = None,
+    ):
+        super().__init__(name)
+        self.recording = recording
+        self.stats = stats
+        self.live = live
+
+    @property
+    def supports_prompt_caching(self) -> bool:
+        return self.live is not None and self.live.supports_prompt_caching
+
+    async def chat_completion(
+        self,
+        messages: list[ChatMessage],
+        config: LLMConfig,
+        model: str,
+        **kwargs,
+    ) -> LLMResponse:
+        digest = request_hash(self._name, model, messages, config)
+        call = self.recording.lookup(digest)
+        if call is not None:
+            self.stats.recorded_hits += 1
+            data = dict(call.response)
+            data["metadata"] = {
+                **data.get("metadata", {}),
+                "replayed": True,
+                "recorded_usage": data.get("usage", {}),
+            }
+            data["usage"] = TokenUsage().model_dump()
+            return LLMResponse(**data)
+
+        if self.live is None:
+            self.stats.misses.append(digest)
+            raise ReplayError(
+                "<llm-call>",
+                f"no recorded response for {self._name}/{model} request {digest[:12]}",
+            )
+
+        self.stats.live_calls += 1
+        return await self.live.chat_completion(
+            messages=messages, config=config, model=model, **kwargs
+        )
+
+    async def stream_chat_completion(
+        self,
+        messages: list[ChatMessage],
+        config: LLMConfig,
+        model: str,
+        **kwargs,
+    ) -> AsyncIterator[StreamChunk]:
+        response = await self.chat_completion(messages, config, model, **kwargs)
+        yield StreamChunk(
+            content=response.content,
+            finish_reason=response.finish_reason,
+            tool_calls=response.tool_calls,
+        )
+
+
+class ReplayStats(BaseModel):
+    """Counters collected while replaying a run."""
+
+    recorded_hits: int = 0
+    live_calls: int = 0
+    misses: list[str] = Field(default_factory=list)
+
+
+class RecordingProviderRegistry:
+    """Provider registry facade that wraps providers in RecordingProvider."""
+
+    def __init__(self, inner: Any):
+        """Initialize the facade.
+
+        Args:
+            inner: Registry exposing ``create_provider(name, **kwargs)``
+        """
+        self.inner = inner
+
+    def create_provider(self, name: str, **kwargs: Any) -> LLMProvider:
+        return RecordingProvider(self.inner.create_provider(name, **kwargs), name)
+
+
+class ReplayProviderRegistry:
+    """Provider registry facade that serves calls from a recording.
+
+    Args:
+        recording: Recorded LLM calls of the original run
+        live_registry: Registry used for calls missing from the recording
+            (hybrid mode). None means strict recorded mode.
+    """
+
+    def __init__(self, recording: LLMRecording, live_registry: Any | None = None):
+        self.recording = recording
+        self.live_registry = live_registry
+        self.stats = ReplayStats()
+
+    def create_provider(self, name: str, **kwargs: Any) -> LLMProvider:
+        live = None
+        if self.live_registry is not None:
+            live = self.live_registry.create_provider(name, **kwargs)
+        return RecordedProvider(name, self.recording, self.stats, live=live)
@@ -1,64 +1,362 @@
-"""Run replay functionality."""
+"""Run replay functionality.
 
+``replay_workflow_run`` and ``replay_agent_run`` re-execute a stored run,
+serving LLM calls from the recorded trace (``ReplayMode.RECORDED``),
+calling live models only for requests that are not in the recording
+(``ReplayMode.HYBRID``), or calling live models for everything
+(``ReplayMode.LIVE``).
+
+Runs are recorded by ``WorkflowEngine`` (workflow runs) and
+``record_agent_run`` (single agent runs). ``load_workflow_run`` and
+``load_agent_run`` return the stored data without executing anything.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
 from typing import Any
 
-from paracle_runs.models import AgentRunMetadata, WorkflowRunMetadata
+from paracle_core.ids import generate_ulid
+
+from paracle_runs.exceptions import ReplayError
+from paracle_runs.models import AgentRunMetadata, RunStatus, WorkflowRunMetadata
+from paracle_runs.recording import (
+    LLMRecording,
+    RecordingProviderRegistry,
+    ReplayProviderRegistry,
+    record_llm_calls,
+)
 from paracle_runs.storage import get_run_storage
 
+logger = logging.getLogger(__name__)
+
 
-def replay_agent_run(
+def load_agent_run(
     run_id: str,
 ) -> tuple[AgentRunMetadata, dict[str, Any]]:
-    """Replay an agent run with the same inputs.
+    """Load the stored data of an agent run.
 
     Args:
-        run_id: Run ID to replay
+        run_id: Run ID
 
     Returns:
         Tuple of (metadata, run_data) containing all run information
 
     Raises:
         FileNotFoundError: If run not found
+    """
+    return get_run_storage().load_agent_run(run_id)
+
+
+def load_workflow_run(
+    run_id: str,
+) -> tuple[WorkflowRunMetadata, dict[str, Any]]:
+    """Load the stored data of a workflow run.
+
+    Args:
+        run_id: Run ID
+
+    Returns:
+        Tuple of (metadata, run_data) containing all run information
 
-    Note:
-        Full replay (re-executing the agent) requires integration
-        with agent execution system. This function currently just
-        loads and returns the original run data.
+    Raises:
+        FileNotFoundError: If run not found
     """
-    storage = get_run_storage()
-    metadata, run_data = storage.load_agent_run(run_id)
+    return get_run_storage().load_workflow_run(run_id)
+
+
+class ReplayMode(str, Enum):
+    """How LLM calls are answered when re-executing a run."""
+
+    RECORDED = "recorded"  # Only from the recording; misses fail the step
+    HYBRID = "hybrid"  # From the recording, live for changed requests
+    LIVE = "live"  # Always call live models
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of re-executing a stored run."""
 
-    # TODO: Execute agent with run_data["input"]
-    # This would require integrating with agent execution system
-    # For now, return the original run data
+    run_id: str
+    mode: ReplayMode
+    status: str
+    outputs: dict[str, Any]
+    step_results: dict[str, Any]
+    recorded_calls: int = 0
+    live_calls: int = 0
+    misses: list[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    error: str | None = None
+    context: Any = None
+    metadata: Any = None
+    original: dict[str, Any] = field(default_factory=dict)
 
-    return metadata, run_data
+    @property
+    def deterministic(self) -> bool:
+        """Whether every LLM call was served from the recording."""
+        return self.live_calls == 0 and not self.misses
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "run_id": self.run_id,
+            "mode": self.mode.value,
+            "status": self.status,
+            "outputs": self.outputs,
+            "recorded_calls": self.recorded_calls,
+            "live_calls": self.live_calls,
+            "misses": self.misses,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "error": self.error,
+        }
 
-def replay_workflow_run(
+
+def _replay_registry(
+    recording: LLMRecording,
+    mode: ReplayMode,
+    live_registry: Any | None,
+) -> Any:
+    if live_registry is None and mode != ReplayMode.RECORDED:
+        from paracle_providers.registry import ProviderRegistry
+
+        live_registry = ProviderRegistry()
+    if mode == ReplayMode.LIVE:
+        return live_registry
+    return ReplayProviderRegistry(
+        recording, live_registry if mode == ReplayMode.HYBRID else None
+    )
+
+
+async def replay_workflow_run(
     run_id: str,
-) -> tuple[WorkflowRunMetadata, dict[str, Any]]:
-    """Replay a workflow run with the same inputs.
+    mode: ReplayMode | str = ReplayMode.RECORDED,
+    workflow: Any | None = None,
+    inputs: dict[str, Any] | None = None,
+    parac_root: Path | None = None,
+    live_registry: Any | None = None,
+    timeout_seconds: float | None = None,
+) -> ReplayResult:
+    """Re-execute a stored workflow run through the orchestrator.
 
     Args:
         run_id: Run ID to replay
+        mode: How LLM calls are answered (see ``ReplayMode``)
+        workflow: Workflow to execute (defaults to the recorded spec, pass an
+            edited workflow to replay it against the recorded responses)
+        inputs: Workflow inputs (defaults to the recorded inputs)
+        parac_root: ``.parac/`` directory used to resolve agents
+        live_registry: Provider registry for live calls (hybrid/live modes)
+        timeout_seconds: Optional execution timeout
 
     Returns:
-        Tuple of (metadata, run_data) containing all run information
+        ReplayResult with the new outputs and call statistics
+
+    Raises:
+        FileNotFoundError: If run not found
+        ReplayError: If the run has no recorded workflow spec and none is given
+    """
+    from paracle_domain.models import Workflow, WorkflowSpec
+    from paracle_events import EventBus
+    from paracle_orchestration.agent_executor import AgentExecutor
+    from paracle_orchestration.engine import WorkflowOrchestrator
+
+    mode = ReplayMode(mode)
+    metadata, run_data = load_workflow_run(run_id)
+    trace = run_data.get("trace") or {}
+
+    if workflow is None:
+        spec = trace.get("workflow_spec")
+        if spec is None:
+            raise ReplayError(run_id, "run has no recorded workflow spec")
+        workflow = Workflow(id=metadata.workflow_id, spec=WorkflowSpec(**spec))
+
+    recording = LLMRecording.from_trace(trace)
+    registry = _replay_registry(recording, mode, live_registry)
+    executor = AgentExecutor(parac_root=parac_root, provider_registry=registry)
+    orchestrator = WorkflowOrchestrator(
+        event_bus=EventBus(), step_executor=executor.execute_step
+    )
+
+    start = time.perf_counter()
+    context = await orchestrator.execute(
+        workflow,
+        inputs if inputs is not None else run_data.get("inputs", {}),
+        timeout_seconds=timeout_seconds,
+        auto_approve=True,
+    )
+    stats = getattr(registry, "stats", None)
+    return ReplayResult(
+        run_id=run_id,
+        mode=mode,
+        status=context.status.value,
+        outputs=context.outputs,
+        step_results=context.step_results,
+        recorded_calls=stats.recorded_hits if stats else 0,
+        live_calls=stats.live_calls if stats else 0,
+        misses=list(stats.misses) if stats else [],
+        duration_seconds=time.perf_counter() - start,
+        error="; ".join(context.errors) or None,
+        context=context,
+        metadata=metadata,
+        original=run_data,
+    )
+
+
+async def replay_agent_run(
+    run_id: str,
+    mode: ReplayMode | str = ReplayMode.RECORDED,
+    prompt: str | None = None,
+    parac_root: Path | None = None,
+    live_registry: Any | None = None,
+) -> ReplayResult:
+    """Re-execute a stored agent run as a single-step execution.
+
+    Runs recorded by ``record_agent_run`` are replayed with their exact
+    step and inputs; older runs are rebuilt from the metadata and
+    ``input["prompt"]``.
+
+    Args:
+        run_id: Run ID to replay
+        mode: How LLM calls are answered (see ``ReplayMode``)
+        prompt: Prompt override (defaults to the recorded prompt)
+        parac_root: ``.parac/`` directory used to resolve the agent
+        live_registry: Provider registry for live calls (hybrid/live modes)
+
+    Returns:
+        ReplayResult with the new output and call statistics
 
     Raises:
         FileNotFoundError: If run not found
+        ReplayError: If the run has no prompt and none is given
+    """
+    from paracle_domain.models import WorkflowStep
+    from paracle_orchestration.agent_executor import AgentExecutor
+
+    mode = ReplayMode(mode)
+    metadata, run_data = load_agent_run(run_id)
+    trace = run_data.get("trace") or {}
+    input_data = run_data.get("input") or {}
+
+    if trace.get("step"):
+        step = WorkflowStep(**trace["step"])
+        if prompt is not None:
+            step = step.model_copy(update={"prompt": prompt})
+        step_inputs = trace.get("inputs", {})
+    else:
+        prompt = prompt if prompt is not None else input_data.get("prompt")
+        if prompt is None:
+            raise ReplayError(run_id, "run input has no prompt")
+
+        config: dict[str, Any] = {}
+        if metadata.provider:
+            config["provider"] = metadata.provider
+        if metadata.model:
+            config["model"] = metadata.model
+        if metadata.temperature is not None:
+            config["temperature"] = metadata.temperature
+        step = WorkflowStep(
+            id="replay",
+            name=metadata.agent_name,
+            agent=metadata.agent_id,
+            prompt=prompt,
+            outputs={"result": {}},
+            config=config,
+        )
+        step_inputs = input_data.get("inputs", {})
+
+    recording = LLMRecording.from_trace(trace)
+    registry = _replay_registry(recording, mode, live_registry)
+    executor = AgentExecutor(parac_root=parac_root, provider_registry=registry)
+
+    start = time.perf_counter()
+    result = await executor.execute_step(step, step_inputs)
+    stats = getattr(registry, "stats", None)
+    return ReplayResult(
+        run_id=run_id,
+        mode=mode,
+        status=result.get("status", "failed"),
+        outputs=result.get("outputs", {}),
+        step_results={step.id: result},
+        recorded_calls=stats.recorded_hits if stats else 0,
+        live_calls=stats.live_calls if stats else 0,
+        misses=list(stats.misses) if stats else [],
+        duration_seconds=time.perf_counter() - start,
+        error=result.get("error"),
+        metadata=metadata,
+        original=run_data,
+    )
 
-    Note:
-        Full replay (re-executing the workflow) requires integration
-        with workflow execution system. This function currently just
-        loads and returns the original run data.
+
+async def record_agent_run(
+    executor: Any,
+    step: Any,
+    inputs: dict[str, Any],
+) -> dict[str, Any]:
+    """Execute a single agent step and store it as a replayable agent run.
+
+    The executor's provider registry is wrapped so every LLM call is
+    recorded; the step, its inputs and the calls are stored in the run
+    trace. Storage failures are logged and do not fail the execution.
+
+    Args:
+        executor: ``AgentExecutor`` (or any object with ``provider_registry``
+            and ``execute_step(step, inputs)``)
+        step: ``WorkflowStep`` to execute
+        inputs: Step inputs
+
+    Returns:
+        Step result, with the stored run ID under ``run_id``
     """
-    storage = get_run_storage()
-    metadata, run_data = storage.load_workflow_run(run_id)
+    if not isinstance(executor.provider_registry, RecordingProviderRegistry):
+        executor.provider_registry = RecordingProviderRegistry(
+            executor.provider_registry
+        )
+
+    started_at = datetime.now()
+    start = time.perf_counter()
+    with record_llm_calls() as recording:
+        result = await executor.execute_step(step, inputs)
+    duration = time.perf_counter() - start
 
-    # TODO: Execute workflow with run_data["inputs"]
-    # This would require integrating with workflow execution system
-    # For now, return the original run data
+    run_id = generate_ulid()
+    result_metadata = result.get("metadata") or {}
+    cost = result.get("cost") or {}
+    completed = result.get("status") == "completed"
+    try:
+        metadata = AgentRunMetadata(
+            run_id=run_id,
+            agent_id=step.agent,
+            agent_name=step.agent,
+            started_at=started_at,
+            completed_at=datetime.now(),
+            duration_seconds=duration,
+            status=RunStatus.COMPLETED if completed else RunStatus.FAILED,
+            provider=result_metadata.get("provider", step.config.get("provider")),
+            model=result_metadata.get("model", step.config.get("model")),
+            temperature=step.config.get("temperature"),
+            tokens_used=cost.get("total_tokens"),
+            cost_usd=cost.get("total_cost"),
+            error_count=0 if completed else 1,
+            error_message=result.get("error"),
+        )
+        get_run_storage().save_agent_run(
+            metadata=metadata,
+            input_data={
+                "prompt": step.prompt or step.config.get("system_prompt"),
+                "inputs": inputs,
+            },
+            output_data=result,
+            trace={
+                "step": step.model_dump(mode="json"),
+                "inputs": inputs,
+                "llm_calls": recording.to_list(),
+            },
+        )
+    except Exception as e:
+        # Don't fail the agent run if storage fails
+        logger.warning(f"Failed to save agent run {run_id}: {e}", exc_info=True)
 
-    return metadata, run_data
+    return {**result, "run_id": run_id}
@@ -1,38 +1,99 @@
-"""Run storage implementation."""
+"""Run storage implementation.
 
+Runs are stored in one of two layouts:
+
+- ``compact`` (default): one compressed JSON blob per run
+  (``agents/<run_id>.json.zst``, or ``.json.gz`` when ``zstandard`` is not
+  installed), written as a stream so large traces are never held twice.
+- ``directory`` (legacy): a directory per run with ``metadata.yaml`` and
+  separate JSON files for inputs, outputs, steps, artifacts and trace.
+
+Both layouts are always readable. Listing and filtering go through a SQLite
+index (``index.db``) and never open per-run files.
+"""
+
+import gzip
+import io
 import json
+import os
 import shutil
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import yaml
 from paracle_core.parac.state import find_parac_root
 
+from paracle_runs.exceptions import RunLoadError
+from paracle_runs.index import RunIndex
 from paracle_runs.models import AgentRunMetadata, RunQuery, WorkflowRunMetadata
 
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None  # type: ignore
+
+BLOB_FORMAT_VERSION = 1
+_BLOB_SUFFIXES = (".json.zst", ".json.gz")
+
+
+def _open_blob_writer(path: Path, use_zstd: bool) -> IO[str]:
+    """Open a text stream that compresses into ``path``."""
+    if use_zstd:
+        raw = open(path, "wb")
+        writer = zstandard.ZstdCompressor(level=3).stream_writer(raw)
+        return io.TextIOWrapper(writer, encoding="utf-8")
+    return gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+
+
+def _open_blob_reader(path: Path) -> IO[str]:
+    """Open a text stream that decompresses ``path``."""
+    if path.name.endswith(".zst"):
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return gzip.open(path, "rt", encoding="utf-8")
+
 
 class RunStorage:
     """Manages storage and retrieval of execution runs."""
 
-    def __init__(self, runs_dir: Path | None = None):
+    def __init__(self, runs_dir: Path | None = None, layout: str = "compact"):
         """Initialize run storage.
 
         Args:
             runs_dir: Directory for storing runs (defaults to .parac/runs/)
+            layout: 'compact' (one compressed blob per run) or 'directory'
+                (legacy directory per run) for newly saved runs
         """
         if runs_dir is None:
             parac_root = find_parac_root()
             runs_dir = parac_root / "runs"
+        if layout not in ("compact", "directory"):
+            raise ValueError(f"Unknown run storage layout: {layout}")
 
         self.runs_dir = runs_dir
         self.agents_dir = runs_dir / "agents"
         self.workflows_dir = runs_dir / "workflows"
+        self.layout = layout
 
         # Ensure directories exist
         self.agents_dir.mkdir(parents=True, exist_ok=True)
         self.workflows_dir.mkdir(parents=True, exist_ok=True)
 
+        self.index = RunIndex(runs_dir / "index.db")
+        if self.index.created and self._has_stored_runs():
+            # First use of the index on an existing runs directory
+            self.reindex()
+
+    # ------------------------------------------------------------------
+    # Save
+    # ------------------------------------------------------------------
+
     def save_agent_run(
         self,
         metadata: AgentRunMetadata,
@@ -53,48 +114,21 @@ class RunStorage:
             trace: OpenTelemetry trace
 
         Returns:
-            Path to run directory
+            Path to the run blob (or run directory in the legacy layout)
         """
-        run_dir = self.agents_dir / metadata.run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save metadata as YAML
-        metadata_path = run_dir / "metadata.yaml"
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(metadata.model_dump(mode="json"), f, sort_keys=False)
-
-        # Save input as JSON
-        input_path = run_dir / "input.json"
-        with open(input_path, "w", encoding="utf-8") as f:
-            json.dump(input_data, f, indent=2)
-
-        # Save output if available
+        run_data: dict[str, Any] = {"input": input_data}
         if output_data:
-            output_path = run_dir / "output.json"
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, indent=2)
-
-        # Save artifacts if available
+            run_data["output"] = output_data
         if artifacts:
-            artifacts_dir = run_dir / "artifacts"
-            artifacts_dir.mkdir(exist_ok=True)
-            artifacts_path = artifacts_dir / "artifacts.json"
-            with open(artifacts_path, "w", encoding="utf-8") as f:
-                json.dump(artifacts, f, indent=2)
-
-        # Save logs if available
+            run_data["artifacts"] = artifacts
         if logs:
-            logs_path = run_dir / "logs.txt"
-            with open(logs_path, "w", encoding="utf-8") as f:
-                f.write(logs)
-
-        # Save trace if available
+            run_data["logs"] = logs
         if trace:
-            trace_path = run_dir / "trace.json"
-            with open(trace_path, "w", encoding="utf-8") as f:
-                json.dump(trace, f, indent=2)
+            run_data["trace"] = trace
 
-        return run_dir
+        path = self._save("agent", metadata, run_data)
+        self.index.upsert("agent", metadata)
+        return path
 
     def save_workflow_run(
         self,
@@ -118,57 +152,27 @@ class RunStorage:
             trace: OpenTelemetry trace
 
         Returns:
-            Path to run directory
+            Path to the run blob (or run directory in the legacy layout)
         """
-        run_dir = self.workflows_dir / metadata.run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save metadata as YAML
-        metadata_path = run_dir / "metadata.yaml"
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(metadata.model_dump(mode="json"), f, sort_keys=False)
-
-        # Save inputs as JSON
-        inputs_path = run_dir / "inputs.json"
-        with open(inputs_path, "w", encoding="utf-8") as f:
-            json.dump(inputs, f, indent=2)
-
-        # Save outputs if available
+        run_data: dict[str, Any] = {"inputs": inputs}
         if outputs:
-            outputs_path = run_dir / "outputs.json"
-            with open(outputs_path, "w", encoding="utf-8") as f:
-                json.dump(outputs, f, indent=2)
-
-        # Save step data if available
+            run_data["outputs"] = outputs
         if steps:
-            steps_dir = run_dir / "steps"
-            steps_dir.mkdir(exist_ok=True)
-            for step_id, step_data in steps.items():
-                step_path = steps_dir / f"{step_id}.json"
-                with open(step_path, "w", encoding="utf-8") as f:
-                    json.dump(step_data, f, indent=2)
-
-        # Save artifacts if available
+            run_data["steps"] = steps
         if artifacts:
-            artifacts_dir = run_dir / "artifacts"
-            artifacts_dir.mkdir(exist_ok=True)
-            artifacts_path = artifacts_dir / "artifacts.json"
-            with open(artifacts_path, "w", encoding="utf-8") as f:
-                json.dump(artifacts, f, indent=2)
-
-        # Save logs if available
+            run_data["artifacts"] = artifacts
         if logs:
-            logs_path = run_dir / "logs.txt"
-            with open(logs_path, "w", encoding="utf-8") as f:
-                f.write(logs)
-
-        # Save trace if available
+            run_data["logs"] = logs
         if trace:
-            trace_path = run_dir / "trace.json"
-            with open(trace_path, "w", encoding="utf-8") as f:
-                json.dump(trace, f, indent=2)
+            run_data["trace"] = trace
 
-        return run_dir
+        path = self._save("workflow", metadata, run_data)
+        self.index.upsert("workflow", metadata)
+        return path
+
+    # ------------------------------------------------------------------
+    # Load
+    # ------------------------------------------------------------------
 
     def load_agent_run(self, run_id: str) -> tuple[AgentRunMetadata, dict[str, Any]]:
         """Load agent run data.
@@ -182,45 +186,8 @@ class RunStorage:
         Raises:
             FileNotFoundError: If run not found
         """
-        run_dir = self.agents_dir / run_id
-        if not run_dir.exists():
-            raise FileNotFoundError(f"Agent run not found: {run_id}")
-
-        # Load metadata
-        metadata_path = run_dir / "metadata.yaml"
-        with open(metadata_path, encoding="utf-8") as f:
-            metadata_dict = yaml.safe_load(f)
-        metadata = AgentRunMetadata(**metadata_dict)
-
-        # Load all available data
-        run_data: dict[str, Any] = {}
-
-        input_path = run_dir / "input.json"
-        if input_path.exists():
-            with open(input_path, encoding="utf-8") as f:
-                run_data["input"] = json.load(f)
-
-        output_path = run_dir / "output.json"
-        if output_path.exists():
-            with open(output_path, encoding="utf-8") as f:
-                run_data["output"] = json.load(f)
-
-        artifacts_path = run_dir / "artifacts" / "artifacts.json"
-        if artifacts_path.exists():
-            with open(artifacts_path, encoding="utf-8") as f:
-                run_data["artifacts"] = json.load(f)
-
-        logs_path = run_dir / "logs.txt"
-        if logs_path.exists():
-            with open(logs_path, encoding="utf-8") as f:
-                run_data["logs"] = f.read()
-
-        trace_path = run_dir / "trace.json"
-        if trace_path.exists():
-            with open(trace_path, encoding="utf-8") as f:
-                run_data["trace"] = json.load(f)
-
-        return metadata, run_data
+        metadata_dict, run_data = self._load("agent", run_id)
+        return AgentRunMetadata(**metadata_dict), run_data
 
     def load_workflow_run(
         self, run_id: str
@@ -236,58 +203,15 @@ class RunStorage:
         Raises:
             FileNotFoundError: If run not found
         """
-        run_dir = self.workflows_dir / run_id
-        if not run_dir.exists():
-            raise FileNotFoundError(f"Workflow run not found: {run_id}")
-
-        # Load metadata
-        metadata_path = run_dir / "metadata.yaml"
-        with open(metadata_path, encoding="utf-8") as f:
-            metadata_dict = yaml.safe_load(f)
-        metadata = WorkflowRunMetadata(**metadata_dict)
-
-        # Load all available data
-        run_data: dict[str, Any] = {}
-
-        inputs_path = run_dir / "inputs.json"
-        if inputs_path.exists():
-            with open(inputs_path, encoding="utf-8") as f:
-                run_data["inputs"] = json.load(f)
+        metadata_dict, run_data = self._load("workflow", run_id)
+        return WorkflowRunMetadata(**metadata_dict), run_data
 
-        outputs_path = run_dir / "outputs.json"
-        if outputs_path.exists():
-            with open(outputs_path, encoding="utf-8") as f:
-                run_data["outputs"] = json.load(f)
-
-        # Load steps
-        steps_dir = run_dir / "steps"
-        if steps_dir.exists():
-            steps = {}
-            for step_file in steps_dir.glob("*.json"):
-                step_id = step_file.stem
-                with open(step_file, encoding="utf-8") as f:
-                    steps[step_id] = json.load(f)
-            run_data["steps"] = steps
-
-        artifacts_path = run_dir / "artifacts" / "artifacts.json"
-        if artifacts_path.exists():
-            with open(artifacts_path, encoding="utf-8") as f:
-                run_data["artifacts"] = json.load(f)
-
-        logs_path = run_dir / "logs.txt"
-        if logs_path.exists():
-            with open(logs_path, encoding="utf-8") as f:
-                run_data["logs"] = f.read()
-
-        trace_path = run_dir / "trace.json"
-        if trace_path.exists():
-            with open(trace_path, encoding="utf-8") as f:
-                run_data["trace"] = json.load(f)
-
-        return metadata, run_data
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
 
     def list_agent_runs(self, query: RunQuery | None = None) -> list[AgentRunMetadata]:
-        """List agent runs.
+        """List agent runs, newest first.
 
         Args:
             query: Query parameters for filtering
@@ -295,48 +219,15 @@ class RunStorage:
         Returns:
             List of agent run metadata
         """
-        if query is None:
-            query = RunQuery()
-
-        runs = []
-        for run_dir in sorted(self.agents_dir.iterdir(), reverse=True):
-            if not run_dir.is_dir():
-                continue
-
-            metadata_path = run_dir / "metadata.yaml"
-            if not metadata_path.exists():
-                continue
-
-            try:
-                with open(metadata_path, encoding="utf-8") as f:
-                    metadata_dict = yaml.safe_load(f)
-                metadata = AgentRunMetadata(**metadata_dict)
-
-                # Apply filters
-                if query.agent_id and metadata.agent_id != query.agent_id:
-                    continue
-                if query.status and metadata.status != query.status:
-                    continue
-                if query.since and metadata.started_at < query.since:
-                    continue
-                if query.until and metadata.started_at > query.until:
-                    continue
-
-                runs.append(metadata)
-
-                if len(runs) >= query.limit:
-                    break
-
-            except Exception:
-                # Skip invalid metadata files
-                continue
-
-        return runs
+        return [
+            AgentRunMetadata(**data)
+            for data in self.index.query("agent", query or RunQuery())
+        ]
 
     def list_workflow_runs(
         self, query: RunQuery | None = None
     ) -> list[WorkflowRunMetadata]:
-        """List workflow runs.
+        """List workflow runs, newest first.
 
         Args:
             query: Query parameters for filtering
@@ -344,43 +235,14 @@ class RunStorage:
         Returns:
             List of workflow run metadata
         """
-        if query is None:
-            query = RunQuery()
+        return [
+            WorkflowRunMetadata(**data)
+            for data in self.index.query("workflow", query or RunQuery())
+        ]
 
-        runs = []
-        for run_dir in sorted(self.workflows_dir.iterdir(), reverse=True):
-            if not run_dir.is_dir():
-                continue
-
-            metadata_path = run_dir / "metadata.yaml"
-            if not metadata_path.exists():
-                continue
-
-            try:
-                with open(metadata_path, encoding="utf-8") as f:
-                    metadata_dict = yaml.safe_load(f)
-                metadata = WorkflowRunMetadata(**metadata_dict)
-
-                # Apply filters
-                if query.workflow_id and metadata.workflow_id != query.workflow_id:
-                    continue
-                if query.status and metadata.status != query.status:
-                    continue
-                if query.since and metadata.started_at < query.since:
-                    continue
-                if query.until and metadata.started_at > query.until:
-                    continue
-
-                runs.append(metadata)
-
-                if len(runs) >= query.limit:
-                    break
-
-            except Exception:
-                # Skip invalid metadata files
-                continue
-
-        return runs
+    # ------------------------------------------------------------------
+    # Delete / cleanup
+    # ------------------------------------------------------------------
 
     def delete_run(self, run_id: str, run_type: str = "agent") -> bool:
         """Delete a run.
@@ -392,16 +254,20 @@ class RunStorage:
         Returns:
             True if deleted, False if not found
         """
-        if run_type == "agent":
-            run_dir = self.agents_dir / run_id
-        else:
-            run_dir = self.workflows_dir / run_id
+        run_type = "agent" if run_type == "agent" else "workflow"
+        deleted = self.index.remove(run_id, run_type)
 
-        if not run_dir.exists():
-            return False
+        for blob in self._blob_candidates(run_type, run_id):
+            if blob.exists():
+                blob.unlink()
+                deleted = True
 
-        shutil.rmtree(run_dir)
-        return True
+        run_dir = self._type_dir(run_type) / run_id
+        if run_dir.is_dir():
+            shutil.rmtree(run_dir)
+            deleted = True
+
+        return deleted
 
     def cleanup_old_runs(
         self, max_age_days: int = 30, max_runs: int | None = None
@@ -420,33 +286,218 @@ class RunStorage:
         cutoff_date = datetime.now() - timedelta(days=max_age_days)
         deleted_count = 0
 
-        # Clean up agent runs
-        agent_runs = self.list_agent_runs(RunQuery(limit=10000))
-        if max_runs and len(agent_runs) > max_runs:
-            # Delete oldest runs beyond max_runs
-            for metadata in agent_runs[max_runs:]:
-                if self.delete_run(metadata.run_id, "agent"):
+        for run_type in ("agent", "workflow"):
+            doomed = set(self.index.query_ids(run_type, RunQuery(until=cutoff_date)))
+            if max_runs:
+                doomed.update(self.index.query_ids(run_type, RunQuery(offset=max_runs)))
+            for run_id in doomed:
+                if self.delete_run(run_id, run_type):
                     deleted_count += 1
 
-        # Delete runs older than cutoff
-        for metadata in agent_runs:
-            if metadata.started_at < cutoff_date:
-                if self.delete_run(metadata.run_id, "agent"):
-                    deleted_count += 1
+        return deleted_count
 
-        # Clean up workflow runs
-        workflow_runs = self.list_workflow_runs(RunQuery(limit=10000))
-        if max_runs and len(workflow_runs) > max_runs:
-            for metadata in workflow_runs[max_runs:]:
-                if self.delete_run(metadata.run_id, "workflow"):
-                    deleted_count += 1
+    # ------------------------------------------------------------------
+    # Index maintenance and migration
+    # ------------------------------------------------------------------
 
-        for metadata in workflow_runs:
-            if metadata.started_at < cutoff_date:
-                if self.delete_run(metadata.run_id, "workflow"):
-                    deleted_count += 1
+    def reindex(self) -> int:
+        """Rebuild the index from the runs stored on disk.
 
-        return deleted_count
+        Returns:
+            Number of runs indexed
+        """
+        self.index.clear()
+        total = 0
+        for run_type, model in (
+            ("agent", AgentRunMetadata),
+            ("workflow", WorkflowRunMetadata),
+        ):
+            batch = []
+            for run_id in self._iter_stored_run_ids(run_type):
+                try:
+                    metadata_dict, _ = self._load(run_type, run_id)
+                    batch.append(model(**metadata_dict))
+                except Exception:
+                    # Skip unreadable runs, as listing always has
+                    continue
+            self.index.upsert_many(run_type, batch)
+            total += len(batch)
+        return total
+
+    def migrate_legacy_runs(self, remove_legacy: bool = True) -> int:
+        """Convert legacy run directories into compact blobs.
+
+        Args:
+            remove_legacy: Delete each run directory once converted
+
+        Returns:
+            Number of runs migrated
+        """
+        migrated = 0
+        for run_type, model in (
+            ("agent", AgentRunMetadata),
+            ("workflow", WorkflowRunMetadata),
+        ):
+            batch = []
+            for run_dir in sorted(self._type_dir(run_type).iterdir()):
+                if not (run_dir / "metadata.yaml").exists():
+                    continue
+                metadata_dict, run_data = self._load_directory(run_dir)
+                metadata = model(**metadata_dict)
+                self._write_blob(run_type, metadata, run_data)
+                batch.append(metadata)
+                if remove_legacy:
+                    shutil.rmtree(run_dir)
+                migrated += 1
+            self.index.upsert_many(run_type, batch)
+        return migrated
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _type_dir(self, run_type: str) -> Path:
+        return self.agents_dir if run_type == "agent" else self.workflows_dir
+
+    def _blob_candidates(self, run_type: str, run_id: str) -> list[Path]:
+        base = self._type_dir(run_type)
+        return [base / f"{run_id}{suffix}" for suffix in _BLOB_SUFFIXES]
+
+    def _has_stored_runs(self) -> bool:
+        return any(self.agents_dir.iterdir()) or any(self.workflows_dir.iterdir())
+
+    def _iter_stored_run_ids(self, run_type: str) -> Iterator[str]:
+        for entry in self._type_dir(run_type).iterdir():
+            if entry.is_dir():
+                if (entry / "metadata.yaml").exists():
+                    yield entry.name
+                continue
+            for suffix in _BLOB_SUFFIXES:
+                if entry.name.endswith(suffix):
+                    yield entry.name[: -len(suffix)]
+                    break
+
+    def _save(
+        self,
+        run_type: str,
+        metadata: AgentRunMetadata | WorkflowRunMetadata,
+        run_data: dict[str, Any],
+    ) -> Path:
+        if self.layout == "directory":
+            return self._write_directory(run_type, metadata, run_data)
+        return self._write_blob(run_type, metadata, run_data)
+
+    def _write_blob(
+        self,
+        run_type: str,
+        metadata: AgentRunMetadata | WorkflowRunMetadata,
+        run_data: dict[str, Any],
+    ) -> Path:
+        suffix = _BLOB_SUFFIXES[0] if ZSTD_AVAILABLE else _BLOB_SUFFIXES[1]
+        path = self._type_dir(run_type) / f"{metadata.run_id}{suffix}"
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        document = {
+            "format": BLOB_FORMAT_VERSION,
+            "metadata": metadata.model_dump(mode="json"),
+            "data": run_data,
+        }
+        # json.dump encodes incrementally, so the payload is streamed through
+        # the compressor instead of being built as one string first.
+        with _open_blob_writer(tmp_path, use_zstd=ZSTD_AVAILABLE) as f:
+            json.dump(document, f, separators=(",", ":"), default=str)
+        os.replace(tmp_path, path)
+        return path
+
+    def _write_directory(
+        self,
+        run_type: str,
+        metadata: AgentRunMetadata | WorkflowRunMetadata,
+        run_data: dict[str, Any],
+    ) -> Path:
+        run_dir = self._type_dir(run_type) / metadata.run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        # Save metadata as YAML
+        with open(run_dir / "metadata.yaml", "w", encoding="utf-8") as f:
+            yaml.safe_dump(metadata.model_dump(mode="json"), f, sort_keys=False)
+
+        for key, value in run_data.items():
+            if key == "logs":
+                (run_dir / "logs.txt").write_text(value, encoding="utf-8")
+            elif key == "steps":
+                steps_dir = run_dir / "steps"
+                steps_dir.mkdir(exist_ok=True)
+                for step_id, step_data in value.items():
+                    self._write_json(steps_dir / f"{step_id}.json", step_data)
+            elif key == "artifacts":
+                artifacts_dir = run_dir / "artifacts"
+                artifacts_dir.mkdir(exist_ok=True)
+                self._write_json(artifacts_dir / "artifacts.json", value)
+            else:
+                self._write_json(run_dir / f"{key}.json", value)
+
+        return run_dir
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def _load(
+        self, run_type: str, run_id: str
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        for blob in self._blob_candidates(run_type, run_id):
+            if blob.exists():
+                if blob.name.endswith(".zst") and not ZSTD_AVAILABLE:
+                    raise RunLoadError(
+                        run_id,
+                        "run is zstandard-compressed, install 'paracle[runs]' "
+                        "to read it",
+                    )
+                try:
+                    with _open_blob_reader(blob) as f:
+                        document = json.load(f)
+                except (OSError, ValueError, EOFError) as e:
+                    raise RunLoadError(run_id, "corrupted run blob", e) from e
+                return document["metadata"], document["data"]
+
+        run_dir = self._type_dir(run_type) / run_id
+        if not run_dir.exists():
+            raise FileNotFoundError(f"{run_type.capitalize()} run not found: {run_id}")
+        return self._load_directory(run_dir)
+
+    @staticmethod
+    def _load_directory(run_dir: Path) -> tuple[dict[str, Any], dict[str, Any]]:
+        with open(run_dir / "metadata.yaml", encoding="utf-8") as f:
+            metadata_dict = yaml.safe_load(f)
+
+        # Load all available data
+        run_data: dict[str, Any] = {}
+        for key in ("input", "output", "inputs", "outputs", "trace"):
+            path = run_dir / f"{key}.json"
+            if path.exists():
+                with open(path, encoding="utf-8") as f:
+                    run_data[key] = json.load(f)
+
+        steps_dir = run_dir / "steps"
+        if steps_dir.exists():
+            steps = {}
+            for step_file in steps_dir.glob("*.json"):
+                with open(step_file, encoding="utf-8") as f:
+                    steps[step_file.stem] = json.load(f)
+            run_data["steps"] = steps
+
+        artifacts_path = run_dir / "artifacts" / "artifacts.json"
+        if artifacts_path.exists():
+            with open(artifacts_path, encoding="utf-8") as f:
+                run_data["artifacts"] = json.load(f)
+
+        logs_path = run_dir / "logs.txt"
+        if logs_path.exists():
+            run_data["logs"] = logs_path.read_text(encoding="utf-8")
+
+        return metadata_dict, run_data
 
 
 # Global instance
@@ -1,13 +1,16 @@
 """Paracle Sandbox - Isolated execution environments for agents.
 
-This package provides Docker-based sandboxing for safe agent execution with
-resource limits, network isolation, and filesystem controls.
+This package provides sandboxing for safe agent execution with resource
+limits, network isolation, and filesystem controls, backed by Docker
+containers or by lightweight Linux namespaces (``backend="process"``).
 
 Components:
 - SandboxManager: Orchestrates sandbox lifecycle
 - DockerSandbox: Docker container wrapper with resource limits
+- ProcessSandbox: Namespace/cgroup sandbox without a container runtime
 - SandboxConfig: Configuration for sandbox environments
 - SandboxMonitor: Real-time resource usage tracking
+- SandboxPool: Warm pool of pre-started sandboxes per configuration
 
 Example:
     ```python
@@ -45,12 +48,17 @@ from paracle_sandbox.exceptions import (
 from paracle_sandbox.executor import SandboxExecutor
 from paracle_sandbox.manager import SandboxManager
 from paracle_sandbox.monitor import SandboxMonitor
+from paracle_sandbox.pool import PoolConfig, SandboxPool
+from paracle_sandbox.process_sandbox import ProcessSandbox
 
 __all__ = [
     "SandboxManager",
     "DockerSandbox",
+    "ProcessSandbox",
     "SandboxConfig",
     "SandboxMonitor",
+    "SandboxPool",
+    "PoolConfig",
     "SandboxExecutor",
     "SandboxError",
     "SandboxCreationError",
@@ -5,6 +5,7 @@ from typing import Literal
 from pydantic import BaseModel, Field
 
 NetworkMode = Literal["none", "bridge", "host"]
+SandboxBackend = Literal["docker", "process"]
 
 
 class SandboxConfig(BaseModel):
@@ -14,6 +15,10 @@ class SandboxConfig(BaseModel):
     for safe agent execution.
 
     Attributes:
+        backend: Isolation backend: ``docker`` containers, or ``process``
+            for Linux namespaces plus cgroups/rlimits (no daemon, much
+            faster startup; runs host binaries, ``base_image`` is ignored and
+            only ``network_mode="none"`` with a read-only root is accepted)
         base_image: Docker base image (default: paracle/sandbox:latest)
         cpu_cores: CPU core limit (0.5 = 50% of one core)
         memory_mb: Memory limit in megabytes
@@ -22,10 +27,13 @@ class SandboxConfig(BaseModel):
         network_mode: Network isolation mode (none, bridge, host)
         read_only_filesystem: Mount root filesystem as read-only
         drop_capabilities: Drop Linux capabilities for security
+        max_processes: Maximum number of processes (pids limit)
         working_dir: Working directory inside container
         env_vars: Environment variables to inject
     """
 
+    backend: SandboxBackend = Field(default="docker", description="Isolation backend")
+
     base_image: str = Field(
         default="paracle/sandbox:latest", description="Docker image for sandbox"
     )
@@ -58,6 +66,10 @@ class SandboxConfig(BaseModel):
         default=True, description="Drop all Linux capabilities"
     )
 
+    max_processes: int = Field(
+        default=256, ge=8, le=32768, description="Maximum number of processes"
+    )
+
     working_dir: str = Field(default="/workspace", description="Working directory")
 
     env_vars: dict[str, str] = Field(
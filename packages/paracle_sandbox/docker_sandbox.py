@@ -2,12 +2,14 @@
 
 import asyncio
 import logging
+import shlex
 from contextlib import asynccontextmanager
 from typing import Any
 
-import docker
 from docker.errors import APIError, ImageNotFound
 from docker.models.containers import Container
+
+import docker
 from paracle_sandbox.config import SandboxConfig
 from paracle_sandbox.exceptions import (
     ResourceLimitError,
@@ -19,6 +21,21 @@ from paracle_sandbox.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+def _reset_script(working_dir: str) -> str:
+    """Shell script killing leftover processes and wiping writable mounts."""
+    return " ".join(
+        [
+            "kill -9 -1 2>/dev/null;",
+            *(
+                f"rm -rf {d}/* {d}/.[!.]* {d}/..?* 2>/dev/null;"
+                # /tmp is the container's own tmpfs
+                for d in (shlex.quote(working_dir), "/tmp")  # nosec B108
+            ),
+            "true",
+        ]
+    )
+
+
 class DockerSandbox:
     """Docker container-based sandbox for agent execution.
 
@@ -31,17 +48,35 @@ class DockerSandbox:
         container: Docker container instance (when active)
     """
 
-    def __init__(self, sandbox_id: str, config: SandboxConfig):
+    def __init__(
+        self,
+        sandbox_id: str,
+        config: SandboxConfig,
+        client: "docker.DockerClient | None" = None,
+    ):
         """Initialize Docker sandbox.
 
         Args:
             sandbox_id: Unique sandbox identifier
             config: Sandbox configuration
+            client: Docker client to use (``docker.from_env()`` if None).
+                A provided client is shared and not closed on stop.
         """
         self.sandbox_id = sandbox_id
         self.config = config
         self.container: Container | None = None
-        self._client: docker.DockerClient | None = None
+        self._client: docker.DockerClient | None = client
+        self._owns_client = client is None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the sandbox container has been started and not stopped."""
+        return self.container is not None
+
+    @property
+    def working_dir(self) -> str:
+        """Working directory inside the sandbox."""
+        return self.config.working_dir
 
     async def start(self) -> None:
         """Start the sandbox container.
@@ -53,63 +88,69 @@ class DockerSandbox:
             SandboxCreationError: If container creation fails
         """
         try:
-            # Initialize Docker client
-            self._client = docker.from_env()
-
-            # Pull image if not present
-            try:
-                self._client.images.get(self.config.base_image)
-            except ImageNotFound:
-                logger.info(f"Pulling image: {self.config.base_image}")
-                self._client.images.pull(self.config.base_image)
-
-            # Calculate resource limits
-            cpu_quota = int(self.config.cpu_cores * 100000)
-            mem_limit = f"{self.config.memory_mb}m"
-
-            # Configure container
-            container_config = {
-                "image": self.config.base_image,
-                "name": f"paracle-sandbox-{self.sandbox_id}",
-                "detach": True,
-                "command": ["sleep", "infinity"],
-                "working_dir": self.config.working_dir,
-                "environment": self.config.env_vars,
-                "cpu_quota": cpu_quota,
-                "cpu_period": 100000,
-                "mem_limit": mem_limit,
-                "memswap_limit": mem_limit,  # Disable swap
-                "network_mode": self.config.network_mode,
-                "read_only": self.config.read_only_filesystem,
-                "tmpfs": {
-                    "/tmp": "rw,noexec,nosuid,size=100m",
-                    self.config.working_dir: f"rw,size={self.config.disk_mb}m",
-                },
-                "security_opt": [],
-                "labels": {
-                    "paracle.sandbox_id": self.sandbox_id,
-                    "paracle.managed": "true",
-                },
-            }
-
-            # Drop capabilities if configured
-            if self.config.drop_capabilities:
-                container_config["cap_drop"] = ["ALL"]
-                container_config["security_opt"].append("no-new-privileges")
-
-            # Create and start container
-            self.container = self._client.containers.create(**container_config)
-            self.container.start()
-
-            logger.info(
-                f"Sandbox {self.sandbox_id} started with container {self.container.short_id}"
-            )
-
+            # Docker SDK calls block; keep them off the event loop
+            await asyncio.to_thread(self._create_container)
         except (APIError, Exception) as e:
             raise SandboxCreationError(
                 f"Failed to create sandbox: {e}", self.sandbox_id
             ) from e
 
+        logger.info(
+            f"Sandbox {self.sandbox_id} started with container {self.container.short_id}"
+        )
+
+    def _create_container(self) -> None:
+        """Create and start the container (blocking)."""
+        # Initialize Docker client
+        if self._client is None:
+            self._client = docker.from_env()
+
+        # Pull image if not present
+        try:
+            self._client.images.get(self.config.base_image)
+        except ImageNotFound:
+            logger.info(f"Pulling image: {self.config.base_image}")
+            self._client.images.pull(self.config.base_image)
+
+        # Calculate resource limits
+        cpu_quota = int(self.config.cpu_cores * 100000)
+        mem_limit = f"{self.config.memory_mb}m"
+
+        # Configure container
+        container_config = {
+            "image": self.config.base_image,
+            "name": f"paracle-sandbox-{self.sandbox_id}",
+            "detach": True,
+            "command": ["sleep", "infinity"],
+            "working_dir": self.config.working_dir,
+            "environment": self.config.env_vars,
+            "cpu_quota": cpu_quota,
+            "cpu_period": 100000,
+            "mem_limit": mem_limit,
+            "memswap_limit": mem_limit,  # Disable swap
+            "network_mode": self.config.network_mode,
+            "pids_limit": self.config.max_processes,
+            "read_only": self.config.read_only_filesystem,
+            "tmpfs": {
+                "/tmp": "rw,noexec,nosuid,size=100m",
+                self.config.working_dir: f"rw,size={self.config.disk_mb}m",
+            },
+            "security_opt": [],
+            "labels": {
+                "paracle.sandbox_id": self.sandbox_id,
+                "paracle.managed": "true",
+            },
+        }
+
+        # Drop capabilities if configured
+        if self.config.drop_capabilities:
+            container_config["cap_drop"] = ["ALL"]
+            container_config["security_opt"].append("no-new-privileges")
+
+        # Create and start container
+        self.container = self._client.containers.create(**container_config)
+        self.container.start()
+
     async def execute(
         self,
         command: str | list[str],
@@ -277,6 +318,31 @@ class DockerSandbox:
                 f"Sandbox {self.sandbox_id} CPU usage high: {stats['cpu_percent']:.1f}%"
             )
 
+    async def reset(self) -> bool:
+        """Restore the sandbox to its freshly started state for reuse.
+
+        Kills leftover processes and wipes the writable tmpfs mounts
+        (working directory and /tmp). The read-only root filesystem is the
+        image itself, so this restores the base snapshot.
+
+        Returns:
+            True if the sandbox can be reused, False if it must be
+            destroyed (writable root filesystem, dead container or a
+            failed reset)
+        """
+        if not self.container or not self.config.read_only_filesystem:
+            return False
+
+        script = _reset_script(self.config.working_dir)
+        try:
+            result = await asyncio.to_thread(
+                self.container.exec_run, ["sh", "-c", script]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to reset sandbox {self.sandbox_id}: {e}")
+            return False
+        return result.exit_code == 0
+
     async def stop(self) -> None:
         """Stop and remove the sandbox container.
 
@@ -290,10 +356,12 @@ class DockerSandbox:
             logger.info(f"Stopping sandbox {self.sandbox_id}")
 
             # Stop container with timeout
-            self.container.stop(timeout=self.config.cleanup_timeout)
+            await asyncio.to_thread(
+                self.container.stop, timeout=self.config.cleanup_timeout
+            )
 
             # Remove container
-            self.container.remove(force=True)
+            await asyncio.to_thread(self.container.remove, force=True)
 
             logger.info(f"Sandbox {self.sandbox_id} stopped and removed")
 
@@ -308,7 +376,7 @@ class DockerSandbox:
 
         finally:
             self.container = None
-            if self._client:
+            if self._client and self._owns_client:
                 self._client.close()
                 self._client = None
 
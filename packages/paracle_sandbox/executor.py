@@ -69,18 +69,18 @@ class SandboxExecutor:
         inputs = inputs or {}
 
         sandbox = None
-        monitor_task = None
+        sandbox_monitor = None
+        reusable = False
 
         try:
-            # Create sandbox
-            sandbox = await self.manager.create(config)
-            logger.info(
-                f"Created sandbox {sandbox.sandbox_id} for agent execution")
+            # Acquire sandbox (from the warm pool when enabled)
+            sandbox = await self.manager.acquire(config)
+            logger.info(f"Acquired sandbox {sandbox.sandbox_id} for agent execution")
 
             # Start monitoring if enabled
             if monitor:
-                sandbox_monitor = SandboxMonitor(sandbox)
-                monitor_task = asyncio.create_task(sandbox_monitor.start())
+                sandbox_monitor = SandboxMonitor(sandbox, pool=self.manager.pool)
+                await sandbox_monitor.start()
 
             # Prepare agent code
             if isinstance(agent_code, Path):
@@ -97,7 +97,7 @@ class SandboxExecutor:
             write_cmd = [
                 "sh",
                 "-c",
-                f'cat > {config.working_dir}/{code_filename} << "EOF"\n{agent_code}\nEOF',
+                f'cat > {sandbox.working_dir}/{code_filename} << "EOF"\n{agent_code}\nEOF',
             ]
             await sandbox.execute(write_cmd)
 
@@ -110,31 +110,35 @@ class SandboxExecutor:
                 write_inputs_cmd = [
                     "sh",
                     "-c",
-                    f'cat > {config.working_dir}/{inputs_filename} << "EOF"\n{inputs_json}\nEOF',
+                    f'cat > {sandbox.working_dir}/{inputs_filename} << "EOF"\n{inputs_json}\nEOF',
                 ]
                 await sandbox.execute(write_inputs_cmd)
 
             # Execute agent code
             exec_cmd = [
                 "python3",
-                f"{config.working_dir}/{code_filename}",
+                f"{sandbox.working_dir}/{code_filename}",
             ]
             result = await sandbox.execute(exec_cmd, timeout=config.timeout_seconds)
 
             # Get resource stats
             stats = await sandbox.get_stats()
-            if monitor and monitor_task:
+            if sandbox_monitor:
                 # Stop monitoring
-                await monitor_task
+                await sandbox_monitor.stop()
                 # Get monitoring history
                 stats["monitoring"] = {
                     "averages": sandbox_monitor.get_averages(),
                     "peaks": sandbox_monitor.get_peaks(),
                     "history_samples": len(sandbox_monitor.get_history()),
                 }
+                if self.manager.pool is not None:
+                    stats["monitoring"]["pool"] = sandbox_monitor.get_pool_metrics()
 
             # Check if execution was successful
             success = result["exit_code"] == 0 and not result["timed_out"]
+            # Only sandboxes that finished cleanly go back to the pool
+            reusable = not result["timed_out"]
 
             response = {
                 "success": success,
@@ -178,17 +182,13 @@ class SandboxExecutor:
             return error_response
 
         finally:
-            # Clean up monitor task
-            if monitor_task and not monitor_task.done():
-                monitor_task.cancel()
-                try:
-                    await monitor_task
-                except asyncio.CancelledError:
-                    pass
-
-            # Destroy sandbox
+            # Stop monitoring
+            if sandbox_monitor:
+                await sandbox_monitor.stop()
+
+            # Release sandbox (reset into the pool, or destroy)
             if sandbox:
-                await self.manager.destroy(sandbox.sandbox_id)
+                await self.manager.release(sandbox, discard=not reusable)
 
     async def execute_batch(
         self,
@@ -221,8 +221,16 @@ class SandboxExecutor:
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(max_concurrent)
 
+        # Jobs waiting on the semaphore size the warm pool
+        pool = self.manager.pool
+        queued = len(jobs)
+
         async def execute_with_semaphore(job: dict[str, Any]) -> dict[str, Any]:
+            nonlocal queued
             async with semaphore:
+                queued -= 1
+                if pool is not None:
+                    pool.set_queue_depth(config, queued)
                 return await self.execute_agent(
                     agent_code=job["agent_code"],
                     config=config,
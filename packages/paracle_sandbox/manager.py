@@ -10,6 +10,8 @@ from paracle_core.ids import generate_ulid
 from paracle_sandbox.config import SandboxConfig
 from paracle_sandbox.docker_sandbox import DockerSandbox
 from paracle_sandbox.exceptions import SandboxError
+from paracle_sandbox.pool import PoolConfig, SandboxPool
+from paracle_sandbox.process_sandbox import ProcessSandbox, Sandbox
 
 logger = logging.getLogger(__name__)
 
@@ -18,72 +20,177 @@ class SandboxManager:
     """Manages sandbox creation, lifecycle, and cleanup.
 
     Coordinates multiple sandboxes, enforces limits, and handles
-    automatic cleanup.
+    automatic cleanup. With a ``pool`` configuration, ``acquire`` and
+    ``release`` reuse pre-started sandboxes per configuration profile;
+    idle pooled sandboxes count toward ``max_concurrent`` and are evicted
+    when a new sandbox needs the slot.
 
     Attributes:
         max_concurrent: Maximum concurrent sandboxes
         active_sandboxes: Currently active sandboxes
+        pool: Warm pool (None when pooling is disabled)
     """
 
-    def __init__(self, max_concurrent: int = 10):
+    def __init__(
+        self,
+        max_concurrent: int = 10,
+        pool: PoolConfig | None = None,
+        client: Any | None = None,
+    ):
         """Initialize sandbox manager.
 
         Args:
             max_concurrent: Maximum concurrent sandboxes
+            pool: Warm pool configuration (pooling disabled if None).
+                Pooled sandboxes are reused across executions after their
+                writable mounts are wiped, so only enable it for workloads
+                that may share containers.
+            client: Docker client shared by all sandboxes (each sandbox
+                connects with ``docker.from_env()`` if None)
         """
         self.max_concurrent = max_concurrent
-        self.active_sandboxes: dict[str, DockerSandbox] = {}
+        self.active_sandboxes: dict[str, Sandbox] = {}
         self._lock = asyncio.Lock()
-
-    async def create(
+        self._client = client
+        self._starting = 0
+        self.pool: SandboxPool | None = (
+            SandboxPool(pool, self._start_sandbox, self.has_capacity)
+            if pool is not None
+            else None
+        )
+
+    def has_capacity(self) -> bool:
+        """Whether another sandbox can be started without evicting one."""
+        return self._in_use() < self.max_concurrent
+
+    def _in_use(self) -> int:
+        """Count active, starting and pooled sandboxes."""
+        pooled = self.pool.size if self.pool else 0
+        return len(self.active_sandboxes) + self._starting + pooled
+
+    async def _start_sandbox(
         self,
         config: SandboxConfig,
         sandbox_id: str | None = None,
-    ) -> DockerSandbox:
-        """Create a new sandbox.
+        evict: bool = True,
+    ) -> Sandbox:
+        """Reserve a slot and start a sandbox.
+
+        The capacity check and reservation happen before the first await,
+        so concurrent callers cannot overshoot ``max_concurrent`` while
+        containers start in parallel.
 
         Args:
             config: Sandbox configuration
             sandbox_id: Optional sandbox ID (generated if None)
+            evict: Stop the longest-idle pooled sandbox if at capacity
 
         Returns:
-            Created DockerSandbox instance
+            Started sandbox (not yet tracked as active)
 
         Raises:
             SandboxError: If max concurrent limit reached
         """
-        async with self._lock:
-            # Check concurrent limit
-            if len(self.active_sandboxes) >= self.max_concurrent:
+        victim = None
+        if not self.has_capacity():
+            if evict and self.pool:
+                victim = self.pool.take_oldest_idle()
+            if victim is None:
                 raise SandboxError(
                     f"Maximum concurrent sandboxes reached: {self.max_concurrent}"
                 )
+        self._starting += 1
+        try:
+            if victim:
+                try:
+                    await victim.stop()
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to stop evicted sandbox {victim.sandbox_id}: {e}"
+                    )
+            sandbox_id = sandbox_id or generate_ulid()
+            sandbox: Sandbox
+            if config.backend == "process":
+                sandbox = ProcessSandbox(sandbox_id, config)
+            else:
+                sandbox = DockerSandbox(sandbox_id, config, client=self._client)
+            await sandbox.start()
+            return sandbox
+        finally:
+            self._starting -= 1
 
-            # Generate ID if not provided
-            if not sandbox_id:
-                sandbox_id = generate_ulid()
+    async def create(
+        self,
+        config: SandboxConfig,
+        sandbox_id: str | None = None,
+    ) -> Sandbox:
+        """Create a new sandbox.
 
-            # Create sandbox
-            sandbox = DockerSandbox(sandbox_id, config)
-            await sandbox.start()
+        Args:
+            config: Sandbox configuration
+            sandbox_id: Optional sandbox ID (generated if None)
 
-            # Track active sandbox
-            self.active_sandboxes[sandbox_id] = sandbox
+        Returns:
+            Created sandbox (DockerSandbox or ProcessSandbox, per
+            ``config.backend``)
 
-            logger.info(
-                f"Created sandbox {sandbox_id} ({len(self.active_sandboxes)}/{self.max_concurrent})"
-            )
+        Raises:
+            SandboxError: If max concurrent limit reached
+        """
+        sandbox = await self._start_sandbox(config, sandbox_id)
 
-            return sandbox
+        # Track active sandbox
+        self.active_sandboxes[sandbox.sandbox_id] = sandbox
+
+        logger.info(
+            f"Created sandbox {sandbox.sandbox_id} ({len(self.active_sandboxes)}/{self.max_concurrent})"
+        )
+
+        return sandbox
+
+    async def acquire(self, config: SandboxConfig) -> Sandbox:
+        """Get a sandbox, from the warm pool when enabled.
 
-    async def get(self, sandbox_id: str) -> DockerSandbox | None:
+        Falls back to ``create`` when pooling is disabled.
+
+        Args:
+            config: Sandbox configuration
+
+        Returns:
+            Started sandbox; hand it back with ``release``
+
+        Raises:
+            SandboxError: If max concurrent limit reached
+        """
+        if self.pool is None:
+            return await self.create(config)
+
+        sandbox = await self.pool.acquire(config)
+        self.active_sandboxes[sandbox.sandbox_id] = sandbox
+        return sandbox
+
+    async def release(self, sandbox: Sandbox, discard: bool = False) -> None:
+        """Hand back a sandbox obtained from ``acquire``.
+
+        Pooled sandboxes are reset and kept warm; others are destroyed.
+
+        Args:
+            sandbox: Sandbox to release
+            discard: Destroy instead of reusing (e.g. after a failure)
+        """
+        if self.pool is not None and await self.pool.release(sandbox, discard):
+            self.active_sandboxes.pop(sandbox.sandbox_id, None)
+            return
+        await self.destroy(sandbox.sandbox_id)
+
+    async def get(self, sandbox_id: str) -> Sandbox | None:
         """Get active sandbox by ID.
 
         Args:
             sandbox_id: Sandbox identifier
 
         Returns:
-            DockerSandbox if found, None otherwise
+            Sandbox if found, None otherwise
         """
         return self.active_sandboxes.get(sandbox_id)
 
@@ -102,7 +209,9 @@ class SandboxManager:
                 )
 
     async def destroy_all(self) -> None:
-        """Destroy all active sandboxes."""
+        """Destroy all active sandboxes and empty the warm pool."""
+        if self.pool:
+            await self.pool.drain()
         async with self._lock:
             sandbox_ids = list(self.active_sandboxes.keys())
             for sandbox_id in sandbox_ids:
@@ -123,6 +232,8 @@ class SandboxManager:
             "utilization": len(self.active_sandboxes) / self.max_concurrent,
             "sandboxes": {},
         }
+        if self.pool:
+            stats["pool"] = self.pool.stats()
 
         for sandbox_id, sandbox in self.active_sandboxes.items():
             try:
@@ -158,3 +269,23 @@ class SandboxManager:
             yield sandbox
         finally:
             await self.destroy(sandbox.sandbox_id)
+
+    @asynccontextmanager
+    async def pooled(self, config: SandboxConfig):
+        """Context manager around ``acquire`` and ``release``.
+
+        The sandbox is discarded instead of reused if the block raises.
+
+        Args:
+            config: Sandbox configuration
+
+        Yields:
+            Started sandbox
+        """
+        sandbox = await self.acquire(config)
+        try:
+            yield sandbox
+        except BaseException:
+            await self.release(sandbox, discard=True)
+            raise
+        await self.release(sandbox)
@@ -4,10 +4,13 @@ import asyncio
 import logging
 from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from paracle_sandbox.docker_sandbox import DockerSandbox
 from paracle_sandbox.exceptions import ResourceLimitError
+from paracle_sandbox.process_sandbox import Sandbox
+
+if TYPE_CHECKING:
+    from paracle_sandbox.pool import SandboxPool
 
 logger = logging.getLogger(__name__)
 
@@ -23,14 +26,16 @@ class SandboxMonitor:
         interval_seconds: Monitoring interval
         on_warning: Callback for resource warnings
         on_limit_exceeded: Callback for limit violations
+        pool: Warm pool the sandbox came from (for pool metrics)
     """
 
     def __init__(
         self,
-        sandbox: DockerSandbox,
+        sandbox: Sandbox,
         interval_seconds: float = 1.0,
         on_warning: Callable[[dict[str, Any]], None] | None = None,
         on_limit_exceeded: Callable[[dict[str, Any]], None] | None = None,
+        pool: "SandboxPool | None" = None,
     ):
         """Initialize sandbox monitor.
 
@@ -39,8 +44,10 @@ class SandboxMonitor:
             interval_seconds: Monitoring check interval
             on_warning: Callback when resource usage is high (>80%)
             on_limit_exceeded: Callback when limit exceeded
+            pool: Warm pool the sandbox was acquired from
         """
         self.sandbox = sandbox
+        self.pool = pool
         self.interval_seconds = interval_seconds
         self.on_warning = on_warning
         self.on_limit_exceeded = on_limit_exceeded
@@ -65,7 +72,7 @@ class SandboxMonitor:
         if self._task:
             await self._task
             self._task = None
-        logger.info(f"Stopped monitoring {self.sandbox.sandbox_id}")
+            logger.info(f"Stopped monitoring {self.sandbox.sandbox_id}")
 
     async def _monitor_loop(self) -> None:
         """Main monitoring loop."""
@@ -182,6 +189,17 @@ class SandboxMonitor:
             "memory_mb": max(s["memory_mb"] for s in self._history),
         }
 
+    def get_pool_metrics(self) -> dict[str, Any]:
+        """Get warm pool metrics for this sandbox's profile.
+
+        Returns:
+            Dict with hits, misses, hit_rate, resets, evictions, idle and
+            acquire_latency_ms (avg/p50/p95/max); empty without a pool
+        """
+        if self.pool is None:
+            return {}
+        return self.pool.stats(self.sandbox.config)
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.start()
@@ -0,0 +1,448 @@
+"""Warm pool of pre-started sandboxes.
+
+Starting a container dominates short agent runs. The pool keeps a few
+started sandboxes per configuration profile, hands them out on acquire and
+takes them back after wiping their writable mounts, so most acquisitions
+skip container creation entirely.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from paracle_sandbox.config import SandboxConfig
+from paracle_sandbox.exceptions import SandboxError
+from paracle_sandbox.process_sandbox import Sandbox
+
+logger = logging.getLogger(__name__)
+
+StartSandbox = Callable[..., Awaitable[Sandbox]]
+
+
+class PoolConfig(BaseModel):
+    """Configuration for the sandbox warm pool.
+
+    Attributes:
+        min_idle: Idle sandboxes kept warm per profile while it is in use
+        max_idle: Upper bound on idle sandboxes per profile
+        max_idle_seconds: Idle TTL; profiles unused for longer are drained
+        reap_interval_seconds: How often the pool is trimmed and refilled
+        reuse: Reset and reuse released sandboxes (False always destroys)
+    """
+
+    min_idle: int = Field(default=1, ge=0, description="Warm sandboxes per profile")
+    max_idle: int = Field(default=4, ge=0, description="Idle sandboxes per profile")
+    max_idle_seconds: float = Field(
+        default=300.0, gt=0, description="Idle TTL in seconds"
+    )
+    reap_interval_seconds: float = Field(
+        default=5.0, gt=0, description="Reaper interval in seconds"
+    )
+    reuse: bool = Field(default=True, description="Reuse released sandboxes")
+
+
+def profile_key(config: SandboxConfig) -> str:
+    """Return the pool profile key for a sandbox configuration.
+
+    Sandboxes are only interchangeable when every setting matches.
+
+    Args:
+        config: Sandbox configuration
+
+    Returns:
+        Short stable hash of the configuration
+    """
+    return hashlib.sha256(config.model_dump_json().encode()).hexdigest()[:16]
+
+
+@dataclass
+class PoolStats:
+    """Counters and acquire latencies for one pool profile."""
+
+    hits: int = 0
+    misses: int = 0
+    resets: int = 0
+    reset_failures: int = 0
+    evictions: int = 0
+    warmed: int = 0
+    acquire_latencies: deque[float] = field(default_factory=lambda: deque(maxlen=512))
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of acquisitions served from the pool."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the stats as a JSON-serializable dict."""
+        latencies = sorted(self.acquire_latencies)
+        latency_ms: dict[str, float] = {"avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        if latencies:
+            latency_ms = {
+                "avg": sum(latencies) / len(latencies) * 1000,
+                "p50": latencies[len(latencies) // 2] * 1000,
+                "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+                * 1000,
+                "max": latencies[-1] * 1000,
+            }
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "resets": self.resets,
+            "reset_failures": self.reset_failures,
+            "evictions": self.evictions,
+            "warmed": self.warmed,
+            "acquire_latency_ms": latency_ms,
+        }
+
+
+@dataclass
+class _Profile:
+    """Pool state for one sandbox configuration."""
+
+    config: SandboxConfig
+    idle: deque[tuple[Sandbox, float]] = field(default_factory=deque)
+    warming: int = 0
+    queued: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    stats: PoolStats = field(default_factory=PoolStats)
+
+
+class SandboxPool:
+    """Per-profile pool of started, reusable sandboxes.
+
+    The pool does not create containers itself: it asks its owner through
+    ``start`` so that concurrency limits are enforced in one place, and
+    only warms new sandboxes while ``has_capacity`` allows it.
+
+    Sizing follows demand. Each profile keeps ``min_idle`` sandboxes warm
+    plus one per queued job (see ``set_queue_depth``), capped by
+    ``max_idle``. A profile that has not been used for
+    ``max_idle_seconds`` is drained completely.
+
+    Attributes:
+        config: Pool configuration
+    """
+
+    def __init__(
+        self,
+        config: PoolConfig,
+        start: StartSandbox,
+        has_capacity: Callable[[], bool],
+    ):
+        """Initialize the pool.
+
+        Args:
+            config: Pool configuration
+            start: Coroutine ``start(config, evict=bool)`` returning a
+                started sandbox; raises SandboxError when at capacity
+            has_capacity: Whether another sandbox may be started now
+        """
+        self.config = config
+        self._start = start
+        self._has_capacity = has_capacity
+        self._profiles: dict[str, _Profile] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._reaper: asyncio.Task | None = None
+        self._closed = False
+        self._draining = False
+
+    @property
+    def size(self) -> int:
+        """Idle sandboxes plus warm-ups that have not started yet."""
+        return sum(len(p.idle) + p.warming for p in self._profiles.values())
+
+    def idle_count(self, config: SandboxConfig | None = None) -> int:
+        """Return the number of idle sandboxes.
+
+        Args:
+            config: Only count this profile (all profiles if None)
+        """
+        if config is not None:
+            profile = self._profiles.get(profile_key(config))
+            return len(profile.idle) if profile else 0
+        return sum(len(p.idle) for p in self._profiles.values())
+
+    async def acquire(self, config: SandboxConfig) -> Sandbox:
+        """Get a started sandbox for ``config``.
+
+        Returns the most recently released idle sandbox of the profile, or
+        starts a new one (evicting idle sandboxes of other profiles if the
+        owner is at capacity).
+
+        Args:
+            config: Sandbox configuration
+
+        Returns:
+            Started sandbox, owned by the caller until released
+
+        Raises:
+            SandboxError: If no sandbox can be started
+        """
+        started = time.perf_counter()
+        profile = self._profile(config)
+        profile.last_used = time.monotonic()
+
+        sandbox = None
+        while profile.idle:
+            candidate, _ = profile.idle.pop()
+            if candidate.is_running:
+                sandbox = candidate
+                break
+
+        if sandbox is not None:
+            profile.stats.hits += 1
+        else:
+            profile.stats.misses += 1
+            sandbox = await self._start(config, evict=True)
+
+        profile.stats.acquire_latencies.append(time.perf_counter() - started)
+        self._schedule_warm(profile)
+        self._ensure_reaper()
+        return sandbox
+
+    async def release(self, sandbox: Sandbox, discard: bool = False) -> bool:
+        """Return a sandbox to the pool.
+
+        The sandbox is reset before it becomes idle again; surplus idle
+        sandboxes are trimmed by the reaper once they exceed the idle TTL.
+        The caller must destroy the sandbox when this returns False.
+
+        Args:
+            sandbox: Sandbox obtained from ``acquire``
+            discard: Never reuse this sandbox (e.g. after a failure)
+
+        Returns:
+            True if the pool kept the sandbox
+        """
+        profile = self._profiles.get(profile_key(sandbox.config))
+        if (
+            discard
+            or self._closed
+            or self._draining
+            or not self.config.reuse
+            or profile is None
+            or len(profile.idle) >= self.config.max_idle
+        ):
+            return False
+
+        if not await sandbox.reset():
+            profile.stats.reset_failures += 1
+            return False
+
+        profile.stats.resets += 1
+        if self._closed or self._draining or len(profile.idle) >= self.config.max_idle:
+            return False
+        profile.last_used = time.monotonic()
+        profile.idle.append((sandbox, profile.last_used))
+        return True
+
+    async def prewarm(self, config: SandboxConfig, count: int | None = None) -> int:
+        """Start idle sandboxes for a profile ahead of demand.
+
+        Args:
+            config: Sandbox configuration
+            count: Sandboxes to warm (defaults to ``min_idle``)
+
+        Returns:
+            Number of idle sandboxes for the profile afterwards
+        """
+        profile = self._profile(config)
+        profile.last_used = time.monotonic()
+        wanted = min(
+            self.config.max_idle, self.config.min_idle if count is None else count
+        )
+        self._schedule_warm(profile, wanted)
+        await self._drain_warmups()
+        self._ensure_reaper()
+        return len(profile.idle)
+
+    def set_queue_depth(self, config: SandboxConfig, depth: int) -> None:
+        """Report how many jobs for a profile are waiting to run.
+
+        The pool grows toward ``min_idle + depth`` idle sandboxes.
+
+        Args:
+            config: Sandbox configuration of the queued jobs
+            depth: Number of queued jobs
+        """
+        profile = self._profile(config)
+        profile.queued = max(0, depth)
+        if depth:
+            profile.last_used = time.monotonic()
+        self._schedule_warm(profile)
+
+    def take_oldest_idle(self) -> Sandbox | None:
+        """Remove and return the longest-idle sandbox of any profile.
+
+        Used by the owner to free capacity; the caller stops the sandbox.
+        """
+        oldest: _Profile | None = None
+        for profile in self._profiles.values():
+            if profile.idle and (
+                oldest is None or profile.idle[0][1] < oldest.idle[0][1]
+            ):
+                oldest = profile
+        if oldest is None:
+            return None
+        oldest.stats.evictions += 1
+        return oldest.idle.popleft()[0]
+
+    async def reap(self) -> int:
+        """Trim idle sandboxes above each profile's target and refill.
+
+        Returns:
+            Number of sandboxes stopped
+        """
+        now = time.monotonic()
+        reaped = []
+        for profile in self._profiles.values():
+            target = self._target(profile, now)
+            while len(profile.idle) > target:
+                sandbox, since = profile.idle[0]
+                if target and now - since < self.config.max_idle_seconds:
+                    break
+                profile.idle.popleft()
+                profile.stats.evictions += 1
+                reaped.append(sandbox)
+            self._schedule_warm(profile)
+
+        for sandbox in reaped:
+            await _stop_quietly(sandbox)
+        return len(reaped)
+
+    async def close(self) -> None:
+        """Drain the pool and stop accepting sandboxes."""
+        self._closed = True
+        await self.drain()
+
+    async def drain(self) -> None:
+        """Stop the reaper, pending warm-ups and all idle sandboxes."""
+        if self._reaper:
+            self._reaper.cancel()
+            self._reaper = None
+        # Warm-ups are not cancelled: a container being created in a worker
+        # thread would leak. They see the flag and stop what they started.
+        self._draining = True
+        try:
+            await self._drain_warmups()
+            for profile in self._profiles.values():
+                while profile.idle:
+                    await _stop_quietly(profile.idle.popleft()[0])
+                profile.queued = 0
+        finally:
+            self._draining = False
+
+    def stats(self, config: SandboxConfig | None = None) -> dict[str, Any]:
+        """Return pool metrics.
+
+        Args:
+            config: Only report this profile (all profiles if None)
+
+        Returns:
+            Per-profile stats, or a single profile's stats
+        """
+        if config is not None:
+            profile = self._profiles.get(profile_key(config))
+            if profile is None:
+                return PoolStats().to_dict() | {"idle": 0}
+            return profile.stats.to_dict() | {"idle": len(profile.idle)}
+
+        profiles = {
+            key: profile.stats.to_dict() | {"idle": len(profile.idle)}
+            for key, profile in self._profiles.items()
+        }
+        hits = sum(p.stats.hits for p in self._profiles.values())
+        misses = sum(p.stats.misses for p in self._profiles.values())
+        return {
+            "idle": self.idle_count(),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "profiles": profiles,
+        }
+
+    def _profile(self, config: SandboxConfig) -> _Profile:
+        """Get or create the profile for a configuration."""
+        key = profile_key(config)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = self._profiles[key] = _Profile(config=config)
+        return profile
+
+    def _target(self, profile: _Profile, now: float | None = None) -> int:
+        """Desired number of idle sandboxes for a profile."""
+        now = time.monotonic() if now is None else now
+        if (
+            not profile.queued
+            and now - profile.last_used > self.config.max_idle_seconds
+        ):
+            return 0
+        return min(self.config.max_idle, self.config.min_idle + profile.queued)
+
+    def _schedule_warm(self, profile: _Profile, target: int | None = None) -> None:
+        """Start background warm-ups up to the profile's target."""
+        if self._closed or self._draining or not self.config.reuse:
+            return
+        target = self._target(profile) if target is None else target
+        for _ in range(target - len(profile.idle) - profile.warming):
+            if not self._has_capacity():
+                break
+            profile.warming += 1
+            task = asyncio.create_task(self._warm(profile))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _warm(self, profile: _Profile) -> None:
+        """Start one sandbox into the profile's idle list."""
+        # Hand the reserved slot over to the owner's own accounting
+        profile.warming -= 1
+        if self._closed or self._draining:
+            return
+        try:
+            sandbox = await self._start(profile.config, evict=False)
+        except SandboxError as e:
+            logger.debug(f"Skipped sandbox warm-up: {e}")
+            return
+
+        if self._closed or self._draining:
+            await _stop_quietly(sandbox)
+            return
+        profile.stats.warmed += 1
+        profile.idle.append((sandbox, time.monotonic()))
+
+    async def _drain_warmups(self) -> None:
+        """Wait for scheduled warm-ups to finish."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def _ensure_reaper(self) -> None:
+        """Start the periodic reaper if it is not running."""
+        if self._closed or self._draining or (self._reaper and not self._reaper.done()):
+            return
+        self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        """Periodically trim and refill the pool."""
+        while True:
+            await asyncio.sleep(self.config.reap_interval_seconds)
+            try:
+                await self.reap()
+            except Exception as e:
+                logger.error(f"Sandbox pool reaper failed: {e}")
+
+
+async def _stop_quietly(sandbox: Sandbox) -> None:
+    """Stop a sandbox, logging instead of raising on failure."""
+    try:
+        await sandbox.stop()
+    except Exception as e:
+        logger.warning(f"Failed to stop pooled sandbox {sandbox.sandbox_id}: {e}")
@@ -0,0 +1,606 @@
+"""Process-based sandbox using Linux namespaces, cgroups and rlimits.
+
+A lightweight alternative to DockerSandbox for many short executions. Each
+sandbox is a tiny init process in fresh user, mount, PID and network
+namespaces, holding private tmpfs mounts for the working
+directory and /tmp. Commands enter those namespaces with ``nsenter`` and
+run without capabilities, so there is no daemon and no image to start.
+
+Unlike a container, the sandbox sees the host's root filesystem, so the
+backend only accepts ``read_only_filesystem=True`` and
+``network_mode="none"`` and hides home directories behind empty tmpfs
+mounts.
+
+Requires Linux with unprivileged user namespaces and the util-linux tools
+``unshare``, ``nsenter`` and ``setpriv``. Limits are enforced with a
+cgroup v2 child group when the current cgroup is delegated, and with
+``setrlimit`` otherwise.
+"""
+
+import asyncio
+import logging
+import os
+import posixpath
+import resource
+import shlex
+import shutil
+import signal
+import sys
+import time
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+from paracle_sandbox.config import SandboxConfig
+from paracle_sandbox.docker_sandbox import DockerSandbox, _reset_script
+from paracle_sandbox.exceptions import (
+    ResourceLimitError,
+    SandboxCreationError,
+    SandboxExecutionError,
+    SandboxTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_TOOLS = ("unshare", "nsenter", "setpriv")
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+SANDBOX_PATH = "/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"
+READY_TIMEOUT_SECONDS = 10.0
+
+OutputCallback = Callable[[str, str], None]
+
+
+def _hidden_dirs() -> list[str]:
+    """Host directories covered with an empty tmpfs inside the sandbox."""
+    candidates = ["/root", "/home", os.environ.get("HOME", "")]
+    hidden: list[str] = []
+    for path in candidates:
+        path = os.path.realpath(path) if path else ""
+        if path not in ("", "/") and path not in hidden and os.path.isdir(path):
+            hidden.append(path)
+    return hidden
+
+
+def _delegated_cgroup() -> Path | None:
+    """Return the current cgroup v2 directory if sandboxes can nest in it."""
+    if not (CGROUP_ROOT / "cgroup.controllers").exists():
+        return None
+    try:
+        for line in Path("/proc/self/cgroup").read_text().splitlines():
+            if line.startswith("0::"):
+                current = CGROUP_ROOT / line[3:].lstrip("/")
+                break
+        else:
+            return None
+        enabled = (current / "cgroup.subtree_control").read_text().split()
+    except OSError:
+        return None
+    if not {"memory", "pids"} <= set(enabled) or not os.access(current, os.W_OK):
+        return None
+    return current
+
+
+class ProcessSandbox:
+    """Namespace-based sandbox with the same interface as DockerSandbox.
+
+    The root filesystem is the host's, remounted read-only inside the
+    sandbox, with /root, /home and ``$HOME`` hidden behind empty tmpfs
+    mounts; only the working directory and /tmp (private tmpfs mounts) are
+    writable. The sandbox always gets an empty network namespace.
+
+    Attributes:
+        sandbox_id: Unique identifier for this sandbox
+        config: Sandbox configuration
+        working_dir: Working directory inside the sandbox
+    """
+
+    def __init__(self, sandbox_id: str, config: SandboxConfig):
+        """Initialize process sandbox.
+
+        Args:
+            sandbox_id: Unique sandbox identifier
+            config: Sandbox configuration
+
+        Raises:
+            SandboxCreationError: If the configuration needs isolation this
+                backend cannot provide
+        """
+        # Without a container image, a writable root or a shared network
+        # would be the host's own filesystem and network
+        if not config.read_only_filesystem:
+            raise SandboxCreationError(
+                "Process sandbox requires read_only_filesystem=True", sandbox_id
+            )
+        if config.network_mode != "none":
+            raise SandboxCreationError(
+                "Process sandbox only supports network_mode='none', "
+                f"got {config.network_mode!r}",
+                sandbox_id,
+            )
+        self.sandbox_id = sandbox_id
+        self.config = config
+        # The host root is read-only inside, so a missing working directory
+        # is created inside the sandbox's private /tmp instead
+        if os.path.isdir(config.working_dir):
+            self.working_dir = config.working_dir
+        else:
+            name = posixpath.basename(config.working_dir.rstrip("/")) or "workspace"
+            # Inside the sandbox's mount namespace /tmp is a private tmpfs
+            self.working_dir = posixpath.join("/tmp", name)  # nosec B108
+        self._init: asyncio.subprocess.Process | None = None
+        self._init_pid: int | None = None
+        self._cgroup: Path | None = None
+        self._cpu_sample: tuple[float, float] | None = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Whether the process backend can run on this host."""
+        return sys.platform.startswith("linux") and all(
+            shutil.which(tool) for tool in REQUIRED_TOOLS
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the sandbox init process is alive."""
+        return self._init is not None and self._init.returncode is None
+
+    async def start(self) -> None:
+        """Create the namespaces and start the sandbox init process.
+
+        Raises:
+            SandboxCreationError: If the sandbox cannot be created
+        """
+        if not self.is_available():
+            raise SandboxCreationError(
+                "Process sandbox requires Linux with unshare, nsenter and setpriv",
+                self.sandbox_id,
+            )
+
+        self._cgroup = self._create_cgroup()
+        try:
+            self._init = await asyncio.create_subprocess_exec(
+                *self._init_command(),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={"PATH": SANDBOX_PATH},
+                preexec_fn=self._enter_cgroup if self._cgroup else None,
+                start_new_session=True,
+            )
+            ready = await asyncio.wait_for(
+                self._init.stdout.readline(), timeout=READY_TIMEOUT_SECONDS
+            )
+            if ready.strip() != b"ready":
+                stderr = await self._init.stderr.read()
+                raise SandboxCreationError(
+                    "Failed to create sandbox namespaces: "
+                    f"{stderr.decode(errors='replace').strip() or 'init exited'}",
+                    self.sandbox_id,
+                )
+            self._init_pid = self._find_init_pid(self._init.pid)
+        except SandboxCreationError:
+            await self.stop()
+            raise
+        except Exception as e:
+            await self.stop()
+            raise SandboxCreationError(
+                f"Failed to create sandbox: {e}", self.sandbox_id
+            ) from e
+
+        logger.info(f"Sandbox {self.sandbox_id} started with init pid {self._init_pid}")
+
+    def _init_command(self) -> list[str]:
+        """Build the command creating the namespaces and mounts."""
+        config = self.config
+        wd = shlex.quote(self.working_dir)
+        script = [
+            # Remount every mount read-only, in parallel to keep startup fast
+            "while read -r _ m _; do "
+            'mount -o bind,remount,ro "$m" 2>/dev/null & done < /proc/self/mounts; '
+            "wait",
+        ]
+        script += [
+            f"mount -t tmpfs -o rw,nosuid,nodev,size=1m,mode=0755 tmpfs "
+            f"{shlex.quote(path)}"
+            for path in _hidden_dirs()
+        ]
+        script += [
+            "mount -t tmpfs -o rw,nosuid,noexec,size=100m tmpfs /tmp",
+            f"mkdir -p {wd}",
+            f"mount -t tmpfs -o rw,nosuid,size={config.disk_mb}m,mode=0755 tmpfs {wd}",
+            f"cd {wd}",
+            "echo ready",
+            "exec sleep infinity",
+        ]
+        command = [
+            "unshare",
+            "--user",
+            "--map-root-user",
+            "--mount",
+            "--pid",
+            "--fork",
+            "--mount-proc",
+            "--kill-child",
+            "--net",
+        ]
+        return [*command, "sh", "-ec", "\n".join(script)]
+
+    @staticmethod
+    def _find_init_pid(unshare_pid: int) -> int:
+        """Return the host PID of the namespace init forked by unshare."""
+        children = Path(f"/proc/{unshare_pid}/task/{unshare_pid}/children")
+        try:
+            pids = children.read_text().split()
+            if pids:
+                return int(pids[0])
+        except OSError:
+            pass
+        # Kernels without CONFIG_PROC_CHILDREN: scan for the child
+        for stat in Path("/proc").glob("[0-9]*/stat"):
+            try:
+                fields = stat.read_text().rsplit(")", 1)[1].split()
+            except (OSError, IndexError):
+                continue
+            if int(fields[1]) == unshare_pid:
+                return int(stat.parent.name)
+        raise SandboxCreationError("Sandbox init process not found")
+
+    def _create_cgroup(self) -> Path | None:
+        """Create a cgroup v2 child group with the configured limits."""
+        parent = _delegated_cgroup()
+        if parent is None:
+            return None
+        cgroup = parent / f"paracle-sandbox-{self.sandbox_id}"
+        limits = {
+            "memory.max": str(self.config.memory_mb * 1024 * 1024),
+            "memory.swap.max": "0",
+            "pids.max": str(self.config.max_processes),
+            "cpu.max": f"{int(self.config.cpu_cores * 100000)} 100000",
+        }
+        try:
+            cgroup.mkdir(exist_ok=True)
+            for name, value in limits.items():
+                if (cgroup / name).exists():
+                    (cgroup / name).write_text(value)
+        except OSError as e:
+            logger.debug(f"cgroup limits unavailable, using rlimits: {e}")
+            try:
+                cgroup.rmdir()
+            except OSError:
+                pass
+            return None
+        return cgroup
+
+    def _enter_cgroup(self) -> None:
+        """Move the forked child into the sandbox cgroup (pre-exec)."""
+        if self._cgroup is not None:
+            (self._cgroup / "cgroup.procs").write_text("0")
+
+    def _limit_command(self) -> None:
+        """Apply cgroup membership and rlimits to a command (pre-exec)."""
+        self._enter_cgroup()
+        config = self.config
+        disk = config.disk_mb * 1024 * 1024
+        limits = [
+            (resource.RLIMIT_CORE, 0),
+            (resource.RLIMIT_FSIZE, disk),
+            (resource.RLIMIT_CPU, config.timeout_seconds),
+        ]
+        if self._cgroup is None:
+            # Without a cgroup, address space is the closest memory bound.
+            # RLIMIT_NPROC is not used: it counts every process of the host
+            # user, not just the sandbox's.
+            limits.append((resource.RLIMIT_AS, config.memory_mb * 1024 * 1024))
+        for limit, value in limits:
+            hard = resource.getrlimit(limit)[1]
+            if hard != resource.RLIM_INFINITY:
+                value = min(value, hard)
+            resource.setrlimit(limit, (value, value))
+
+    def _enter_command(self, command: list[str], drop_privileges: bool) -> list[str]:
+        """Wrap a command to run inside the sandbox namespaces."""
+        enter = [
+            "nsenter",
+            "--target",
+            str(self._init_pid),
+            "--user",
+            "--mount",
+            "--pid",
+            "--net",
+            # Working directory of the init, i.e. the sandbox working dir
+            "--wd",
+            "--",
+        ]
+        if drop_privileges and self.config.drop_capabilities:
+            enter += [
+                "setpriv",
+                "--no-new-privs",
+                "--bounding-set=-all",
+                "--inh-caps=-all",
+                "--",
+            ]
+        return enter + command
+
+    async def execute(
+        self,
+        command: str | list[str],
+        timeout: int | None = None,
+        on_output: OutputCallback | None = None,
+    ) -> dict[str, Any]:
+        """Execute command in sandbox.
+
+        Args:
+            command: Command to execute (string or list)
+            timeout: Execution timeout (uses config default if None)
+            on_output: Called with ``("stdout" | "stderr", text)`` as output
+                arrives, for streaming
+
+        Returns:
+            Dict with keys: exit_code, stdout, stderr, timed_out
+
+        Raises:
+            SandboxExecutionError: If execution fails
+            SandboxTimeoutError: If execution times out
+        """
+        if not self.is_running:
+            raise SandboxExecutionError("Sandbox not started", self.sandbox_id)
+
+        timeout = timeout or self.config.timeout_seconds
+        if isinstance(command, str):
+            command = shlex.split(command)
+
+        logger.debug(f"Executing in {self.sandbox_id}: {command}")
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._enter_command(command, drop_privileges=True),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={
+                    "PATH": SANDBOX_PATH,
+                    "HOME": self.working_dir,
+                    "TMPDIR": "/tmp",  # nosec B108 - sandbox-private tmpfs
+                    **self.config.env_vars,
+                },
+                preexec_fn=self._limit_command,
+                start_new_session=True,
+            )
+        except Exception as e:
+            raise SandboxExecutionError(
+                f"Execution failed: {e}", self.sandbox_id
+            ) from e
+
+        stdout: list[bytes] = []
+        stderr: list[bytes] = []
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    _pump(process.stdout, stdout, "stdout", on_output),
+                    _pump(process.stderr, stderr, "stderr", on_output),
+                    process.wait(),
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            _kill_group(process.pid)
+            await process.wait()
+            raise SandboxTimeoutError(
+                f"Execution timed out after {timeout}s",
+                self.sandbox_id,
+                timeout,
+            ) from None
+        except asyncio.CancelledError:
+            _kill_group(process.pid)
+            raise
+
+        result = {
+            "exit_code": process.returncode,
+            "stdout": b"".join(stdout).decode("utf-8", errors="replace"),
+            "stderr": b"".join(stderr).decode("utf-8", errors="replace"),
+            "timed_out": False,
+        }
+        logger.debug(
+            f"Execution in {self.sandbox_id} completed: exit_code={result['exit_code']}"
+        )
+        return result
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get resource usage statistics.
+
+        Returns:
+            Dict with CPU and memory stats (network counters are zero)
+
+        Raises:
+            SandboxExecutionError: If stats retrieval fails
+        """
+        if not self.is_running:
+            raise SandboxExecutionError("Sandbox not started", self.sandbox_id)
+
+        try:
+            cpu_seconds, mem_usage = await asyncio.to_thread(self._read_usage)
+        except Exception as e:
+            raise SandboxExecutionError(
+                f"Failed to get stats: {e}",
+                self.sandbox_id,
+            ) from e
+
+        now = time.monotonic()
+        cpu_percent = 0.0
+        if self._cpu_sample is not None:
+            last_time, last_cpu = self._cpu_sample
+            if now > last_time:
+                cpu_percent = max(0.0, cpu_seconds - last_cpu) / (now - last_time)
+                cpu_percent *= 100.0
+        self._cpu_sample = (now, cpu_seconds)
+
+        mem_limit = self.config.memory_mb * 1024 * 1024
+        return {
+            "cpu_percent": cpu_percent,
+            "memory_bytes": mem_usage,
+            "memory_mb": mem_usage / (1024 * 1024),
+            "memory_percent": mem_usage / mem_limit * 100.0,
+            "memory_limit_mb": self.config.memory_mb,
+            "network_rx_bytes": 0,
+            "network_tx_bytes": 0,
+        }
+
+    def _read_usage(self) -> tuple[float, int]:
+        """Return (cpu seconds, memory bytes) used by the sandbox."""
+        if self._cgroup is not None:
+            memory = int((self._cgroup / "memory.current").read_text())
+            cpu_usec = 0
+            for line in (self._cgroup / "cpu.stat").read_text().splitlines():
+                key, _, value = line.partition(" ")
+                if key == "usage_usec":
+                    cpu_usec = int(value)
+            return cpu_usec / 1e6, memory
+
+        # No cgroup: sum over the processes in the sandbox PID namespace
+        ticks = os.sysconf("SC_CLK_TCK")
+        page = os.sysconf("SC_PAGE_SIZE")
+        cpu = 0.0
+        memory = 0
+        for pid in self._sandbox_pids():
+            try:
+                fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+                rss_pages = int(Path(f"/proc/{pid}/statm").read_text().split()[1])
+            except (OSError, IndexError):
+                continue
+            cpu += (int(fields[11]) + int(fields[12])) / ticks
+            memory += rss_pages * page
+        return cpu, memory
+
+    def _sandbox_pids(self) -> list[int]:
+        """Return host PIDs of processes in the sandbox PID namespace."""
+        namespace = os.readlink(f"/proc/{self._init_pid}/ns/pid")
+        pids = []
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            try:
+                if os.readlink(f"/proc/{entry.name}/ns/pid") == namespace:
+                    pids.append(int(entry.name))
+            except OSError:
+                continue
+        return pids
+
+    async def check_limits(self) -> None:
+        """Check if resource limits are exceeded.
+
+        Raises:
+            ResourceLimitError: If any resource limit is exceeded
+        """
+        stats = await self.get_stats()
+
+        # Check memory limit
+        if stats["memory_percent"] > 95:
+            raise ResourceLimitError(
+                f"Memory limit exceeded: {stats['memory_percent']:.1f}%",
+                self.sandbox_id,
+                "memory",
+                stats["memory_mb"],
+                self.config.memory_mb,
+            )
+
+        # Check CPU (warning only, not enforced)
+        if stats["cpu_percent"] > self.config.cpu_cores * 100:
+            logger.warning(
+                f"Sandbox {self.sandbox_id} CPU usage high: {stats['cpu_percent']:.1f}%"
+            )
+
+    async def reset(self) -> bool:
+        """Restore the sandbox to its freshly started state for reuse.
+
+        Kills every process except the init and wipes the private tmpfs
+        mounts (working directory and /tmp).
+
+        Returns:
+            True if the sandbox can be reused, False if it must be destroyed
+        """
+        if not self.is_running:
+            return False
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._enter_command(
+                    ["sh", "-c", _reset_script(self.working_dir)],
+                    drop_privileges=False,
+                ),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+                env={"PATH": SANDBOX_PATH},
+            )
+            exit_code = await asyncio.wait_for(
+                process.wait(), timeout=self.config.cleanup_timeout
+            )
+        except Exception as e:
+            logger.warning(f"Failed to reset sandbox {self.sandbox_id}: {e}")
+            return False
+        return exit_code == 0
+
+    async def stop(self) -> None:
+        """Stop the sandbox, killing every process in it."""
+        init, self._init = self._init, None
+        if init is not None:
+            logger.info(f"Stopping sandbox {self.sandbox_id}")
+            # Killing the namespace init tears down the whole PID namespace
+            for pid in (self._init_pid, init.pid):
+                if pid is not None:
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+            try:
+                await asyncio.wait_for(init.wait(), timeout=self.config.cleanup_timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Sandbox {self.sandbox_id} init did not exit")
+            logger.info(f"Sandbox {self.sandbox_id} stopped")
+        self._init_pid = None
+
+        if self._cgroup is not None:
+            try:
+                self._cgroup.rmdir()
+            except OSError as e:
+                logger.warning(f"Failed to remove cgroup {self._cgroup}: {e}")
+            self._cgroup = None
+
+    @asynccontextmanager
+    async def context(self):
+        """Context manager for sandbox lifecycle.
+
+        Automatically starts and stops the sandbox.
+        """
+        try:
+            await self.start()
+            yield self
+        finally:
+            await self.stop()
+
+
+async def _pump(
+    stream: asyncio.StreamReader,
+    chunks: list[bytes],
+    name: str,
+    on_output: OutputCallback | None,
+) -> None:
+    """Collect a process stream, forwarding chunks to ``on_output``."""
+    while chunk := await stream.read(65536):
+        chunks.append(chunk)
+        if on_output is not None:
+            try:
+                on_output(name, chunk.decode("utf-8", errors="replace"))
+            except Exception as e:
+                logger.error(f"Output callback failed: {e}")
+
+
+def _kill_group(pid: int) -> None:
+    """Kill a command's process group."""
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+Sandbox = DockerSandbox | ProcessSandbox
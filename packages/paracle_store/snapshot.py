@@ -5,15 +5,22 @@ Provides snapshot-based state management with rollback capabilities:
 - Version tracking for optimistic concurrency
 - Rollback to previous versions
 - Snapshot pruning and retention policies
+- Compact history: periodic keyframes plus JSON-patch deltas (SQLite)
 
 This is the foundation for transaction-like semantics in Paracle.
 """
 
 from __future__ import annotations
 
+import copy
+import json
+import sqlite3
 import threading
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any, Generic, TypeVar
 from uuid import uuid4
 
@@ -251,6 +258,575 @@ class InMemorySnapshotStore(SnapshotStore):
             return count
 
 
+# =============================================================================
+# Delta encoding
+# =============================================================================
+
+
+def _escape_token(token: str) -> str:
+    """Escape a key for use in a JSON pointer."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_token(token: str) -> str:
+    """Unescape a JSON pointer token."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_state(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """Compute a JSON patch (RFC 6902) turning ``old`` into ``new``.
+
+    Objects are compared key by key and lists index by index, so a small
+    change to a large state yields a small patch. Only ``add``, ``remove``
+    and ``replace`` operations are produced.
+
+    Args:
+        old: Previous JSON-compatible value
+        new: New JSON-compatible value
+        path: JSON pointer of the compared values
+
+    Returns:
+        Patch operations (empty if the values are equal)
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key, value in old.items():
+            child = f"{path}/{_escape_token(key)}"
+            if key in new:
+                ops.extend(diff_state(value, new[key], child))
+            else:
+                ops.append({"op": "remove", "path": child})
+        for key, value in new.items():
+            if key not in old:
+                ops.append(
+                    {
+                        "op": "add",
+                        "path": f"{path}/{_escape_token(key)}",
+                        "value": value,
+                    }
+                )
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(diff_state(old[i], new[i], f"{path}/{i}"))
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        return ops
+
+    # Type check keeps 1 / 1.0 / True distinct
+    if type(old) is type(new) and old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: list[dict[str, Any]]) -> Any:
+    """Apply a patch produced by :func:`diff_state`, in place.
+
+    Args:
+        document: JSON-compatible value to modify
+        patch: Patch operations
+
+    Returns:
+        The patched document (a new object if the root was replaced)
+    """
+    for op in patch:
+        path = op["path"]
+        if not path:
+            document = op["value"]
+            continue
+        *parents, last = [_unescape_token(t) for t in path[1:].split("/")]
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+
+        if isinstance(target, list):
+            index = int(last)
+            if op["op"] == "add":
+                target.insert(index, op["value"])
+            elif op["op"] == "remove":
+                del target[index]
+            else:
+                target[index] = op["value"]
+        elif op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = op["value"]
+    return document
+
+
+class SnapshotRetention(BaseModel):
+    """Retention policy for stored snapshots.
+
+    The latest snapshot of an aggregate is always kept.
+    """
+
+    keep_versions: int | None = Field(
+        None, ge=1, description="Keep at most this many versions per aggregate"
+    )
+    max_age_hours: float | None = Field(
+        None, gt=0, description="Drop snapshots older than this"
+    )
+
+
+CREATE_SNAPSHOTS_TABLE = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id TEXT PRIMARY KEY,
+    aggregate_id TEXT NOT NULL,
+    aggregate_type TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    keyframe INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    created_by TEXT,
+    reason TEXT,
+    parent_snapshot_id TEXT
+);
+"""
+
+CREATE_SNAPSHOTS_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_snapshots_version
+    ON snapshots(aggregate_id, version);
+CREATE INDEX IF NOT EXISTS idx_snapshots_created ON snapshots(created_at);
+"""
+
+
+class SQLiteSnapshotStore(SnapshotStore):
+    """SQLite-backed snapshot store with delta-encoded history.
+
+    Every ``keyframe_interval`` versions the full state is stored (a
+    keyframe); versions in between store a JSON patch against the previous
+    version. Reading any version applies at most ``keyframe_interval - 1``
+    patches to its keyframe, found through the (aggregate_id, version)
+    index. A full state is stored instead whenever the patch would not be
+    clearly smaller.
+
+    Rows record the version of their keyframe, so deleting or pruning a
+    row first turns its successor into a keyframe when needed and the
+    remaining chain stays readable.
+
+    Example:
+        >>> store = SQLiteSnapshotStore("snapshots.db", keyframe_interval=16)
+        >>> store.save(snapshot)
+        >>> store.get_by_version("agent_123", 42)
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        *,
+        in_memory: bool = False,
+        keyframe_interval: int = 16,
+        retention: SnapshotRetention | None = None,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            db_path: Path to SQLite database file
+            in_memory: Use in-memory database (for testing)
+            keyframe_interval: Versions between full-state keyframes
+            retention: Retention policy (``keep_versions`` is enforced on
+                save, ``max_age_hours`` by :meth:`apply_retention`)
+        """
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        if in_memory:
+            self._db_path = ":memory:"
+        elif db_path:
+            self._db_path = str(db_path)
+        else:
+            self._db_path = "paracle_snapshots.db"
+
+        self.keyframe_interval = keyframe_interval
+        self.retention = retention or SnapshotRetention()
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        # aggregate_id -> (version, keyframe version, state) of latest snapshot
+        self._latest: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+        with self._transaction() as cursor:
+            cursor.execute(CREATE_SNAPSHOTS_TABLE)
+            cursor.executescript(CREATE_SNAPSHOTS_INDEXES)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Context manager for database transactions."""
+        with self._lock:
+            cursor = self._connection.cursor()
+            try:
+                yield cursor
+                self._connection.commit()
+            except Exception:
+                self._connection.rollback()
+                raise
+
+    # -------------------------------------------------------------------------
+    # Reconstruction
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _row_to_snapshot(row: sqlite3.Row, state: dict[str, Any]) -> StateSnapshot:
+        """Convert database row and reconstructed state to a snapshot."""
+        return StateSnapshot(
+            id=row["id"],
+            aggregate_id=row["aggregate_id"],
+            aggregate_type=row["aggregate_type"],
+            version=row["version"],
+            state=state,
+            created_at=datetime.fromisoformat(row["created_at"]),
+            metadata=json.loads(row["metadata"]),
+            created_by=row["created_by"],
+            reason=row["reason"],
+            parent_snapshot_id=row["parent_snapshot_id"],
+        )
+
+    @staticmethod
+    def _replay(rows: list[sqlite3.Row]) -> Iterator[tuple[sqlite3.Row, Any]]:
+        """Yield each row with its state, rows ascending from a keyframe.
+
+        The yielded state is modified by later steps; copy it to keep it.
+        """
+        state: Any = None
+        for row in rows:
+            data = json.loads(row["data"])
+            if row["keyframe"] == row["version"]:
+                state = data
+            else:
+                state = apply_patch(state, data)
+            yield row, state
+
+    def _chain(
+        self, cursor: sqlite3.Cursor, aggregate_id: str, version: int
+    ) -> list[sqlite3.Row]:
+        """Rows needed to reconstruct a version (keyframe first)."""
+        cursor.execute(
+            """
+            SELECT * FROM snapshots
+            WHERE aggregate_id = ? AND version BETWEEN
+                (SELECT keyframe FROM snapshots WHERE aggregate_id = ? AND version = ?)
+                AND ?
+            ORDER BY version ASC
+            """,
+            (aggregate_id, aggregate_id, version, version),
+        )
+        return cursor.fetchall()
+
+    def _materialize(
+        self, cursor: sqlite3.Cursor, aggregate_id: str, version: int
+    ) -> tuple[sqlite3.Row, Any] | None:
+        """Reconstruct one version; returns (row, state) or None."""
+        result = None
+        for row, state in self._replay(self._chain(cursor, aggregate_id, version)):
+            result = row, state
+        return result
+
+    def _make_keyframe(
+        self, cursor: sqlite3.Cursor, aggregate_id: str, version: int
+    ) -> None:
+        """Store a delta row as a full state so its predecessors can go."""
+        row, state = self._materialize(cursor, aggregate_id, version)
+        if row["keyframe"] == version:
+            return
+        cursor.execute(
+            "UPDATE snapshots SET keyframe = ? "
+            "WHERE aggregate_id = ? AND keyframe = ? AND version >= ?",
+            (version, aggregate_id, row["keyframe"], version),
+        )
+        cursor.execute(
+            "UPDATE snapshots SET data = ? WHERE aggregate_id = ? AND version = ?",
+            (json.dumps(state, separators=(",", ":")), aggregate_id, version),
+        )
+        latest = self._latest.get(aggregate_id)
+        if latest and latest[1] == row["keyframe"] and latest[0] >= version:
+            self._latest[aggregate_id] = (latest[0], version, latest[2])
+
+    def _next_version(
+        self, cursor: sqlite3.Cursor, aggregate_id: str, version: int
+    ) -> int | None:
+        """Return the first stored version after ``version``."""
+        cursor.execute(
+            "SELECT MIN(version) FROM snapshots WHERE aggregate_id = ? AND version > ?",
+            (aggregate_id, version),
+        )
+        return cursor.fetchone()[0]
+
+    def _latest_state(
+        self, cursor: sqlite3.Cursor, aggregate_id: str
+    ) -> tuple[int, int, dict[str, Any]] | None:
+        """Latest (version, keyframe, state) for an aggregate, cached."""
+        latest = self._latest.get(aggregate_id)
+        if latest is None:
+            cursor.execute(
+                "SELECT MAX(version) FROM snapshots WHERE aggregate_id = ?",
+                (aggregate_id,),
+            )
+            version = cursor.fetchone()[0]
+            if version is None:
+                return None
+            row, state = self._materialize(cursor, aggregate_id, version)
+            latest = (version, row["keyframe"], state)
+            self._latest[aggregate_id] = latest
+        return latest
+
+    # -------------------------------------------------------------------------
+    # SnapshotStore interface
+    # -------------------------------------------------------------------------
+
+    def save(self, snapshot: StateSnapshot) -> None:
+        """Save a snapshot as a keyframe or as a delta to the previous one."""
+        aggregate_id = snapshot.aggregate_id
+        full = json.dumps(snapshot.state, separators=(",", ":"))
+
+        with self._transaction() as cursor:
+            latest = self._latest_state(cursor, aggregate_id)
+            data, keyframe = full, snapshot.version
+            if latest is not None and snapshot.version <= latest[0]:
+                # Inserted before newer versions: the successor's delta was
+                # computed against another state, so it becomes a keyframe
+                following = self._next_version(cursor, aggregate_id, snapshot.version)
+                if following is not None:
+                    self._make_keyframe(cursor, aggregate_id, following)
+            elif (
+                latest is not None
+                and snapshot.version - latest[1] < self.keyframe_interval
+            ):
+                patch = json.dumps(
+                    diff_state(latest[2], snapshot.state), separators=(",", ":")
+                )
+                if len(patch) * 2 < len(full):
+                    data, keyframe = patch, latest[1]
+
+            cursor.execute(
+                """
+                INSERT INTO snapshots (id, aggregate_id, aggregate_type, version,
+                    keyframe, data, created_at, metadata, created_by, reason,
+                    parent_snapshot_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    snapshot.id,
+                    aggregate_id,
+                    snapshot.aggregate_type,
+                    snapshot.version,
+                    keyframe,
+                    data,
+                    snapshot.created_at.isoformat(),
+                    json.dumps(snapshot.metadata),
+                    snapshot.created_by,
+                    snapshot.reason,
+                    snapshot.parent_snapshot_id,
+                ),
+            )
+            if latest is None or snapshot.version > latest[0]:
+                self._latest[aggregate_id] = (
+                    snapshot.version,
+                    keyframe,
+                    json.loads(full),
+                )
+
+            if self.retention.keep_versions:
+                self._prune(cursor, aggregate_id, self.retention.keep_versions)
+
+    def get(self, snapshot_id: str) -> StateSnapshot | None:
+        """Get snapshot by ID."""
+        with self._transaction() as cursor:
+            cursor.execute(
+                "SELECT aggregate_id, version FROM snapshots WHERE id = ?",
+                (snapshot_id,),
+            )
+            row = cursor.fetchone()
+        if not row:
+            return None
+        return self.get_by_version(row["aggregate_id"], row["version"])
+
+    def get_latest(self, aggregate_id: str) -> StateSnapshot | None:
+        """Get the latest snapshot for an aggregate."""
+        with self._transaction() as cursor:
+            latest = self._latest_state(cursor, aggregate_id)
+            if latest is None:
+                return None
+            cursor.execute(
+                "SELECT * FROM snapshots WHERE aggregate_id = ? AND version = ?",
+                (aggregate_id, latest[0]),
+            )
+            return self._row_to_snapshot(cursor.fetchone(), copy.deepcopy(latest[2]))
+
+    def get_by_version(self, aggregate_id: str, version: int) -> StateSnapshot | None:
+        """Get snapshot by aggregate ID and version (keyframe + deltas)."""
+        with self._transaction() as cursor:
+            result = self._materialize(cursor, aggregate_id, version)
+        if result is None:
+            return None
+        return self._row_to_snapshot(*result)
+
+    def get_history(
+        self,
+        aggregate_id: str,
+        limit: int | None = None,
+    ) -> list[StateSnapshot]:
+        """Get snapshot history for an aggregate (newest first)."""
+        with self._transaction() as cursor:
+            cursor.execute(
+                "SELECT version, keyframe FROM snapshots WHERE aggregate_id = ? "
+                "ORDER BY version DESC LIMIT ?",
+                (aggregate_id, limit or -1),
+            )
+            wanted = cursor.fetchall()
+            if not wanted:
+                return []
+            oldest, keyframe = wanted[-1]
+            cursor.execute(
+                "SELECT * FROM snapshots WHERE aggregate_id = ? AND version >= ? "
+                "ORDER BY version ASC",
+                (aggregate_id, keyframe),
+            )
+            rows = cursor.fetchall()
+
+        history = [
+            self._row_to_snapshot(row, copy.deepcopy(state))
+            for row, state in self._replay(rows)
+            if row["version"] >= oldest
+        ]
+        history.reverse()
+        return history
+
+    def delete(self, snapshot_id: str) -> bool:
+        """Delete a snapshot, re-encoding its successor if it depends on it."""
+        with self._transaction() as cursor:
+            cursor.execute(
+                "SELECT aggregate_id, version FROM snapshots WHERE id = ?",
+                (snapshot_id,),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return False
+            aggregate_id, version = row
+            following = self._next_version(cursor, aggregate_id, version)
+            if following is not None:
+                self._make_keyframe(cursor, aggregate_id, following)
+            cursor.execute("DELETE FROM snapshots WHERE id = ?", (snapshot_id,))
+            self._latest.pop(aggregate_id, None)
+            return True
+
+    def prune(
+        self,
+        aggregate_id: str,
+        keep_versions: int = 10,
+    ) -> int:
+        """Prune old snapshots, keeping the N most recent versions."""
+        with self._transaction() as cursor:
+            return self._prune(cursor, aggregate_id, keep_versions)
+
+    def _prune(
+        self, cursor: sqlite3.Cursor, aggregate_id: str, keep_versions: int
+    ) -> int:
+        """Delete all but the newest ``keep_versions`` versions."""
+        cursor.execute(
+            "SELECT version FROM snapshots WHERE aggregate_id = ? "
+            "ORDER BY version DESC LIMIT 1 OFFSET ?",
+            (aggregate_id, max(keep_versions, 1) - 1),
+        )
+        row = cursor.fetchone()
+        return self._truncate(cursor, aggregate_id, row[0]) if row else 0
+
+    def _truncate(
+        self, cursor: sqlite3.Cursor, aggregate_id: str, first_version: int
+    ) -> int:
+        """Delete versions before ``first_version``."""
+        self._make_keyframe(cursor, aggregate_id, first_version)
+        cursor.execute(
+            "DELETE FROM snapshots WHERE aggregate_id = ? AND version < ?",
+            (aggregate_id, first_version),
+        )
+        return cursor.rowcount
+
+    # -------------------------------------------------------------------------
+    # Retention and maintenance
+    # -------------------------------------------------------------------------
+
+    def apply_retention(self, aggregate_id: str | None = None) -> int:
+        """Apply the retention policy.
+
+        Args:
+            aggregate_id: Only this aggregate (all aggregates if None)
+
+        Returns:
+            Number of snapshots deleted
+        """
+        keep = self.retention.keep_versions
+        max_age = self.retention.max_age_hours
+        if not keep and not max_age:
+            return 0
+
+        deleted = 0
+        with self._transaction() as cursor:
+            if aggregate_id is None:
+                cursor.execute("SELECT DISTINCT aggregate_id FROM snapshots")
+                aggregate_ids = [row[0] for row in cursor.fetchall()]
+            else:
+                aggregate_ids = [aggregate_id]
+
+            for agg in aggregate_ids:
+                if keep:
+                    deleted += self._prune(cursor, agg, keep)
+                if max_age:
+                    cutoff = _utcnow() - timedelta(hours=max_age)
+                    cursor.execute(
+                        "SELECT MIN(version) FROM snapshots "
+                        "WHERE aggregate_id = ? AND created_at >= ?",
+                        (agg, cutoff.isoformat()),
+                    )
+                    first = cursor.fetchone()[0]
+                    if first is None:
+                        cursor.execute(
+                            "SELECT MAX(version) FROM snapshots WHERE aggregate_id = ?",
+                            (agg,),
+                        )
+                        first = cursor.fetchone()[0]
+                    if first is not None:
+                        deleted += self._truncate(cursor, agg, first)
+        return deleted
+
+    def storage_stats(self) -> dict[str, int]:
+        """Get keyframe/delta counts and stored payload size."""
+        with self._transaction() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*), COALESCE(SUM(keyframe = version), 0), "
+                "COALESCE(SUM(LENGTH(data)), 0) FROM snapshots"
+            )
+            count, keyframes, size = cursor.fetchone()
+        return {
+            "snapshots": count,
+            "keyframes": keyframes,
+            "deltas": count - keyframes,
+            "data_bytes": size,
+        }
+
+    def count(self) -> int:
+        """Get total number of snapshots."""
+        with self._transaction() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM snapshots")
+            return cursor.fetchone()[0]
+
+    def clear(self) -> int:
+        """Clear all snapshots."""
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM snapshots")
+            self._latest.clear()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
 class VersionedEntity(BaseModel):
     """Mixin for entities that support versioning.
 
@@ -332,15 +908,15 @@ class Snapshottable(Generic[T]):
         Returns:
             Created snapshot
         """
-        # Get next version
-        current_version = self._versions.get(entity_id, 0)
-        new_version = current_version + 1
-        self._versions[entity_id] = new_version
-
         # Get parent snapshot
         parent = self._snapshot_store.get_latest(entity_id)
         parent_id = parent.id if parent else None
 
+        # Get next version (continuing a persistent store's history)
+        current_version = self._versions.get(entity_id, parent.version if parent else 0)
+        new_version = current_version + 1
+        self._versions[entity_id] = new_version
+
         # Create snapshot
         snapshot = StateSnapshot(
             aggregate_id=entity_id,
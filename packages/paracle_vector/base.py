@@ -6,6 +6,7 @@ and common types used across implementations.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -197,6 +198,42 @@ class VectorStore(ABC):
         """
         pass
 
+    async def search_batch(
+        self,
+        collection: str,
+        query_embeddings: list[list[float]],
+        *,
+        top_k: int = 10,
+        filter_metadata: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several query vectors at once.
+
+        The default runs the searches concurrently; stores with native
+        multi-query support override this with a single request.
+
+        Args:
+            collection: Collection name
+            query_embeddings: Query vectors
+            top_k: Number of results per query
+            filter_metadata: Optional metadata filter (shared by all queries)
+
+        Returns:
+            One result list per query vector, in order
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.search(
+                        collection,
+                        embedding,
+                        top_k=top_k,
+                        filter_metadata=filter_metadata,
+                    )
+                    for embedding in query_embeddings
+                )
+            )
+        )
+
     @abstractmethod
     async def count_documents(self, collection: str) -> int:
         """Count documents in a collection.
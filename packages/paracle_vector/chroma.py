@@ -256,6 +256,26 @@ class ChromaStore(VectorStore):
         filter_metadata: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
         """Search for similar documents."""
+        results = await self.search_batch(
+            collection,
+            [query_embedding],
+            top_k=top_k,
+            filter_metadata=filter_metadata,
+        )
+        return results[0]
+
+    async def search_batch(
+        self,
+        collection: str,
+        query_embeddings: list[list[float]],
+        *,
+        top_k: int = 10,
+        filter_metadata: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several query vectors in one ChromaDB query."""
+        if not query_embeddings:
+            return []
+
         client = self._get_client()
 
         try:
@@ -272,7 +292,7 @@ class ChromaStore(VectorStore):
 
         try:
             result = coll.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=query_embeddings,
                 n_results=top_k,
                 where=where,
                 include=["documents", "embeddings", "metadatas", "distances"],
@@ -280,21 +300,27 @@ class ChromaStore(VectorStore):
         except Exception as e:
             raise VectorStoreError(f"Failed to search: {e}") from e
 
-        # Convert results
+        return [self._convert_results(result, q) for q in range(len(query_embeddings))]
+
+    @staticmethod
+    def _convert_results(result: dict[str, Any], q: int) -> list[SearchResult]:
+        """Convert the results of query ``q`` of a ChromaDB query."""
         results = []
-        if result["ids"] and result["ids"][0]:
-            for i, doc_id in enumerate(result["ids"][0]):
-                distance = result["distances"][0][i] if result["distances"] else 0.0
+        if result["ids"] and result["ids"][q]:
+            distances = result["distances"][q] if result["distances"] else None
+            documents = result["documents"][q] if result["documents"] else None
+            embeddings = result["embeddings"][q] if result["embeddings"] else None
+            metadatas = result["metadatas"][q] if result["metadatas"] else None
+            for i, doc_id in enumerate(result["ids"][q]):
+                distance = distances[i] if distances else 0.0
                 # Convert distance to similarity score (assuming L2 distance)
                 score = 1.0 / (1.0 + distance)
 
                 doc = Document(
                     id=doc_id,
-                    content=result["documents"][0][i] if result["documents"] else "",
-                    embedding=(
-                        result["embeddings"][0][i] if result["embeddings"] else None
-                    ),
-                    metadata=result["metadatas"][0][i] if result["metadatas"] else {},
+                    content=documents[i] if documents else "",
+                    embedding=embeddings[i] if embeddings is not None else None,
+                    metadata=metadatas[i] if metadatas else {},
                 )
                 results.append(
                     SearchResult(document=doc, score=score, distance=distance)
@@ -0,0 +1,153 @@
+"""Tests for incremental AgentCompiler builds."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from paracle_core.parac.agent_compiler import AgentCompiler
+from paracle_core.parac.compiled import clear_workspace_cache
+
+MANIFEST = """\
+agents:
+  - id: coder
+    name: Coder
+    role: Writes code
+    description: Implements features
+  - id: tester
+    name: Tester
+    role: Tests code
+    description: Writes tests
+"""
+
+
+@pytest.fixture
+def parac(tmp_path):
+    root = tmp_path / ".parac"
+    (root / "agents" / "specs").mkdir(parents=True)
+    (root / "agents" / "manifest.yaml").write_text(MANIFEST)
+    for agent_id in ("coder", "tester"):
+        (root / "agents" / "specs" / f"{agent_id}.md").write_text(f"# {agent_id}\n")
+    yield root
+    clear_workspace_cache()
+
+
+def _set_description(parac, agent_id, description):
+    manifest = parac / "agents" / "manifest.yaml"
+    content = MANIFEST
+    if agent_id == "coder":
+        content = content.replace("Implements features", description)
+    manifest.write_text(content)
+    # Make sure the tree hash moves even on coarse mtime file systems
+    stat = manifest.stat()
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestIncrementalBuild:
+    """Tests for AgentCompiler.build."""
+
+    def test_second_build_writes_nothing(self, parac):
+        first = AgentCompiler(parac).build("claude")
+        assert sorted(first["written"]) == sorted(first["files"])
+        assert len(first["files"]) == 2
+
+        second = AgentCompiler(parac).build("claude")
+
+        assert second["written"] == []
+        assert sorted(second["unchanged"]) == sorted(first["files"])
+
+    def test_only_affected_agent_is_rewritten(self, parac):
+        compiler = AgentCompiler(parac)
+        compiler.build("claude")
+
+        _set_description(parac, "coder", "Ships features")
+        result = compiler.build("claude")
+
+        assert [p.rsplit("/", 1)[-1] for p in result["written"]] == ["coder.md"]
+        coder = parac / "integrations" / "ide" / "agents" / "claude" / "coder.md"
+        assert "Ships features" in coder.read_text()
+
+    def test_unchanged_render_is_not_written(self, parac):
+        compiler = AgentCompiler(parac)
+        result = compiler.build("claude")
+        path = Path(result["files"][0])
+        mtime = path.stat().st_mtime_ns
+
+        full = compiler.build("claude", incremental=False)
+
+        assert full["written"] == []
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_hand_edited_output_is_restored(self, parac):
+        compiler = AgentCompiler(parac)
+        result = compiler.build("claude")
+        path = next(p for p in result["files"] if p.endswith("coder.md"))
+        original = open(path).read()
+
+        with open(path, "w") as f:
+            f.write("edited")
+        rebuilt = compiler.build("claude")
+
+        assert rebuilt["written"] == [path]
+        assert open(path).read() == original
+
+    def test_removed_agent_output_is_deleted(self, parac):
+        compiler = AgentCompiler(parac)
+        compiler.build("claude")
+        tester = parac / "integrations" / "ide" / "agents" / "claude" / "tester.md"
+        assert tester.exists()
+
+        manifest = parac / "agents" / "manifest.yaml"
+        manifest.write_text(MANIFEST.split("  - id: tester")[0])
+        result = compiler.build("claude")
+
+        assert result["removed"] == [str(tester)]
+        assert not tester.exists()
+
+    def test_parallel_build_all_matches_sequential(self, parac, tmp_path):
+        parallel = AgentCompiler(parac).build("all")
+        sequential = AgentCompiler(parac).build(
+            "all", output_dir=tmp_path / "seq", parallel=False, incremental=False
+        )
+
+        assert len(parallel["files"]) == len(sequential["files"])
+        assert any(p.endswith("tasks.json") for p in parallel["files"])
+
+    def test_copy_skips_identical_destinations(self, parac):
+        compiler = AgentCompiler(parac)
+        compiler.build("claude")
+
+        assert len(compiler.copy_to_destinations("claude")) == 2
+        assert compiler.copy_to_destinations("claude") == []
+
+
+class TestWatch:
+    """Tests for AgentCompiler.watch."""
+
+    def test_rebuilds_on_change(self, parac):
+        compiler = AgentCompiler(parac)
+        compiler.build("claude")
+        results = []
+        stop = threading.Event()
+
+        def on_build(result):
+            results.append(result)
+            stop.set()
+
+        thread = threading.Thread(
+            target=compiler.watch,
+            args=("claude",),
+            kwargs={"on_build": on_build, "stop_event": stop, "poll_interval": 0.05},
+        )
+        thread.start()
+        try:
+            time.sleep(0.1)
+            _set_description(parac, "coder", "Watched")
+            thread.join(timeout=5)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert results
+        assert [p.rsplit("/", 1)[-1] for p in results[0]["written"]] == ["coder.md"]
@@ -0,0 +1,252 @@
+"""Tests for the compiled .parac/ workspace cache."""
+
+import os
+
+import pytest
+import yaml
+from paracle_core.parac import compiled
+from paracle_core.parac.agent_compiler import AgentCompiler
+from paracle_core.parac.compiled import (
+    cache_path,
+    clear_workspace_cache,
+    compile_workspace,
+    load_file_management,
+    load_workspace,
+    read_workspace,
+    workspace_tree_hash,
+    write_workspace,
+)
+from paracle_core.parac.context_builder import ContextBuilder
+
+MANIFEST = """\
+agents:
+  - id: coder
+    name: Coder
+    role: Writes code
+    tools:
+      - code_generation
+"""
+
+PROJECT = """\
+file_management:
+  logs:
+    base_path: custom/logs
+"""
+
+
+@pytest.fixture
+def parac(tmp_path):
+    root = tmp_path / ".parac"
+    (root / "agents" / "specs").mkdir(parents=True)
+    (root / "agents" / "skills" / "testing-qa").mkdir(parents=True)
+    (root / "workflows" / "definitions").mkdir(parents=True)
+    (root / "policies").mkdir()
+    (root / "tools" / "custom").mkdir(parents=True)
+    (root / "tools" / "mcp").mkdir(parents=True)
+
+    (root / "project.yaml").write_text(PROJECT)
+    (root / "agents" / "manifest.yaml").write_text(MANIFEST)
+    (root / "agents" / "specs" / "coder.md").write_text(
+        "# Coder Agent\n\n## Role\n\nWrites code.\n"
+    )
+    (root / "agents" / "skills" / "testing-qa" / "SKILL.md").write_text(
+        "---\nname: testing-qa\ndescription: Test things\n---\nBody\n"
+    )
+    (root / "workflows" / "definitions" / "build.yaml").write_text("name: build\n")
+    (root / "workflows" / "catalog.yaml").write_text(
+        "workflows:\n  - name: build\n    status: active\n"
+    )
+    (root / "policies" / "SECURITY.md").write_text("# Security\n")
+    (root / "GOVERNANCE.md").write_text("# Governance\n\nBe nice.\n")
+    (root / "tools" / "custom" / "greet.py").write_text(
+        'DESCRIPTION = "Say hello"\n\ndef execute():\n    return "hi"\n'
+    )
+    (root / "tools" / "mcp" / "mcp.json").write_text(
+        '{"mcpServers": {"fs": {"command": "npx", "description": "Files"}}}'
+    )
+    yield root
+    clear_workspace_cache()
+
+
+def _rewrite(path, content):
+    """Write content and make sure the mtime moves forward."""
+    before = path.stat().st_mtime_ns
+    path.write_text(content)
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+class TestCompileWorkspace:
+    """Tests for compilation and the cache file."""
+
+    def test_compiles_all_artifacts(self, parac):
+        workspace = compile_workspace(parac)
+
+        assert workspace.file_management.logs.base_path == "custom/logs"
+        assert workspace.document("agents/manifest.yaml")["agents"][0]["id"] == "coder"
+        assert workspace.agents["coder"].tools == ["code_generation"]
+        assert workspace.skills["testing-qa"].description == "Test things"
+        assert workspace.workflows["build"] == {"name": "build"}
+        assert workspace.text("GOVERNANCE.md").startswith("# Governance")
+        assert workspace.files("tools/custom", (".py",)) == ["tools/custom/greet.py"]
+        assert workspace.policies == ["SECURITY"]
+        assert workspace.errors == {}
+
+    def test_round_trip_through_cache_file(self, parac, tmp_path):
+        workspace = compile_workspace(parac)
+        path = tmp_path / "workspace.cache"
+        write_workspace(workspace, path)
+
+        loaded = read_workspace(path, workspace.tree_hash)
+
+        assert loaded is not None
+        assert loaded.agents == workspace.agents
+        assert loaded.documents == workspace.documents
+        assert read_workspace(path, "0" * 64) is None
+
+    def test_corrupt_or_foreign_files_are_rejected(self, tmp_path):
+        path = tmp_path / "workspace.cache"
+        assert read_workspace(path) is None
+
+        path.write_bytes(b"not a cache file at all" * 4)
+        assert read_workspace(path) is None
+
+        path.write_bytes(b"")
+        assert read_workspace(path) is None
+
+    def test_tree_hash_tracks_inputs_only(self, parac):
+        before = workspace_tree_hash(parac)
+
+        (parac / "memory" / "logs").mkdir(parents=True)
+        (parac / "memory" / "logs" / "actions.log").write_text("x")
+        assert workspace_tree_hash(parac) == before
+
+        (parac / "agents" / "specs" / "tester.md").write_text("# Tester\n")
+        assert workspace_tree_hash(parac) != before
+
+    def test_parse_errors_surface_from_document(self, parac):
+        (parac / "tools" / "registry.yaml").write_text("custom: [")
+
+        workspace = compile_workspace(parac)
+
+        assert "tools/registry.yaml" in workspace.errors
+        with pytest.raises(yaml.YAMLError):
+            workspace.document("tools/registry.yaml")
+
+
+class TestLoadWorkspace:
+    """Tests for load_workspace freshness handling."""
+
+    def test_cold_start_reads_cache_without_parsing(self, parac, monkeypatch):
+        first = load_workspace(parac)
+        assert cache_path(parac).exists()
+
+        clear_workspace_cache()
+        monkeypatch.setattr(
+            compiled,
+            "compile_workspace",
+            lambda *a, **k: pytest.fail("fresh cache was recompiled"),
+        )
+        second = load_workspace(parac)
+
+        assert second is not first
+        assert second.tree_hash == first.tree_hash
+        assert second.agents == first.agents
+        assert load_workspace(parac) is second
+
+    def test_stale_cache_is_recompiled(self, parac):
+        load_workspace(parac)
+
+        _rewrite(parac / "GOVERNANCE.md", "# Governance\n\nBe kind.\n")
+        clear_workspace_cache()
+        workspace = load_workspace(parac)
+
+        assert "Be kind." in workspace.text("GOVERNANCE.md")
+        assert read_workspace(cache_path(parac), workspace.tree_hash) is not None
+
+    def test_unwritable_cache_still_loads(self, parac, monkeypatch):
+        def fail(*args, **kwargs):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(compiled, "write_workspace", fail)
+
+        workspace = load_workspace(parac)
+
+        assert workspace.agents["coder"].name == "Coder Agent"
+        assert not cache_path(parac).exists()
+
+
+class TestConsumers:
+    """Consumers read parsed files from the compiled workspace."""
+
+    def test_file_management_never_compiles(self, parac, monkeypatch):
+        monkeypatch.setattr(
+            compiled,
+            "compile_workspace",
+            lambda *a, **k: pytest.fail("file_management compiled the workspace"),
+        )
+
+        config = load_file_management(parac)
+        missing = load_file_management(parac.parent / "missing" / ".parac")
+
+        assert config.logs.base_path == "custom/logs"
+        assert missing.logs.base_path != "custom/logs"
+        assert not cache_path(parac).exists()
+        assert not (parac.parent / "missing").exists()
+
+    def test_file_management_uses_fresh_cache(self, parac, monkeypatch):
+        load_workspace(parac)
+        clear_workspace_cache()
+        monkeypatch.setattr(
+            compiled.FileManagementConfig,
+            "from_project_yaml",
+            lambda *a: pytest.fail("fresh cache was not used"),
+        )
+
+        assert load_file_management(parac).logs.base_path == "custom/logs"
+
+    async def test_mcp_server_reloads_changed_workspace(self, parac):
+        from paracle_mcp.server import ParacleMCPServer
+
+        server = ParacleMCPServer(parac_root=parac, api_base_url="http://127.0.0.1:9")
+        assert [tool.name for tool in server.custom_tools] == ["greet"]
+
+        (parac / "tools" / "custom" / "wave.py").write_text(
+            'DESCRIPTION = "Wave"\n\ndef execute():\n    return "o/"\n'
+        )
+        names = {tool["name"] for tool in server.get_tool_schemas()}
+        assert "custom_wave" not in names
+
+        listed = await server.handle_list_tools()
+        names = {tool["name"] for tool in listed["tools"]}
+        assert {"custom_greet", "custom_wave"} <= names
+
+    def test_agent_compiler(self, parac):
+        compiler = AgentCompiler(parac)
+
+        agents = compiler.load_agents()
+
+        assert [agent.id for agent in agents] == ["coder"]
+        assert agents[0].spec_content.startswith("# Coder Agent")
+        assert agents[0].workflows == ["build"]
+        assert agents[0].custom_tools == [
+            {
+                "name": "greet",
+                "description": "Say hello",
+                "file": os.path.join("tools", "custom", "greet.py"),
+            }
+        ]
+        assert agents[0].external_mcp_tools == [
+            {"prefix": "fs", "name": "fs", "description": "Files"}
+        ]
+        # The cached document is not mutated by the compiler
+        assert (
+            "id"
+            not in compiler.workspace.document("tools/mcp/mcp.json")["mcpServers"]["fs"]
+        )
+
+    def test_context_builder(self, parac):
+        data = ContextBuilder(parac).collect()
+
+        assert [agent.id for agent in data.agents] == ["coder"]
+        assert data.governance_summary == "Be nice."
+        assert data.policies_available == ["SECURITY"]
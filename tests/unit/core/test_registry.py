@@ -0,0 +1,222 @@
+"""Tests for the .parac/ artifact registry."""
+
+import os
+import time
+
+import pytest
+from paracle_core.parac.agent_discovery import AgentDiscovery
+from paracle_core.parac.registry import (
+    WATCHDOG_AVAILABLE,
+    ArtifactKind,
+    ArtifactRegistry,
+    ChangeType,
+    get_registry,
+)
+from paracle_orchestration.skill_loader import SkillLoader
+from paracle_orchestration.workflow_loader import WorkflowLoader, WorkflowLoadError
+
+MANIFEST = """\
+agents:
+  - id: coder
+    tools:
+      - code_generation # writes code
+    skills:
+      - testing-qa
+"""
+
+WORKFLOW = """\
+name: build
+steps:
+  - id: write
+    agent: coder
+"""
+
+
+@pytest.fixture
+def parac(tmp_path):
+    root = tmp_path / ".parac"
+    (root / "agents" / "specs").mkdir(parents=True)
+    (root / "agents" / "skills" / "testing-qa" / "assets").mkdir(parents=True)
+    (root / "workflows" / "definitions").mkdir(parents=True)
+    (root / "workflows" / "templates").mkdir(parents=True)
+
+    (root / "agents" / "manifest.yaml").write_text(MANIFEST)
+    (root / "agents" / "specs" / "coder.md").write_text(
+        "# Coder Agent\n\n## Role\n\nWrites code.\n"
+    )
+    (root / "agents" / "skills" / "testing-qa" / "SKILL.md").write_text(
+        "---\nname: testing-qa\ndescription: Test things\n---\nBody\n"
+    )
+    (root / "agents" / "skills" / "testing-qa" / "assets" / "t.txt").write_text("a")
+    (root / "workflows" / "definitions" / "build.yaml").write_text(WORKFLOW)
+    return root
+
+
+def _rewrite(path, content):
+    """Write content and make sure the mtime moves forward."""
+    before = path.stat().st_mtime_ns
+    path.write_text(content)
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+class TestArtifactRegistry:
+    """Tests for ArtifactRegistry lookups and validation."""
+
+    def test_agent_enriched_from_manifest(self, parac):
+        registry = ArtifactRegistry(parac)
+
+        agent = registry.get_agent("coder")
+
+        assert agent.name == "Coder Agent"
+        assert agent.role == "Writes code."
+        assert agent.tools == ["code_generation"]
+        assert agent.skills == ["testing-qa"]
+        assert registry.get_agent("coder") is agent
+        assert registry.get_agent("missing") is None
+
+    def test_unchanged_file_is_not_reparsed(self, parac):
+        registry = ArtifactRegistry(parac)
+        first = registry.artifact(ArtifactKind.WORKFLOW, "build")
+
+        # Touch without changing content: re-hashed, not re-parsed
+        path = parac / "workflows" / "definitions" / "build.yaml"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = registry.artifact(ArtifactKind.WORKFLOW, "build")
+
+        assert second is first
+        assert second.version == 1
+
+    def test_edit_is_seen_immediately(self, parac):
+        registry = ArtifactRegistry(parac)
+        assert registry.get_workflow("build")["name"] == "build"
+
+        _rewrite(
+            parac / "workflows" / "definitions" / "build.yaml",
+            WORKFLOW.replace("name: build", "name: build2"),
+        )
+
+        assert registry.get_workflow("build")["name"] == "build2"
+        assert registry.artifact(ArtifactKind.WORKFLOW, "build").version == 2
+
+    def test_manifest_change_updates_enrichment(self, parac):
+        registry = ArtifactRegistry(parac)
+        assert registry.get_agent("coder").skills == ["testing-qa"]
+
+        _rewrite(
+            parac / "agents" / "manifest.yaml", MANIFEST.replace("testing-qa", "x")
+        )
+
+        assert registry.get_agent("coder").skills == ["x"]
+
+    def test_skill_asset_change_is_detected(self, parac):
+        registry = ArtifactRegistry(parac)
+        skill = registry.get_skill("testing-qa")
+        assert skill.name == "testing-qa"
+        assert skill.description == "Test things"
+        assert skill.assets == {"t.txt": "a"}
+
+        (parac / "agents" / "skills" / "testing-qa" / "assets" / "u.txt").write_text(
+            "b"
+        )
+
+        assert registry.get_skill("testing-qa").assets == {"t.txt": "a", "u.txt": "b"}
+
+    def test_subscribers_and_removal(self, parac):
+        registry = ArtifactRegistry(parac)
+        changes = []
+        unsubscribe = registry.subscribe(changes.append)
+
+        registry.get_agent("coder")
+        (parac / "agents" / "specs" / "coder.md").unlink()
+        assert registry.get_agent("coder") is None
+
+        kinds = [(c.kind, c.key, c.change) for c in changes]
+        assert (ArtifactKind.AGENT, "coder", ChangeType.ADDED) in kinds
+        assert (ArtifactKind.AGENT, "coder", ChangeType.REMOVED) in kinds
+
+        unsubscribe()
+        (parac / "agents" / "specs" / "coder.md").write_text("# Coder\n")
+        registry.get_agent("coder")
+        assert len(changes) == len(kinds)
+
+    def test_refresh_reports_changes(self, parac):
+        registry = ArtifactRegistry(parac)
+        registry.refresh()
+
+        (parac / "agents" / "specs" / "tester.md").write_text("# Tester\n")
+        changes = registry.refresh()
+
+        assert [(c.kind, c.key, c.change) for c in changes] == [
+            (ArtifactKind.AGENT, "tester", ChangeType.ADDED)
+        ]
+        assert registry.list_keys(ArtifactKind.AGENT) == ["coder", "tester"]
+
+    def test_template_workflow_fallback(self, parac):
+        (parac / "workflows" / "templates" / "tpl.yaml").write_text(WORKFLOW)
+        registry = ArtifactRegistry(parac)
+
+        assert registry.get_workflow("tpl")["name"] == "build"
+        assert registry.list_keys(ArtifactKind.WORKFLOW) == ["build", "tpl"]
+
+    @pytest.mark.skipif(not WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    def test_watcher_pushes_changes(self, parac):
+        registry = ArtifactRegistry(parac)
+        registry.get_workflow("build")
+        changes = []
+        registry.subscribe(changes.append)
+        assert registry.start_watching()
+        try:
+            _rewrite(
+                parac / "workflows" / "definitions" / "build.yaml",
+                WORKFLOW.replace("name: build", "name: watched"),
+            )
+            deadline = time.monotonic() + 5
+            while not changes and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            assert changes[0].change == ChangeType.MODIFIED
+            assert registry.get_workflow("build")["name"] == "watched"
+        finally:
+            registry.stop_watching()
+
+
+class TestRegistryConsumers:
+    """Loaders share the registry and always see fresh data."""
+
+    def test_loaders_use_shared_registry(self, parac):
+        assert AgentDiscovery(parac).registry is get_registry(parac)
+        assert SkillLoader(parac).registry is get_registry(parac)
+        assert WorkflowLoader(parac).registry is get_registry(parac)
+
+    def test_workflow_loader_sees_edits(self, parac):
+        loader = WorkflowLoader(parac)
+        assert loader.load_workflow_spec("build").name == "build"
+
+        _rewrite(
+            parac / "workflows" / "definitions" / "build.yaml",
+            WORKFLOW.replace("name: build", "name: edited"),
+        )
+
+        assert loader.load_workflow_spec("build").name == "edited"
+
+    def test_workflow_loader_errors(self, parac):
+        loader = WorkflowLoader(parac)
+        (parac / "workflows" / "definitions" / "bad.yaml").write_text("a: [")
+
+        with pytest.raises(WorkflowLoadError, match="Invalid YAML"):
+            loader.load_workflow_yaml("bad")
+        with pytest.raises(WorkflowLoadError, match="not found"):
+            loader.load_workflow_yaml("missing")
+
+    def test_skill_loader_reuses_skill_until_changed(self, parac):
+        loader = SkillLoader(parac)
+        skill = loader.load_skill("testing-qa")
+        assert loader.load_skill("testing-qa") is skill
+        assert loader.get_agent_skill_ids("coder") == ["testing-qa"]
+
+        _rewrite(parac / "agents" / "skills" / "testing-qa" / "SKILL.md", "New body\n")
+
+        updated = loader.load_skill("testing-qa")
+        assert updated is not skill
+        assert updated.content == "New body\n"
@@ -0,0 +1,138 @@
+"""Unit tests for indexed governance log queries."""
+
+import gzip
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from paracle_core.governance import GovernanceActionType, GovernanceLogger
+from paracle_core.governance.log_index import ActionLogIndex, tail_lines
+
+TODAY = datetime.now().strftime("%Y-%m-%d")
+
+
+def _line(day: str, agent: str, text: str) -> str:
+    return f"[{day} 10:00:00] [{agent}] [IMPLEMENTATION] {text}\n"
+
+
+@pytest.fixture
+def parac_root():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / ".parac"
+        (root / "memory" / "logs").mkdir(parents=True)
+        yield root
+
+
+class TestTailLines:
+    """Tests for reverse-seek tailing."""
+
+    def test_reads_last_lines_across_blocks(self, tmp_path):
+        path = tmp_path / "log"
+        path.write_text("".join(f"line {i}\n" for i in range(1000)))
+
+        lines = tail_lines(path, 3, block_size=16)
+
+        assert lines == ["line 997\n", "line 998\n", "line 999\n"]
+        assert tail_lines(path, 5000) == path.read_text().splitlines(keepends=True)
+        assert tail_lines(tmp_path / "missing", 3) == []
+
+
+class TestActionLogIndex:
+    """Tests for the sidecar index."""
+
+    def test_index_catches_up_and_persists(self, tmp_path):
+        log = tmp_path / "agent_actions.log"
+        log.write_text(
+            _line("2026-01-01", "CoderAgent", "a")
+            + _line("2026-01-02", "TesterAgent", "b")
+            + _line("2026-01-02", "CoderAgent", "c")
+        )
+        index = ActionLogIndex(log)
+        index.refresh()
+
+        assert index.read_lines(index.agent_offsets("CoderAgent")) == [
+            _line("2026-01-01", "CoderAgent", "a"),
+            _line("2026-01-02", "CoderAgent", "c"),
+        ]
+        assert len(index.read_range(*index.day_range("2026-01-02"))) == 2
+
+        # Lines appended by another writer are indexed from the saved size
+        with open(log, "a") as f:
+            f.write(_line("2026-01-03", "CoderAgent", "d"))
+        reloaded = ActionLogIndex(log)
+        reloaded.refresh()
+
+        assert len(reloaded.agent_offsets("CoderAgent")) == 3
+        assert reloaded.size == log.stat().st_size
+
+    def test_rotation_rebuilds_index(self, tmp_path):
+        log = tmp_path / "agent_actions.log"
+        log.write_text(_line("2026-01-01", "CoderAgent", "old") * 3)
+        index = ActionLogIndex(log)
+        index.refresh()
+
+        log.rename(tmp_path / "agent_actions.log.1")
+        log.write_text(_line("2026-01-02", "TesterAgent", "new"))
+        index.refresh()
+
+        assert index.agent_offsets("CoderAgent") == []
+        assert index.agent_offsets("TesterAgent") == [0]
+        assert index.first_day() == "2026-01-02"
+
+    def test_unreadable_index_is_rebuilt(self, tmp_path):
+        log = tmp_path / "agent_actions.log"
+        log.write_text(_line("2026-01-01", "CoderAgent", "a"))
+        index = ActionLogIndex(log)
+        index.index_path.write_text('{"size": 0, "days": {}}')
+
+        index.refresh()
+
+        assert index.agent_offsets("CoderAgent") == [0]
+        assert index.agent_offsets("CoderAgent", limit=0) == []
+
+
+class TestGovernanceLoggerQueries:
+    """Tests for GovernanceLogger queries backed by the index."""
+
+    def test_agent_actions_use_index(self, parac_root):
+        logger = GovernanceLogger(parac_root)
+        for i in range(5):
+            agent = "CoderAgent" if i % 2 == 0 else "TesterAgent"
+            logger.log(GovernanceActionType.IMPLEMENTATION, f"Action {i}", agent=agent)
+
+        coder = logger.get_agent_actions("CoderAgent")
+        recent = logger.get_agent_actions("CoderAgent", limit=1)
+
+        assert [line.split()[-1] for line in coder] == ["0", "2", "4"]
+        assert recent == coder[-1:]
+        assert logger._index.index_path.exists()
+
+        # Appends leave the index alone and are indexed by the next query
+        indexed = logger._index.size
+        logger.log(GovernanceActionType.TEST, "Action 5", agent="CoderAgent")
+        assert logger._index.size == indexed
+        assert logger.get_agent_actions("CoderAgent", limit=1)[0].endswith("Action 5\n")
+
+    def test_today_actions_span_rotation(self, parac_root):
+        logger = GovernanceLogger(parac_root)
+        rotated = logger.actions_log.with_name("agent_actions.log.1.gz")
+        with gzip.open(rotated, "wt") as f:
+            f.write(_line("2000-01-01", "CoderAgent", "yesterday"))
+            f.write(_line(TODAY, "CoderAgent", "early"))
+        logger.log(GovernanceActionType.TEST, "late", agent="TesterAgent")
+
+        today = logger.get_today_actions()
+
+        assert [line.split()[-1] for line in today] == ["early", "late"]
+
+    def test_recent_actions_continue_into_rotated_log(self, parac_root):
+        logger = GovernanceLogger(parac_root)
+        logger.actions_log.with_name("agent_actions.log.1").write_text(
+            _line(TODAY, "CoderAgent", "older1") + _line(TODAY, "CoderAgent", "older2")
+        )
+        logger.log(GovernanceActionType.TEST, "newest", agent="CoderAgent")
+
+        recent = logger.get_recent_actions(2)
+
+        assert [line.split()[-1] for line in recent] == ["older2", "newest"]
@@ -6,6 +6,7 @@ and auto-repair functionality.
 
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -16,6 +17,7 @@ from paracle_core.governance import (
     ViolationSeverity,
     get_monitor,
 )
+from paracle_core.governance.monitor import ValidationCache
 
 
 @pytest.fixture
@@ -461,3 +463,119 @@ class TestRealWorldScenarios:
         assert target.read_text() == "cost data"
 
         monitor.stop()
+
+
+class TestIncrementalMonitoring:
+    """Test debouncing, the validation cache and incremental health."""
+
+    def test_validation_cache_persists(self, temp_parac):
+        """A second monitor reuses saved results instead of revalidating."""
+        (temp_parac / "costs.db").touch()
+        (temp_parac / "memory" / "data" / "valid.db").touch()
+
+        first = GovernanceMonitor(parac_root=temp_parac)
+        first._scan_all_files()
+        assert first.cache.path.exists()
+
+        second = GovernanceMonitor(parac_root=temp_parac)
+
+        def fail(path):
+            raise AssertionError(f"revalidated {path}")
+
+        second.engine = type("Engine", (), {"validate_file_path": staticmethod(fail)})
+        second._scan_all_files()
+
+        assert second.cache.misses == 0
+        assert set(second.violations) == {".parac/costs.db"}
+        assert second.get_health().total_files == 2
+
+    def test_rules_change_discards_cache(self, temp_parac):
+        """Saved results are ignored when the compliance rules change."""
+        (temp_parac / "costs.db").touch()
+        monitor = GovernanceMonitor(parac_root=temp_parac)
+        monitor._scan_all_files()
+
+        cache = ValidationCache(monitor.cache.path, "other-rules")
+
+        assert len(monitor.cache) == 1
+        assert len(cache) == 0
+
+    def test_burst_of_events_is_coalesced(self, temp_parac):
+        """Repeated events for a path are validated once after they settle."""
+        monitor = GovernanceMonitor(parac_root=temp_parac, debounce_seconds=0.1)
+        monitor._executor = ThreadPoolExecutor(max_workers=1)
+        checked = []
+        original = monitor.check_file
+        monitor.check_file = lambda path: checked.append(path) or original(path)
+
+        target = temp_parac / "costs.db"
+        temp_file = temp_parac / "costs.db.tmp"
+        temp_file.write_text("data")
+        monitor.schedule_check(temp_file)
+        temp_file.rename(target)
+        for _ in range(5):
+            monitor.schedule_check(temp_file)
+            monitor.schedule_check(target)
+
+        assert checked == []  # Nothing validated on the caller's thread
+        assert monitor.wait_idle(timeout=5.0)
+        monitor._executor.shutdown()
+
+        assert checked == [target]
+        assert set(monitor.violations) == {".parac/costs.db"}
+        assert monitor.total_violations == 1
+
+    def test_deleted_file_resolves_violation(self, temp_parac):
+        """Deleting a misplaced file removes it from violations and health."""
+        monitor = GovernanceMonitor(parac_root=temp_parac, debounce_seconds=0.05)
+        monitor.start()
+        assert monitor.wait_idle(timeout=5.0)
+
+        invalid_file = temp_parac / "debug.log"
+        invalid_file.touch()
+        time.sleep(0.3)
+        assert monitor.wait_idle(timeout=5.0)
+        assert monitor.get_health().violations == 1
+
+        invalid_file.unlink()
+        time.sleep(0.3)
+        assert monitor.wait_idle(timeout=5.0)
+        monitor.stop()
+
+        health = monitor.get_health()
+        assert health.violations == 0
+        assert health.total_files == 0
+
+    def test_health_does_not_walk_tree(self, temp_parac, monkeypatch):
+        """get_health uses the file index once the tree was scanned."""
+        (temp_parac / "costs.db").touch()
+        (temp_parac / "memory" / "data" / "valid.db").touch()
+        monitor = GovernanceMonitor(parac_root=temp_parac)
+        monitor._scan_all_files()
+
+        def no_walk(*args, **kwargs):
+            raise AssertionError("walked the tree")
+
+        monkeypatch.setattr("paracle_core.governance.monitor.os.walk", no_walk)
+        health = monitor.get_health()
+
+        assert health.total_files == 2
+        assert health.valid_files == 1
+        assert health.health_percentage == 50.0
+
+    def test_health_waits_for_initial_scan(self, temp_parac, monkeypatch):
+        """Health of a just-started monitor reflects the initial scan."""
+        (temp_parac / "memory" / "data" / "test.db").touch()
+        monitor = GovernanceMonitor(parac_root=temp_parac)
+        scan = monitor._scan_all_files
+
+        def slow_scan():
+            time.sleep(0.2)
+            scan()
+
+        monkeypatch.setattr(monitor, "_scan_all_files", slow_scan)
+        monitor.start()
+        health = monitor.get_health()
+        monitor.stop()
+
+        assert health.total_files >= 1
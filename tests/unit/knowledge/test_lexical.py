@@ -0,0 +1,150 @@
+"""Tests for the lexical index and hybrid search."""
+
+import pytest
+from paracle_knowledge import (
+    Chunk,
+    ChunkMetadata,
+    Document,
+    HybridConfig,
+    KnowledgeBase,
+    LexicalIndex,
+    tokenize_code,
+)
+from paracle_knowledge.lexical import fuse_rankings
+
+
+class ListVectorStore:
+    """Vector store returning documents in insertion order."""
+
+    def __init__(self) -> None:
+        self.docs: list = []
+
+    async def collection_exists(self, name: str) -> bool:
+        return True
+
+    async def add_documents(self, collection: str, docs: list) -> list[str]:
+        self.docs.extend(docs)
+        return [d.id for d in docs]
+
+    async def delete_document(self, collection: str, document_id: str) -> bool:
+        self.docs = [d for d in self.docs if d.id != document_id]
+        return True
+
+    async def search(self, collection, query_embedding, *, top_k=10, **kwargs):
+        from paracle_vector.base import SearchResult
+
+        return [SearchResult(document=d, score=0.5) for d in self.docs[:top_k]]
+
+
+class ConstantEmbeddingService:
+    """Embeds every text as the same vector."""
+
+    dimension = 2
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        return [[1.0, 0.0] for _ in texts]
+
+    async def embed_single(self, text: str) -> list[float]:
+        return [1.0, 0.0]
+
+
+class TestTokenizer:
+    """Tests for the code-aware tokenizer."""
+
+    def test_identifiers_are_kept_and_split(self) -> None:
+        assert tokenize_code("getUserName(user_id) -> HTTPError E1101") == [
+            "getusername",
+            "get",
+            "user",
+            "name",
+            "user_id",
+            "user",
+            "id",
+            "httperror",
+            "http",
+            "error",
+            "e1101",
+            "e",
+            "1101",
+        ]
+
+    def test_stopwords_dropped(self) -> None:
+        assert tokenize_code("How is the token refreshed?") == ["token", "refreshed"]
+
+
+class TestLexicalIndex:
+    """Tests for indexing, BM25 search and deletion."""
+
+    @pytest.fixture
+    def index(self) -> LexicalIndex:
+        index = LexicalIndex()
+        index.add(
+            [
+                ("c1", "def parse_config(path): ...", {"document_id": "d1"}),
+                ("c2", "class ConfigError(Exception): ...", {"document_id": "d1"}),
+                ("c3", "Configuration guide for users", {"document_id": "d2"}),
+            ]
+        )
+        return index
+
+    def test_exact_identifier_ranks_first(self, index: LexicalIndex) -> None:
+        hits = index.search("where is parse_config defined")
+
+        assert hits[0].chunk_id == "c1"
+        assert hits[0].metadata == {"document_id": "d1"}
+        assert hits[0].score > 0
+
+    def test_split_parts_and_filters(self, index: LexicalIndex) -> None:
+        assert {h.chunk_id for h in index.search("config error")} == {"c1", "c2"}
+        hits = index.search("config", filter_metadata={"document_id": "d2"})
+        assert hits == []
+
+    def test_replace_and_remove(self, index: LexicalIndex) -> None:
+        index.add([("c1", "def load_settings(): ...", {"document_id": "d1"})])
+
+        assert index.count() == 3
+        assert "c1" not in {h.chunk_id for h in index.search("parse_config")}
+        assert index.remove_document("d1") == 2
+        assert index.count() == 1
+
+
+class TestFusion:
+    """Tests for fusing vector and lexical rankings."""
+
+    def test_rrf_and_weighted(self) -> None:
+        vector = [("a", 0.9), ("b", 0.6)]
+        lexical = [("c", 8.0), ("b", 4.0)]
+
+        rrf = fuse_rankings(vector, lexical, HybridConfig())
+        weighted = fuse_rankings(
+            vector, lexical, HybridConfig(fusion="weighted", vector_weight=0.2)
+        )
+
+        # a and c tie on RRF; the fused score breaks the tie
+        assert [chunk_id for chunk_id, _ in rrf] == ["b", "c", "a"]
+        assert dict(rrf)["b"] == pytest.approx(0.5 * 0.6 + 0.5 * 0.5)
+        assert [chunk_id for chunk_id, _ in weighted] == ["c", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_knowledge_base_hybrid_search() -> None:
+    index = LexicalIndex()
+    kb = KnowledgeBase(
+        ListVectorStore(), ConstantEmbeddingService(), lexical_index=index
+    )
+    document = Document(
+        name="auth.py",
+        content="",
+        chunks=[
+            Chunk(content=text, metadata=ChunkMetadata(document_id="doc"))
+            for text in ["unrelated helper", "def refresh_token(): ..."]
+        ],
+    )
+    await kb.add_document(document)
+
+    # Vector scores cannot tell the chunks apart; the lexical side can
+    results = await kb.search("refresh_token", top_k=1)
+    assert results[0][0].content == "def refresh_token(): ..."
+
+    await kb.remove_document(document.id)
+    assert index.count() == 0
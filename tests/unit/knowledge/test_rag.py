@@ -1,8 +1,16 @@
 """Tests for RAG engine."""
 
 import pytest
-from paracle_knowledge.base import KnowledgeBase
-from paracle_knowledge.rag import RAGConfig, RAGContext, RAGEngine, RAGResponse
+from paracle_knowledge.base import Chunk, ChunkMetadata, KnowledgeBase
+from paracle_knowledge.rag import (
+    RAGChain,
+    RAGConfig,
+    RAGContext,
+    RAGEngine,
+    RAGResponse,
+    reciprocal_rank_fusion,
+)
+from paracle_knowledge.reranker import Reranker, RerankResult
 
 
 class MockVectorStore:
@@ -114,6 +122,132 @@ class TestRAGEngine:
         assert all(isinstance(r, RAGResponse) for r in responses)
 
 
+class KeywordVectorStore(MockVectorStore):
+    """Mock store whose "embedding" is the query text; counts batch calls."""
+
+    def __init__(self, documents: dict[str, str]) -> None:
+        super().__init__()
+        self.batch_calls = 0
+        self._texts = documents
+
+    async def search_batch(self, collection, query_embeddings, **kwargs):
+        from paracle_vector.base import Document, SearchResult
+
+        self.batch_calls += 1
+        batches = []
+        for (query,) in query_embeddings:
+            hits = [
+                (doc_id, sum(w in text for w in query.split()))
+                for doc_id, text in self._texts.items()
+            ]
+            hits = sorted((h for h in hits if h[1]), key=lambda h: -h[1])
+            batches.append(
+                [
+                    SearchResult(
+                        document=Document(
+                            id=doc_id,
+                            content=self._texts[doc_id],
+                            metadata={"document_id": doc_id},
+                        ),
+                        score=min(1.0, 0.5 + 0.1 * hits_count),
+                    )
+                    for doc_id, hits_count in hits[: kwargs.get("top_k", 10)]
+                ]
+            )
+        return batches
+
+
+class TextEmbeddingService(MockEmbeddingService):
+    """Embeds each text as itself so the store can match keywords."""
+
+    def __init__(self) -> None:
+        super().__init__(dimension=1)
+        self.calls: list[list[str]] = []
+
+    async def embed(self, texts: list[str]) -> list[list[str]]:
+        self.calls.append(list(texts))
+        return [[text] for text in texts]
+
+
+class CountingReranker(Reranker):
+    """Keeps retrieval order and records each rerank pass."""
+
+    def __init__(self) -> None:
+        self.passes: list[tuple[str, list[str]]] = []
+
+    async def rerank(self, query, chunks, top_k=10):
+        self.passes.append((query, [chunk.id for chunk, _ in chunks]))
+        return [
+            RerankResult(chunk=c, original_score=s, rerank_score=s, combined_score=s)
+            for c, s in chunks[:top_k]
+        ]
+
+
+class TestBatchedRetrieval:
+    """Tests for batched multi-query retrieval and fusion."""
+
+    @pytest.fixture
+    def parts(self):
+        store = KeywordVectorStore(
+            {
+                "auth": "python authentication tokens",
+                "db": "python database sessions",
+                "web": "javascript frontend",
+            }
+        )
+        embedding = TextEmbeddingService()
+        reranker = CountingReranker()
+        engine = RAGEngine(
+            KnowledgeBase(store, embedding),
+            RAGConfig(min_relevance_score=0.0),
+            reranker=reranker,
+        )
+        return store, embedding, reranker, engine
+
+    @pytest.mark.asyncio
+    async def test_multi_query_embeds_and_searches_once(self, parts) -> None:
+        store, embedding, reranker, engine = parts
+
+        responses = await engine.multi_query(["authentication", "javascript"])
+
+        assert embedding.calls == [["authentication", "javascript"]]
+        assert store.batch_calls == 1
+        assert [[c.id for c in r.chunks] for r in responses] == [["auth"], ["web"]]
+        assert [query for query, _ in reranker.passes] == [
+            "authentication",
+            "javascript",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chain_fuses_and_reranks_once(self, parts) -> None:
+        store, embedding, reranker, engine = parts
+        question = "python authentication and python database"
+
+        response = await RAGChain(engine).query(question)
+
+        assert store.batch_calls == 1
+        assert len(embedding.calls) == 1
+        # Candidates from both sub-questions, deduplicated, one rerank pass
+        assert reranker.passes == [(question, ["auth", "db"])]
+        assert [c.id for c in response.chunks] == ["auth", "db"]
+        assert response.query == question
+
+    def test_reciprocal_rank_fusion(self) -> None:
+        def chunk(chunk_id: str) -> Chunk:
+            return Chunk(
+                id=chunk_id, content=chunk_id, metadata=ChunkMetadata(document_id="d")
+            )
+
+        a, b, c = chunk("a"), chunk("b"), chunk("c")
+        fused = reciprocal_rank_fusion([[(a, 0.9), (b, 0.5)], [(b, 0.8), (c, 0.7)]])
+
+        assert [(ch.id, score) for ch, score in fused] == [
+            ("b", 0.8),
+            ("a", 0.9),
+            ("c", 0.7),
+        ]
+
+
 class TestRAGConfig:
     """Tests for RAGConfig."""
 
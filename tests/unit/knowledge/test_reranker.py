@@ -0,0 +1,111 @@
+"""Tests for the batched, off-loop cross-encoder reranker."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from paracle_knowledge import Chunk, ChunkMetadata, CrossEncoderReranker
+
+
+class FakeCrossEncoder:
+    """Scores pairs by passage length; records calls and threads."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.calls: list[list[tuple[str, str]]] = []
+        self.threads: set[int] = set()
+        self.delay = delay
+        self.fail = fail
+
+    def predict(self, pairs, batch_size=32):
+        self.calls.append(list(pairs))
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("inference failed")
+        return [float(len(passage)) for _, passage in pairs]
+
+
+def _chunks(*contents: str) -> list[tuple[Chunk, float]]:
+    return [
+        (Chunk(content=content, metadata=ChunkMetadata(document_id="d")), 0.5)
+        for content in contents
+    ]
+
+
+@pytest.fixture
+def model() -> FakeCrossEncoder:
+    return FakeCrossEncoder()
+
+
+@pytest.fixture
+def reranker(model: FakeCrossEncoder):
+    reranker = CrossEncoderReranker(max_wait_ms=20)
+    reranker._model = model
+    yield reranker
+    reranker.close()
+
+
+@pytest.mark.asyncio
+class TestCrossEncoderReranker:
+    """Tests for micro-batching, caching and off-loop inference."""
+
+    async def test_concurrent_requests_share_one_batch(self, reranker, model):
+        results = await asyncio.gather(
+            reranker.rerank("q1", _chunks("aa", "a")),
+            reranker.rerank("q2", _chunks("bbb", "b", "bb")),
+        )
+
+        assert len(model.calls) == 1
+        assert len(model.calls[0]) == 5
+        assert [r.chunk.content for r in results[1]] == ["bbb", "bb", "b"]
+        assert threading.get_ident() not in model.threads
+        assert reranker.get_stats()["avg_batch_size"] == 5
+
+    async def test_full_batch_is_sent_without_waiting(self, model):
+        reranker = CrossEncoderReranker(batch_size=2, max_wait_ms=10_000)
+        reranker._model = model
+
+        results = await asyncio.wait_for(
+            reranker.rerank("q", _chunks("x", "yy")), timeout=2
+        )
+
+        assert [r.rerank_score for r in results] == [2.0, 1.0]
+        reranker.close()
+
+    async def test_cache_and_duplicate_passages(self, reranker, model):
+        await reranker.rerank("q", _chunks("same", "same", "other"))
+        results = await reranker.rerank("q", _chunks("same", "other"))
+        await reranker.rerank("different query", _chunks("same"))
+
+        assert [len(call) for call in model.calls] == [2, 1]
+        assert len(results) == 2
+        assert reranker.get_stats()["cache_hits"] == 2
+
+    async def test_event_loop_stays_responsive(self, reranker, model):
+        model.delay = 0.2
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await reranker.rerank("q", _chunks("passage"))
+        task.cancel()
+
+        assert ticks >= 10
+
+    async def test_inference_errors_reach_every_waiter(self, reranker, model):
+        model.fail = True
+
+        results = await asyncio.gather(
+            reranker.rerank("q1", _chunks("a")),
+            reranker.rerank("q2", _chunks("b")),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert reranker.get_stats()["cache_size"] == 0
@@ -1,5 +1,8 @@
 """Unit tests for paracle_meta.capabilities.provider_chain module."""
 
+import asyncio
+import time
+
 import pytest
 from paracle_meta.capabilities.provider_chain import (
     CircuitBreaker,
@@ -104,6 +107,7 @@ class TestFallbackStrategy:
         assert FallbackStrategy.COST_OPTIMIZED.value == "cost_optimized"
         assert FallbackStrategy.QUALITY_FIRST.value == "quality_first"
         assert FallbackStrategy.RANDOM.value == "random"
+        assert FallbackStrategy.LATENCY_AWARE.value == "latency_aware"
 
 
 class TestProviderChain:
@@ -255,3 +259,143 @@ class TestProviderChainWithCircuitBreaker:
 
         # Circuit should be open for failing provider
         assert cb.is_open("failing_mock") is True
+
+
+class NamedMockProvider(MockProvider):
+    """Mock provider with its own name (metrics are keyed by name)."""
+
+    def __init__(self, provider_name: str, **kwargs):
+        super().__init__(model=provider_name, **kwargs)
+        self._provider_name = provider_name
+
+    @property
+    def name(self) -> str:
+        return self._provider_name
+
+
+class TestLatencyMetrics:
+    """Tests for latency statistics in ProviderMetrics."""
+
+    def test_ewma_takes_increases_immediately(self):
+        """Latency spikes are reflected at once, recoveries are smoothed."""
+        metrics = ProviderMetrics()
+        metrics.observe_latency(100.0, alpha=0.5)
+        metrics.observe_latency(400.0, alpha=0.5)
+        assert metrics.ewma_latency_ms == 400.0
+
+        metrics.observe_latency(100.0, alpha=0.5)
+        assert metrics.ewma_latency_ms == 250.0
+
+    def test_percentile(self):
+        """Percentiles come from the recent latency window."""
+        metrics = ProviderMetrics()
+        assert metrics.percentile_latency_ms(0.95) is None
+        for latency in range(1, 101):
+            metrics.observe_latency(float(latency))
+        assert metrics.percentile_latency_ms(0.95) == 96.0
+
+
+class TestLatencyAwareRouting:
+    """Tests for the LATENCY_AWARE strategy."""
+
+    @pytest.fixture
+    async def chain(self):
+        chain = ProviderChain(
+            providers=[NamedMockProvider("slow"), NamedMockProvider("fast")],
+            strategy=FallbackStrategy.LATENCY_AWARE,
+        )
+        await chain.initialize()
+        return chain
+
+    async def test_prefers_lower_latency(self, chain):
+        """The provider with the lower EWMA latency is tried first."""
+        chain.get_metrics("slow").observe_latency(500.0)
+        chain.get_metrics("fast").observe_latency(20.0)
+
+        assert [p.name for p in chain._select_providers()] == ["fast", "slow"]
+
+    async def test_in_flight_requests_count(self, chain):
+        """A loaded provider loses to a slightly slower idle one."""
+        chain.get_metrics("slow").observe_latency(50.0)
+        chain.get_metrics("fast").observe_latency(20.0)
+        chain.get_metrics("fast").in_flight = 5
+
+        assert chain._select_providers()[0].name == "slow"
+
+    async def test_streams_rank_by_time_to_first_token(self, chain):
+        """Streaming requests use TTFT when it is known."""
+        chain.get_metrics("slow").observe_latency(500.0)
+        chain.get_metrics("slow").observe_ttft(10.0)
+        chain.get_metrics("fast").observe_latency(20.0)
+        chain.get_metrics("fast").observe_ttft(15.0)
+
+        assert chain._select_providers(streaming=True)[0].name == "slow"
+
+    async def test_stream_records_ttft(self, chain):
+        """Streaming through the chain records time-to-first-token."""
+        chunks = [chunk async for chunk in chain.stream(LLMRequest(prompt="Hi"))]
+
+        assert chunks[-1].is_final
+        used = [
+            name for name in ("slow", "fast") if chain.get_metrics(name).success_count
+        ]
+        assert len(used) == 1
+        assert chain.get_metrics(used[0]).ewma_ttft_ms > 0
+        assert chain.get_metrics(used[0]).in_flight == 0
+
+
+class TestHedgedRequests:
+    """Tests for hedged requests."""
+
+    async def test_backup_wins_when_primary_is_slow(self):
+        """A hedge to the backup answers before the degraded primary."""
+        slow = NamedMockProvider("slow", delay_ms=500)
+        fast = NamedMockProvider("fast", delay_ms=5)
+        chain = ProviderChain(
+            providers=[slow, fast], hedge_requests=True, hedge_delay_ms=20
+        )
+        await chain.initialize()
+
+        start = time.perf_counter()
+        response = await chain.complete(LLMRequest(prompt="Hello"))
+        elapsed = time.perf_counter() - start
+
+        assert response.model == "fast"
+        assert elapsed < 0.3
+        assert chain.hedge_stats == {"fired": 1, "won": 1}
+        # The cancelled loser is neither a success nor a failure
+        slow_metrics = chain.get_metrics("slow")
+        assert slow_metrics.failure_count == 0
+        assert slow_metrics.success_count == 0
+        assert slow_metrics.in_flight == 0
+
+    async def test_no_hedge_when_primary_is_fast(self):
+        """No backup request is sent when the primary answers in time."""
+        primary = NamedMockProvider("primary")
+        backup = NamedMockProvider("backup")
+        chain = ProviderChain(
+            providers=[primary, backup], hedge_requests=True, hedge_delay_ms=200
+        )
+        await chain.initialize()
+
+        response = await chain.complete(LLMRequest(prompt="Hello"))
+
+        assert response.model == "primary"
+        assert backup.call_count == 0
+        assert chain.hedge_stats["fired"] == 0
+
+    async def test_hedge_falls_back_after_fast_failure(self):
+        """A failing primary falls through to the backup without waiting."""
+        chain = ProviderChain(
+            providers=[FailingMockProvider(), NamedMockProvider("backup")],
+            hedge_requests=True,
+            hedge_delay_ms=1000,
+        )
+        await chain.initialize()
+
+        response = await asyncio.wait_for(
+            chain.complete(LLMRequest(prompt="Hello")), timeout=0.5
+        )
+
+        assert response.model == "backup"
+        assert chain.get_metrics("failing_mock").failure_count == 1
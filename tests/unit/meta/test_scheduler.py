@@ -0,0 +1,232 @@
+"""Unit tests for paracle_meta.capabilities.scheduler module."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from paracle_meta.capabilities.scheduler import (
+    SchedulerCapability,
+    SchedulerConfig,
+    TaskStatus,
+)
+
+
+@pytest.fixture
+async def scheduler():
+    """Running scheduler with a recording callback."""
+    sched = SchedulerCapability(SchedulerConfig())
+    await sched.initialize()
+    sched.calls = []
+
+    async def record(*args, **kwargs):
+        sched.calls.append((datetime.utcnow(), args, kwargs))
+
+    sched.register_callback("record", record)
+    yield sched
+    await sched.shutdown()
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+class TestSchedulerConfig:
+    """Tests for SchedulerConfig."""
+
+    def test_default_values(self):
+        """Test default configuration values."""
+        config = SchedulerConfig()
+        assert config.persist_tasks is False
+        assert config.misfire_grace_seconds is None
+        assert config.coalesce is True
+
+
+class TestHeapScheduling:
+    """Tests for deadline-driven execution."""
+
+    async def test_delay_runs_close_to_deadline(self, scheduler):
+        """A delayed task fires near its deadline, not on a polling tick."""
+        result = await scheduler.delay(name="t", callback="record", seconds=0.05)
+        task_id = result.output["task_id"]
+        scheduled = datetime.utcnow() + timedelta(seconds=0.05)
+
+        await _wait_for(lambda: scheduler.calls)
+
+        fired_at = scheduler.calls[0][0]
+        assert abs((fired_at - scheduled).total_seconds()) < 0.2
+        await _wait_for(
+            lambda: scheduler._tasks[task_id].status == TaskStatus.COMPLETED
+        )
+
+    async def test_tasks_fire_in_deadline_order(self, scheduler):
+        """Earlier deadlines scheduled later still fire first."""
+        await scheduler.delay(
+            name="late", callback="record", seconds=0.1, args=("late",)
+        )
+        await scheduler.delay(
+            name="early", callback="record", seconds=0.02, args=("early",)
+        )
+
+        await _wait_for(lambda: len(scheduler.calls) == 2)
+
+        assert [call[1][0] for call in scheduler.calls] == ["early", "late"]
+
+    async def test_cancelled_task_does_not_run(self, scheduler):
+        """Cancelling removes the task from the timer heap."""
+        result = await scheduler.delay(name="t", callback="record", seconds=0.05)
+        await scheduler.cancel(result.output["task_id"])
+
+        await asyncio.sleep(0.15)
+
+        assert scheduler.calls == []
+
+    async def test_pause_and_resume(self, scheduler):
+        """Paused tasks are skipped until resumed."""
+        result = await scheduler.delay(name="t", callback="record", seconds=0.05)
+        task_id = result.output["task_id"]
+
+        await scheduler.execute(action="pause", task_id=task_id)
+        status = await scheduler.status(task_id)
+        assert status.output["paused"] is True
+        await asyncio.sleep(0.1)
+        assert scheduler.calls == []
+
+        await scheduler.execute(action="resume", task_id=task_id)
+        await _wait_for(lambda: scheduler.calls)
+
+    async def test_many_tasks_keep_loop_idle(self, scheduler):
+        """Far-future tasks do not make the loop wake up."""
+        for i in range(5000):
+            await scheduler.delay(name=f"t{i}", callback="record", hours=1)
+
+        assert len(scheduler._heap_keys) == 5000
+        assert scheduler._scheduler_task is not None
+        assert not scheduler._scheduler_task.done()
+        assert scheduler.calls == []
+
+    async def test_misfired_once_task_is_skipped(self, scheduler):
+        """Runs later than the grace period are recorded as misfires."""
+        scheduler.config.misfire_grace_seconds = 1.0
+        result = await scheduler.delay(name="t", callback="record", seconds=-10)
+        task_id = result.output["task_id"]
+
+        await _wait_for(lambda: scheduler._tasks[task_id].status == TaskStatus.FAILED)
+
+        task = scheduler._tasks[task_id]
+        assert task.misfire_count == 1
+        assert "Misfired" in task.error
+        assert scheduler.calls == []
+
+    async def test_late_once_task_runs_by_default(self, scheduler):
+        """Without a grace period, a late one-time task still runs."""
+        result = await scheduler.delay(name="t", callback="record", seconds=-600)
+        task_id = result.output["task_id"]
+
+        await _wait_for(
+            lambda: scheduler._tasks[task_id].status == TaskStatus.COMPLETED
+        )
+
+        assert len(scheduler.calls) == 1
+        assert scheduler._tasks[task_id].misfire_count == 0
+
+
+class TestRunNow:
+    """Tests for manual runs of recurring tasks."""
+
+    async def test_run_now_keeps_next_slot(self, scheduler, monkeypatch):
+        """A manual run does not skip or shift the next scheduled slot."""
+        monkeypatch.setattr(
+            scheduler,
+            "_get_next_run",
+            lambda schedule, base=None: (
+                (base or datetime.utcnow()) + timedelta(seconds=0.2)
+            ),
+        )
+        result = await scheduler.schedule(
+            name="t", cron="every-0.2s", callback="record"
+        )
+        task_id = result.output["task_id"]
+        slot = scheduler._tasks[task_id].next_run
+
+        await scheduler.run_now(task_id)
+
+        task = scheduler._tasks[task_id]
+        assert len(scheduler.calls) == 1
+        assert task.next_run == slot
+        assert task.status == TaskStatus.PENDING
+        await _wait_for(lambda: len(scheduler.calls) == 2)
+        assert scheduler.calls[1][0] >= slot
+        assert (scheduler.calls[1][0] - slot).total_seconds() < 0.15
+
+    async def test_run_now_cron_task(self, scheduler):
+        """With a real cron expression the next slot is left in place."""
+        pytest.importorskip("croniter")
+        result = await scheduler.schedule(name="t", cron="0 0 * * *", callback="record")
+        task_id = result.output["task_id"]
+        slot = scheduler._tasks[task_id].next_run
+
+        await scheduler.run_now(task_id)
+
+        assert scheduler._tasks[task_id].next_run == slot
+        assert task_id in scheduler._heap_keys
+
+
+class TestPersistence:
+    """Tests for SQLite persistence."""
+
+    async def test_schedules_survive_restart(self, tmp_path):
+        """Pending tasks are restored with their arguments after a restart."""
+        config = SchedulerConfig(
+            persist_tasks=True, persist_path=str(tmp_path / "scheduler.db")
+        )
+        first = SchedulerCapability(config)
+        await first.initialize()
+        result = await first.delay(
+            name="t", callback="record", seconds=0.3, args=["a"], kwargs={"k": 1}
+        )
+        task_id = result.output["task_id"]
+        await first.shutdown()
+
+        second = SchedulerCapability(config)
+        calls = []
+
+        async def record(*args, **kwargs):
+            calls.append((args, kwargs))
+
+        second.register_callback("record", record)
+        await second.initialize()
+        try:
+            assert second._tasks[task_id].status == TaskStatus.PENDING
+            await _wait_for(lambda: calls)
+            assert calls == [(("a",), {"k": 1})]
+        finally:
+            await second.shutdown()
+
+    async def test_store_writes_run_off_the_event_loop(self, tmp_path, monkeypatch):
+        """SQLite writes happen in a worker thread, in the order issued."""
+        config = SchedulerConfig(
+            persist_tasks=True, persist_path=str(tmp_path / "scheduler.db")
+        )
+        scheduler = SchedulerCapability(config)
+        await scheduler.initialize()
+        writes = []
+        save_row = scheduler._store.save_row
+
+        def record_write(row):
+            writes.append((threading.current_thread(), row[6]))
+            save_row(row)
+
+        monkeypatch.setattr(scheduler._store, "save_row", record_write)
+        try:
+            result = await scheduler.delay(name="t", callback="record", seconds=60)
+            await scheduler.cancel(result.output["task_id"])
+        finally:
+            await scheduler.shutdown()
+
+        assert [status for _, status in writes] == ["pending", "cancelled"]
+        assert threading.main_thread() not in {thread for thread, _ in writes}
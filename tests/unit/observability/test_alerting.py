@@ -1,17 +1,27 @@
 """Tests for intelligent alerting."""
 
+import email
+import json
+import socketserver
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
+import pytest
 from paracle_observability.alerting import (
     Alert,
     AlertManager,
     AlertRule,
     AlertSeverity,
     AlertState,
+    DeliveryConfig,
     EmailChannel,
+    NotificationChannel,
+    NotificationDispatcher,
     SlackChannel,
     WebhookChannel,
     get_alert_manager,
+    group_alerts,
 )
 
 
@@ -274,3 +284,262 @@ def test_global_alert_manager():
     manager2 = get_alert_manager()
 
     assert manager1 is manager2
+
+
+# --- Notification delivery ------------------------------------------------
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Local HTTP stand-in recording posted JSON bodies."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(self.server.delay)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.server.requests.append((self.path, body))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP stand-in recording received messages."""
+
+    def handle(self):
+        self.wfile.write(b"220 localhost ready\r\n")
+        data = None
+        while line := self.rfile.readline():
+            if data is not None:
+                if line.rstrip(b"\r\n") != b".":
+                    data.append(line)
+                    continue
+                self.server.messages.append(email.message_from_bytes(b"".join(data)))
+                data = None
+                reply = b"250 OK"
+            elif line.upper().startswith(b"DATA"):
+                data = []
+                reply = b"354 End data with <CR><LF>.<CR><LF>"
+            elif line.upper().startswith(b"QUIT"):
+                self.wfile.write(b"221 Bye\r\n")
+                return
+            else:
+                reply = b"250 localhost"
+            self.wfile.write(reply + b"\r\n")
+
+
+@pytest.fixture
+def webhook_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _WebhookHandler)
+    server.requests = []
+    server.statuses = []
+    server.delay = 0.0
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SMTPHandler)
+    server.daemon_threads = True
+    server.messages = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+FAST = DeliveryConfig(group_wait=0.0, min_interval=0.0, retry_backoff=0.01)
+
+
+def _firing(name: str, severity=AlertSeverity.WARNING) -> Alert:
+    alert = Alert(rule_name=name, severity=severity, message=f"{name} is failing")
+    alert.fire()
+    return alert
+
+
+def _always_firing_rule(name: str) -> AlertRule:
+    return AlertRule(
+        name=name,
+        severity=AlertSeverity.ERROR,
+        condition=lambda: True,
+        message=f"{name} is failing",
+        for_duration=0.0,
+    )
+
+
+def test_evaluate_rules_does_not_wait_on_delivery(webhook_server):
+    """A slow endpoint does not stall rule evaluation."""
+    webhook_server.delay = 0.5
+    manager = AlertManager(delivery=FAST)
+    manager.add_rule(_always_firing_rule("slow"))
+    manager.add_channel(WebhookChannel("hook", {"url": webhook_server.url}))
+
+    start = time.perf_counter()
+    assert len(manager.evaluate_rules()) == 1
+    assert time.perf_counter() - start < 0.2
+
+    assert manager.flush_notifications(timeout=5.0)
+    assert len(webhook_server.requests) == 1
+    stats = manager.get_delivery_stats()["hook"]
+    assert stats["messages_sent"] == 1
+    assert stats["avg_latency_ms"] >= 500
+    manager.close()
+
+
+def test_alerts_are_grouped_into_one_digest(webhook_server):
+    """Alerts firing together are sent as a single message."""
+    manager = AlertManager(delivery=DeliveryConfig(group_wait=0.2))
+    for i in range(5):
+        manager.add_rule(_always_firing_rule(f"rule_{i}"))
+    manager.add_channel(WebhookChannel("hook", {"url": webhook_server.url}))
+    manager.add_channel(
+        SlackChannel("slack", {"webhook_url": f"{webhook_server.url}/slack"})
+    )
+
+    manager.evaluate_rules()
+    assert manager.flush_notifications(timeout=5.0)
+
+    bodies = dict(webhook_server.requests)
+    assert bodies["/"]["count"] == 5
+    assert bodies["/"]["status"] == "firing"
+    assert len(bodies["/"]["groups"]) == 5
+    assert bodies["/slack"]["text"] == "🚨 5 alerts (5 firing) from 5 rules"
+    assert len(bodies["/slack"]["attachments"]) == 5
+    manager.close()
+
+
+def test_rate_limit_batches_into_digest(webhook_server):
+    """Alerts arriving within min_interval are sent together."""
+    dispatcher = NotificationDispatcher(
+        DeliveryConfig(group_wait=0.0, min_interval=0.3)
+    )
+    channel = WebhookChannel("hook", {"url": webhook_server.url})
+
+    dispatcher.submit(channel, _firing("first"))
+    time.sleep(0.1)
+    dispatcher.submit(channel, _firing("second"))
+    dispatcher.submit(channel, _firing("third"))
+    assert dispatcher.flush(timeout=5.0)
+
+    assert [body["count"] for _, body in webhook_server.requests] == [1, 2]
+    dispatcher.close()
+
+
+def test_retry_with_backoff(webhook_server):
+    """Server errors are retried, client errors are not."""
+    webhook_server.statuses = [503, 503]
+    dispatcher = NotificationDispatcher(FAST)
+    dispatcher.submit(WebhookChannel("hook", {"url": webhook_server.url}), _firing("a"))
+    assert dispatcher.flush(timeout=5.0)
+
+    stats = dispatcher.stats()["hook"]
+    assert stats["retries"] == 2
+    assert stats["messages_sent"] == 1
+
+    webhook_server.statuses = [404]
+    dispatcher.submit(WebhookChannel("bad", {"url": webhook_server.url}), _firing("b"))
+    assert dispatcher.flush(timeout=5.0)
+
+    stats = dispatcher.stats()["bad"]
+    assert stats["retries"] == 0
+    assert stats["alerts_failed"] == 1
+    assert "404" in stats["last_error"]
+    dispatcher.close()
+
+
+def test_failing_channel_does_not_block_others(webhook_server):
+    """An unreachable channel only delays its own deliveries."""
+    dispatcher = NotificationDispatcher(
+        DeliveryConfig(group_wait=0.0, min_interval=0.0, max_retries=1)
+    )
+    dead = WebhookChannel("dead", {"url": "http://127.0.0.1:9/unreachable"})
+    live = WebhookChannel("live", {"url": webhook_server.url})
+
+    dispatcher.submit(dead, _firing("a"))
+    dispatcher.submit(live, _firing("a"))
+    assert dispatcher.flush(timeout=10.0)
+
+    stats = dispatcher.stats()
+    assert stats["dead"]["messages_failed"] == 1
+    assert stats["live"]["messages_sent"] == 1
+    dispatcher.close()
+
+
+def test_queue_overflow_drops_alerts():
+    """Alerts beyond queue_size are dropped and counted."""
+    dispatcher = NotificationDispatcher(DeliveryConfig(group_wait=10.0, queue_size=2))
+    channel = WebhookChannel("hook", {"url": "http://127.0.0.1:9"})
+
+    results = [dispatcher.submit(channel, _firing(str(i))) for i in range(3)]
+
+    assert results == [True, True, False]
+    assert dispatcher.stats()["hook"]["dropped"] == 1
+    dispatcher.close(timeout=0.1)
+    assert dispatcher.pending() == 0
+
+
+def test_email_digest_over_smtp(smtp_server):
+    """Email channel sends one message per batch over SMTP."""
+    host, port = smtp_server.server_address
+    channel = EmailChannel(
+        "email",
+        {"to": "oncall@example.com", "smtp_host": host, "smtp_port": port},
+    )
+    dispatcher = NotificationDispatcher(DeliveryConfig(group_wait=0.1))
+
+    dispatcher.submit(channel, _firing("disk", AlertSeverity.CRITICAL))
+    dispatcher.submit(channel, _firing("cpu"))
+    assert dispatcher.flush(timeout=5.0)
+
+    [message] = smtp_server.messages
+    assert message["To"] == "oncall@example.com"
+    assert message["Subject"] == "[CRITICAL] 2 alerts (2 firing) from 2 rules"
+    assert "disk is failing" in message.get_payload()
+    dispatcher.close()
+
+
+def test_custom_channel_uses_send():
+    """Channels implementing only send() are delivered in a worker thread."""
+
+    class ListChannel(NotificationChannel):
+        def __init__(self):
+            super().__init__("list", {})
+            self.received = []
+
+        def send(self, alert):
+            self.received.append(alert.rule_name)
+            return True
+
+    channel = ListChannel()
+    dispatcher = NotificationDispatcher(FAST)
+    dispatcher.submit(channel, _firing("a"))
+    assert dispatcher.flush(timeout=5.0)
+
+    assert channel.received == ["a"]
+    dispatcher.close()
+
+
+def test_group_alerts_orders_by_severity():
+    """Groups are per rule and state, most severe first."""
+    resolved = _firing("a")
+    resolved.resolve()
+    alerts = [
+        _firing("a"),
+        _firing("a"),
+        resolved,
+        _firing("b", AlertSeverity.CRITICAL),
+    ]
+
+    groups = group_alerts(alerts)
+
+    assert [(g.rule_name, g.state, g.count) for g in groups] == [
+        ("b", AlertState.FIRING, 1),
+        ("a", AlertState.FIRING, 2),
+        ("a", AlertState.RESOLVED, 1),
+    ]
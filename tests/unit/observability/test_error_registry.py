@@ -1,6 +1,8 @@
 """Tests for error registry."""
 
 import json
+import sys
+import threading
 import time
 
 import pytest
@@ -8,6 +10,7 @@ from paracle_observability.error_registry import (
     ErrorRecord,
     ErrorRegistry,
     ErrorSeverity,
+    SlidingWindowCounter,
     get_error_registry,
 )
 
@@ -351,6 +354,47 @@ class TestPatternDetection:
         assert len(cascading) >= 1
         assert cascading[0]["component"] == "failing_component"
 
+    def test_duplicate_storm_is_high_frequency(self):
+        """Test repeated identical errors count towards patterns."""
+        registry = ErrorRegistry()
+
+        for _ in range(12):
+            registry.record_error(TimeoutError("upstream timeout"), "api_client")
+
+        patterns = registry.get_patterns()
+        high_freq = [p for p in patterns if p["pattern_type"] == "high_frequency"]
+        assert high_freq[0]["count"] == 12
+        assert len(registry.errors) == 1
+
+    def test_patterns_evaluated_on_interval(self, monkeypatch):
+        """Test recording does not evaluate patterns for every error."""
+        registry = ErrorRegistry(pattern_interval=60)
+        calls = []
+        detect = registry._detect_patterns
+        monkeypatch.setattr(
+            registry,
+            "_detect_patterns",
+            lambda now=None: calls.append(now) or detect(now),
+        )
+
+        for i in range(1000):
+            registry.record_error(ValueError(f"Error {i}"), "storm")
+
+        assert len(calls) == 1
+        assert registry.get_patterns()[0]["count"] == 1000
+        assert len(calls) == 2
+
+    def test_sliding_window_expires_buckets(self):
+        """Test counts leave the window after it elapses."""
+        counter = SlidingWindowCounter(window_seconds=60)
+        counter.add("ValueError", now=1000.0)
+        counter.add("ValueError", now=1030.5)
+        counter.add("TypeError", now=1030.9)
+
+        assert counter.counts(1030.9) == {"ValueError": 2, "TypeError": 1}
+        assert counter.counts(1060.0) == {"ValueError": 1, "TypeError": 1}
+        assert counter.counts(1091.0) == {}
+
 
 class TestErrorSearch:
     """Test error search functionality."""
@@ -451,6 +495,46 @@ class TestErrorRegistryManagement:
         # Should only store 10 most recent
         assert len(registry.errors) == 10
 
+    def test_eviction_keeps_index_and_components_bounded(self):
+        """Test evicted records are forgotten and per-component history is bounded."""
+        registry = ErrorRegistry(max_errors=10, max_errors_per_component=4)
+
+        for i in range(15):
+            registry.record_error(ValueError(f"Error {i}"), "test_component")
+
+        assert len(registry._error_index) == 10
+        assert len(registry.get_errors_by_component("test_component")) == 4
+        # An evicted error is recorded again as a new record
+        record = registry.record_error(ValueError("Error 0"), "test_component")
+        assert record.count == 1
+        assert registry.errors[-1] is record
+
+    def test_readers_tolerate_concurrent_recording(self):
+        """Test readers do not iterate the ring buffer while it is mutated."""
+        registry = ErrorRegistry(max_errors=50)
+        stop = threading.Event()
+
+        def record():
+            i = 0
+            while not stop.is_set():
+                registry.record_error(ValueError(f"Error {i}"), f"component_{i % 3}")
+                i += 1
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        writer = threading.Thread(target=record)
+        writer.start()
+        try:
+            for _ in range(200):
+                registry.get_errors_by_type("ValueError")
+                registry.get_errors_by_component("component_0")
+                registry.search_errors("error")
+                registry.get_statistics()
+        finally:
+            stop.set()
+            writer.join()
+            sys.setswitchinterval(interval)
+
     def test_clear_registry(self):
         """Test clearing registry."""
         registry = ErrorRegistry()
@@ -0,0 +1,117 @@
+"""Tests for import-time budgets and lazy CLI loading."""
+
+import click
+from click.testing import CliRunner
+from paracle_cli.lazy_group import LazyCommand, LazyGroup
+from paracle_profiling.import_time import (
+    ImportBudgetResult,
+    ImportTimeReport,
+    check_cli_import_budget,
+    parse_importtime,
+)
+
+SAMPLE_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:       300 |        500 |     json.decoder
+import time:       200 |        700 |   json
+import time:        50 |        750 | mypkg
+"""
+
+
+class TestParseImportTime:
+    """Tests for -X importtime parsing."""
+
+    def test_parses_entries_and_depth(self):
+        entries = parse_importtime(SAMPLE_OUTPUT)
+
+        assert [e.module for e in entries] == ["_io", "json.decoder", "json", "mypkg"]
+        assert [e.depth for e in entries] == [1, 2, 1, 0]
+        assert entries[1].self_us == 300
+
+    def test_report_total_and_top(self):
+        report = ImportTimeReport(
+            module="mypkg", entries=parse_importtime(SAMPLE_OUTPUT), wall_ms=1.0
+        )
+
+        assert report.total_ms == 0.75
+        assert report.top(1)[0].module == "json.decoder"
+        assert "json" in report.modules
+
+    def test_budget_result(self):
+        report = ImportTimeReport(
+            module="mypkg", entries=parse_importtime(SAMPLE_OUTPUT), wall_ms=1.0
+        )
+
+        assert ImportBudgetResult(report=report, budget_ms=1.0).passed
+        assert not ImportBudgetResult(report=report, budget_ms=0.5).passed
+        assert not ImportBudgetResult(
+            report=report, budget_ms=1.0, forbidden=["json"]
+        ).passed
+
+
+class TestLazyGroup:
+    """Tests for the lazy-loading Click group."""
+
+    def test_help_does_not_import_commands(self):
+        group = LazyGroup(
+            name="cli",
+            lazy_commands={
+                "missing": LazyCommand("does_not_exist.module:cmd", "Listed lazily.")
+            },
+        )
+
+        result = CliRunner().invoke(group, ["--help"])
+
+        assert result.exit_code == 0
+        assert "Listed lazily." in result.output
+
+    def test_command_loaded_on_invoke(self):
+        group = LazyGroup(
+            name="cli",
+            lazy_commands={
+                "hello": LazyCommand(
+                    "tests.unit.profiling.test_import_time:_hello", "Say hello."
+                )
+            },
+        )
+
+        result = CliRunner().invoke(group, ["hello"])
+
+        assert result.exit_code == 0
+        assert result.output.strip() == "hello"
+        assert "hello" in group.commands
+
+    def test_hidden_commands_not_listed(self):
+        group = LazyGroup(
+            name="cli",
+            lazy_commands={"secret": LazyCommand("x:y", "Hidden.", hidden=True)},
+        )
+
+        result = CliRunner().invoke(group, ["--help"])
+
+        assert "secret" not in result.output
+
+
+class TestCliImportBudget:
+    """Regression check for CLI cold start."""
+
+    def test_cli_does_not_import_heavy_modules(self):
+        result = check_cli_import_budget(runs=1)
+
+        assert result.forbidden == [], result.format()
+
+    def test_lazy_table_matches_command_modules(self):
+        from paracle_cli.main import cli
+
+        ctx = click.Context(cli)
+        for name, spec in cli.lazy_commands.items():
+            command = cli.get_command(ctx, name)
+            assert command is not None, name
+            assert command.hidden == spec.hidden, name
+            assert command.get_short_help_str(limit=200) == spec.help, name
+
+
+@click.command()
+def _hello() -> None:
+    click.echo("hello")
@@ -0,0 +1,246 @@
+"""Tests for the aggregated profiler and the stack sampler."""
+
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+from paracle_profiling.analyzer import PerformanceAnalyzer
+from paracle_profiling.profiler import (
+    ProfileEntry,
+    Profiler,
+    QuantileSketch,
+    get_profile_stats,
+    profile,
+    profile_async,
+)
+from paracle_profiling.sampler import StackSampler
+
+
+@pytest.fixture(autouse=True)
+def clean_profiler():
+    Profiler.clear()
+    Profiler.enable()
+    yield
+    Profiler.clear()
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch."""
+
+    def test_empty(self):
+        assert QuantileSketch().quantile(0.5) is None
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(42)
+        values = [rng.lognormvariate(-4, 1.5) for _ in range(20_000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[int(q * len(ordered))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    def test_bucket_count_is_bounded(self):
+        sketch = QuantileSketch(max_buckets=64)
+        for i in range(1, 10_000):
+            sketch.add(i * 1e-6 * 1.5 ** (i % 40))
+        assert len(sketch._buckets) <= 64
+        assert sketch.count == 9_999
+
+
+class TestProfiler:
+    """Tests for Profiler aggregates."""
+
+    def test_memory_does_not_grow_with_calls(self):
+        for i in range(10_000):
+            Profiler.observe("op", 0.001 + (i % 100) * 1e-5)
+
+        stats = Profiler.get_stats()
+        assert list(stats) == ["op"]
+        assert stats["op"].count == 10_000
+        assert len(stats["op"].sketch._buckets) < 200
+
+    def test_summary_keys_and_values(self):
+        for duration in (0.1, 0.2, 0.3, 0.4):
+            Profiler.record(
+                ProfileEntry(
+                    name="op",
+                    start_time=0.0,
+                    end_time=duration,
+                    duration=duration,
+                    memory_start=100,
+                    memory_end=150,
+                )
+            )
+
+        summary = Profiler.get_summary("op")
+        assert summary["calls"] == 4
+        assert summary["total_time"] == pytest.approx(1.0)
+        assert summary["avg_time"] == pytest.approx(0.25)
+        assert summary["min_time"] == 0.1
+        assert summary["max_time"] == 0.4
+        assert 0.1 <= summary["p50_time"] <= 0.4
+        assert summary["p99_time"] == pytest.approx(0.4, rel=0.02)
+        assert summary["memory_avg"] == 50
+        assert summary["memory_max"] == 50
+
+    def test_unknown_name(self):
+        assert Profiler.get_summary("missing") == {}
+        assert Profiler.get_stats("missing") == {}
+
+    def test_disabled_profiler_records_nothing(self):
+        Profiler.disable()
+        Profiler.observe("op", 1.0)
+        assert Profiler.get_stats() == {}
+
+    def test_decorators(self):
+        @profile("sync_op")
+        def sync_op():
+            return 1
+
+        @profile_async("async_op")
+        async def async_op():
+            return 2
+
+        for _ in range(3):
+            assert sync_op() == 1
+            assert asyncio.run(async_op()) == 2
+
+        stats = get_profile_stats()
+        assert stats["sync_op"]["calls"] == 3
+        assert stats["async_op"]["calls"] == 3
+
+    def test_track_memory_is_sampled(self, monkeypatch):
+        pytest.importorskip("psutil")
+        monkeypatch.setattr(Profiler, "memory_sample_every", 4)
+
+        @profile("mem_op", track_memory=True)
+        def mem_op():
+            return None
+
+        for _ in range(8):
+            mem_op()
+
+        aggregate = Profiler.get_stats()["mem_op"]
+        assert aggregate.count == 8
+        assert aggregate.memory_samples == 2
+
+    def test_concurrent_observe(self):
+        def worker():
+            for _ in range(1000):
+                Profiler.observe("op", 0.001)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert Profiler.get_stats()["op"].count == 4000
+
+    def test_analyzer_uses_aggregates(self):
+        for _ in range(10):
+            Profiler.observe("slow", 0.6)
+            Profiler.observe("fast", 0.001)
+
+        bottlenecks = PerformanceAnalyzer.analyze_bottlenecks(min_calls=5)
+
+        assert [b.name for b in bottlenecks] == ["slow"]
+        assert bottlenecks[0].severity == "medium"
+        assert bottlenecks[0].calls == 10
+        assert bottlenecks[0].p95_time == pytest.approx(0.6)
+
+
+def _busy_leaf(running: list[bool]) -> None:
+    # No Python-level calls, so this is always the innermost frame
+    while running[0]:
+        sum(range(100))
+
+
+def _busy_root(running: list[bool]) -> None:
+    _busy_leaf(running)
+
+
+@pytest.fixture
+def busy_thread():
+    running = [True]
+    thread = threading.Thread(target=_busy_root, args=(running,), name="busy")
+    thread.start()
+    yield thread
+    running[0] = False
+    thread.join()
+
+
+class TestStackSampler:
+    """Tests for StackSampler."""
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            StackSampler(interval=0)
+
+    def test_manual_sample_records_other_threads(self, busy_thread):
+        sampler = StackSampler()
+        for _ in range(5):
+            sampler.sample()
+
+        status = sampler.status()
+        assert status["samples"] == 5
+        assert not status["running"]
+        stacks = sampler.stacks()
+        assert any(
+            [frame[0] for frame in stack][-2:] == ["_busy_root", "_busy_leaf"]
+            for stack in stacks
+        )
+
+    def test_start_stop(self, busy_thread):
+        sampler = StackSampler(interval=0.002)
+        sampler.start()
+        assert sampler.is_running
+        time.sleep(0.1)
+        sampler.stop()
+
+        status = sampler.status()
+        assert not status["running"]
+        assert status["samples"] > 0
+        assert status["elapsed_seconds"] > 0
+
+        sampler.reset()
+        assert sampler.status()["samples"] == 0
+        assert sampler.stacks() == {}
+
+    def test_max_stacks_drops_new_stacks(self, busy_thread):
+        sampler = StackSampler(max_stacks=0)
+        sampler.sample()
+
+        assert sampler.stacks() == {}
+        assert sampler.status()["dropped"] >= 1
+
+    def test_collapsed_export(self, busy_thread):
+        sampler = StackSampler(include_threads=True)
+        sampler.sample()
+
+        lines = sampler.to_collapsed().splitlines()
+        busy = [line for line in lines if line.startswith("thread:busy;")]
+        assert len(busy) == 1
+        names, count = busy[0].rsplit(" ", 1)
+        assert count == "1"
+        assert names.split(";")[-1].startswith("_busy_leaf (")
+
+    def test_speedscope_export(self, busy_thread):
+        sampler = StackSampler(interval=0.01)
+        sampler.sample()
+        sampler.sample()
+
+        doc = sampler.to_speedscope(name="test")
+        frames = doc["shared"]["frames"]
+        profile_data = doc["profiles"][0]
+        assert profile_data["type"] == "sampled"
+        assert len(profile_data["samples"]) == len(profile_data["weights"])
+        assert profile_data["endValue"] == pytest.approx(sum(profile_data["weights"]))
+        for stack in profile_data["samples"]:
+            assert all(0 <= index < len(frames) for index in stack)
+        assert any(frame["name"] == "_busy_leaf" for frame in frames)
@@ -6,10 +6,29 @@ from pathlib import Path
 
 import pytest
 from paracle_core.ids import generate_ulid
+from paracle_domain.models import Workflow, WorkflowSpec, WorkflowStep
+from paracle_events import EventBus
+from paracle_orchestration.agent_executor import AgentExecutor
+from paracle_orchestration.engine import WorkflowOrchestrator
+from paracle_providers.base import (
+    ChatMessage,
+    LLMConfig,
+    LLMProvider,
+    LLMResponse,
+    StreamChunk,
+    TokenUsage,
+)
 from paracle_runs import (
     AgentRunMetadata,
+    RecordingProviderRegistry,
+    ReplayError,
+    ReplayMode,
     RunStatus,
     WorkflowRunMetadata,
+    load_agent_run,
+    load_workflow_run,
+    record_agent_run,
+    record_llm_calls,
     replay_agent_run,
     replay_workflow_run,
     set_run_storage,
@@ -59,7 +78,7 @@ def test_replay_agent_run_basic(storage):
     )
 
     # Replay the run
-    replay_metadata, replay_data = replay_agent_run(run_id)
+    replay_metadata, replay_data = load_agent_run(run_id)
 
     assert replay_metadata.run_id == run_id
     assert replay_metadata.agent_id == "coder"
@@ -91,7 +110,7 @@ def test_replay_agent_run_with_artifacts(storage):
     )
 
     # Replay the run
-    replay_metadata, replay_data = replay_agent_run(run_id)
+    replay_metadata, replay_data = load_agent_run(run_id)
 
     assert replay_metadata.artifacts_count == 2
     assert "artifacts" in replay_data
@@ -122,7 +141,7 @@ def test_replay_agent_run_with_logs(storage):
     )
 
     # Replay the run
-    replay_metadata, replay_data = replay_agent_run(run_id)
+    replay_metadata, replay_data = load_agent_run(run_id)
 
     assert "logs" in replay_data
     assert "Starting agent execution" in replay_data["logs"]
@@ -158,7 +177,7 @@ def test_replay_workflow_run_basic(storage):
     )
 
     # Replay the run
-    replay_metadata, replay_data = replay_workflow_run(run_id)
+    replay_metadata, replay_data = load_workflow_run(run_id)
 
     assert replay_metadata.run_id == run_id
     assert replay_metadata.workflow_id == "wf_123"
@@ -205,7 +224,7 @@ def test_replay_workflow_run_with_steps(storage):
     )
 
     # Replay the run
-    replay_metadata, replay_data = replay_workflow_run(run_id)
+    replay_metadata, replay_data = load_workflow_run(run_id)
 
     assert len(replay_data["steps"]) == 3
     assert replay_data["steps"]["step1"]["agent"] == "coder"
@@ -239,22 +258,22 @@ def test_replay_workflow_run_with_logs(storage):
     )
 
     # Replay the run
-    replay_metadata, replay_data = replay_workflow_run(run_id)
+    replay_metadata, replay_data = load_workflow_run(run_id)
 
     assert "logs" in replay_data
     assert "Workflow started" in replay_data["logs"]
 
 
-def test_replay_nonexistent_agent_run():
+def test_load_nonexistent_agent_run():
     """Test replaying agent run that doesn't exist."""
     with pytest.raises(FileNotFoundError):
-        replay_agent_run("nonexistent_run_id")
+        load_agent_run("nonexistent_run_id")
 
 
-def test_replay_nonexistent_workflow_run():
+def test_load_nonexistent_workflow_run():
     """Test replaying workflow run that doesn't exist."""
     with pytest.raises(FileNotFoundError):
-        replay_workflow_run("nonexistent_run_id")
+        load_workflow_run("nonexistent_run_id")
 
 
 def test_replay_failed_agent_run(storage):
@@ -281,7 +300,7 @@ def test_replay_failed_agent_run(storage):
     )
 
     # Replay should still work for failed runs
-    replay_metadata, replay_data = replay_agent_run(run_id)
+    replay_metadata, replay_data = load_agent_run(run_id)
 
     assert replay_metadata.status == RunStatus.FAILED
     assert replay_metadata.error_message == "Execution failed: Invalid input"
@@ -311,7 +330,7 @@ def test_replay_failed_workflow_run(storage):
     )
 
     # Replay should work for failed workflows
-    replay_metadata, replay_data = replay_workflow_run(run_id)
+    replay_metadata, replay_data = load_workflow_run(run_id)
 
     assert replay_metadata.status == RunStatus.FAILED
     assert replay_metadata.steps_failed == 2
@@ -344,7 +363,7 @@ def test_replay_with_trace_data(storage):
     )
 
     # Replay the run
-    replay_metadata, replay_data = replay_agent_run(run_id)
+    replay_metadata, replay_data = load_agent_run(run_id)
 
     assert "trace" in replay_data
     assert replay_data["trace"]["trace_id"] == "abc123"
@@ -374,7 +393,7 @@ def test_replay_preserves_metadata(storage):
     storage.save_agent_run(metadata=metadata, input_data={})
 
     # Replay and verify all metadata preserved
-    replay_metadata, _ = replay_agent_run(run_id)
+    replay_metadata, _ = load_agent_run(run_id)
 
     assert replay_metadata.run_id == run_id
     assert replay_metadata.agent_id == "coder"
@@ -382,3 +401,243 @@ def test_replay_preserves_metadata(storage):
     assert replay_metadata.tokens_used == 5000
     assert replay_metadata.cost_usd == 0.15
     assert replay_metadata.artifacts_count == 3
+
+
+# ---------------------------------------------------------------------------
+# Re-execution with recorded LLM responses
+# ---------------------------------------------------------------------------
+
+
+class FakeProvider(LLMProvider):
+    """Provider answering with a deterministic echo of the prompt."""
+
+    def __init__(self, registry):
+        super().__init__()
+        self.registry = registry
+
+    async def chat_completion(self, messages, config, model, **kwargs):
+        self.registry.calls += 1
+        return LLMResponse(
+            content=f"{self.registry.prefix}:{messages[-1].content}",
+            model=model,
+            usage=TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        )
+
+    async def stream_chat_completion(self, messages, config, model, **kwargs):
+        self.registry.calls += 1
+        for word in ("streamed", " ", messages[-1].content):
+            yield StreamChunk(content=word)
+        yield StreamChunk(finish_reason="stop")
+
+    def validate_config(self, config):
+        return True
+
+    @property
+    def provider_name(self):
+        return "fake"
+
+    @property
+    def supported_models(self):
+        return ["fake-model"]
+
+
+class FakeRegistry:
+    def __init__(self, prefix="live"):
+        self.prefix = prefix
+        self.calls = 0
+
+    def create_provider(self, name, **kwargs):
+        return FakeProvider(self)
+
+
+def _workflow(prompts):
+    steps = [
+        WorkflowStep(
+            id=f"s{i}",
+            name=f"step {i}",
+            agent="coder",
+            prompt=prompt,
+            outputs={"result": {}},
+            depends_on=[f"s{i - 1}"] if i else [],
+            config={"provider": "fake", "model": "fake-model"},
+        )
+        for i, prompt in enumerate(prompts)
+    ]
+    return Workflow(id="wf-replay", spec=WorkflowSpec(name="replay", steps=steps))
+
+
+async def _record_workflow(storage, tmp_path, workflow):
+    """Execute a workflow with recording and store it like WorkflowEngine."""
+    registry = FakeRegistry(prefix="original")
+    executor = AgentExecutor(
+        parac_root=tmp_path, provider_registry=RecordingProviderRegistry(registry)
+    )
+    orchestrator = WorkflowOrchestrator(EventBus(), executor.execute_step)
+    with record_llm_calls() as recording:
+        context = await orchestrator.execute(workflow, {"topic": "x"})
+
+    metadata = WorkflowRunMetadata(
+        run_id=context.execution_id,
+        workflow_id=workflow.id,
+        workflow_name=workflow.spec.name,
+        started_at=datetime.now(),
+        status=RunStatus.COMPLETED,
+    )
+    storage.save_workflow_run(
+        metadata=metadata,
+        inputs={"topic": "x"},
+        outputs=context.outputs,
+        steps=context.step_results,
+        trace={
+            "workflow_spec": workflow.spec.model_dump(mode="json"),
+            "llm_calls": recording.to_list(),
+        },
+    )
+    return context, recording
+
+
+async def test_replay_workflow_recorded_mode_is_deterministic(storage, tmp_path):
+    """Recorded mode serves every call from the trace without live calls."""
+    workflow = _workflow(["first", "second"])
+    original, recording = await _record_workflow(storage, tmp_path, workflow)
+    assert len(recording) == 2
+
+    result = await replay_workflow_run(original.execution_id, parac_root=tmp_path)
+
+    assert result.status == "completed"
+    assert result.recorded_calls == 2
+    assert result.deterministic
+    for step_id, step in result.step_results.items():
+        assert step["outputs"] == original.step_results[step_id]["outputs"]
+        assert step["cost"]["total_tokens"] == 0
+
+
+async def test_replay_workflow_recorded_mode_reports_misses(storage, tmp_path):
+    """A changed prompt fails in recorded mode instead of falling back to mock."""
+    original, _ = await _record_workflow(storage, tmp_path, _workflow(["a", "b"]))
+
+    result = await replay_workflow_run(
+        original.execution_id,
+        mode=ReplayMode.RECORDED,
+        workflow=_workflow(["a", "b changed"]),
+        parac_root=tmp_path,
+    )
+
+    assert len(result.misses) == 1
+    assert result.step_results["s1"]["status"] == "failed"
+    assert "mock" not in str(result.step_results["s1"])
+
+
+async def test_replay_workflow_hybrid_mode_calls_live_for_changed_steps(
+    storage, tmp_path
+):
+    """Hybrid mode only calls the live provider for edited prompts."""
+    original, _ = await _record_workflow(storage, tmp_path, _workflow(["a", "b"]))
+    live = FakeRegistry(prefix="live")
+
+    result = await replay_workflow_run(
+        original.execution_id,
+        mode="hybrid",
+        workflow=_workflow(["a", "b changed"]),
+        parac_root=tmp_path,
+        live_registry=live,
+    )
+
+    assert result.status == "completed"
+    assert result.recorded_calls == 1
+    assert result.live_calls == 1
+    assert live.calls == 1
+    assert result.step_results["s0"]["outputs"]["result"] == "original:a"
+    assert result.step_results["s1"]["outputs"]["result"] == "live:b changed"
+
+
+async def test_replay_workflow_without_spec_raises(storage):
+    """Runs stored without a workflow spec cannot be re-executed."""
+    run_id = generate_ulid()
+    storage.save_workflow_run(
+        metadata=WorkflowRunMetadata(
+            run_id=run_id,
+            workflow_id="wf",
+            workflow_name="wf",
+            started_at=datetime.now(),
+        ),
+        inputs={},
+        outputs={},
+    )
+
+    with pytest.raises(ReplayError):
+        await replay_workflow_run(run_id)
+
+
+async def test_replay_agent_run_live_mode(storage, tmp_path):
+    """Agent runs are re-executed as a single step."""
+    run_id = generate_ulid()
+    storage.save_agent_run(
+        metadata=AgentRunMetadata(
+            run_id=run_id,
+            agent_id="coder",
+            agent_name="Coder",
+            started_at=datetime.now(),
+            provider="fake",
+            model="fake-model",
+        ),
+        input_data={"prompt": "Fix bug"},
+        output_data={},
+    )
+    live = FakeRegistry()
+
+    result = await replay_agent_run(
+        run_id, mode="live", parac_root=tmp_path, live_registry=live
+    )
+
+    assert result.status == "completed"
+    assert result.outputs["result"] == "live:Fix bug"
+    assert live.calls == 1
+
+
+async def test_record_agent_run_then_replay_is_deterministic(storage, tmp_path):
+    """Agent runs are stored with their LLM calls and replay from them."""
+    step = WorkflowStep(
+        id="coder_task",
+        name="Fix bug",
+        agent="coder",
+        prompt="Fix bug",
+        outputs={"result": {}},
+        config={"provider": "fake", "model": "fake-model"},
+    )
+    executor = AgentExecutor(
+        parac_root=tmp_path, provider_registry=FakeRegistry(prefix="original")
+    )
+
+    result = await record_agent_run(executor, step, {"file": "a.py"})
+
+    metadata, run_data = load_agent_run(result["run_id"])
+    assert metadata.status == RunStatus.COMPLETED
+    assert metadata.tokens_used == 15
+    assert len(run_data["trace"]["llm_calls"]) == 1
+
+    replay = await replay_agent_run(result["run_id"], parac_root=tmp_path)
+
+    assert replay.deterministic
+    assert replay.recorded_calls == 1
+    assert replay.outputs == result["outputs"]
+
+
+async def test_streamed_calls_are_recorded():
+    """Completed streams are recorded as a single assembled response."""
+    registry = RecordingProviderRegistry(FakeRegistry(prefix="live"))
+    provider = registry.create_provider("fake")
+    messages = [ChatMessage(role="user", content="hi")]
+
+    with record_llm_calls() as recording:
+        chunks = [
+            chunk
+            async for chunk in provider.stream_chat_completion(
+                messages, LLMConfig(), "fake-model"
+            )
+        ]
+
+    assert "".join(c.content for c in chunks) == "streamed hi"
+    (call,) = recording.calls
+    assert call.response["content"] == "streamed hi"
+    assert call.response["finish_reason"] == "stop"
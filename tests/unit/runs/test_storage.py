@@ -14,6 +14,7 @@ from paracle_runs import (
     WorkflowRunMetadata,
     get_run_storage,
 )
+from paracle_runs.exceptions import RunLoadError
 from paracle_runs.models import RunQuery
 from paracle_runs.storage import RunStorage
 
@@ -31,6 +32,12 @@ def storage(temp_runs_dir):
     return RunStorage(temp_runs_dir)
 
 
+@pytest.fixture
+def legacy_storage(temp_runs_dir):
+    """Create RunStorage instance using the legacy directory layout."""
+    return RunStorage(temp_runs_dir, layout="directory")
+
+
 def test_agent_run_metadata_creation():
     """Test creating agent run metadata."""
     metadata = AgentRunMetadata(
@@ -70,7 +77,7 @@ def test_workflow_run_metadata_creation():
     assert len(metadata.agents_used) == 2
 
 
-def test_save_agent_run(storage):
+def test_save_agent_run(legacy_storage):
     """Test saving agent run data."""
     metadata = AgentRunMetadata(
         run_id=generate_ulid(),
@@ -88,7 +95,7 @@ def test_save_agent_run(storage):
     output_data = {"result": "Fixed", "changes": ["line 10"]}
     artifacts = {"test.py": "def test(): pass"}
 
-    run_dir = storage.save_agent_run(
+    run_dir = legacy_storage.save_agent_run(
         metadata=metadata,
         input_data=input_data,
         output_data=output_data,
@@ -104,7 +111,7 @@ def test_save_agent_run(storage):
     assert (run_dir / "logs.txt").exists()
 
 
-def test_save_workflow_run(storage):
+def test_save_workflow_run(legacy_storage):
     """Test saving workflow run data."""
     metadata = WorkflowRunMetadata(
         run_id=generate_ulid(),
@@ -126,7 +133,7 @@ def test_save_workflow_run(storage):
         "step2": {"input": "a", "output": "b"},
     }
 
-    run_dir = storage.save_workflow_run(
+    run_dir = legacy_storage.save_workflow_run(
         metadata=metadata,
         inputs=inputs,
         outputs=outputs,
@@ -410,7 +417,7 @@ def test_global_run_storage():
     assert storage1 is storage2  # Same instance
 
 
-def test_metadata_yaml_format(storage):
+def test_metadata_yaml_format(legacy_storage):
     """Test metadata is saved in YAML format."""
     run_id = generate_ulid()
     metadata = AgentRunMetadata(
@@ -420,10 +427,10 @@ def test_metadata_yaml_format(storage):
         started_at=datetime.now(),
         status=RunStatus.COMPLETED,
     )
-    storage.save_agent_run(metadata=metadata, input_data={})
+    legacy_storage.save_agent_run(metadata=metadata, input_data={})
 
     # Read metadata file directly
-    metadata_file = storage.agents_dir / run_id / "metadata.yaml"
+    metadata_file = legacy_storage.agents_dir / run_id / "metadata.yaml"
     with open(metadata_file) as f:
         data = yaml.safe_load(f)
 
@@ -432,7 +439,7 @@ def test_metadata_yaml_format(storage):
     assert data["status"] == "completed"
 
 
-def test_json_data_format(storage):
+def test_json_data_format(legacy_storage):
     """Test data is saved in JSON format."""
     run_id = generate_ulid()
     metadata = AgentRunMetadata(
@@ -443,12 +450,133 @@ def test_json_data_format(storage):
         status=RunStatus.COMPLETED,
     )
     input_data = {"prompt": "Test", "context": {"key": "value"}}
-    storage.save_agent_run(metadata=metadata, input_data=input_data)
+    legacy_storage.save_agent_run(metadata=metadata, input_data=input_data)
 
     # Read input file directly
-    input_file = storage.agents_dir / run_id / "input.json"
+    input_file = legacy_storage.agents_dir / run_id / "input.json"
     with open(input_file) as f:
         data = json.load(f)
 
     assert data["prompt"] == "Test"
     assert data["context"]["key"] == "value"
+
+
+def _agent_metadata(**overrides):
+    values = {
+        "run_id": generate_ulid(),
+        "agent_id": "coder",
+        "agent_name": "Coder Agent",
+        "started_at": datetime.now(),
+        "status": RunStatus.COMPLETED,
+    }
+    values.update(overrides)
+    return AgentRunMetadata(**values)
+
+
+def test_compact_layout_single_blob(storage):
+    """Test compact layout stores one compressed blob per run."""
+    metadata = _agent_metadata()
+    trace = {"spans": [{"name": f"span-{i}"} for i in range(1000)]}
+
+    path = storage.save_agent_run(
+        metadata=metadata,
+        input_data={"prompt": "Test"},
+        output_data={"response": "ok"},
+        trace=trace,
+    )
+
+    assert path.is_file()
+    assert path.name.startswith(metadata.run_id)
+    assert list(storage.agents_dir.iterdir()) == [path]
+
+    loaded, run_data = storage.load_agent_run(metadata.run_id)
+    assert loaded == metadata
+    assert run_data["input"] == {"prompt": "Test"}
+    assert run_data["output"] == {"response": "ok"}
+    assert run_data["trace"] == trace
+
+
+def test_zstd_run_without_zstandard(storage, monkeypatch):
+    """Test zstd runs fail clearly and are skipped by listing when unreadable."""
+    from paracle_runs import storage as storage_module
+
+    metadata = _agent_metadata()
+    storage.save_agent_run(metadata=metadata, input_data={})
+    (blob,) = storage.agents_dir.glob(f"{metadata.run_id}.json.*")
+    blob.rename(blob.with_name(f"{metadata.run_id}.json.zst"))
+    monkeypatch.setattr(storage_module, "ZSTD_AVAILABLE", False)
+    monkeypatch.setattr(storage_module, "zstandard", None)
+
+    with pytest.raises(RunLoadError, match="zstandard"):
+        storage.load_agent_run(metadata.run_id)
+    assert storage.reindex() == 0
+
+
+def test_list_runs_by_duration(storage):
+    """Test filtering runs on the indexed duration column."""
+    for duration in (1.0, 5.0, 30.0):
+        storage.save_agent_run(
+            metadata=_agent_metadata(duration_seconds=duration), input_data={}
+        )
+
+    runs = storage.list_agent_runs(RunQuery(min_duration_seconds=2.0))
+    assert sorted(r.duration_seconds for r in runs) == [5.0, 30.0]
+
+    runs = storage.list_agent_runs(RunQuery(max_duration_seconds=10.0))
+    assert sorted(r.duration_seconds for r in runs) == [1.0, 5.0]
+
+
+def test_list_runs_newest_first_with_offset(storage):
+    """Test runs are ordered by start time and paginated."""
+    now = datetime.now()
+    ids = []
+    for hours in (3, 1, 2):
+        metadata = _agent_metadata(started_at=now - timedelta(hours=hours))
+        storage.save_agent_run(metadata=metadata, input_data={})
+        ids.append((hours, metadata.run_id))
+
+    expected = [run_id for _, run_id in sorted(ids)]
+    assert [r.run_id for r in storage.list_agent_runs()] == expected
+    assert [
+        r.run_id for r in storage.list_agent_runs(RunQuery(offset=1, limit=1))
+    ] == expected[1:2]
+
+
+def test_migrate_legacy_runs(temp_runs_dir):
+    """Test legacy run directories are migrated to compact blobs."""
+    legacy = RunStorage(temp_runs_dir, layout="directory")
+    agent_md = _agent_metadata(status=RunStatus.FAILED)
+    legacy.save_agent_run(metadata=agent_md, input_data={"prompt": "x"}, logs="line 1")
+    workflow_md = WorkflowRunMetadata(
+        run_id=generate_ulid(),
+        workflow_id="wf",
+        workflow_name="WF",
+        started_at=datetime.now(),
+    )
+    legacy.save_workflow_run(
+        metadata=workflow_md, inputs={}, steps={"s1": {"ok": True}}
+    )
+
+    storage = RunStorage(temp_runs_dir)
+    assert storage.migrate_legacy_runs() == 2
+    assert not (storage.agents_dir / agent_md.run_id).exists()
+
+    _, agent_data = storage.load_agent_run(agent_md.run_id)
+    assert agent_data["logs"] == "line 1"
+    _, workflow_data = storage.load_workflow_run(workflow_md.run_id)
+    assert workflow_data["steps"] == {"s1": {"ok": True}}
+
+    failed = storage.list_agent_runs(RunQuery(status=RunStatus.FAILED))
+    assert [r.run_id for r in failed] == [agent_md.run_id]
+
+
+def test_index_rebuilt_for_existing_runs(temp_runs_dir):
+    """Test a missing index is rebuilt from runs on disk."""
+    storage = RunStorage(temp_runs_dir)
+    metadata = _agent_metadata()
+    storage.save_agent_run(metadata=metadata, input_data={})
+    storage.index.close()
+    (temp_runs_dir / "index.db").unlink()
+
+    reopened = RunStorage(temp_runs_dir)
+    assert [r.run_id for r in reopened.list_agent_runs()] == [metadata.run_id]
@@ -0,0 +1,117 @@
+"""Tests for A2A task persistence and the task manager indexes."""
+
+import asyncio
+
+from paracle_a2a.config import A2AServerConfig
+from paracle_a2a.models import TaskState, create_artifact, create_message
+from paracle_a2a.server.task_manager import TaskManager
+from paracle_a2a.server.task_store import SQLiteTaskStore
+
+
+def _manager(path, limit: int = 1000) -> TaskManager:
+    return TaskManager(
+        A2AServerConfig(task_history_limit=limit), store=SQLiteTaskStore(path)
+    )
+
+
+class TestSQLiteTaskStore:
+    """Tests for the SQLite task store."""
+
+    async def test_round_trip(self, tmp_path):
+        manager = _manager(tmp_path / "tasks.db")
+        task = await manager.create_task(
+            create_message("hello"), context_id="ctx", session_id="s1"
+        )
+        await manager.add_message(task.id, create_message("more"))
+        await manager.add_artifact(task.id, create_artifact("result"))
+        await manager.update_status(task.id, TaskState.completed)
+        manager.close()
+
+        (stored,) = SQLiteTaskStore(tmp_path / "tasks.db").load(limit=10)
+
+        assert stored.task.id == task.id
+        assert stored.task.status.state == TaskState.completed
+        assert stored.task.metadata["session_id"] == "s1"
+        assert len(stored.messages) == 2
+        assert len(stored.artifacts) == 1
+
+    async def test_load_keeps_most_recent(self, tmp_path):
+        manager = _manager(tmp_path / "tasks.db")
+        tasks = [await manager.create_task(create_message(str(i))) for i in range(5)]
+        manager.close()
+
+        stored = SQLiteTaskStore(tmp_path / "tasks.db").load(limit=3)
+
+        assert [s.task.id for s in stored] == [t.id for t in tasks[2:]]
+
+
+class TestTaskManagerRestore:
+    """Tests for restoring task history after a restart."""
+
+    async def test_restored_indexes(self, tmp_path):
+        manager = _manager(tmp_path / "tasks.db")
+        first = await manager.create_task(create_message("a"), context_id="ctx")
+        await manager.create_task(create_message("b"), context_id="other")
+        await manager.update_status(first.id, TaskState.completed)
+        manager.close()
+
+        restored = _manager(tmp_path / "tasks.db")
+
+        (task,) = await restored.list_tasks(context_id="ctx")
+        assert task.id == first.id
+        assert await restored.get_task_messages(first.id)
+        assert [t.id for t in await restored.list_tasks(cursor=task.id)] == []
+
+    async def test_live_tasks_are_failed_and_evictable(self, tmp_path):
+        manager = _manager(tmp_path / "tasks.db")
+        live = await manager.create_task(create_message("running"))
+        await manager.update_status(live.id, TaskState.working)
+        manager.close()
+
+        restored = _manager(tmp_path / "tasks.db", limit=1)
+        task = await restored.get_task(live.id)
+
+        assert task.status.state == TaskState.failed
+        assert await restored.list_tasks(states=[TaskState.working]) == []
+
+        newer = await restored.create_task(create_message("new"))
+        assert [t.id for t in await restored.list_tasks()] == [newer.id]
+        restored.close()
+
+        # The eviction is persisted too
+        (stored,) = SQLiteTaskStore(tmp_path / "tasks.db").load(limit=10)
+        assert stored.task.id == newer.id
+
+
+class TestTaskManagerEviction:
+    """Tests for evicting terminal tasks over the history limit."""
+
+    async def test_continue_task_evicted_while_waiting(self):
+        manager = TaskManager(A2AServerConfig(task_history_limit=1))
+        old = await manager.create_task(create_message("old"))
+        await manager.update_status(old.id, TaskState.completed)
+
+        async with manager._task_lock(old.id):
+            continued = asyncio.create_task(
+                manager.create_task(create_message("more"), task_id=old.id)
+            )
+            await asyncio.sleep(0)
+            # Evicts the completed task while the continuation waits
+            await manager.create_task(create_message("new"))
+
+        task = await continued
+
+        assert task.id == old.id
+        assert task.status.state == TaskState.submitted
+        assert len(await manager.get_task_messages(old.id)) == 1
+
+    async def test_live_tasks_are_not_evicted(self):
+        manager = TaskManager(A2AServerConfig(task_history_limit=2))
+        live = await manager.create_task(create_message("live"))
+        done = await manager.create_task(create_message("done"))
+        await manager.update_status(done.id, TaskState.completed)
+
+        newest = await manager.create_task(create_message("newest"))
+
+        ids = {t.id for t in await manager.list_tasks()}
+        assert ids == {live.id, newest.id}
@@ -0,0 +1,281 @@
+"""Tests for approval storage, expiration timers and resuming after a restart."""
+
+import asyncio
+import threading
+from datetime import timedelta
+
+import pytest
+from paracle_core.compat import UTC, datetime
+from paracle_domain.models import (
+    ApprovalConfig,
+    ApprovalPriority,
+    ApprovalRequest,
+    ApprovalStatus,
+    Workflow,
+    WorkflowSpec,
+    WorkflowStep,
+)
+from paracle_events import EventBus
+from paracle_orchestration import ExecutionStatus, WorkflowOrchestrator
+from paracle_orchestration.approval import ApprovalManager, ApprovalTimeoutError
+from paracle_orchestration.approval_store import SQLiteApprovalStore
+from paracle_orchestration.engine_wrapper import WorkflowEngine
+from paracle_runs import set_run_storage
+from paracle_runs.storage import RunStorage
+
+
+def _request(workflow_id: str = "wf_1", **kwargs) -> ApprovalRequest:
+    return ApprovalRequest(
+        workflow_id=workflow_id,
+        execution_id="exec_1",
+        step_id="review",
+        step_name="Review",
+        agent_name="reviewer",
+        **kwargs,
+    )
+
+
+async def _create(manager: ApprovalManager) -> ApprovalRequest:
+    return await manager.create_request(
+        workflow_id="wf_1",
+        execution_id="exec_1",
+        step_id="review",
+        step_name="Review",
+        agent_name="reviewer",
+        config=ApprovalConfig(timeout_seconds=300),
+    )
+
+
+class TestSQLiteApprovalStore:
+    """Tests for the SQLite approval store."""
+
+    def test_indexed_queries(self):
+        store = SQLiteApprovalStore(in_memory=True)
+        low = _request(priority=ApprovalPriority.LOW)
+        critical = _request(workflow_id="wf_2", priority=ApprovalPriority.CRITICAL)
+        decided = _request()
+        decided.reject("admin", "no")
+        for request in (low, critical, decided):
+            store.save(request)
+
+        assert [r.id for r in store.list_pending()] == [critical.id, low.id]
+        assert [r.id for r in store.list_pending(workflow_id="wf_1")] == [low.id]
+        assert store.list_pending(priority=ApprovalPriority.LOW) == [store.get(low.id)]
+        assert [r.id for r in store.list_decided(status=ApprovalStatus.REJECTED)] == [
+            decided.id
+        ]
+        assert store.count_by_status()[ApprovalStatus.PENDING] == 2
+
+    def test_rejects_values_that_are_not_json(self):
+        store = SQLiteApprovalStore(in_memory=True)
+        request = _request(context={"obj": object()})
+
+        with pytest.raises(ValueError, match="not JSON-serializable"):
+            store.save(request)
+        assert store.get(request.id) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "approvals.db"
+        request = _request(expires_at=datetime.now(UTC) - timedelta(seconds=1))
+        SQLiteApprovalStore(path).save(request)
+
+        reopened = SQLiteApprovalStore(path)
+
+        assert reopened.get(request.id).expires_at == request.expires_at
+        assert [r.id for r in reopened.list_expiring(datetime.now(UTC))] == [request.id]
+
+
+@pytest.mark.asyncio
+async def test_manager_runs_store_io_off_the_event_loop(monkeypatch):
+    store = SQLiteApprovalStore(in_memory=True)
+    manager = ApprovalManager(store=store)
+    threads = []
+    save = store.save
+
+    def recording_save(request):
+        threads.append(threading.get_ident())
+        save(request)
+
+    monkeypatch.setattr(store, "save", recording_save)
+    request = await _create(manager)
+    await manager.approve(request.id, approver="admin")
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+    assert store.get(request.id).status == ApprovalStatus.APPROVED
+
+
+@pytest.mark.asyncio
+class TestApprovalExpiration:
+    """Tests for the shared expiration timer."""
+
+    async def test_requests_expire_without_waiters(self):
+        manager = ApprovalManager()
+        request = _request(expires_at=datetime.now(UTC) + timedelta(seconds=0.02))
+        manager.store.save(request)
+        await manager.rehydrate()
+
+        await asyncio.sleep(0.05)
+
+        assert manager.get_request(request.id).status == ApprovalStatus.EXPIRED
+        assert not await manager.wait_for_decision(request.id)
+
+    async def test_one_timer_serves_all_waiters(self):
+        manager = ApprovalManager()
+        requests = [await _create(manager) for _ in range(50)]
+        waiters = [
+            asyncio.create_task(manager.wait_for_decision(r.id)) for r in requests
+        ]
+        await asyncio.sleep(0)
+
+        short = asyncio.create_task(
+            manager.wait_for_decision(requests[0].id, timeout_seconds=0.05)
+        )
+        await manager.approve(requests[1].id, approver="admin")
+
+        assert await waiters[1] is True
+        with pytest.raises(ApprovalTimeoutError):
+            await short
+        with pytest.raises(ApprovalTimeoutError):
+            await waiters[0]
+        timers = [t for t in asyncio.all_tasks() if "_run_expirations" in repr(t)]
+        assert len(timers) == 1
+        assert manager.get_stats()["pending_count"] == 48
+
+        for task in waiters[2:]:
+            task.cancel()
+        timers[0].cancel()
+
+
+@pytest.mark.asyncio
+class TestResumeAfterRestart:
+    """Tests for rehydrating paused workflows from a persistent store."""
+
+    @pytest.fixture
+    def workflow(self):
+        spec = WorkflowSpec(
+            name="deploy-workflow",
+            steps=[
+                WorkflowStep(id="build", name="build", agent="builder"),
+                WorkflowStep(
+                    id="deploy",
+                    name="deploy",
+                    agent="deployer",
+                    depends_on=["build"],
+                    requires_approval=True,
+                    approval_config={"required": True, "timeout_seconds": 300},
+                ),
+                WorkflowStep(
+                    id="notify",
+                    name="notify",
+                    agent="notifier",
+                    depends_on=["deploy"],
+                ),
+            ],
+        )
+        return Workflow(spec=spec)
+
+    async def test_paused_workflow_resumes_in_new_process(self, workflow, tmp_path):
+        path = tmp_path / "approvals.db"
+        executed = []
+
+        async def executor(step, inputs):
+            executed.append(step.name)
+            return {"output": f"{step.name} done"}
+
+        # First process pauses at the approval gate and goes away
+        first = WorkflowOrchestrator(
+            EventBus(),
+            executor,
+            approval_manager=ApprovalManager(store=SQLiteApprovalStore(path)),
+        )
+        paused = asyncio.create_task(first.execute(workflow, {"env": "prod"}))
+        await asyncio.sleep(0.05)
+        paused.cancel()
+
+        # Second process rehydrates and resumes from the saved state
+        manager = ApprovalManager(store=SQLiteApprovalStore(path))
+        second = WorkflowOrchestrator(EventBus(), executor, approval_manager=manager)
+        tasks = await second.resume_pending({workflow.id: workflow})
+        await asyncio.sleep(0.05)
+
+        (approval,) = manager.list_pending()
+        assert len(tasks) == 1
+        assert second.active_executions[approval.execution_id].is_awaiting_approval
+        await manager.approve(approval.id, approver="admin")
+        context = await tasks[0]
+
+        assert context.status == ExecutionStatus.COMPLETED
+        assert context.step_results["deploy"] == {"output": "deploy done"}
+        assert executed == ["build", "deploy", "notify"]
+
+    async def test_unserializable_step_output_fails_the_gate(self, workflow):
+        async def executor(step, inputs):
+            return {"output": object()}
+
+        manager = ApprovalManager(store=SQLiteApprovalStore(in_memory=True))
+        orchestrator = WorkflowOrchestrator(
+            EventBus(), executor, approval_manager=manager
+        )
+
+        context = await orchestrator.execute(workflow, {"env": "prod"})
+
+        assert context.status == ExecutionStatus.FAILED
+        assert "not JSON-serializable" in context.errors[0]
+        assert manager.list_pending() == []
+
+    async def test_overdue_requests_expire_on_rehydrate(self, tmp_path):
+        store = SQLiteApprovalStore(tmp_path / "approvals.db")
+        overdue = _request(expires_at=datetime.now(UTC) - timedelta(seconds=1))
+        store.save(overdue)
+
+        pending = await ApprovalManager(store=store).rehydrate()
+
+        assert pending == []
+        assert store.get(overdue.id).status == ApprovalStatus.EXPIRED
+
+    @pytest.fixture
+    def run_storage(self, tmp_path):
+        set_run_storage(RunStorage(tmp_path / "runs"))
+        yield
+        set_run_storage(None)
+
+    async def test_engine_tracks_resumed_executions(
+        self, workflow, tmp_path, run_storage
+    ):
+        path = tmp_path / "approvals.db"
+
+        async def executor(step, inputs):
+            return {"output": f"{step.name} done"}
+
+        first = WorkflowEngine(
+            step_executor=executor,
+            approval_manager=ApprovalManager(store=SQLiteApprovalStore(path)),
+        )
+        paused = asyncio.create_task(first.execute(workflow, {"env": "prod"}))
+        await asyncio.sleep(0.05)
+        paused.cancel()
+
+        manager = ApprovalManager(store=SQLiteApprovalStore(path))
+        engine = WorkflowEngine(step_executor=executor, approval_manager=manager)
+        (task,) = await engine.resume_pending({workflow.id: workflow})
+        await asyncio.sleep(0.05)
+        (approval,) = manager.list_pending()
+        await manager.approve(approval.id, approver="admin")
+        await task
+
+        status = await engine.get_execution_status(approval.execution_id)
+        assert status.status == "completed"
+        assert status.completed_steps == ["build", "deploy", "notify"]
+
+
+def test_api_manager_persists_in_parac(tmp_path, monkeypatch):
+    from paracle_api.routers import approvals
+
+    monkeypatch.setattr(approvals, "resolve_parac_root", lambda: tmp_path)
+    monkeypatch.setattr(approvals, "_approval_manager", None)
+
+    manager = approvals.get_approval_manager()
+
+    assert isinstance(manager.store, SQLiteApprovalStore)
+    assert (tmp_path / approvals.APPROVALS_DB).exists()
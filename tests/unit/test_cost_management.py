@@ -316,6 +316,62 @@ class TestCostTracker:
         assert report.total_usage.request_count >= 1
         assert report.budget_status == BudgetStatus.OK
 
+    def test_cached_tokens_discounted(self, tracker):
+        """Test prompt cache reads are billed at the cached price."""
+        record = tracker.track_usage(
+            provider="anthropic",
+            model="claude-3.5-sonnet",
+            prompt_tokens=10_000,
+            completion_tokens=0,
+            cached_tokens=8_000,
+            agent_id="coder",
+        )
+
+        # $3/M input: 2000 full price + 8000 at 10%
+        assert record.prompt_cost == pytest.approx(0.0084)
+        assert record.cache_savings == pytest.approx(0.0216)
+
+        report = tracker.get_report()
+        assert report.total_usage.cached_tokens == 8_000
+        assert report.by_agent["coder"].cache_savings == pytest.approx(0.0216)
+        assert report.to_dict()["summary"]["cached_tokens"] == 8_000
+
+    def test_cache_writes_cost_a_premium(self, tracker):
+        """Test prompt cache writes are billed above the input price."""
+        record = tracker.track_usage(
+            provider="anthropic",
+            model="claude-3.5-sonnet",
+            prompt_tokens=10_000,
+            completion_tokens=0,
+            cached_tokens=2_000,
+            cache_write_tokens=8_000,
+        )
+
+        # $3/M input: 2000 at 10% + 8000 at 125%
+        assert record.prompt_cost == pytest.approx(0.0306)
+        # Reads saved $0.0054, writes cost $0.006 extra
+        assert record.cache_savings == pytest.approx(-0.0006)
+        assert tracker.get_total_usage().cache_savings == pytest.approx(-0.0006)
+
+    def test_existing_database_gets_cache_columns(self, temp_db):
+        """Test databases created before prompt caching are migrated."""
+        import sqlite3
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute(
+            "CREATE TABLE cost_records (id INTEGER PRIMARY KEY, timestamp TEXT, "
+            "provider TEXT, model TEXT, prompt_tokens INTEGER, "
+            "completion_tokens INTEGER, total_tokens INTEGER, prompt_cost REAL, "
+            "completion_cost REAL, total_cost REAL, execution_id TEXT, "
+            "workflow_id TEXT, step_id TEXT, agent_id TEXT, metadata_json TEXT)"
+        )
+        conn.close()
+
+        tracker = CostTracker(config=CostConfig(), db_path=temp_db)
+        tracker.track_usage("openai", "gpt-4o", 1000, 10, cached_tokens=500)
+
+        assert tracker.get_total_usage().cached_tokens == 500
+
     def test_estimate_cost(self, tracker):
         """Test cost estimation."""
         estimate = tracker.estimate_cost(
@@ -0,0 +1,193 @@
+"""Unit tests for provider middleware (prompt caching and single-flight)."""
+
+import asyncio
+
+import pytest
+from paracle_providers.base import (
+    ChatMessage,
+    LLMConfig,
+    LLMProvider,
+    LLMResponse,
+    TokenUsage,
+)
+from paracle_providers.middleware import (
+    ProviderMiddleware,
+    SingleFlight,
+    stable_prefix_breakpoints,
+)
+
+SYSTEM = ChatMessage(role="system", content="You are a coder agent. " * 300)
+GREEDY = LLMConfig(temperature=0)
+
+
+class SlowProvider(LLMProvider):
+    """Provider that records calls and answers after a short delay."""
+
+    def __init__(self, caching: bool = True, fail: bool = False):
+        super().__init__()
+        self.calls: list[dict] = []
+        self.caching = caching
+        self.fail = fail
+
+    async def chat_completion(self, messages, config, model, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("upstream failed")
+        return LLMResponse(
+            content=messages[-1].content.upper(),
+            usage=TokenUsage(
+                prompt_tokens=1500,
+                completion_tokens=10,
+                total_tokens=1510,
+                cached_tokens=1400 if "cache_breakpoints" in kwargs else 0,
+            ),
+        )
+
+    async def stream_chat_completion(self, messages, config, model, **kwargs):
+        yield  # pragma: no cover
+
+    def validate_config(self, config):
+        return True
+
+    @property
+    def provider_name(self):
+        return "slow"
+
+    @property
+    def supported_models(self):
+        return ["slow-model"]
+
+    @property
+    def supports_prompt_caching(self):
+        return self.caching
+
+
+def _messages(prompt: str) -> list[ChatMessage]:
+    return [SYSTEM, ChatMessage(role="user", content=prompt)]
+
+
+class TestStablePrefix:
+    """Tests for cache breakpoint selection."""
+
+    def test_system_prompt_and_history(self):
+        messages = [
+            SYSTEM,
+            ChatMessage(role="user", content="first " * 1000),
+            ChatMessage(role="assistant", content="answer"),
+            ChatMessage(role="user", content="next"),
+        ]
+
+        assert stable_prefix_breakpoints(messages) == [0, 2]
+
+    def test_short_prefix_is_not_marked(self):
+        messages = [
+            ChatMessage(role="system", content="short"),
+            ChatMessage(role="user", content="hi"),
+        ]
+
+        assert stable_prefix_breakpoints(messages) == []
+        assert stable_prefix_breakpoints(messages, min_prefix_chars=1) == [0]
+
+
+@pytest.mark.asyncio
+class TestProviderMiddleware:
+    """Tests for the middleware wrapper."""
+
+    async def test_marks_prefix_only_when_supported(self):
+        supported = SlowProvider()
+        unsupported = SlowProvider(caching=False)
+
+        response = await ProviderMiddleware(supported).chat_completion(
+            _messages("hi"), LLMConfig(), "slow-model"
+        )
+        await ProviderMiddleware(unsupported).chat_completion(
+            _messages("hi"), LLMConfig(), "slow-model"
+        )
+
+        assert supported.calls == [{"cache_breakpoints": [0]}]
+        assert unsupported.calls == [{}]
+        assert response.usage.cached_tokens == 1400
+
+    async def test_concurrent_duplicates_share_one_call(self):
+        inner = SlowProvider()
+        group = SingleFlight()
+        # Separate wrappers (e.g. one per step) share the group
+        providers = [ProviderMiddleware(inner, single_flight=group) for _ in range(3)]
+
+        responses = await asyncio.gather(
+            *(
+                p.chat_completion(_messages("a"), GREEDY, "slow-model")
+                for p in providers
+            ),
+            providers[0].chat_completion(_messages("b"), GREEDY, "slow-model"),
+        )
+
+        assert len(inner.calls) == 2
+        assert [r.content for r in responses] == ["A", "A", "A", "B"]
+        # Only the leader reports usage, so the call is paid once
+        assert sum(r.usage.total_tokens for r in responses[:3]) == 1510
+        assert sum(bool(r.metadata.get("deduplicated")) for r in responses) == 2
+        assert group.shared == 2
+        assert len(group) == 0
+
+        # Sequential calls are not deduplicated
+        await providers[0].chat_completion(_messages("a"), GREEDY, "slow-model")
+        assert len(inner.calls) == 3
+
+    async def test_sampled_requests_are_not_merged(self):
+        inner = SlowProvider()
+        provider = ProviderMiddleware(inner)
+
+        responses = await asyncio.gather(
+            *(
+                provider.chat_completion(
+                    _messages("a"), LLMConfig(temperature=0.7), "slow-model"
+                )
+                for _ in range(2)
+            )
+        )
+
+        assert len(inner.calls) == 2
+        assert all(r.usage.total_tokens == 1510 for r in responses)
+        assert provider.stats()["deduplicated"] == 0
+
+    async def test_errors_reach_every_caller(self):
+        provider = ProviderMiddleware(SlowProvider(fail=True))
+
+        results = await asyncio.gather(
+            *(
+                provider.chat_completion(_messages("x"), GREEDY, "slow-model")
+                for _ in range(2)
+            ),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert provider.stats()["upstream_calls"] == 1
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        inner = SlowProvider()
+        provider = ProviderMiddleware(inner)
+
+        leader = asyncio.ensure_future(
+            provider.chat_completion(_messages("x"), GREEDY, "slow-model")
+        )
+        await asyncio.sleep(0)
+        follower = provider.chat_completion(_messages("x"), GREEDY, "slow-model")
+        leader.cancel()
+
+        assert (await follower).content == "X"
+        assert len(inner.calls) == 1
+
+
+def test_anthropic_cache_control_blocks():
+    pytest.importorskip("anthropic")
+    from paracle_providers.anthropic_provider import AnthropicProvider
+
+    system, conversation = AnthropicProvider._split_messages(
+        _messages("hi"), cache_breakpoints=[0]
+    )
+
+    assert system[0]["cache_control"] == {"type": "ephemeral"}
+    assert conversation == [{"role": "user", "content": "hi"}]
@@ -0,0 +1,209 @@
+"""Unit tests for chunked, deduplicated rollback snapshots."""
+
+import io
+import os
+import random
+import subprocess
+import tarfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from paracle_rollback import ChunkedSnapshotStrategy, ChunkStore
+from paracle_rollback.chunkstore import chunk_spans
+
+
+class FakeContainer:
+    """Container whose /workspace is a local directory."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.archives: list[str] = []
+
+    def _local(self, path: str) -> Path:
+        return self.root / path.lstrip("/")
+
+    def get_archive(self, path):
+        self.archives.append(path)
+        buffer = io.BytesIO()
+        local = self._local(path)
+        with tarfile.open(fileobj=buffer, mode="w") as archive:
+            archive.add(local, arcname=local.name)
+        return iter([buffer.getvalue()]), {}
+
+    def put_archive(self, path, data):
+        with tarfile.open(fileobj=data, mode="r|") as archive:
+            archive.extractall(self._local(path), filter="fully_trusted")
+        return True
+
+    def exec_run(self, command):
+        command = [str(self._local(c)) if c == "/workspace" else c for c in command]
+        result = subprocess.run(command, capture_output=True)
+        return SimpleNamespace(exit_code=result.returncode, output=result.stdout)
+
+
+@pytest.fixture
+def container(tmp_path):
+    workspace = tmp_path / "container" / "workspace"
+    (workspace / "src").mkdir(parents=True)
+    rng = random.Random(7)
+    (workspace / "src" / "big.bin").write_bytes(rng.randbytes(600_000))
+    (workspace / "notes.txt").write_text("hello\n")
+    os.symlink("notes.txt", workspace / "link")
+    # Older than the racy window, like files that existed before a task ran
+    for file in (workspace / "src" / "big.bin", workspace / "notes.txt"):
+        os.utime(file, (1_700_000_000, 1_700_000_000))
+    return FakeContainer(tmp_path / "container")
+
+
+@pytest.fixture
+def strategy(tmp_path, container):
+    strategy = ChunkedSnapshotStrategy(tmp_path / "snapshots")
+    strategy._client = SimpleNamespace(
+        containers=SimpleNamespace(get=lambda _: container), close=lambda: None
+    )
+    yield strategy
+    strategy.close()
+
+
+class TestChunking:
+    """Tests for content-defined chunking and the chunk store."""
+
+    def test_insertion_keeps_most_chunks(self):
+        data = random.Random(1).randbytes(2_000_000)
+        edited = data[:1_000_000] + b"inserted" + data[1_000_000:]
+
+        def chunks(blob):
+            return {blob[s:e] for s, e in chunk_spans(blob)}
+
+        before, after = chunks(data), chunks(edited)
+        assert b"".join(data[s:e] for s, e in chunk_spans(data)) == data
+        assert len(before & after) >= len(before) - 3
+
+    def test_store_dedups_and_collects_garbage(self, tmp_path):
+        store = ChunkStore(tmp_path)
+        digest, written = store.put(b"x" * 1000)
+
+        assert written > 0
+        assert store.put(b"x" * 1000) == (digest, 0)
+        assert store.get(digest) == b"x" * 1000
+
+        store.add_refs([digest])
+        assert store.collect_garbage() == (0, 0)
+        store.add_refs([digest], delta=-1)
+        assert store.collect_garbage()[0] == 1
+        assert store.stats()["chunks"] == 0
+        store.close()
+
+
+@pytest.mark.asyncio
+class TestChunkedSnapshotStrategy:
+    """Tests for snapshot, restore and deletion."""
+
+    async def test_second_snapshot_only_stores_changes(self, strategy, container):
+        first = await strategy.create_snapshot("c1")
+        workspace = container.root / "workspace"
+        (workspace / "notes.txt").write_text("changed notes\n")
+        (workspace / "new.txt").write_text("new\n")
+        second = await strategy.create_snapshot("c1")
+
+        assert first.size_bytes > 500_000
+        assert second.size_bytes < 1000
+        assert second.metadata["parent_snapshot"] == first.snapshot_id
+        assert second.metadata["changed_files"] == "2"
+        # Only the changed files were fetched
+        assert container.archives[1:] == ["/workspace/notes.txt", "/workspace/new.txt"]
+        entries = strategy.load_manifest(second.snapshot_id)["entries"]
+        assert (entries["link"]["t"], entries["link"]["l"]) == ("l", "notes.txt")
+
+    async def test_same_second_rewrite_is_detected(self, strategy, container):
+        notes = container.root / "workspace" / "notes.txt"
+        await strategy.create_snapshot("c1")
+        # Same size, same whole-second mtime: only the nanoseconds differ
+        notes.write_text("HELLO\n")
+        os.utime(notes, ns=(1_700_000_000_500_000_000, 1_700_000_000_500_000_000))
+
+        second = await strategy.create_snapshot("c1")
+
+        assert second.metadata["changed_files"] == "1"
+        await strategy.restore_snapshot(second, "c1")
+        assert notes.read_text() == "HELLO\n"
+
+    async def test_racy_files_are_reread(self, strategy, container):
+        (container.root / "workspace" / "notes.txt").write_text("fresh\n")
+        first = await strategy.create_snapshot("c1")
+        entries = strategy.load_manifest(first.snapshot_id)["entries"]
+        assert entries["notes.txt"]["r"] == 1
+        assert "r" not in entries["src/big.bin"]
+
+        second = await strategy.create_snapshot("c1")
+
+        assert second.metadata["changed_files"] == "1"
+        assert container.archives[1:] == ["/workspace/notes.txt"]
+
+    async def test_restore_recreates_files(self, strategy, container):
+        workspace = container.root / "workspace"
+        original = (workspace / "src" / "big.bin").read_bytes()
+        snapshot = await strategy.create_snapshot("c1")
+
+        (workspace / "src" / "big.bin").write_bytes(b"corrupted")
+        (workspace / "notes.txt").unlink()
+        await strategy.restore_snapshot(snapshot, "c1")
+
+        assert (workspace / "src" / "big.bin").read_bytes() == original
+        assert (workspace / "notes.txt").read_text() == "hello\n"
+
+    async def test_delete_frees_only_unshared_chunks(self, strategy, container):
+        first = await strategy.create_snapshot("c1")
+        (container.root / "workspace" / "src" / "big.bin").write_bytes(
+            random.Random(8).randbytes(300_000)
+        )
+        second = await strategy.create_snapshot("c1")
+        total = strategy.get_total_size()
+
+        await strategy.delete_snapshot(first)
+        assert 0 < strategy.get_total_size() < total
+        assert not first.storage_path.exists()
+
+        # The remaining snapshot is still complete
+        await strategy.restore_snapshot(second, "c1")
+        await strategy.delete_snapshot(second)
+        assert strategy.get_total_size() == 0
+
+    async def test_parent_comes_from_the_index(
+        self, strategy, container, tmp_path, monkeypatch
+    ):
+        first = await strategy.create_snapshot("c1")
+        other = await strategy.create_snapshot("c2")
+        second = await strategy.create_snapshot("c1")
+        strategy.close()
+
+        # A fresh process finds the parent without scanning manifests
+        reopened = ChunkedSnapshotStrategy(tmp_path / "snapshots")
+        monkeypatch.setattr(Path, "glob", None)
+        assert reopened._parent_manifest("c1", "/workspace")["snapshot_id"] == (
+            second.snapshot_id
+        )
+
+        # Deleting the latest snapshot falls back to the one before it
+        reopened._delete_snapshots([second.snapshot_id])
+        assert reopened._parent_manifest("c1", "/workspace")["snapshot_id"] == (
+            first.snapshot_id
+        )
+        reopened._delete_snapshots([first.snapshot_id])
+        assert reopened._parent_manifest("c1", "/workspace") is None
+        assert reopened._parent_manifest("c2", "/workspace")["snapshot_id"] == (
+            other.snapshot_id
+        )
+        reopened.close()
+
+    async def test_existing_manifests_are_indexed(self, strategy, container, tmp_path):
+        snapshot = await strategy.create_snapshot("c1")
+        strategy.store.remove_manifest(snapshot.snapshot_id)
+        strategy.close()
+
+        reopened = ChunkedSnapshotStrategy(tmp_path / "snapshots")
+        assert reopened._parent_manifest("c1", "/workspace")["snapshot_id"] == (
+            snapshot.snapshot_id
+        )
+        reopened.close()
@@ -0,0 +1,247 @@
+"""Unit tests for the sandbox warm pool, driven by a fake Docker client."""
+
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+from paracle_sandbox import (
+    PoolConfig,
+    SandboxConfig,
+    SandboxExecutor,
+    SandboxManager,
+    SandboxMonitor,
+)
+from paracle_sandbox.exceptions import SandboxError
+
+
+class FakeContainer:
+    """In-memory stand-in for a docker Container."""
+
+    _ids = itertools.count()
+
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.short_id = f"c{next(self._ids)}"
+        self.running = False
+        self.removed = False
+        self.commands = []
+        self.reset_exit_code = 0
+
+    def start(self):
+        self.running = True
+
+    def reload(self):
+        pass
+
+    def exec_run(self, command, **kwargs):
+        self.commands.append(command)
+        if not self.running:
+            raise RuntimeError("container is not running")
+        if command[:2] == ["sh", "-c"] and "kill -9 -1" in command[2]:
+            return SimpleNamespace(exit_code=self.reset_exit_code, output=None)
+        return SimpleNamespace(exit_code=0, output=(b"ok\n", b""))
+
+    def stats(self, stream=False):
+        return {
+            "cpu_stats": {
+                "cpu_usage": {"total_usage": 0},
+                "system_cpu_usage": 0,
+                "online_cpus": 1,
+            },
+            "precpu_stats": {"cpu_usage": {"total_usage": 0}, "system_cpu_usage": 0},
+            "memory_stats": {"usage": 1024 * 1024, "limit": 512 * 1024 * 1024},
+            "networks": {},
+        }
+
+    def stop(self, timeout=None):
+        self.running = False
+
+    def remove(self, force=False):
+        self.removed = True
+        self.client.live.discard(self)
+
+
+class FakeDockerClient:
+    """Fake docker client recording created containers."""
+
+    def __init__(self):
+        self.created = []
+        self.live = set()
+        self.images = SimpleNamespace(get=lambda name: object(), pull=None)
+        self.containers = SimpleNamespace(create=self._create)
+
+    def _create(self, **kwargs):
+        container = FakeContainer(self, kwargs["name"])
+        self.created.append(container)
+        self.live.add(container)
+        return container
+
+    def close(self):
+        raise AssertionError("shared client must not be closed by sandboxes")
+
+
+@pytest.fixture
+def client():
+    return FakeDockerClient()
+
+
+def _manager(client, max_concurrent=10, **pool):
+    return SandboxManager(
+        max_concurrent=max_concurrent,
+        pool=PoolConfig(reap_interval_seconds=3600, **pool),
+        client=client,
+    )
+
+
+@pytest.mark.asyncio
+class TestSandboxPool:
+    """Tests for acquire/release through the warm pool."""
+
+    async def test_released_sandbox_is_reset_and_reused(self, client):
+        manager = _manager(client, min_idle=0)
+        config = SandboxConfig()
+
+        first = await manager.acquire(config)
+        await manager.release(first)
+        second = await manager.acquire(config)
+
+        assert second is first
+        assert len(client.created) == 1
+        assert "kill -9 -1" in first.container.commands[-1][2]
+        stats = manager.pool.stats(config)
+        assert (stats["hits"], stats["misses"], stats["resets"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+        await manager.destroy_all()
+        assert not client.live
+
+    async def test_profiles_are_isolated(self, client):
+        manager = _manager(client, min_idle=0)
+        small = SandboxConfig(memory_mb=256)
+        large = SandboxConfig(memory_mb=1024)
+
+        sandbox = await manager.acquire(small)
+        await manager.release(sandbox)
+        other = await manager.acquire(large)
+
+        assert other is not sandbox
+        assert other.config == large
+        await manager.destroy_all()
+
+    async def test_failed_reset_or_discard_destroys(self, client):
+        manager = _manager(client, min_idle=0)
+        config = SandboxConfig()
+
+        sandbox = await manager.acquire(config)
+        sandbox.container.reset_exit_code = 1
+        container = sandbox.container
+        await manager.release(sandbox)
+        assert container.removed
+        assert manager.pool.stats(config)["reset_failures"] == 1
+
+        sandbox = await manager.acquire(config)
+        container = sandbox.container
+        await manager.release(sandbox, discard=True)
+        assert container.removed
+        assert manager.pool.idle_count() == 0
+        assert manager.active_sandboxes == {}
+
+    async def test_writable_root_is_never_reused(self, client):
+        manager = _manager(client, min_idle=0)
+        config = SandboxConfig(read_only_filesystem=False)
+
+        sandbox = await manager.acquire(config)
+        await manager.release(sandbox)
+
+        assert sandbox.container is None
+        assert manager.pool.idle_count() == 0
+
+    async def test_prewarm_and_queue_depth_autoscaling(self, client):
+        manager = _manager(client, min_idle=1, max_idle=3)
+        config = SandboxConfig()
+
+        assert await manager.pool.prewarm(config) == 1
+        manager.pool.set_queue_depth(config, 5)
+        await manager.pool._drain_warmups()
+        assert manager.pool.idle_count(config) == 3
+
+        sandbox = await manager.acquire(config)
+        assert manager.pool.stats(config)["hits"] == 1
+        await manager.release(sandbox)
+        await manager.destroy_all()
+        assert not client.live
+
+    async def test_idle_sandboxes_count_toward_limit_and_are_evicted(self, client):
+        manager = _manager(client, max_concurrent=2, min_idle=0)
+        a, b = SandboxConfig(memory_mb=256), SandboxConfig(memory_mb=1024)
+
+        first = await manager.acquire(a)
+        await manager.release(first)
+        held = await manager.acquire(a)
+        assert held is first
+
+        # Slot 2 is free: warm-ups respect the limit
+        manager.pool.set_queue_depth(b, 4)
+        await manager.pool._drain_warmups()
+        assert manager.pool.idle_count(b) == 1
+        manager.pool.set_queue_depth(b, 0)
+
+        # Limit reached: the idle sandbox is evicted for a cold start
+        other = await manager.acquire(SandboxConfig(memory_mb=512))
+        assert manager.pool.idle_count() == 0
+        with pytest.raises(SandboxError):
+            await manager.create(SandboxConfig())
+
+        await manager.release(held)
+        await manager.release(other)
+        await manager.destroy_all()
+        assert not client.live
+
+    async def test_reaper_drains_profiles_past_ttl(self, client):
+        manager = _manager(client, min_idle=1, max_idle_seconds=0.05)
+        config = SandboxConfig()
+        await manager.pool.prewarm(config, 2)
+        assert manager.pool.idle_count() == 2
+
+        await asyncio.sleep(0.1)
+
+        assert await manager.pool.reap() == 2
+        assert manager.pool.idle_count() == 0
+        assert manager.pool.stats(config)["evictions"] == 2
+        assert not client.live
+
+    async def test_pool_disabled_falls_back_to_create(self, client):
+        manager = SandboxManager(client=client)
+
+        async with manager.pooled(SandboxConfig()) as sandbox:
+            assert sandbox.sandbox_id in manager.active_sandboxes
+
+        assert manager.active_sandboxes == {}
+        assert not client.live
+
+
+@pytest.mark.asyncio
+class TestPoolIntegration:
+    """Executor and monitor integration."""
+
+    async def test_executor_reuses_and_reports_pool_metrics(self, client):
+        executor = SandboxExecutor(_manager(client, min_idle=0))
+
+        first = await executor.execute_agent("print('a')", monitor=False)
+        second = await executor.execute_agent("print('b')")
+
+        assert first["success"] and second["success"]
+        assert second["sandbox_id"] == first["sandbox_id"]
+        pool_metrics = second["stats"]["monitoring"]["pool"]
+        assert pool_metrics["hits"] == 1
+        assert pool_metrics["acquire_latency_ms"]["max"] >= 0
+        assert len(client.created) == 1
+        await executor.manager.destroy_all()
+
+    async def test_monitor_without_pool(self, client):
+        manager = SandboxManager(client=client)
+        sandbox = await manager.create(SandboxConfig())
+
+        assert SandboxMonitor(sandbox).get_pool_metrics() == {}
+        await manager.destroy_all()
@@ -0,0 +1,164 @@
+"""Unit tests for the namespace-based process sandbox backend."""
+
+import os
+import subprocess
+
+import pytest
+from paracle_sandbox import (
+    PoolConfig,
+    ProcessSandbox,
+    SandboxConfig,
+    SandboxExecutor,
+    SandboxManager,
+)
+from paracle_sandbox.exceptions import (
+    SandboxCreationError,
+    SandboxExecutionError,
+    SandboxTimeoutError,
+)
+
+
+def _namespaces_available() -> bool:
+    if not ProcessSandbox.is_available():
+        return False
+    probe = subprocess.run(
+        ["unshare", "--user", "--map-root-user", "--mount", "--pid", "--fork", "true"],
+        capture_output=True,
+    )
+    return probe.returncode == 0
+
+
+requires_namespaces = pytest.mark.skipif(
+    not _namespaces_available(), reason="unprivileged user namespaces unavailable"
+)
+
+CONFIG = SandboxConfig(backend="process", timeout_seconds=10)
+
+
+class TestProcessSandboxCommands:
+    """Command construction, independent of the host."""
+
+    @pytest.mark.parametrize(
+        "update",
+        [
+            {"network_mode": "host"},
+            {"network_mode": "bridge"},
+            {"read_only_filesystem": False},
+        ],
+    )
+    def test_rejects_config_exposing_the_host(self, update):
+        with pytest.raises(SandboxCreationError):
+            ProcessSandbox("a", CONFIG.model_copy(update=update))
+
+    def test_home_directories_are_hidden(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        command = ProcessSandbox("a", CONFIG)._init_command()
+
+        assert "--net" in command
+        script = command[-1]
+        assert f"tmpfs {tmp_path}\n" in script
+        if os.path.isdir("/root"):
+            assert "tmpfs /root\n" in script
+
+    def test_missing_working_dir_lives_in_private_tmp(self):
+        sandbox = ProcessSandbox(
+            "a", CONFIG.model_copy(update={"working_dir": "/nope/w"})
+        )
+
+        assert sandbox.working_dir == "/tmp/w"
+        assert "mkdir -p /tmp/w" in sandbox._init_command()[-1]
+
+    def test_privileges_dropped_for_commands_only(self):
+        sandbox = ProcessSandbox("a", CONFIG)
+        sandbox._init_pid = 42
+
+        command = sandbox._enter_command(["id"], drop_privileges=True)
+        reset = sandbox._enter_command(["id"], drop_privileges=False)
+
+        assert command[:3] == ["nsenter", "--target", "42"]
+        assert "setpriv" in command and "--bounding-set=-all" in command
+        assert "setpriv" not in reset
+
+
+@requires_namespaces
+@pytest.mark.asyncio
+class TestProcessSandbox:
+    """Tests running real namespaces."""
+
+    async def test_isolation(self):
+        sandbox = ProcessSandbox("iso", CONFIG)
+        async with sandbox.context():
+            result = await sandbox.execute(
+                ["sh", "-c", "echo data > f && cat f && pwd && touch /etc/x"]
+            )
+            net = await sandbox.execute(["cat", "/proc/net/dev"])
+            home = await sandbox.execute(["ls", "-A", "/root"])
+
+        assert result["stdout"].splitlines() == ["data", sandbox.working_dir]
+        assert "Read-only file system" in result["stderr"]
+        assert result["exit_code"] != 0
+        assert "eth0" not in net["stdout"]
+        assert home["stdout"] == ""
+        assert not sandbox.is_running
+
+    async def test_streaming_and_stats(self):
+        chunks = []
+        sandbox = ProcessSandbox("stream", CONFIG)
+        async with sandbox.context():
+            result = await sandbox.execute(
+                "sh -c 'echo out; echo err >&2'",
+                on_output=lambda name, text: chunks.append((name, text)),
+            )
+            stats = await sandbox.get_stats()
+
+        assert ("stdout", "out\n") in chunks and ("stderr", "err\n") in chunks
+        assert result["stdout"] == "out\n"
+        assert stats["memory_limit_mb"] == CONFIG.memory_mb
+        assert stats["memory_bytes"] > 0
+
+    async def test_timeout_kills_and_reset_cleans_up(self):
+        sandbox = ProcessSandbox("timeout", CONFIG)
+        async with sandbox.context():
+            await sandbox.execute(["sh", "-c", "touch left-over /tmp/t"])
+            # Escapes the command's process group, so only reset kills it
+            await sandbox.execute(["sh", "-c", "setsid sleep 300 >/dev/null 2>&1 &"])
+            with pytest.raises(SandboxTimeoutError):
+                await sandbox.execute(["sleep", "30"], timeout=1)
+
+            assert await sandbox.reset()
+            listing = await sandbox.execute(["ls", "-A", ".", "/tmp"])
+            procs = await sandbox.execute(
+                ["sh", "-c", "cat /proc/[0-9]*/cmdline | tr '\\0' ' '"]
+            )
+
+        # Only the working dir mount point is left in /tmp
+        assert listing["stdout"].split() == [".:", "/tmp:", "workspace"]
+        assert "sleep 300" not in procs["stdout"]
+        assert "sleep 30 " not in procs["stdout"]
+
+    async def test_execute_after_stop_fails(self):
+        sandbox = ProcessSandbox("stopped", CONFIG)
+        await sandbox.start()
+        await sandbox.stop()
+
+        with pytest.raises(SandboxExecutionError):
+            await sandbox.execute(["true"])
+
+    async def test_manager_and_pool_use_backend(self):
+        manager = SandboxManager(pool=PoolConfig(min_idle=0))
+        executor = SandboxExecutor(manager)
+
+        first = await executor.execute_agent(
+            "import json; print(json.load(open('inputs.json'))['n'])",
+            config=CONFIG,
+            inputs={"n": 7},
+            monitor=False,
+        )
+        second = await executor.execute_agent("print('again')", config=CONFIG)
+
+        assert first["success"], first
+        assert first["result"]["stdout"] == "7\n"
+        assert second["sandbox_id"] == first["sandbox_id"]
+        assert isinstance(manager.pool.stats(CONFIG)["hit_rate"], float)
+        await manager.destroy_all()
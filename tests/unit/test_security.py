@@ -182,6 +182,132 @@ class TestRateLimiting:
         allowed, _ = await limiter.is_allowed("client2")
         assert allowed
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_refills_continuously(self, monkeypatch):
+        """Tokens refill gradually instead of at a window boundary."""
+        from paracle_api.security import rate_limit_backends
+        from paracle_api.security.rate_limit import RateLimiter
+
+        clock = [1000.0]
+        monkeypatch.setattr(rate_limit_backends.time, "time", lambda: clock[0])
+        limiter = RateLimiter(
+            requests_per_window=10, window_seconds=10, block_duration_seconds=0
+        )
+
+        for _ in range(10):
+            allowed, _ = await limiter.is_allowed("client")
+            assert allowed
+        allowed, headers = await limiter.is_allowed("client")
+        assert not allowed
+        assert headers["Retry-After"] == 1
+
+        # One emission interval later exactly one token is back
+        clock[0] += 1.0
+        allowed, headers = await limiter.is_allowed("client")
+        assert allowed
+        assert headers["X-RateLimit-Remaining"] == 0
+        allowed, _ = await limiter.is_allowed("client")
+        assert not allowed
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_route_and_key_costs(self):
+        """Expensive routes and weighted keys consume more tokens."""
+        from paracle_api.security.rate_limit import RateLimiter, RouteCost
+
+        limiter = RateLimiter(
+            requests_per_window=10,
+            window_seconds=60,
+            route_costs=[RouteCost.parse("POST /api/workflows/*/execute", 5)],
+            key_costs={"heavy": 2.0},
+        )
+
+        assert limiter.cost_for("POST", "/api/workflows/wf1/execute") == 5
+        assert limiter.cost_for("GET", "/api/workflows/wf1/execute") == 1.0
+
+        for _ in range(2):
+            allowed, _ = await limiter.is_allowed("client", cost=5)
+            assert allowed
+        allowed, _ = await limiter.is_allowed("client", cost=5)
+        assert not allowed
+
+        for _ in range(5):
+            allowed, _ = await limiter.is_allowed("heavy")
+            assert allowed
+        allowed, _ = await limiter.is_allowed("heavy")
+        assert not allowed
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_cleanup_expired(self, monkeypatch):
+        """Refilled buckets are garbage-collected."""
+        from paracle_api.security import rate_limit_backends
+        from paracle_api.security.rate_limit import RateLimiter
+
+        clock = [1000.0]
+        monkeypatch.setattr(rate_limit_backends.time, "time", lambda: clock[0])
+        limiter = RateLimiter(requests_per_window=10, window_seconds=10)
+
+        await limiter.is_allowed("a")
+        await limiter.is_allowed("b")
+        assert await limiter.cleanup_expired() == 0
+
+        clock[0] += 1.0
+        assert await limiter.cleanup_expired() == 2
+        assert len(limiter.backend) == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_sqlite_shared_between_limiters(self, tmp_path):
+        """Limiters using the same SQLite file share one budget."""
+        from paracle_api.security.rate_limit import RateLimiter
+        from paracle_api.security.rate_limit_backends import SQLiteRateLimitBackend
+
+        db_path = tmp_path / "limits.db"
+        worker1 = RateLimiter(
+            requests_per_window=4,
+            window_seconds=60,
+            backend=SQLiteRateLimitBackend(db_path),
+        )
+        worker2 = RateLimiter(
+            requests_per_window=4,
+            window_seconds=60,
+            backend=SQLiteRateLimitBackend(db_path),
+        )
+
+        for limiter in (worker1, worker2, worker1, worker2):
+            allowed, _ = await limiter.is_allowed("client")
+            assert allowed
+        allowed, _ = await worker2.is_allowed("client")
+        assert not allowed
+
+        status_info = await worker1.get_client_status("client")
+        assert status_info["blocked"]
+
+        await worker1.backend.close()
+        await worker2.backend.close()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_sqlite_does_not_block_event_loop(self, tmp_path):
+        """Waiting for another worker's write lock leaves the loop running."""
+        import asyncio
+        import sqlite3
+
+        from paracle_api.security.rate_limit_backends import SQLiteRateLimitBackend
+
+        db_path = tmp_path / "limits.db"
+        backend = SQLiteRateLimitBackend(db_path)
+        other_worker = sqlite3.connect(str(db_path), isolation_level=None)
+        other_worker.execute("BEGIN IMMEDIATE")
+
+        acquire = asyncio.create_task(backend.acquire("client", 1.0, 10.0))
+        await asyncio.sleep(0.05)
+        assert not acquire.done()
+
+        other_worker.execute("COMMIT")
+        other_worker.close()
+        result = await asyncio.wait_for(acquire, timeout=5)
+
+        assert result.allowed
+        await backend.close()
+
 
 # =============================================================================
 # Test Filesystem Tool Security
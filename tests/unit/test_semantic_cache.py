@@ -0,0 +1,139 @@
+"""Tests for the semantic LLM cache tier."""
+
+import pytest
+from paracle_cache import (
+    CacheKey,
+    LLMCache,
+    SemanticCache,
+    SemanticCacheConfig,
+    hash_embedding,
+    llm_cache,
+    normalize_prompt,
+)
+
+SYSTEM = {"role": "system", "content": "You answer FAQ questions."}
+RESPONSE = {"content": "Paracle is a multi-agent framework."}
+
+
+def _key(prompt: str, **kwargs) -> CacheKey:
+    fields = {"provider": "openai", "model": "gpt-4o", "temperature": 0.0}
+    fields.update(kwargs)
+    messages = fields.pop("messages", [SYSTEM])
+    return CacheKey(messages=messages + [{"role": "user", "content": prompt}], **fields)
+
+
+@pytest.fixture
+def semantic():
+    return SemanticCache(
+        SemanticCacheConfig(enabled=True, similarity_threshold=0.8, sample_rate=1.0)
+    )
+
+
+class TestSemanticCache:
+    """Tests for lookup, scoping and eviction."""
+
+    def test_normalize_prompt(self):
+        assert normalize_prompt("  What is\n Paracle?? ") == "what is paracle"
+
+    def test_hash_embedding_is_unit_length(self):
+        vector = hash_embedding("how do I install paracle")
+
+        assert len(vector) == 256
+        assert sum(x * x for x in vector) == pytest.approx(1.0)
+
+    def test_near_duplicate_hits(self, semantic):
+        semantic.store(_key("How do I install the Paracle CLI?"), RESPONSE)
+
+        exact = semantic.lookup(_key("how do I   install the paracle CLI"))
+        near = semantic.lookup(_key("How do I install the Paracle CLI tool?"))
+
+        assert exact.similarity == 1.0
+        assert near.response == RESPONSE
+        assert 0.8 <= near.similarity < 1.0
+        assert semantic.lookup(_key("What license does Paracle use?")) is None
+
+    def test_scope_must_match(self, semantic):
+        semantic.store(_key("What is Paracle?"), RESPONSE)
+
+        assert semantic.lookup(_key("What is Paracle?", model="gpt-4o-mini")) is None
+        assert semantic.lookup(_key("What is Paracle?", temperature=0.9)) is None
+        assert semantic.lookup(_key("What is Paracle?", messages=[])) is None
+        # Temperatures in the same bucket share entries
+        assert semantic.lookup(_key("What is Paracle?", temperature=0.1)) is not None
+        # Hot requests are never served
+        hot = _key("What is Paracle?", temperature=1.5)
+        assert not semantic.store(hot, RESPONSE)
+        assert semantic.lookup(hot) is None
+
+    def test_per_agent_enablement(self):
+        semantic = SemanticCache(
+            SemanticCacheConfig(enabled=True, agents={"faq", "docs"}),
+        )
+        semantic.config.excluded_agents.add("docs")
+
+        assert semantic.is_enabled_for("faq")
+        assert not semantic.is_enabled_for("docs")
+        assert not semantic.is_enabled_for("coder")
+        assert not semantic.is_enabled_for(None)
+        assert not semantic.store(_key("What is Paracle?"), RESPONSE, agent="coder")
+        assert semantic.store(_key("What is Paracle?"), RESPONSE, agent="faq")
+        assert not SemanticCache(SemanticCacheConfig()).is_enabled_for("faq")
+
+    def test_lru_eviction_and_ttl(self):
+        semantic = SemanticCache(
+            SemanticCacheConfig(enabled=True, max_entries_per_scope=2)
+        )
+        for prompt in ("first question", "second question", "third question"):
+            semantic.store(_key(prompt), {"content": prompt})
+
+        assert semantic.lookup(_key("first question")) is None
+        assert semantic.stats()["evictions"] == 1
+
+        semantic.store(_key("expired question"), RESPONSE, ttl=-1)
+        assert semantic.lookup(_key("expired question")) is None
+
+    def test_hit_sampling_and_feedback(self, semantic):
+        semantic.store(_key("How do I install the Paracle CLI?"), RESPONSE)
+        semantic.lookup(_key("How do I install the Paracle CLI tool?"), agent="faq")
+
+        [sample] = semantic.samples()
+        assert sample.agent == "faq"
+        assert sample.matched_prompt == "How do I install the Paracle CLI?"
+        assert semantic.precision() is None
+
+        assert semantic.record_feedback(sample.sample_id, accepted=False)
+        assert semantic.record_feedback(sample.sample_id, accepted=True)
+        assert not semantic.record_feedback("unknown", accepted=True)
+        assert semantic.stats()["precision"] == 1.0
+
+
+class TestLLMCacheSemanticTier:
+    """Tests for the semantic tier behind LLMCache."""
+
+    def test_exact_miss_falls_back_to_semantic(self, semantic):
+        cache = LLMCache(semantic=semantic)
+        cache.clear()
+        cache.set(_key("How do I install the Paracle CLI?"), RESPONSE, agent="faq")
+
+        assert cache.get(_key("how do i install the paracle cli"), agent="faq") == (
+            RESPONSE
+        )
+        assert cache.stats()["semantic_hits"] == 1
+
+        cache.invalidate(_key("How do I install the Paracle CLI?"))
+        assert cache.get(_key("how do i install the paracle cli")) is None
+        assert cache.hit_rate() == 0.5
+
+    @pytest.mark.parametrize("enabled", ["true", "false"])
+    def test_global_cache_reads_semantic_config(self, monkeypatch, enabled):
+        monkeypatch.setattr(llm_cache, "_llm_cache", None)
+        monkeypatch.setenv("PARACLE_SEMANTIC_CACHE_ENABLED", enabled)
+        monkeypatch.setenv("PARACLE_SEMANTIC_CACHE_AGENTS", "faq")
+
+        semantic = llm_cache.get_llm_cache().semantic
+
+        if enabled == "true":
+            assert semantic.is_enabled_for("faq")
+            assert not semantic.is_enabled_for("coder")
+        else:
+            assert semantic is None
@@ -0,0 +1,146 @@
+"""Tests for delta-encoded snapshot storage."""
+
+import random
+from datetime import timedelta
+
+import pytest
+from paracle_store.snapshot import (
+    SnapshotRetention,
+    SQLiteSnapshotStore,
+    StateSnapshot,
+    _utcnow,
+    apply_patch,
+    diff_state,
+)
+
+
+def _state(version: int) -> dict:
+    rng = random.Random(0)
+    return {
+        "name": "agent",
+        "config": {"temperature": 0.5, "tools": ["search", "read/file"]},
+        "history": [{"step": i, "text": rng.randbytes(40).hex()} for i in range(50)]
+        + [{"step": i} for i in range(50, 50 + version)],
+        "counter": version,
+        "flag": version % 2 == 0,
+    }
+
+
+def _snapshot(version: int, aggregate_id: str = "agent_1", **kwargs) -> StateSnapshot:
+    return StateSnapshot(
+        aggregate_id=aggregate_id,
+        aggregate_type="Agent",
+        version=version,
+        state=_state(version),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def store():
+    store = SQLiteSnapshotStore(in_memory=True, keyframe_interval=4)
+    yield store
+    store.close()
+
+
+class TestDiffState:
+    """Tests for JSON patch generation and application."""
+
+    @pytest.mark.parametrize(
+        "old,new",
+        [
+            ({"a": 1, "b": [1, 2, 3]}, {"a": 1, "b": [1, 5], "c": {"x~/y": None}}),
+            ({"a": [1]}, {"a": [1, 2, 3]}),
+            ({"a": 1}, {"a": True}),
+            ([1, 2], {"root": "replaced"}),
+        ],
+    )
+    def test_round_trip(self, old, new):
+        patch = diff_state(old, new)
+        result = apply_patch(old, patch)
+
+        assert result == new
+        assert type(result) is type(new)
+        assert diff_state(new, new) == []
+
+    def test_patch_is_local(self):
+        patch = diff_state(_state(1), _state(2))
+
+        assert {op["path"] for op in patch} == {"/history/51", "/counter", "/flag"}
+
+
+class TestSQLiteSnapshotStore:
+    """Tests for keyframe + delta storage."""
+
+    def test_every_version_reconstructs(self, store):
+        for version in range(1, 11):
+            store.save(_snapshot(version))
+
+        stats = store.storage_stats()
+        assert (stats["keyframes"], stats["deltas"]) == (3, 7)
+        for version in range(1, 11):
+            assert store.get_by_version("agent_1", version).state == _state(version)
+        assert store.get_latest("agent_1").version == 10
+        assert store.get_by_version("agent_1", 11) is None
+
+    def test_history_is_newest_first_and_shrinks_storage(self, tmp_path):
+        store = SQLiteSnapshotStore(tmp_path / "s.db", keyframe_interval=16)
+        snapshots = [_snapshot(v) for v in range(1, 33)]
+        for snapshot in snapshots:
+            store.save(snapshot)
+
+        history = store.get_history("agent_1", limit=5)
+        assert [s.version for s in history] == [32, 31, 30, 29, 28]
+        assert history[2].state == _state(30)
+        assert store.get(snapshots[20].id).state == _state(21)
+
+        full = sum(len(s.model_dump_json(include={"state"})) for s in snapshots)
+        assert store.storage_stats()["data_bytes"] * 5 < full
+        store.close()
+
+        # Reopened store continues from persisted data
+        reopened = SQLiteSnapshotStore(tmp_path / "s.db", keyframe_interval=16)
+        reopened.save(_snapshot(33))
+        assert reopened.get_by_version("agent_1", 33).state == _state(33)
+        reopened.close()
+
+    def test_delete_and_prune_keep_chain_readable(self, store):
+        snapshots = [_snapshot(v) for v in range(1, 11)]
+        for snapshot in snapshots:
+            store.save(snapshot)
+
+        assert store.delete(snapshots[5].id)
+        assert store.get_by_version("agent_1", 6) is None
+        assert store.get_by_version("agent_1", 7).state == _state(7)
+
+        assert store.prune("agent_1", keep_versions=3) == 6
+        assert [s.version for s in store.get_history("agent_1")] == [10, 9, 8]
+        assert store.get_by_version("agent_1", 8).state == _state(8)
+
+        store.save(_snapshot(11))
+        assert store.get_latest("agent_1").state == _state(11)
+
+    def test_out_of_order_save(self, store):
+        for version in (1, 2, 4):
+            store.save(_snapshot(version))
+        store.save(_snapshot(3))
+
+        for version in (1, 2, 3, 4):
+            assert store.get_by_version("agent_1", version).state == _state(version)
+
+    def test_retention_policy(self):
+        store = SQLiteSnapshotStore(
+            in_memory=True,
+            retention=SnapshotRetention(keep_versions=5, max_age_hours=1),
+        )
+        old = _utcnow() - timedelta(hours=2)
+        for version in range(1, 4):
+            store.save(_snapshot(version, aggregate_id="old", created_at=old))
+        for version in range(1, 9):
+            store.save(_snapshot(version))
+
+        assert store.count() == 3 + 5
+        assert store.apply_retention() == 2
+        assert store.get_latest("old").version == 3
+        assert store.get_by_version("agent_1", 4).state == _state(4)
+        store.close()